@@ -1,6 +1,8 @@
+import atexit
 import logging
 from logging.handlers import SMTPHandler, RotatingFileHandler
 import os
+from concurrent.futures import ThreadPoolExecutor
 from flask import Flask, request, current_app
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
@@ -11,6 +13,10 @@ from flask_moment import Moment
 from flask_babel import Babel, lazy_gettext as _l
 from config import Config
 from elasticsearch import Elasticsearch
+from app.dist_cache import DistCache
+from app.fanout import THREAD_NAME_PREFIX
+from app.jobs import JobQueue
+from app.storage import storage, table_metadata
 
 
 
@@ -39,6 +45,23 @@ def create_app(config_class=Config):
     babel.init_app(app)
     app.elasticsearch = Elasticsearch([app.config['ELASTICSEARCH_URL']]) \
         if app.config['ELASTICSEARCH_URL'] else None
+    app.dist_cache = DistCache(app.config['DIST_CACHE_PATH']) \
+        if app.config['DIST_CACHE_PATH'] else None
+    storage.init_app(app)
+    table_metadata.interval = app.config['TABLE_METADATA_INTERVAL']
+    if not app.testing:
+        table_metadata.start()
+    app.fanout = ThreadPoolExecutor(app.config['FANOUT_WORKERS'], thread_name_prefix=THREAD_NAME_PREFIX) \
+        if app.config['FANOUT_WORKERS'] else None
+
+    from app.main import sent_prefetch
+    app.prefetch = ThreadPoolExecutor(app.config['PREFETCH_WORKERS'],
+                                      thread_name_prefix=sent_prefetch.THREAD_NAME_PREFIX) \
+        if app.config['PREFETCH_WORKERS'] else None
+    app.jobs = JobQueue(app, app.config['JOB_WORKERS'], app.config['JOB_QUEUE_SIZE']) \
+        if app.config['JOB_WORKERS'] else None
+    if app.jobs:
+        atexit.register(app.jobs.shutdown, app.config['JOB_DRAIN_TIMEOUT'])
 
     from app.errors import bp as errors_bp
     app.register_blueprint(errors_bp)
@@ -1,5 +1,11 @@
 import os
 import click
+from flask import current_app
+from app.corpus import build_corpus, CorpusFile, CORPUS_PATH
+from app.dist_cache import cache_key
+from app.word_index import build_word_index, WORD_INDEX_PATH
+from app.storage import DynamoStorage, SQLiteStorage, copy_tables, TABLES
+from app.rhyme_index import build_rhyme_index, build_rhyme_matrix, clear_rhyme_matrix, INDEX_PATH, MATRIX_DIR
 
 
 def register(app):
@@ -32,4 +38,116 @@ def register(app):
     def compile():
         """Compile all languages."""
         if os.system('pybabel compile -d app/translations'):
-            raise RuntimeError('compile command failed')
\ No newline at end of file
+            raise RuntimeError('compile command failed')
+
+    @app.cli.group()
+    def corpus():
+        """Phonetic corpus commands."""
+        pass
+
+    @corpus.command()
+    def build():
+        """Compile the phonetic corpus and viable words into the binary corpus file."""
+        build_corpus()
+        click.echo('Corpus written to ' + CORPUS_PATH)
+        if current_app.dist_cache and current_app.dist_cache.sync_corpus(CorpusFile(CORPUS_PATH).digest()):
+            click.echo('Corpus changed, distance cache cleared')
+
+    @corpus.command()
+    @click.option('--k', default=20, help='Number of neighbours stored per word.')
+    def index(k):
+        """Build the rhyme index: the k closest words of every corpus word."""
+        def progress(done):
+            if done % 500 == 0:
+                click.echo('{} words done'.format(done))
+
+        build_rhyme_index(k=k, progress=progress)
+        click.echo('Rhyme index written to ' + INDEX_PATH)
+
+    @corpus.command()
+    @click.option('--cutoff', default=0.3, help='Only pairs with a distance below this are kept.')
+    @click.option('--alliteration', is_flag=True, help='Use alliteration distances instead of rhymes.')
+    @click.option('--shards', default=256, help='Number of shards the rows are split in.')
+    @click.option('--workers', default=None, type=int, help='Number of processes. Defaults to the number of CPUs.')
+    @click.option('--out', default=MATRIX_DIR, help='Directory the shards are saved to.')
+    @click.option('--restart', is_flag=True, help='Remove the shards already in out first.')
+    def matrix(cutoff, alliteration, shards, workers, out, restart):
+        """Compute all pairs of corpus words closer than cutoff. Resumes from the shards already in out, if they
+        were computed with the same options from the same corpus."""
+        def progress(done, total, pairs_per_second):
+            click.echo('{}/{} shards done, {:.0f} pairs/s'.format(done, total, pairs_per_second))
+
+        if restart and os.path.isdir(out):
+            clear_rhyme_matrix(out)
+        try:
+            build_rhyme_matrix(out, cutoff=cutoff, alliteration=alliteration, num_shards=shards, workers=workers,
+                               progress=progress)
+        except ValueError as e:
+            raise click.ClickException('{}. Use --restart to start over, or another --out'.format(e))
+        click.echo('Rhyme matrix written to ' + out)
+
+    @corpus.command('word-index')
+    def word_index():
+        """Build the word -> sentence ids index used by sentence_with from a scan of the Lyric table."""
+        from app.main.sentence_generator import lyric_table
+
+        def progress(done):
+            click.echo('{} sentences read'.format(done))
+
+        build_word_index(lyric_table, progress=progress)
+        click.echo('Word index written to ' + WORD_INDEX_PATH)
+
+    @corpus.command('warm-dist-cache')
+    @click.option('--top', default=10000, help='Number of most requested pairs to compute.')
+    @click.option('--pairs-file', type=click.File(), default=None,
+                  help='File with one "word_1 word_2" pair per line to compute as well.')
+    @click.option('--alliteration', is_flag=True, help='Pairs of --pairs-file are alliterations.')
+    def warm_dist_cache(top, pairs_file, alliteration):
+        """Pre-compute the most requested pairs of the distance cache (e.g. after a corpus build)."""
+        if not current_app.dist_cache:
+            raise click.ClickException('DIST_CACHE_PATH is not set')
+
+        keys = current_app.dist_cache.most_requested(top)
+        if pairs_file is not None:
+            keys += [cache_key(*line.split()[:2], alliteration=alliteration) for line in pairs_file if line.strip()]
+
+        computed = current_app.dist_cache.warm_up(keys)
+        click.echo('{} pairs computed, {} already cached'.format(computed, len(keys) - computed))
+
+    @corpus.command('dist-cache-stats')
+    def dist_cache_stats():
+        """Show the size and hit rate of the distance cache."""
+        if not current_app.dist_cache:
+            raise click.ClickException('DIST_CACHE_PATH is not set')
+
+        stats = current_app.dist_cache.stats()
+        click.echo('{} pairs cached'.format(stats['size']))
+        click.echo('hit rate: {:.1%} ({} hits, {} misses)'.format(
+            stats['total_hit_rate'], stats['total_hits'], stats['total_misses']))
+
+    @app.cli.group()
+    def storage():
+        """Lyric storage commands."""
+        pass
+
+    def copy_progress(table, copied):
+        if copied % 100000 == 0:
+            click.echo('{}: {} items copied'.format(table, copied))
+
+    @storage.command('export')
+    @click.argument('path')
+    @click.option('--table', 'tables', multiple=True, type=click.Choice(TABLES),
+                  help='Table to copy. Defaults to all of them.')
+    def export_storage(path, tables):
+        """Copy the DynamoDB tables to a local SQLite store, to be used with LYRIC_STORE_PATH."""
+        copy_tables(DynamoStorage(), SQLiteStorage(path), tables or TABLES, progress=copy_progress)
+        click.echo('Tables copied to ' + path)
+
+    @storage.command('import')
+    @click.argument('path')
+    @click.option('--table', 'tables', multiple=True, type=click.Choice(TABLES),
+                  help='Table to copy. Defaults to all of them.')
+    def import_storage(path, tables):
+        """Copy the tables of a local SQLite store to DynamoDB."""
+        copy_tables(SQLiteStorage(path), DynamoStorage(), tables or TABLES, progress=copy_progress)
+        click.echo('Tables copied from ' + path)
@@ -0,0 +1,214 @@
+import hashlib
+import json
+import mmap
+import os
+import struct
+import threading
+from collections.abc import Mapping
+
+from app.helper_lyric_generator import phonetic_clean, phonetic_syllables
+
+# The phonetic corpus and the list of viable words are compiled by build_corpus() into a single binary file.
+# Workers mmap the file, so every gunicorn worker shares the same pages and nothing is parsed per process.
+#
+# Layout (all integers are little-endian):
+#   header:    magic, format version, number of tables                      <4sHH
+#   directory: per table, its name, the file offset of its offset table
+#              and its number of records                                    <16sII
+#   table:     (count + 1) uint32 file offsets, one per record plus the end of the last record,
+#              followed by the records. A record is key + b'\0' + value, and records are sorted by key
+#              so lookups are a binary search over the offset table.
+
+basedir = os.path.abspath(os.path.dirname(__file__))
+
+CORPUS_PATH = os.path.join(basedir, 'corpus.bin')
+PHONETIC_JSON = os.path.join(basedir, 'rap_phonetic_array.json')
+VIABLE_WORDS_JSON = os.path.join(basedir, 'main', 'viable_words.json')
+
+MAGIC = b'PNLA'
+VERSION = 2
+HEADER = struct.Struct('<4sHH')
+DIRECTORY_ENTRY = struct.Struct('<16sII')
+OFFSET = struct.Struct('<I')
+
+
+class SortedTable(Mapping):
+    """Read-only view of one table of a corpus file. Keys and values are str"""
+
+    def __init__(self, buf, start, count):
+        self._buf = buf
+        self._start = start
+        self._count = count
+
+    def _record(self, i):
+        begin, end = struct.unpack_from('<II', self._buf, self._start + 4 * i)
+        return self._buf[begin:end]
+
+    def key_at(self, i):
+        """Returns the i-th key, in sorted order"""
+        record = self._record(i)
+        return record[:record.index(b'\0')].decode('utf-8')
+
+    def value_at(self, i):
+        record = self._record(i)
+        return record[record.index(b'\0') + 1:].decode('utf-8')
+
+    def value_view(self, i):
+        """Returns the i-th value as a memoryview of the file, without copying or decoding it"""
+        begin, end = struct.unpack_from('<II', self._buf, self._start + 4 * i)
+        return memoryview(self._buf)[self._buf.find(b'\0', begin, end) + 1:end]
+
+    def index(self, key):
+        """Returns the position of key in the table, or -1 if key is not in the table"""
+        target = key.encode('utf-8')
+        lo, hi = 0, self._count - 1
+
+        while lo <= hi:
+            mid = (lo + hi) // 2
+            record = self._record(mid)
+            current = record[:record.index(b'\0')]
+
+            if current == target:
+                return mid
+            elif current < target:
+                lo = mid + 1
+            else:
+                hi = mid - 1
+
+        return -1
+
+    def __getitem__(self, key):
+        i = self.index(key)
+        if i == -1:
+            raise KeyError(key)
+        return self.value_at(i)
+
+    def __contains__(self, key):
+        return self.index(key) != -1
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self.key_at(i)
+
+    def items(self):
+        """Returns all (key, value) pairs in sorted order. Faster than looking up every key"""
+        offsets = struct.unpack_from('<{}I'.format(self._count + 1), self._buf, self._start)
+        data = self._buf[offsets[0]:offsets[-1]]
+        base = offsets[0]
+
+        items = []
+        for i in range(self._count):
+            key, value = data[offsets[i] - base:offsets[i + 1] - base].split(b'\0', 1)
+            items.append((key.decode('utf-8'), value.decode('utf-8')))
+        return items
+
+    def __len__(self):
+        return self._count
+
+
+class CorpusFile(object):
+    """Memory-maps a file written by write_corpus()"""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._digest = None
+
+        magic, version, num_tables = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('{} is not a version {} corpus file'.format(path, VERSION))
+
+        self.tables = {}
+        for i in range(num_tables):
+            name, start, count = DIRECTORY_ENTRY.unpack_from(self._mm, HEADER.size + i * DIRECTORY_ENTRY.size)
+            self.tables[name.rstrip(b'\0').decode('utf-8')] = SortedTable(self._mm, start, count)
+
+    def table(self, name):
+        return self.tables[name]
+
+    def digest(self):
+        """Returns a hash of the content of the file. Files written from the same tables have the same digest"""
+        if self._digest is None:
+            self._digest = hashlib.sha1(self._mm).hexdigest()
+        return self._digest
+
+
+def write_corpus(path, tables):
+    """Writes tables to path in the corpus format. tables maps a table name to a dictionary of str -> str
+    (or str -> bytes, for values read with SortedTable.value_view).
+    The file is written next to path and then renamed, so readers never see a partial file"""
+
+    names = sorted(tables)
+    position = HEADER.size + DIRECTORY_ENTRY.size * len(names)
+    directory = []
+    chunks = []
+
+    for name in names:
+        records = [key.encode('utf-8') + b'\0' + (value if isinstance(value, bytes) else value.encode('utf-8'))
+                   for key, value in sorted(tables[name].items(), key=lambda item: item[0].encode('utf-8'))]
+
+        directory.append(DIRECTORY_ENTRY.pack(name.encode('utf-8'), position, len(records)))
+        offset = position + OFFSET.size * (len(records) + 1)
+        offsets = []
+        for record in records:
+            offsets.append(OFFSET.pack(offset))
+            offset += len(record)
+        offsets.append(OFFSET.pack(offset))
+
+        chunks += offsets + records
+        position = offset
+
+    tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, len(names)))
+        f.write(b''.join(directory))
+        f.write(b''.join(chunks))
+    os.replace(tmp_path, path)
+
+
+def build_corpus(path=CORPUS_PATH, phonetic_json=PHONETIC_JSON, viable_words_json=VIABLE_WORDS_JSON):
+    """Compiles the phonetic corpus and the viable words list from their JSON sources into the corpus file.
+    Phonetics are normalized here, once: values are stored as 'phonetic\\0metaphone\\0syllables', where phonetic
+    is cleaned as phonetic_dist expects it and syllables are separated by spaces"""
+
+    with open(phonetic_json) as f:
+        phonetics = json.load(f)
+    with open(viable_words_json) as f:
+        viable_words = json.load(f)['words']
+
+    phonetic_table = {}
+    for word, info in phonetics.items():
+        # a few phonetics are stored as lists. phonetic_dist formats them with str() anyway
+        phonetic = info[0] if isinstance(info[0], str) else str(info[0])
+        cleaned = phonetic_clean(phonetic).replace("\'", "")
+        phonetic_table[word] = '\0'.join([cleaned, info[1], ' '.join(phonetic_syllables(phonetic))])
+
+    write_corpus(path, {
+        'phonetics': phonetic_table,
+        'viable_words': {word: '' for word in viable_words},
+    })
+
+
+_corpus = None
+_corpus_lock = threading.Lock()
+
+
+def get_corpus():
+    """Returns the corpus file shared by all threads of the process. The file is built from the JSON sources
+    if it does not exist yet (i.e. when running without 'flask corpus build') or if it is outdated"""
+    global _corpus
+
+    if _corpus is None:
+        with _corpus_lock:
+            if _corpus is None:
+                if not os.path.exists(CORPUS_PATH):
+                    build_corpus()
+
+                try:
+                    _corpus = CorpusFile(CORPUS_PATH)
+                except ValueError:
+                    # file was built by an older version of this module
+                    build_corpus()
+                    _corpus = CorpusFile(CORPUS_PATH)
+
+    return _corpus
@@ -0,0 +1,185 @@
+import atexit
+import sqlite3
+import threading
+from collections import Counter
+
+from flask import current_app
+
+from app.corpus import get_corpus
+from app.rhyme_distances import dist
+
+# dist() results are cached in a SQLite file shared by all workers, so popular pairs are computed once and survive
+# restarts. The cache is enabled by setting DIST_CACHE_PATH. Request counts and hit/miss totals are buffered in
+# each process and written every FLUSH_EVERY requests, so reads never wait on a write.
+#
+# Values are only valid for the corpus they were computed from. The digest of that corpus (CorpusFile.digest) is
+# stored with them, and they are dropped when a process finds another one (see sync_corpus).
+
+FLUSH_EVERY = 100
+
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS dist (
+    word_1 TEXT NOT NULL, word_2 TEXT NOT NULL, mode TEXT NOT NULL, value REAL NOT NULL,
+    PRIMARY KEY (word_1, word_2, mode)) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS requests (
+    word_1 TEXT NOT NULL, word_2 TEXT NOT NULL, mode TEXT NOT NULL, count INTEGER NOT NULL,
+    PRIMARY KEY (word_1, word_2, mode)) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT NOT NULL);
+'''
+
+
+def cache_key(word_1, word_2, alliteration=False, mode='chunk'):
+    """Returns the (word_1, word_2, mode) key of a dist() call. Words are not normalized, as dist() does not
+    normalize them either"""
+    return word_1, word_2, '{}-{}'.format('alliteration' if alliteration else 'rhyme', mode)
+
+
+class DistCache(object):
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+        # counters of this process, and the part of them not yet written to the file
+        self.hits = 0
+        self.misses = 0
+        self._pending_requests = Counter()
+        self._pending_hits = 0
+        self._pending_misses = 0
+        self._synced = False
+
+        self._connection().executescript(SCHEMA)
+        atexit.register(self.flush)
+
+    def _connection(self):
+        """sqlite3 connections cannot be shared between threads, so each thread gets its own"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            self._local.conn = conn
+        return conn
+
+    def get(self, key):
+        row = self._connection().execute(
+            'SELECT value FROM dist WHERE word_1 = ? AND word_2 = ? AND mode = ?', key).fetchone()
+        return None if row is None else row[0]
+
+    def put(self, key, value):
+        self._connection().execute('INSERT OR REPLACE INTO dist VALUES (?, ?, ?, ?)', key + (value,))
+
+    def sync_corpus(self, digest=None):
+        """Drops the cached values if they were computed from another corpus than the one with this digest (the
+        corpus of this process by default). Returns whether they were dropped"""
+        if digest is None:
+            digest = get_corpus().digest()
+
+        conn = self._connection()
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            row = conn.execute("SELECT value FROM meta WHERE name = 'corpus'").fetchone()
+            changed = row is None or row[0] != digest
+            if changed:
+                conn.execute('DELETE FROM dist')
+                conn.execute("INSERT OR REPLACE INTO meta VALUES ('corpus', ?)", (digest,))
+
+        self._synced = True
+        return changed
+
+    def dist(self, word_1, word_2, alliteration=False, mode='chunk'):
+        """Same as rhyme_distances.dist, served from the cache when possible"""
+        if not self._synced:
+            self.sync_corpus()
+
+        key = cache_key(word_1, word_2, alliteration, mode)
+        value = self.get(key)
+        hit = value is not None
+
+        if not hit:
+            value = dist(word_1, word_2, alliteration, mode)
+            self.put(key, value)
+
+        with self._lock:
+            self._pending_requests[key] += 1
+            if hit:
+                self.hits += 1
+                self._pending_hits += 1
+            else:
+                self.misses += 1
+                self._pending_misses += 1
+            flush = sum(self._pending_requests.values()) >= FLUSH_EVERY
+
+        if flush:
+            self.flush()
+
+        return value
+
+    def flush(self):
+        """Writes the buffered request counts and hit/miss totals to the file"""
+        with self._lock:
+            requests, self._pending_requests = self._pending_requests, Counter()
+            hits, misses = self._pending_hits, self._pending_misses
+            self._pending_hits = self._pending_misses = 0
+
+        if not requests:
+            return
+
+        conn = self._connection()
+        with conn:
+            conn.execute('BEGIN')
+            conn.executemany(
+                'INSERT INTO requests VALUES (?, ?, ?, ?) '
+                'ON CONFLICT (word_1, word_2, mode) DO UPDATE SET count = count + excluded.count',
+                [key + (count,) for key, count in requests.items()])
+            conn.executemany(
+                'INSERT INTO stats VALUES (?, ?) ON CONFLICT (name) DO UPDATE SET value = value + excluded.value',
+                [('hits', hits), ('misses', misses)])
+
+    def clear(self):
+        """Drops all cached values. Request counts are kept for warm_up()"""
+        self._connection().execute('DELETE FROM dist')
+
+    def most_requested(self, limit):
+        """Returns the limit most requested keys"""
+        return [tuple(row) for row in self._connection().execute(
+            'SELECT word_1, word_2, mode FROM requests ORDER BY count DESC LIMIT ?', (limit,))]
+
+    def warm_up(self, keys):
+        """Computes and stores the keys that are not cached yet. Returns the number of values computed"""
+        if not self._synced:
+            self.sync_corpus()
+
+        computed = 0
+        for key in keys:
+            if self.get(key) is None:
+                alliteration, mode = key[2].split('-')
+                self.put(key, dist(key[0], key[1], alliteration == 'alliteration', mode))
+                computed += 1
+        return computed
+
+    def stats(self):
+        """Hit rate of this process and of all processes since the cache file was created"""
+        self.flush()
+        conn = self._connection()
+        totals = dict(conn.execute('SELECT name, value FROM stats').fetchall())
+        total_hits, total_misses = totals.get('hits', 0), totals.get('misses', 0)
+
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / max(self.hits + self.misses, 1),
+            'total_hits': total_hits,
+            'total_misses': total_misses,
+            'total_hit_rate': total_hits / max(total_hits + total_misses, 1),
+            'size': conn.execute('SELECT COUNT(*) FROM dist').fetchone()[0],
+        }
+
+
+def cached_dist(word_1, word_2, alliteration=False, mode='chunk'):
+    """dist() going through the shared cache of the current app, if it has one"""
+    if not current_app.dist_cache:
+        return dist(word_1, word_2, alliteration, mode)
+    return current_app.dist_cache.dist(word_1, word_2, alliteration, mode)
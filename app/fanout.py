@@ -0,0 +1,32 @@
+import threading
+from flask import current_app, has_app_context, g
+
+THREAD_NAME_PREFIX = 'fanout'
+
+
+def fan_out(*calls):
+    """Runs independent calls concurrently on the app's thread pool and returns their results in order.
+    Each call is a function or a (function, arg1, arg2, ...) tuple. Calls run one after another when there is
+    no pool (FANOUT_WORKERS=0, or outside of an app context) and when called from a pool thread, since waiting
+    on the bounded pool from one of its own threads could deadlock"""
+
+    calls = [call if isinstance(call, tuple) else (call,) for call in calls]
+
+    if not has_app_context() or not current_app.fanout or \
+            threading.current_thread().name.startswith(THREAD_NAME_PREFIX):
+        return [call[0](*call[1:]) for call in calls]
+
+    app = current_app._get_current_object()
+    caller_g = g._get_current_object()
+
+    def run(call):
+        # each pool thread gets its own app context (and database session), but shares the caller's g
+        ctx = app.app_context()
+        ctx.g = caller_g
+        with ctx:
+            return call[0](*call[1:])
+
+    futures = [current_app.fanout.submit(run, call) for call in calls[1:]]
+    # the calling thread would be waiting anyway, so it runs the first call itself
+    results = [calls[0][0](*calls[0][1:])]
+    return results + [future.result() for future in futures]
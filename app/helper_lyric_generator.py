@@ -1,21 +1,24 @@
 
 
+# characters erased by phonetic_clean
+PHONETIC_CLEAN_TABLE = str.maketrans('', '', '[] ,-;')
+
+# characters erased from each syllable by phonetic_syllables
+SYLLABLE_CLEAN_TABLE = str.maketrans('', '', '[] -;\'"')
+
+
 def phonetic_clean(word: str):
     """
     This function formats the output phonetic by erasing the characters:
     , "]", ",", "-", " ", ";" from the output
     """
+    return word.translate(PHONETIC_CLEAN_TABLE)
 
-    initial_length = len(word)
-    modified_word = word
-    counter = 0
 
-    while (counter < initial_length):
-        current = modified_word[counter:counter + 1]
-        if (current == "[" or current == "]" or current == " " or
-                current == "," or current == "-" or current == ";"):
-            modified_word = modified_word[:counter] + modified_word[counter + 1:]
-            counter -= 1
-
-        counter += 1
-    return modified_word
\ No newline at end of file
+def phonetic_syllables(word: str):
+    """
+    This function splits a phonetic such as "[uh,bout]" or "['zag', 's']" into a tuple of syllables
+    without quotes, e.g. ('zag', 's'). Empty syllables are dropped
+    """
+    syllables = (syllable.translate(SYLLABLE_CLEAN_TABLE) for syllable in word.split(','))
+    return tuple(syllable for syllable in syllables if syllable)
@@ -0,0 +1,144 @@
+import logging
+import queue
+import threading
+import time
+from collections import deque
+
+from flask import current_app, has_app_context
+
+logger = logging.getLogger(__name__)
+
+# Work that should not hold up a request (refilling the candidate sentences of a song...) is queued on the app's
+# JobQueue (app.jobs) and run by a fixed number of worker threads (JOB_WORKERS). Each job runs in its own app context,
+# so it gets its own database session, removed when the job ends. At most JOB_QUEUE_SIZE jobs wait at a time, and a
+# job is not queued while one with the same key is waiting or running, so jobs with the same key never run at the
+# same time. On exit, waiting jobs are given JOB_DRAIN_TIMEOUT seconds to finish.
+
+THREAD_NAME_PREFIX = 'jobs'
+
+# number of recent jobs latencies are computed over
+LATENCY_WINDOW = 1000
+
+
+class JobQueue(object):
+
+    def __init__(self, app, workers=2, max_queued=100):
+        self.app = app
+        self.workers = workers
+        self._queue = queue.Queue(max_queued)
+        self._threads = []
+        # keys of the jobs waiting or running
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._closed = False
+
+        # totals since the app was created, and (seconds waiting, seconds running) of the last jobs
+        self.counts = {'queued': 0, 'done': 0, 'failed': 0, 'deduplicated': 0, 'rejected': 0}
+        self.running = 0
+        self._latencies = deque(maxlen=LATENCY_WINDOW)
+
+    def _start(self):
+        # threads are only started by the first job, most apps (tests, flask commands) never queue one
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._work, name='{}-{}'.format(THREAD_NAME_PREFIX, i), daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def submit(self, key, func, *args):
+        """Queues func(*args). Returns False if it was not queued, because a job with the same key is waiting or
+        running, the queue is full or the app is shutting down"""
+        with self._lock:
+            if self._closed:
+                return False
+            if key in self._pending:
+                self.counts['deduplicated'] += 1
+                return False
+
+            try:
+                self._queue.put_nowait((key, func, args, time.monotonic()))
+            except queue.Full:
+                self.counts['rejected'] += 1
+                logger.warning('Job queue full, %s dropped', key)
+                return False
+
+            self._pending.add(key)
+            self.counts['queued'] += 1
+            if not self._threads:
+                self._start()
+        return True
+
+    def _work(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+
+            key, func, args, queued_at = job
+            with self._lock:
+                self.running += 1
+
+            started_at = time.monotonic()
+            failed = False
+            try:
+                with self.app.app_context():
+                    func(*args)
+            except Exception:
+                failed = True
+                self.app.logger.exception('Job %s failed', key)
+            finally:
+                with self._lock:
+                    self._pending.discard(key)
+                    self.running -= 1
+                    self.counts['failed' if failed else 'done'] += 1
+                    self._latencies.append((started_at - queued_at, time.monotonic() - started_at))
+                logger.debug('Job %s ran in %.2f s, %d jobs waiting', key, time.monotonic() - started_at,
+                             self._queue.qsize())
+
+    def stats(self):
+        """Returns the counts of jobs, the queue depth and the p50 and p99 of the time the last jobs waited in the
+        queue and ran"""
+        with self._lock:
+            stats = dict(self.counts, depth=self._queue.qsize(), running=self.running)
+            latencies = list(self._latencies)
+
+        for i, name in enumerate(['wait', 'run']):
+            values = sorted(latency[i] for latency in latencies)
+            stats[name + '_p50'] = values[len(values) // 2] if values else 0
+            stats[name + '_p99'] = values[min(len(values) * 99 // 100, len(values) - 1)] if values else 0
+        return stats
+
+    def shutdown(self, timeout=30):
+        """Stops queuing jobs and waits up to timeout seconds for the queued ones to finish"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+
+        deadline = time.monotonic() + timeout
+        try:
+            # workers stop when they get None, after the jobs queued before it
+            for _ in self._threads:
+                self._queue.put(None, timeout=max(deadline - time.monotonic(), 0))
+        except queue.Full:
+            pass
+
+        for thread in self._threads:
+            thread.join(max(deadline - time.monotonic(), 0))
+
+        unfinished = self._queue.qsize() + self.running
+        if unfinished:
+            logger.warning('%d jobs unfinished at shutdown', unfinished)
+
+
+def on_worker():
+    """Returns whether the caller runs on a worker of a JobQueue, rather than inline in a request (see submit_job)"""
+    return threading.current_thread().name.startswith(THREAD_NAME_PREFIX + '-')
+
+
+def submit_job(key, func, *args):
+    """Queues func(*args) on the app's job queue, or runs it right away when there is none (JOB_WORKERS=0, or
+    outside of an app context). Returns False if the job was not queued, see JobQueue.submit"""
+    if not has_app_context() or not current_app.jobs:
+        func(*args)
+        return True
+    return current_app.jobs.submit(key, func, *args)
@@ -0,0 +1,86 @@
+import random
+from datetime import datetime, timedelta
+
+from app import db
+from app.models import Songs
+from app.main.sentence_generator import populate_custom_song
+
+# In the custom mode the lines of a song are taken from the related candidates of the song, which are split in two
+# pools (thread False and True). Lines are taken from the active one (Songs.active_pool) while the other one, on
+# standby, is refilled by a job (populate_custom_song). The standby pool is refilled once both pools are down to
+# REFILL_LOW_WATERMARK unused candidates, and the pools are swapped when the active one runs out.
+#
+# Requests mark candidates as used and move the pointer. Jobs insert new candidates after the last one of their pool
+# (see Songs.update_related) and write no column of the song but refill_requested_at and the legacy copy of the pool
+# they refill (see SongState.legacy_columns), which the next flush of that pool writes again. refill_requested_at
+# marks a pending refill: it is set with a conditional UPDATE, so only one request of all workers queues a refill,
+# and cleared by the job when it ends. The mark is committed before the job is queued, so the job never clears it
+# before it is set. Marks older than REFILL_TIMEOUT seconds (a worker that died) are ignored.
+
+REFILL_LOW_WATERMARK = 5
+REFILL_TIMEOUT = 600
+
+
+class CandidatePool(object):
+
+    def __init__(self, song, low_watermark=REFILL_LOW_WATERMARK):
+        self.song = song
+        self.low_watermark = low_watermark
+
+    @property
+    def active(self):
+        """thread of the pool lines are taken from"""
+        return bool(self.song.active_pool)
+
+    @property
+    def standby(self):
+        return not self.active
+
+    def unused(self, thread):
+        """Returns the positions of the unused candidates of a pool"""
+        return [item[1] for item in self.song.non_used(thread=thread)]
+
+    def refill(self, thread):
+        """Queues a refill of a pool, unless one is pending for the song. Returns whether it was queued"""
+        now = datetime.utcnow()
+        expired = now - timedelta(seconds=REFILL_TIMEOUT)
+        if self.song.refill_requested_at is not None and self.song.refill_requested_at > expired:
+            return False
+
+        # the song is not updated through the session, the mark is not read from it again
+        claimed = Songs.query.filter(Songs.id == self.song.id, db.or_(Songs.refill_requested_at.is_(None),
+                                                                      Songs.refill_requested_at <= expired)) \
+            .update({'refill_requested_at': now}, synchronize_session=False)
+        if not claimed:
+            return False
+        # this commits what the request changed so far too
+        db.session.commit()
+
+        if not populate_custom_song(self.song.about_syns(), self.song.id, thread=thread):
+            Songs.query.filter_by(id=self.song.id).update({'refill_requested_at': None}, synchronize_session=False)
+            db.session.commit()
+            return False
+        return True
+
+    def swap(self):
+        self.song.active_pool = self.standby
+
+    def pop(self, line):
+        """Marks a random unused candidate of the active pool as used in line (starting at 1) and returns it (a
+        RelatedCandidate). When the active pool is empty it is refilled and the pools are swapped first. Returns None
+        if both are empty"""
+        unused = self.unused(self.active)
+        if not unused:
+            self.refill(self.active)
+            self.swap()
+            unused = self.unused(self.active)
+            if not unused:
+                return None
+
+        thread = self.active
+        picked = random.choice(unused)
+        self.song.update_related_id(id=picked, action='used', line_being_used=line, thread=thread)
+
+        if len(unused) - 1 <= self.low_watermark and len(self.unused(self.standby)) <= self.low_watermark:
+            self.refill(self.standby)
+        return self.song._related(picked, thread=thread)
@@ -4,11 +4,8 @@ from wtforms import StringField, SubmitField, TextAreaField, BooleanField, Integ
 from wtforms.validators import ValidationError, DataRequired, Length
 from flask_babel import _, lazy_gettext as _l
 from app.models import User
-import boto3
 from markupsafe import Markup
-
-dynamodb = boto3.resource("dynamodb")
-rhyme_table = dynamodb.Table("Rhyme")
+from app.main.rhyme_repository import rhyme_repository
 
 class EditProfileForm(FlaskForm):
     username = StringField(_l('Username'), validators=[DataRequired()])
@@ -59,16 +56,10 @@ class JinniBlankCanvasForm(FlaskForm):
             raise ValidationError('Please type a word.')
             """
         if req_word:
-            try:
-                response = rhyme_table.get_item(
-                    Key={
-                        'id': req_word
-                    }
-                )
-
-                return response['Item']['rhymes']
-            except KeyError:
+            rhymes = rhyme_repository.attribute(req_word, 'rhymes')
+            if rhymes is None:
                 raise ValidationError(req_word + ' is not currently in the database')
+            return rhymes
 
 
 
@@ -89,16 +80,10 @@ class JinniCustomSong(FlaskForm):
         if not req_word:
             raise ValidationError('Please type a word.')
 
-        try:
-            response = rhyme_table.get_item(
-                Key={
-                    'id': req_word
-                }
-            )
-
-            return response['Item']['rhymes']
-        except KeyError:
+        rhymes = rhyme_repository.attribute(req_word, 'rhymes')
+        if rhymes is None:
             raise ValidationError(req_word + ' is not currently in the database')
+        return rhymes
 
 class DefZeroProb(FlaskForm):
 
@@ -0,0 +1,197 @@
+import bisect
+import copy
+import itertools
+import random
+import threading
+import time
+from collections import OrderedDict
+
+import numpy as np
+from flask import g, has_app_context
+
+from app.storage import storage
+
+# Items of the Rhyme table are read by many helpers for the same word during one request (rhymes, sent_ids, syns,
+# validation of the forms...). RhymeRepository fetches each item once and keeps it in a size-bounded LRU cache whose
+# entries expire after a TTL, so changes made by other workers are eventually seen.
+
+
+class RhymeRepository(object):
+
+    def __init__(self, table, maxsize=4096, ttl=300):
+        self.table = table
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+        # totals since the process started
+        self.calls = 0
+        self.calls_saved = 0
+
+    def _count(self, saved):
+        with self._lock:
+            if saved:
+                self.calls_saved += 1
+            else:
+                self.calls += 1
+
+        if has_app_context():
+            name = 'rhyme_calls_saved' if saved else 'rhyme_calls'
+            setattr(g, name, g.get(name, 0) + 1)
+
+    def _entry(self, word):
+        """Returns the cache entry of word=word, fetching the item if it is not cached or expired"""
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._items.get(word)
+            if entry is not None and entry[0] > now:
+                self._items.move_to_end(word)
+            else:
+                entry = None
+
+        if entry is not None:
+            self._count(saved=True)
+            return entry
+
+        item = self.table.get_item(word)
+        self._count(saved=False)
+
+        # an entry is (expiry time, item, values derived from the item). Words that are not in the table are cached
+        # as well, they are looked up as often
+        entry = (now + self.ttl, item, {})
+        with self._lock:
+            self._items[word] = entry
+            self._items.move_to_end(word)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+        return entry
+
+    def get(self, word):
+        """Returns the Rhyme item of word=word, or None if word is not in the table. Items are copies, so callers
+        can modify them"""
+        return copy.deepcopy(self._entry(word)[1])
+
+    def derived(self, word, name, build):
+        """Returns build(item) for the item of word=word. The result is computed once per cached item and shared, so
+        callers must not modify it"""
+        expires, item, derived = self._entry(word)
+        if name not in derived:
+            derived[name] = build(item)
+        return derived[name]
+
+    def attribute(self, word, key, default=None):
+        """Returns attribute key of the item of word=word, or default if the item or the attribute do not exist.
+        Only the attribute is copied"""
+        item = self._entry(word)[1]
+        if item is None or key not in item:
+            return default
+        return copy.deepcopy(item[key])
+
+    def __contains__(self, word):
+        return self._entry(word)[1] is not None
+
+    def update(self, word, key, value):
+        """Sets attribute key of the item of word=word to value and drops the cached item"""
+        self.table.update_item(word, key, value)
+        self.invalidate(word)
+
+    def invalidate(self, word):
+        with self._lock:
+            self._items.pop(word, None)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+
+class RhymeRanges(object):
+    """The rhymes of a word that have sentences, with their id ranges and the cumulative number of sentences up to
+    each of them, so a rhyming sentence is sampled with one bisection and no retries"""
+
+    def __init__(self, words, ranges):
+        self.words = words
+        self.ranges = ranges
+        self.cumulative = list(itertools.accumulate(hi - lo + 1 for lo, hi in ranges))
+
+        # the same ranges sorted by first id, for links_in_ranges
+        bounds = np.array(sorted(ranges), dtype=np.int64).reshape(-1, 2)
+        self.starts = bounds[:, 0]
+        self.ends = bounds[:, 1]
+
+    @classmethod
+    def from_rhymes(cls, rhymes):
+        """Builds the ranges from the rhymes attribute of a Rhyme item, i.e. a dictionary rhyme -> [first id, last id]
+        where the list is empty for rhymes without sentences"""
+        rhymes = sorted((word, [int(ids[0]), int(ids[1])]) for word, ids in rhymes.items()
+                        if ids and int(ids[1]) >= int(ids[0]))
+        return cls([word for word, ids in rhymes], [ids for word, ids in rhymes])
+
+    @classmethod
+    def from_item(cls, item):
+        """Builds the ranges of a Rhyme item, from its precomputed rhyme_ranges attribute if it has one.
+        Returns None if item is None"""
+        if item is None:
+            return None
+        if 'rhyme_ranges' in item:
+            ranges = item['rhyme_ranges']
+            return cls(ranges['words'], [[int(lo), int(hi)] for lo, hi in ranges['ranges']])
+        return cls.from_rhymes(item.get('rhymes', {}))
+
+    def to_attribute(self):
+        """Returns the value stored in the rhyme_ranges attribute"""
+        return {'words': self.words, 'ranges': self.ranges}
+
+    def __len__(self):
+        return len(self.words)
+
+    def sample(self):
+        """Returns a random (rhyme, sentence id). Every sentence of every rhyme is equally likely"""
+        r = random.randrange(self.cumulative[-1])
+        i = bisect.bisect_right(self.cumulative, r)
+        return self.words[i], self.ranges[i][1] - (self.cumulative[i] - 1 - r)
+
+
+def links_array(links):
+    """Converts the links of a LyricLink page to the sorted array of the sentence ids they point to"""
+    # float is the fastest conversion of Decimal, and exact for ids below 2 ** 53. -1 offset since ids in lyric_link
+    # are off by 1
+    ids = np.fromiter(map(float, links), dtype=np.float64, count=len(links)).astype(np.int64)
+    return np.sort(ids) - 1
+
+
+def links_in_ranges(links, ranges):
+    """Returns all the sentence ids of links that are in one of the id ranges of ranges (a RhymeRanges), in
+    increasing order. links is an array from links_array, or the links of a page as they are read (sorted Decimals),
+    which are bisected without converting them"""
+
+    if not isinstance(links, np.ndarray):
+        # -1 offset since ids in lyric_link are off by 1
+        hits = []
+        for start, end in zip(ranges.starts.tolist(), ranges.ends.tolist()):
+            hits.extend(links[bisect.bisect_left(links, start + 1):bisect.bisect_right(links, end + 1)])
+        return np.array([int(link) - 1 for link in hits], dtype=np.int64)
+
+    # links[lo[i]:hi[i]] are the links inside the i-th range
+    lo = np.searchsorted(links, ranges.starts, side='left')
+    hi = np.searchsorted(links, ranges.ends, side='right')
+    counts = hi - lo
+    total = counts.sum()
+    if total == 0:
+        return links[:0]
+
+    # gathers all the slices at once: position k of the output is lo[i] + (k - first output position of range i)
+    first = np.cumsum(counts) - counts
+    hits = links[np.repeat(lo - first, counts) + np.arange(total)]
+    # ranges of different rhymes never overlap, so hits are only sorted to return them in order
+    return np.unique(hits)
+
+
+def request_stats():
+    """Returns the number of Rhyme table calls made and saved by the cache during the current request"""
+    return {'calls': g.get('rhyme_calls', 0), 'saved': g.get('rhyme_calls_saved', 0)}
+
+
+rhyme_repository = RhymeRepository(storage.table("Rhyme"))
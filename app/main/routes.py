@@ -10,18 +10,16 @@ from app.main.forms import EditProfileForm, PostForm, \
 from app.models import User, Post, Songs
 from app.translate import translate
 from app.main import bp
-from app.rhyme_distances import dist
+from app.dist_cache import cached_dist
 from app.main.sentence_generator import generate_sentence, find_suggestions, generate_sentence_lastword, \
-    change_sent, sentence_related, update_syns_rank, list_of_similar_words_updated, string_to_dic, \
-    populate_custom_song, synonym_scrape, get_sent_with_rhyme, get_sent
+    change_sent, sentence_related, update_syns_rank, list_of_similar_words_updated, \
+    populate_custom_song, synonym_scrape, get_sent
 from app.main.jinni_custom_song_helper import get_related
+from app.main.rhyme_repository import rhyme_repository, request_stats
+from app.main.sent_prefetch import sent_prefetch
 import re
 import random
 import time
-import boto3
-
-dynamodb = boto3.resource("dynamodb")
-rhyme_table = dynamodb.Table("Rhyme")
 
 @bp.before_app_request
 def before_request():
@@ -32,6 +30,15 @@ def before_request():
     g.locale = str(get_locale())
 
 
+@bp.after_app_request
+def after_request(response):
+    stats = request_stats()
+    if stats['calls'] or stats['saved']:
+        current_app.logger.debug('%s: %d Rhyme table calls, %d saved by cache', request.path,
+                                 stats['calls'], stats['saved'])
+    return response
+
+
 @bp.route('/', methods = ['GET', 'POST'])
 def main():
     return render_template('main.html')
@@ -155,6 +162,22 @@ def explore():
 
 
 
+@bp.route('/jinni_rhyme_distance', methods=['GET', 'POST'])
+def jinni_rhyme_distance():
+
+    form = JinniRhymeDistanceForm()
+    # -4 means nothing was asked yet, see the template
+    output, word_1, word_2 = -4, '', ''
+
+    if form.validate_on_submit():
+        word_1 = form.word_1.data.strip().lower()
+        word_2 = form.word_2.data.strip().lower()
+        output = cached_dist(word_1, word_2, alliteration=form.rhyme_at_start.data)
+
+    return render_template('jinni/jinni_rhyme_distance.html', form=form, output=output, word_1=word_1,
+                           word_2=word_2)
+
+
 @bp.route('/jinni_line_edit_custom/<song_id>/<line_id>', methods=['GET', 'POST'])
 def jinni_line_edit_custom(song_id, line_id):
 
@@ -162,24 +185,11 @@ def jinni_line_edit_custom(song_id, line_id):
     line_id = int(line_id)
 
     curr_song = Songs.query.filter_by(id=song_id).first()
-    lyrics = curr_song.part_1
-
-    all_index = [m.start() for m in re.finditer(';', lyrics)]
+    lyric = curr_song.lyric()
 
-    if len(all_index) == line_id + 1:
-        curr_line = lyrics[all_index[line_id] + 1:]
-    else:
-        curr_line = lyrics[all_index[line_id]+1:all_index[line_id+1]]
-
-    try:
-        prec_line = lyrics[all_index[line_id-1]:all_index[line_id]]
-    except IndexError:
-        prec_line = ''
-
-    try:
-        suc_line = lyrics[all_index[line_id+1]:all_index[line_id+2]]
-    except IndexError:
-        suc_line = ''
+    curr_line = lyric[line_id]
+    prec_line = lyric[line_id - 1] if line_id > 0 else ''
+    suc_line = lyric[line_id + 1] if line_id + 1 < len(lyric) else ''
 
 
     # find new suggestions for line
@@ -195,24 +205,11 @@ def jinni_line_edit(song_id, line_id):
     line_id = int(line_id)
 
     curr_song = Songs.query.filter_by(id=song_id).first()
-    lyrics = curr_song.part_1
-
-    all_index = [m.start() for m in re.finditer(';', lyrics)]
-
-    if len(all_index) == line_id + 1:
-        curr_line = lyrics[all_index[line_id] + 1:]
-    else:
-        curr_line = lyrics[all_index[line_id]+1:all_index[line_id+1]]
-
-    try:
-        prec_line = lyrics[all_index[line_id-1]:all_index[line_id]]
-    except IndexError:
-        prec_line = ''
+    lyric = curr_song.lyric()
 
-    try:
-        suc_line = lyrics[all_index[line_id+1]:all_index[line_id+2]]
-    except IndexError:
-        suc_line = ''
+    curr_line = lyric[line_id]
+    prec_line = lyric[line_id - 1] if line_id > 0 else ''
+    suc_line = lyric[line_id + 1] if line_id + 1 < len(lyric) else ''
 
 
     # find new suggestions for line
@@ -251,7 +248,7 @@ def jinni_use_syn(syn, rhyme_with_line, song_id):
                 syn = ''
 
 
-        new_sent = get_sent(word=syn, rhyme=rhyme_word)
+        new_sent = sent_prefetch.get_sent(word=syn, rhyme=rhyme_word)
 
         if new_sent != 1:
 
@@ -262,7 +259,7 @@ def jinni_use_syn(syn, rhyme_with_line, song_id):
         return redirect(url_for('main.jinni_blank_canvas', song_id=song.id, timeout=1))
 
     if rhyme_with_line == '-1':
-        song = Songs(part_1='', part_1_ids='')
+        song = Songs()
         db.session.add(song)
         song.clear_lyrics()
         song.about = syn
@@ -271,7 +268,7 @@ def jinni_use_syn(syn, rhyme_with_line, song_id):
     elif rhyme_with_line == '-2':
         song = Songs.query.filter_by(id=song_id).first()
 
-    new_sent = get_sent(word=syn)
+    new_sent = sent_prefetch.get_sent(word=syn)
 
     if new_sent != 1:
 
@@ -315,7 +312,7 @@ def jinni_implement_recom(recom, song_id, line_id):
     # recom comes from database
     elif recom.find('!-!') != -1:
         sent = recom[:recom.find('!-!')]
-        id = recom[recom.find('!-!') + 2:]
+        id = recom[recom.find('!-!') + 3:]
 
         song.update_line_id(line_id, str(id))
         song.update_line(line_id, sent)
@@ -382,7 +379,7 @@ def jinni_main():
 
 
         req_word = custom_song_form.req_word.data.lower()
-        song = Songs(part_1='', part_1_ids='')
+        song = Songs()
         db.session.add(song)
         song.clear_lyrics()
 
@@ -407,7 +404,7 @@ def jinni_blank_canvas(song_id, timeout):
     #related = song.get_line_related(song.get_num_lines()-1)
     blank_canvas_form = JinniBlankCanvasForm()
 
-    lyric_clean = song.part_1.split(';')[1:]
+    lyric_clean = song.lyric()
     synonyms = []
     synonyms_rhyme = []
     rhyme_with_line = -2
@@ -433,17 +430,10 @@ def jinni_blank_canvas(song_id, timeout):
 
         # checks if req_word is in database
         if blank_canvas_form.req_word.data:
-            try:
-                response = rhyme_table.get_item(
-                    Key={
-                        'id': str(blank_canvas_form.req_word.data).lower()
-                    }
-                )
-
-                response['Item']['rhymes']
+            if rhyme_repository.attribute(str(blank_canvas_form.req_word.data).lower(), 'rhymes') is not None:
                 req_word_allowed = True
 
-            except KeyError:
+            else:
                 blank_canvas_form.req_word.errors = [str(blank_canvas_form.req_word.data) +
                                                      ' is not currently in the database']
                 synonyms = synonym_scrape(blank_canvas_form.req_word.data.lower())
@@ -452,17 +442,10 @@ def jinni_blank_canvas(song_id, timeout):
 
         if blank_canvas_form.rhyme_with_line.data and not is_int:
 
-            try:
-                response = rhyme_table.get_item(
-                    Key={
-                        'id': blank_canvas_form.rhyme_with_line.data.lower()
-                    }
-                )
-
-                response['Item']['rhymes']
+            if rhyme_repository.attribute(blank_canvas_form.rhyme_with_line.data.lower(), 'rhymes') is not None:
                 req_rhyme_allowed = True
 
-            except KeyError:
+            else:
                 blank_canvas_form.rhyme_with_line.errors = [str(blank_canvas_form.rhyme_with_line.data) +
                                                             ' is not currently in the database']
                 synonyms_rhyme = synonym_scrape(blank_canvas_form.rhyme_with_line.data.lower())
@@ -470,7 +453,7 @@ def jinni_blank_canvas(song_id, timeout):
 
         if not req_word_allowed or not req_rhyme_allowed:
 
-            lyric_clean = song.part_1.split(';')[1:]
+            lyric_clean = song.lyric()
             return render_template('jinni/jinni_blank_canvas.html', new_line_form=blank_canvas_form,
                                    lyric=lyric_clean,
                                    song=song, synonyms=synonyms, synonyms_rhyme=synonyms_rhyme,
@@ -493,31 +476,31 @@ def jinni_blank_canvas(song_id, timeout):
 
                 # check if req_word is in database
                 if blank_canvas_form.req_word.data and req_word_allowed:
-                    new_sent = get_sent(word=str(blank_canvas_form.req_word.data).lower(),
-                                                       rhyme=rhyme_word)
+                    new_sent = sent_prefetch.get_sent(word=str(blank_canvas_form.req_word.data).lower(),
+                                                         rhyme=rhyme_word)
                 # generate sentence based only on rhyme
                 else:
-                    new_sent = get_sent(rhyme=rhyme_word)
+                    new_sent = sent_prefetch.get_sent(rhyme=rhyme_word)
 
         else:
             if blank_canvas_form.rhyme_with_line.data:
 
                 if blank_canvas_form.req_word.data and req_word_allowed:
                     if req_rhyme_allowed:
-                        new_sent = get_sent(word=str(blank_canvas_form.req_word.data).lower(),
-                                                           rhyme=str(blank_canvas_form.rhyme_with_line.data).lower())
+                        new_sent = sent_prefetch.get_sent(word=str(blank_canvas_form.req_word.data).lower(),
+                                                             rhyme=str(blank_canvas_form.rhyme_with_line.data).lower())
 
                 # TODO maybe delete this
                 else:
                     if req_rhyme_allowed:
-                        new_sent = get_sent(rhyme=str(blank_canvas_form.rhyme_with_line.data).lower())
+                        new_sent = sent_prefetch.get_sent(rhyme=str(blank_canvas_form.rhyme_with_line.data).lower())
 
             else:
                 if blank_canvas_form.req_word.data and req_word_allowed:
-                    new_sent = get_sent(word=str(blank_canvas_form.req_word.data).lower())
+                    new_sent = sent_prefetch.get_sent(word=str(blank_canvas_form.req_word.data).lower())
 
                 elif not blank_canvas_form.req_word.data:
-                    new_sent = get_sent()
+                    new_sent = sent_prefetch.get_sent()
 
         # timeout
         if new_sent == 1:
@@ -539,7 +522,7 @@ def jinni_blank_canvas(song_id, timeout):
             song.update_lyric(new_sent, related)
             db.session.commit()
 
-        lyric_clean = song.part_1.split(';')[1:]
+        lyric_clean = song.lyric()
         return render_template('jinni/jinni_blank_canvas.html', new_line_form=blank_canvas_form,
                                lyric=lyric_clean,
                                song=song, synonyms=synonyms, synonyms_rhyme=synonyms_rhyme,
@@ -0,0 +1,126 @@
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+
+from flask import current_app, has_app_context
+
+from app.main.sentence_generator import get_sent
+
+logger = logging.getLogger(__name__)
+
+# get_sent reads DynamoDB for up to GET_SENT_DEADLINE seconds, and adding a line to a song used to wait on it. The
+# prefetcher keeps a few sentences ready for each (word, rhyme) songs ask for, so adding a line only pops one. After
+# every pop the queue is refilled in the background on the app's prefetch pool (PREFETCH_WORKERS, 0 disables it).
+# Queues are dropped once unused for PREFETCH_IDLE seconds and at most PREFETCH_KEYS of them are kept, so memory is
+# bounded by PREFETCH_KEYS * PREFETCH_DEPTH sentences.
+
+THREAD_NAME_PREFIX = 'prefetch'
+
+PREFETCH_DEPTH = 3
+PREFETCH_KEYS = 1000
+PREFETCH_IDLE = 900
+
+
+class SentPrefetcher(object):
+
+    def __init__(self, depth=PREFETCH_DEPTH, max_keys=PREFETCH_KEYS, idle=PREFETCH_IDLE):
+        self.depth = depth
+        self.max_keys = max_keys
+        self.idle = idle
+
+        # (word, rhyme) -> [last time asked for, deque of sentences], least recently asked for first
+        self._queues = OrderedDict()
+        self._refilling = set()
+        self._lock = threading.Lock()
+
+        # totals since the process started
+        self.hits = 0
+        self.misses = 0
+
+    def _expire(self, now):
+        while self._queues and now - next(iter(self._queues.values()))[0] >= self.idle:
+            self._queues.popitem(last=False)
+
+    def get_sent(self, word='', rhyme=''):
+        """Same as get_sent(word=word, rhyme=rhyme), but served from the queue of (word, rhyme) when it has a
+        sentence ready. The queue is then refilled in the background"""
+        key = (word, rhyme)
+        now = time.monotonic()
+
+        with self._lock:
+            self._expire(now)
+            entry = self._queues.get(key)
+            if entry is None:
+                entry = self._queues[key] = [now, deque()]
+                while len(self._queues) > self.max_keys:
+                    self._queues.popitem(last=False)
+            entry[0] = now
+            self._queues.move_to_end(key)
+
+            sent = entry[1].popleft() if entry[1] else None
+            if sent is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        if sent is None:
+            sent = get_sent(word=word, rhyme=rhyme)
+
+        # 1 means there is no such sentence, there is nothing to prefetch either
+        if sent != 1:
+            self._schedule(key)
+        return sent
+
+    def _schedule(self, key):
+        if not has_app_context() or not current_app.prefetch:
+            return
+
+        with self._lock:
+            if key in self._refilling:
+                return
+            self._refilling.add(key)
+
+        current_app.prefetch.submit(self._refill, current_app._get_current_object(), key)
+
+    def _refill(self, app, key):
+        try:
+            with app.app_context():
+                while True:
+                    with self._lock:
+                        entry = self._queues.get(key)
+                        if entry is None or len(entry[1]) >= self.depth:
+                            return
+
+                    sent = get_sent(word=key[0], rhyme=key[1])
+                    if sent == 1:
+                        return
+
+                    with self._lock:
+                        # the queue may have expired while get_sent ran
+                        if self._queues.get(key) is entry:
+                            entry[1].append(sent)
+        except Exception:
+            logger.exception('Could not prefetch sentences for %s', key)
+        finally:
+            with self._lock:
+                self._refilling.discard(key)
+
+    def queued(self, word='', rhyme=''):
+        """Number of sentences ready for (word, rhyme)"""
+        with self._lock:
+            entry = self._queues.get((word, rhyme))
+            return 0 if entry is None else len(entry[1])
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'hit_rate': self.hits / max(self.hits + self.misses, 1),
+                    'keys': len(self._queues), 'sentences': sum(len(sents) for _, sents in self._queues.values())}
+
+    def clear(self):
+        with self._lock:
+            self._queues.clear()
+
+
+sent_prefetch = SentPrefetcher()
@@ -1,13289 +1,205 @@
+import bisect
+import logging
 import random
-import boto3
 import time
-from boto3.dynamodb.conditions import Key
-from botocore import exceptions
 import re
 import operator
 from decimal import Decimal
 import ast
-from threading import Thread
+from threading import Lock
+from collections import OrderedDict
 from app.models import Songs
 from app import db
-from flask import redirect, url_for
-import json
-
-dynamodb = boto3.resource("dynamodb")
-lyric_table = dynamodb.Table("Lyric")
-lyrics_table = dynamodb.Table("Lyrics")
-rhyme_table = dynamodb.Table("Rhyme")
-lyric_link_table = dynamodb.Table("LyricLink")
-
-viable_words = {
-  "words": [
-    "a",
-    "aa",
-    "aaa",
-    "aah",
-    "abandon",
-    "abandoned",
-    "abc",
-    "abdomen",
-    "abel",
-    "abide",
-    "ability",
-    "able",
-    "aboard",
-    "abort",
-    "abortion",
-    "abortions",
-    "about",
-    "above",
-    "abracadabra",
-    "abroad",
-    "abs",
-    "absence",
-    "absent",
-    "absolutely",
-    "absurd",
-    "abundance",
-    "abuse",
-    "abusers",
-    "abusing",
-    "abusive",
-    "ac",
-    "academy",
-    "acapella",
-    "accent",
-    "accept",
-    "acceptance",
-    "accepted",
-    "accepting",
-    "access",
-    "accident",
-    "accidentally",
-    "accidents",
-    "accolades",
-    "accomplish",
-    "accomplished",
-    "accord",
-    "according",
-    "accordingly",
-    "accordion",
-    "account",
-    "accountant",
-    "accountants",
-    "accounts",
-    "accurate",
-    "accused",
-    "accustomed",
-    "ace",
-    "aces",
-    "ache",
-    "achieve",
-    "achievement",
-    "achilles",
-    "aching",
-    "acid",
-    "acknowledge",
-    "acne",
-    "acquainted",
-    "acquire",
-    "acre",
-    "acres",
-    "acrobat",
-    "acrobats",
-    "across",
-    "act",
-    "acted",
-    "acting",
-    "action",
-    "actions",
-    "activated",
-    "active",
-    "activist",
-    "activists",
-    "activities",
-    "activity",
-    "actor",
-    "actors",
-    "actress",
-    "actresses",
-    "acts",
-    "actual",
-    "actually",
-    "acura",
-    "ad",
-    "adage",
-    "adam",
-    "adapt",
-    "add",
-    "added",
-    "adderall",
-    "addict",
-    "addicted",
-    "addiction",
-    "addictive",
-    "addicts",
-    "adding",
-    "additional",
-    "address",
-    "addressing",
-    "addy",
-    "addys",
-    "adi",
-    "adidas",
-    "adios",
-    "adjust",
-    "adjusting",
-    "admiration",
-    "admire",
-    "admired",
-    "admiring",
-    "admit",
-    "admitted",
-    "admitting",
-    "adolescence",
-    "adolescent",
-    "adonis",
-    "adore",
-    "adrenaline",
-    "ads",
-    "advance",
-    "advanced",
-    "advances",
-    "advantage",
-    "adventure",
-    "adversity",
-    "advice",
-    "advil",
-    "advise",
-    "advised",
-    "aea",
-    "aerosol",
-    "afar",
-    "affair",
-    "affairs",
-    "affect",
-    "affection",
-    "affiliated",
-    "afford",
-    "affronted",
-    "afghanistan",
-    "afloat",
-    "afraid",
-    "africa",
-    "african",
-    "africans",
-    "afro",
-    "afros",
-    "after",
-    "afterlife",
-    "aftermath",
-    "afternoon",
-    "afternoons",
-    "again",
-    "against",
-    "age",
-    "agenda",
-    "agent",
-    "agents",
-    "ages",
-    "aggravated",
-    "aggression",
-    "aggressive",
-    "agitated",
-    "ago",
-    "agony",
-    "agree",
-    "agreed",
-    "agreement",
-    "ah",
-    "ahead",
-    "ahem",
-    "ai",
-    "aid",
-    "aids",
-    "aight",
-    "aim",
-    "aimed",
-    "aiming",
-    "ain",
-    "air",
-    "aired",
-    "aires",
-    "airline",
-    "airplane",
-    "airport",
-    "airports",
-    "airs",
-    "airwaves",
-    "aisle",
-    "ajax",
-    "ak",
-    "aka",
-    "akon",
-    "aks",
-    "al",
-    "alabama",
-    "aladdin",
-    "alarm",
-    "alarms",
-    "alaska",
-    "albino",
-    "album",
-    "albums",
-    "alcohol",
-    "alcoholic",
-    "alcoholics",
-    "alert",
-    "alexander",
-    "alfred",
-    "ali",
-    "alias",
-    "alibis",
-    "alicia",
-    "alien",
-    "alienated",
-    "aliens",
-    "aligned",
-    "alignment",
-    "alike",
-    "alive",
-    "all",
-    "allah",
-    "allegations",
-    "allegiance",
-    "allen",
-    "aller",
-    "allergic",
-    "allergies",
-    "alley",
-    "alleys",
-    "alliance",
-    "alligator",
-    "alligators",
-    "allow",
-    "allowance",
-    "allowed",
-    "allure",
-    "ally",
-    "almanac",
-    "almighty",
-    "almost",
-    "alone",
-    "along",
-    "alpha",
-    "alphabet",
-    "alphabets",
-    "already",
-    "alright",
-    "also",
-    "altar",
-    "alter",
-    "altitude",
-    "aluminum",
-    "alumni",
-    "always",
-    "am",
-    "amaretto",
-    "amateur",
-    "amateurs",
-    "amaze",
-    "amazed",
-    "amazing",
-    "amazon",
-    "amber",
-    "ambiance",
-    "ambidextrous",
-    "ambition",
-    "ambitions",
-    "ambitious",
-    "ambulance",
-    "amen",
-    "amenities",
-    "america",
-    "american",
-    "americaner",
-    "americans",
-    "amigo",
-    "amigos",
-    "ammo",
-    "ammunition",
-    "amnesia",
-    "amongst",
-    "amor",
-    "amount",
-    "amounts",
-    "amp",
-    "amphetamine",
-    "amphetamines",
-    "amsterdam",
-    "amusing",
-    "an",
-    "anaconda",
-    "anal",
-    "analyze",
-    "anatomy",
-    "ancestors",
-    "anchor",
-    "and",
-    "andale",
-    "anderson",
-    "andrew",
-    "anemic",
-    "aner",
-    "anesthesia",
-    "angel",
-    "angelina",
-    "angels",
-    "anger",
-    "angle",
-    "angles",
-    "angry",
-    "angus",
-    "ani",
-    "animal",
-    "animals",
-    "animated",
-    "animosity",
-    "anita",
-    "ankle",
-    "ankles",
-    "anna",
-    "anniversary",
-    "announcement",
-    "annoying",
-    "anonymous",
-    "another",
-    "answer",
-    "answered",
-    "answering",
-    "answers",
-    "ant",
-    "antarctica",
-    "antenna",
-    "antennas",
-    "anthem",
-    "anthems",
-    "anthrax",
-    "anti",
-    "anticipating",
-    "anticipation",
-    "antidote",
-    "ants",
-    "antsy",
-    "anus",
-    "anxiety",
-    "anxious",
-    "any",
-    "anybody",
-    "anyday",
-    "anyhow",
-    "anymore",
-    "anyone",
-    "anything",
-    "anytime",
-    "anyway",
-    "anyways",
-    "anywhere",
-    "ap",
-    "apart",
-    "apartment",
-    "apartments",
-    "ape",
-    "apes",
-    "apeshit",
-    "apocalypse",
-    "apollo",
-    "apologies",
-    "apologize",
-    "apologizing",
-    "apology",
-    "app",
-    "appalled",
-    "apparent",
-    "apparently",
-    "appeal",
-    "appealing",
-    "appear",
-    "appearance",
-    "appears",
-    "appetite",
-    "applaud",
-    "applause",
-    "apple",
-    "applebees",
-    "apples",
-    "application",
-    "applied",
-    "apply",
-    "applying",
-    "appraised",
-    "appreciate",
-    "apprentice",
-    "approach",
-    "approached",
-    "approaches",
-    "approaching",
-    "approval",
-    "approve",
-    "approved",
-    "approving",
-    "april",
-    "apron",
-    "aqua",
-    "aquafina",
-    "aquarium",
-    "aquarius",
-    "ar",
-    "arab",
-    "arabian",
-    "arcade",
-    "arch",
-    "are",
-    "area",
-    "arena",
-    "arenas",
-    "argue",
-    "argueing",
-    "arguing",
-    "argument",
-    "arguments",
-    "aria",
-    "arizona",
-    "ark",
-    "arm",
-    "armageddon",
-    "armani",
-    "armed",
-    "arming",
-    "armor",
-    "arms",
-    "army",
-    "arnold",
-    "aroma",
-    "around",
-    "aroused",
-    "arraignment",
-    "arrange",
-    "arrangement",
-    "arrangements",
-    "arrest",
-    "arrested",
-    "arresting",
-    "arrival",
-    "arrive",
-    "arrived",
-    "arrogant",
-    "arrow",
-    "arrows",
-    "arsenal",
-    "arson",
-    "arsonist",
-    "art",
-    "arthritis",
-    "arthur",
-    "articles",
-    "artillery",
-    "artist",
-    "artists",
-    "arts",
-    "aruba",
-    "as",
-    "asap",
-    "ash",
-    "ashamed",
-    "ashanti",
-    "ashed",
-    "ashes",
-    "ashley",
-    "ashton",
-    "ashtray",
-    "ashtrays",
-    "ashy",
-    "asian",
-    "asians",
-    "aside",
-    "ask",
-    "asked",
-    "asking",
-    "asks",
-    "asleep",
-    "asparagus",
-    "aspen",
-    "asphalt",
-    "aspire",
-    "aspiring",
-    "ass",
-    "assassin",
-    "assassinate",
-    "assassins",
-    "assault",
-    "assembly",
-    "asses",
-    "asshole",
-    "assholes",
-    "assignment",
-    "assist",
-    "assistance",
-    "assistant",
-    "assists",
-    "associate",
-    "associates",
-    "association",
-    "assume",
-    "assuming",
-    "assumption",
-    "assumptions",
-    "astaire",
-    "asthma",
-    "asthmatic",
-    "aston",
-    "astonishing",
-    "astrology",
-    "astronaut",
-    "astronomical",
-    "asylum",
-    "at",
-    "ate",
-    "atf",
-    "atheist",
-    "athlete",
-    "athletes",
-    "athletic",
-    "atl",
-    "atlanta",
-    "atlantic",
-    "atlantis",
-    "atlas",
-    "atm",
-    "atmosphere",
-    "atom",
-    "attach",
-    "attached",
-    "attack",
-    "attacking",
-    "attempt",
-    "attend",
-    "attendance",
-    "attendant",
-    "attention",
-    "attic",
-    "attire",
-    "attitude",
-    "attitudes",
-    "attorney",
-    "attract",
-    "attracted",
-    "attraction",
-    "attractive",
-    "au",
-    "auction",
-    "audemar",
-    "audi",
-    "audible",
-    "audience",
-    "audio",
-    "audition",
-    "august",
-    "aunt",
-    "auntie",
-    "aunties",
-    "aunts",
-    "aunty",
-    "aura",
-    "aurora",
-    "austin",
-    "australia",
-    "authentic",
-    "author",
-    "authorities",
-    "authority",
-    "auto",
-    "autobahn",
-    "autobiography",
-    "autograph",
-    "automatic",
-    "automatically",
-    "automatics",
-    "automobiles",
-    "autos",
-    "autumn",
-    "av",
-    "available",
-    "avalanche",
-    "avatar",
-    "ave",
-    "aventador",
-    "avenue",
-    "average",
-    "aviator",
-    "aviators",
-    "avoid",
-    "aw",
-    "await",
-    "awaits",
-    "awake",
-    "award",
-    "awards",
-    "aware",
-    "away",
-    "awe",
-    "awesome",
-    "awful",
-    "awfully",
-    "awhile",
-    "awkward",
-    "awol",
-    "axe",
-    "axis",
-    "aye",
-    "ayo",
-    "azure",
-    "b",
-    "ba",
-    "baba",
-    "babble",
-    "babe",
-    "babes",
-    "babies",
-    "baboon",
-    "baby",
-    "babygirl",
-    "babylon",
-    "babys",
-    "babysit",
-    "babysitter",
-    "bach",
-    "bachelor",
-    "back",
-    "backboard",
-    "backed",
-    "backflip",
-    "background",
-    "backing",
-    "backpack",
-    "backpackers",
-    "backroom",
-    "backs",
-    "backseat",
-    "backseats",
-    "backside",
-    "backstabbed",
-    "backstabbing",
-    "backstage",
-    "backstreet",
-    "backstreets",
-    "backstroke",
-    "backtrack",
-    "backup",
-    "backwards",
-    "backwood",
-    "backwoods",
-    "backyard",
-    "bacon",
-    "bad",
-    "badder",
-    "baddest",
-    "baddies",
-    "bader",
-    "badge",
-    "badges",
-    "badly",
-    "bae",
-    "bag",
-    "bagel",
-    "baggage",
-    "bagged",
-    "bagging",
-    "baggy",
-    "baghdad",
-    "bags",
-    "baguettes",
-    "bahamas",
-    "bail",
-    "bailed",
-    "bailey",
-    "baileys",
-    "bailing",
-    "bails",
-    "bait",
-    "bake",
-    "baked",
-    "baker",
-    "bakers",
-    "bakery",
-    "baking",
-    "balance",
-    "balancing",
-    "balboa",
-    "balcony",
-    "bald",
-    "balding",
-    "bale",
-    "balenciaga",
-    "balenciagas",
-    "bales",
-    "bali",
-    "ball",
-    "balled",
-    "baller",
-    "ballerina",
-    "ballers",
-    "ballet",
-    "balling",
-    "ballistic",
-    "balloon",
-    "balloons",
-    "ballpark",
-    "ballplayer",
-    "balls",
-    "bally",
-    "balmain",
-    "balmains",
-    "bam",
-    "bama",
-    "bambi",
-    "bamboo",
-    "ban",
-    "banana",
-    "bananas",
-    "band",
-    "bandage",
-    "bandages",
-    "bandana",
-    "bandanas",
-    "bandanna",
-    "bandannas",
-    "bandicoot",
-    "bandit",
-    "bando",
-    "bands",
-    "bandwagon",
-    "bang",
-    "banged",
-    "banger",
-    "bangers",
-    "banging",
-    "bangles",
-    "bangs",
-    "banister",
-    "bank",
-    "bankbook",
-    "banker",
-    "bankhead",
-    "banking",
-    "bankroll",
-    "bankrolls",
-    "bankrupt",
-    "banks",
-    "banned",
-    "banner",
-    "banquet",
-    "bans",
-    "banshee",
-    "bap",
-    "bape",
-    "baptism",
-    "baptist",
-    "baptized",
-    "bar",
-    "barbarian",
-    "barbecue",
-    "barbecued",
-    "barbecuing",
-    "barbell",
-    "barbeque",
-    "barber",
-    "barbers",
-    "barbershop",
-    "barbie",
-    "barbies",
-    "barbwire",
-    "bare",
-    "barefoot",
-    "barely",
-    "barfing",
-    "bargain",
-    "bari",
-    "baritone",
-    "bark",
-    "barker",
-    "barking",
-    "barkley",
-    "barn",
-    "barred",
-    "barrel",
-    "barrels",
-    "barrier",
-    "barrio",
-    "barry",
-    "bars",
-    "bart",
-    "bartender",
-    "base",
-    "baseball",
-    "based",
-    "baseline",
-    "basement",
-    "basements",
-    "bases",
-    "bashing",
-    "basic",
-    "basically",
-    "basics",
-    "basing",
-    "basis",
-    "basket",
-    "basketball",
-    "baskets",
-    "basquiat",
-    "bass",
-    "bastard",
-    "bastards",
-    "bat",
-    "batch",
-    "bate",
-    "bates",
-    "bath",
-    "bathe",
-    "bathing",
-    "bathroom",
-    "bathrooms",
-    "bathtub",
-    "batman",
-    "batmans",
-    "baton",
-    "bats",
-    "batted",
-    "batter",
-    "batteries",
-    "battery",
-    "battle",
-    "battlefield",
-    "battles",
-    "battleship",
-    "battling",
-    "bay",
-    "bayou",
-    "bb",
-    "bbq",
-    "bbs",
-    "bc",
-    "bd",
-    "be",
-    "beach",
-    "beaches",
-    "beads",
-    "beam",
-    "beamer",
-    "beaming",
-    "beams",
-    "bean",
-    "beanie",
-    "beans",
-    "bear",
-    "beard",
-    "bearer",
-    "bearing",
-    "bears",
-    "beast",
-    "beat",
-    "beaten",
-    "beater",
-    "beaters",
-    "beating",
-    "beatle",
-    "beatles",
-    "beats",
-    "beaucoup",
-    "beautiful",
-    "beauty",
-    "beaver",
-    "became",
-    "because",
-    "becky",
-    "become",
-    "becoming",
-    "bed",
-    "bedrock",
-    "bedroom",
-    "bedrooms",
-    "beds",
-    "bedtime",
-    "bee",
-    "beef",
-    "beefing",
-    "beefs",
-    "been",
-    "beep",
-    "beeped",
-    "beeper",
-    "beepers",
-    "beer",
-    "beers",
-    "bees",
-    "beetle",
-    "beetlejuice",
-    "beetles",
-    "before",
-    "beg",
-    "began",
-    "begging",
-    "beging",
-    "beginner",
-    "beginners",
-    "beginning",
-    "beginnings",
-    "begins",
-    "begun",
-    "behalf",
-    "behave",
-    "behaving",
-    "behavior",
-    "behead",
-    "behind",
-    "behold",
-    "beholder",
-    "beige",
-    "beijing",
-    "being",
-    "beings",
-    "bel",
-    "belated",
-    "belief",
-    "believe",
-    "believed",
-    "believer",
-    "believers",
-    "believing",
-    "belittle",
-    "bell",
-    "bells",
-    "belly",
-    "belong",
-    "belongs",
-    "beloved",
-    "below",
-    "belt",
-    "belts",
-    "belvedere",
-    "belvederes",
-    "ben",
-    "bench",
-    "benches",
-    "bend",
-    "bending",
-    "bends",
-    "beneath",
-    "beneficial",
-    "benefit",
-    "benefits",
-    "bengal",
-    "benihana",
-    "benjamin",
-    "benjamins",
-    "benji",
-    "bennett",
-    "benny",
-    "bens",
-    "bent",
-    "bentley",
-    "bentleys",
-    "benzes",
-    "benzo",
-    "beretta",
-    "berettas",
-    "berg",
-    "berks",
-    "berlin",
-    "bermuda",
-    "berry",
-    "berserk",
-    "beside",
-    "besides",
-    "best",
-    "bestest",
-    "bestie",
-    "bet",
-    "betray",
-    "betrayed",
-    "bets",
-    "betta",
-    "better",
-    "betting",
-    "between",
-    "beverage",
-    "beverly",
-    "beware",
-    "beyond",
-    "bezel",
-    "bezels",
-    "bg",
-    "bi",
-    "bias",
-    "biased",
-    "bib",
-    "bible",
-    "bibles",
-    "biblical",
-    "bic",
-    "biceps",
-    "bickering",
-    "bicoastal",
-    "bicycle",
-    "bicycles",
-    "bid",
-    "bidding",
-    "biddy",
-    "bidness",
-    "bieber",
-    "big",
-    "bigger",
-    "biggest",
-    "biggie",
-    "bih",
-    "bike",
-    "biker",
-    "bikes",
-    "biking",
-    "bikini",
-    "bikinis",
-    "bilingual",
-    "bill",
-    "billboard",
-    "billi",
-    "billion",
-    "billionaire",
-    "billions",
-    "bills",
-    "billy",
-    "bimmer",
-    "bind",
-    "bing",
-    "binge",
-    "bingo",
-    "binoculars",
-    "bio",
-    "bionic",
-    "bipolar",
-    "bird",
-    "birdie",
-    "birdies",
-    "birdman",
-    "birds",
-    "birdy",
-    "birkin",
-    "birmingham",
-    "birth",
-    "birthday",
-    "birthdays",
-    "birthed",
-    "birthplace",
-    "birthright",
-    "bis",
-    "biscayne",
-    "biscuit",
-    "biscuits",
-    "bisexual",
-    "bishop",
-    "bit",
-    "bitch",
-    "bitched",
-    "bitches",
-    "bitching",
-    "bite",
-    "bites",
-    "biting",
-    "bits",
-    "bitter",
-    "bitty",
-    "bity",
-    "bizarre",
-    "bizzy",
-    "bk",
-    "black",
-    "blackberry",
-    "blacked",
-    "blacker",
-    "blacking",
-    "blackjack",
-    "blacks",
-    "bladder",
-    "blade",
-    "blades",
-    "blah",
-    "blake",
-    "blam",
-    "blame",
-    "blaming",
-    "blanco",
-    "bland",
-    "blank",
-    "blanket",
-    "blankets",
-    "blanks",
-    "blast",
-    "blasted",
-    "blasting",
-    "blas\u00e9",
-    "blat",
-    "blatant",
-    "blaze",
-    "blazed",
-    "blazer",
-    "blazing",
-    "bleach",
-    "bleached",
-    "bleachers",
-    "bleak",
-    "bled",
-    "bleed",
-    "bleeding",
-    "bleeds",
-    "bleek",
-    "bleep",
-    "blemish",
-    "blend",
-    "blender",
-    "bless",
-    "blessed",
-    "blessing",
-    "blessings",
-    "bleu",
-    "blew",
-    "blimp",
-    "blind",
-    "blinded",
-    "blindfold",
-    "blindfolded",
-    "blinding",
-    "blinds",
-    "blindside",
-    "bling",
-    "blinging",
-    "blink",
-    "blinkers",
-    "blinking",
-    "bliss",
-    "blisters",
-    "blitz",
-    "blizzard",
-    "blizzards",
-    "block",
-    "blocka",
-    "blockbuster",
-    "blocked",
-    "blockers",
-    "blocking",
-    "blocks",
-    "blog",
-    "bloggers",
-    "blogging",
-    "blogs",
-    "bloke",
-    "blond",
-    "blonde",
-    "blood",
-    "blooded",
-    "bloodline",
-    "bloods",
-    "bloodshot",
-    "bloodsuckers",
-    "bloody",
-    "bloom",
-    "blouse",
-    "blouses",
-    "blow",
-    "blowed",
-    "blower",
-    "blowing",
-    "blowjob",
-    "blown",
-    "blows",
-    "blue",
-    "blueberry",
-    "blueprint",
-    "bluer",
-    "blues",
-    "bluff",
-    "bluffing",
-    "blunt",
-    "blunted",
-    "blunts",
-    "blur",
-    "blurred",
-    "blurry",
-    "blush",
-    "blushing",
-    "bm",
-    "bo",
-    "board",
-    "boarded",
-    "boards",
-    "boast",
-    "boasting",
-    "boat",
-    "boatload",
-    "boats",
-    "bob",
-    "bobbing",
-    "bobble",
-    "bobby",
-    "bodega",
-    "bodied",
-    "bodies",
-    "body",
-    "bodyguard",
-    "bodyguards",
-    "bogart",
-    "bogus",
-    "boil",
-    "boiling",
-    "boils",
-    "bold",
-    "bolder",
-    "bologna",
-    "bolt",
-    "bolts",
-    "bomb",
-    "bombay",
-    "bomber",
-    "bombing",
-    "bombs",
-    "bond",
-    "bonds",
-    "bone",
-    "boned",
-    "boner",
-    "bones",
-    "boney",
-    "bong",
-    "boning",
-    "bonita",
-    "bonkers",
-    "bonnie",
-    "bonny",
-    "bonus",
-    "bony",
-    "boo",
-    "boobies",
-    "boobs",
-    "booby",
-    "booed",
-    "booger",
-    "boogers",
-    "boogie",
-    "book",
-    "booked",
-    "booker",
-    "booking",
-    "books",
-    "booling",
-    "boom",
-    "boomerang",
-    "booming",
-    "booms",
-    "boosie",
-    "boost",
-    "booster",
-    "boosters",
-    "boosting",
-    "boot",
-    "booted",
-    "booth",
-    "bootie",
-    "booties",
-    "bootleg",
-    "boots",
-    "booty",
-    "booze",
-    "boozy",
-    "bop",
-    "bopping",
-    "bops",
-    "bora",
-    "border",
-    "borderline",
-    "borders",
-    "bore",
-    "bored",
-    "boredom",
-    "boring",
-    "born",
-    "borough",
-    "borrow",
-    "borrowed",
-    "boss",
-    "bossed",
-    "bosses",
-    "bossing",
-    "bossy",
-    "boston",
-    "both",
-    "bother",
-    "bothered",
-    "bothering",
-    "bothers",
-    "bottle",
-    "bottled",
-    "bottles",
-    "bottom",
-    "bottoms",
-    "bought",
-    "bougie",
-    "boulder",
-    "boulders",
-    "boulevard",
-    "bounce",
-    "bounced",
-    "bouncer",
-    "bouncers",
-    "bouncing",
-    "bound",
-    "boundaries",
-    "bounds",
-    "bounty",
-    "bouquet",
-    "bourbon",
-    "bout",
-    "boutta",
-    "bow",
-    "bowed",
-    "bowels",
-    "bowie",
-    "bowl",
-    "bowling",
-    "bowls",
-    "bows",
-    "bowtie",
-    "box",
-    "boxed",
-    "boxer",
-    "boxers",
-    "boxes",
-    "boxing",
-    "boy",
-    "boyfriend",
-    "boyfriends",
-    "boys",
-    "bozo",
-    "bra",
-    "brace",
-    "bracelet",
-    "bracelets",
-    "braces",
-    "bracket",
-    "brad",
-    "brady",
-    "brag",
-    "bragging",
-    "braging",
-    "braid",
-    "braided",
-    "braids",
-    "braille",
-    "brain",
-    "brained",
-    "brainless",
-    "brains",
-    "brainstorm",
-    "brainwash",
-    "brainwashed",
-    "braise",
-    "brake",
-    "brakes",
-    "branch",
-    "branches",
-    "brand",
-    "brands",
-    "brandy",
-    "bras",
-    "brash",
-    "brass",
-    "brat",
-    "brave",
-    "braves",
-    "bravo",
-    "brawl",
-    "brawling",
-    "braxton",
-    "brazil",
-    "brazilian",
-    "brazy",
-    "bread",
-    "breads",
-    "break",
-    "breakdown",
-    "breaker",
-    "breakfast",
-    "breaking",
-    "breaks",
-    "breast",
-    "breasts",
-    "breath",
-    "breathe",
-    "breather",
-    "breathing",
-    "bred",
-    "breed",
-    "breeds",
-    "breeze",
-    "breezes",
-    "breezing",
-    "breezy",
-    "breitling",
-    "brethren",
-    "brew",
-    "brewing",
-    "brews",
-    "brian",
-    "brick",
-    "bricks",
-    "bride",
-    "bridge",
-    "bridges",
-    "brief",
-    "briefcase",
-    "bright",
-    "brighten",
-    "brighter",
-    "brightest",
-    "brilliant",
-    "brim",
-    "bring",
-    "bringing",
-    "brings",
-    "brink",
-    "brinks",
-    "brisk",
-    "britches",
-    "british",
-    "britney",
-    "brittany",
-    "bro",
-    "broad",
-    "broadcast",
-    "broads",
-    "broadway",
-    "broccoli",
-    "brody",
-    "brokanese",
-    "broke",
-    "broken",
-    "broker",
-    "brome",
-    "bronco",
-    "broncos",
-    "bronx",
-    "bronze",
-    "brook",
-    "brooklyn",
-    "broom",
-    "bros",
-    "brother",
-    "brothers",
-    "brought",
-    "brow",
-    "brown",
-    "browns",
-    "brownsville",
-    "brr",
-    "bruce",
-    "bruh",
-    "bruins",
-    "bruise",
-    "bruised",
-    "bruises",
-    "bruising",
-    "brunch",
-    "brunette",
-    "brung",
-    "bruno",
-    "brush",
-    "brushes",
-    "brushing",
-    "brutal",
-    "bryan",
-    "bs",
-    "bubba",
-    "bubble",
-    "bubbles",
-    "bubbling",
-    "bubbly",
-    "buck",
-    "bucked",
-    "bucket",
-    "buckets",
-    "bucking",
-    "buckle",
-    "bucks",
-    "bud",
-    "buddha",
-    "buddhist",
-    "buddies",
-    "buddy",
-    "budge",
-    "budget",
-    "budging",
-    "buds",
-    "budweiser",
-    "buff",
-    "buffer",
-    "bug",
-    "bugatti",
-    "bugging",
-    "bugs",
-    "build",
-    "builder",
-    "building",
-    "buildings",
-    "built",
-    "bulbs",
-    "bulging",
-    "bulimic",
-    "bull",
-    "bulldog",
-    "bullet",
-    "bulletproof",
-    "bullets",
-    "bullied",
-    "bullies",
-    "bulls",
-    "bullshit",
-    "bullshitting",
-    "bully",
-    "bum",
-    "bumble",
-    "bumblebee",
-    "bummer",
-    "bumming",
-    "bump",
-    "bumped",
-    "bumper",
-    "bumping",
-    "bumps",
-    "bums",
-    "bun",
-    "bunch",
-    "bundle",
-    "bundles",
-    "bungee",
-    "bunk",
-    "bunking",
-    "bunnies",
-    "bunny",
-    "buns",
-    "bur",
-    "burberry",
-    "burden",
-    "burdens",
-    "burger",
-    "burgers",
-    "burglar",
-    "burglary",
-    "burgundy",
-    "burial",
-    "buried",
-    "burking",
-    "burn",
-    "burned",
-    "burner",
-    "burners",
-    "burning",
-    "burns",
-    "burnt",
-    "burp",
-    "burping",
-    "burr",
-    "burst",
-    "bury",
-    "burying",
-    "bus",
-    "buses",
-    "bush",
-    "bushes",
-    "business",
-    "businessman",
-    "buss",
-    "bussing",
-    "bust",
-    "busta",
-    "bustas",
-    "busted",
-    "buster",
-    "busters",
-    "busting",
-    "busty",
-    "busy",
-    "but",
-    "butcher",
-    "butler",
-    "butt",
-    "butta",
-    "butter",
-    "buttercup",
-    "buttercups",
-    "butterflies",
-    "butterfly",
-    "butters",
-    "button",
-    "buttoned",
-    "buttons",
-    "butts",
-    "buy",
-    "buyer",
-    "buyers",
-    "buying",
-    "buys",
-    "buzz",
-    "buzzing",
-    "by",
-    "bye",
-    "bygones",
-    "c",
-    "ca",
-    "cab",
-    "cabana",
-    "cabanas",
-    "cabbage",
-    "cabinet",
-    "cabinets",
-    "cabing",
-    "cable",
-    "cabo",
-    "cabs",
-    "cactus",
-    "cadastre",
-    "caddy",
-    "cadence",
-    "cadillac",
-    "cadillacs",
-    "caesar",
-    "cage",
-    "caged",
-    "cages",
-    "cahoots",
-    "cain",
-    "caine",
-    "cajun",
-    "cake",
-    "cakes",
-    "caking",
-    "cal",
-    "calabasas",
-    "calamari",
-    "calculated",
-    "calculating",
-    "calculator",
-    "calendar",
-    "calendars",
-    "calender",
-    "cali",
-    "caliber",
-    "calico",
-    "california",
-    "call",
-    "called",
-    "caller",
-    "calling",
-    "callous",
-    "calls",
-    "calm",
-    "calories",
-    "cam",
-    "camaro",
-    "came",
-    "camel",
-    "camels",
-    "camera",
-    "cameraman",
-    "cameras",
-    "camo",
-    "camouflage",
-    "camp",
-    "campaign",
-    "campbell",
-    "campfire",
-    "campus",
-    "campuses",
-    "can",
-    "canada",
-    "canal",
-    "canaries",
-    "canary",
-    "cancel",
-    "cancelled",
-    "cancer",
-    "cancun",
-    "candidate",
-    "candidates",
-    "candies",
-    "candle",
-    "candlelight",
-    "candles",
-    "candy",
-    "cane",
-    "canines",
-    "cannabis",
-    "canned",
-    "cannibal",
-    "cannon",
-    "cannons",
-    "cannot",
-    "canopy",
-    "cans",
-    "cant",
-    "cantaloupe",
-    "canvas",
-    "canyon",
-    "cap",
-    "capacity",
-    "cape",
-    "caper",
-    "capers",
-    "capital",
-    "capitol",
-    "capo",
-    "capone",
-    "capped",
-    "capping",
-    "capri",
-    "caprice",
-    "caprices",
-    "caps",
-    "capsule",
-    "captain",
-    "caption",
-    "captive",
-    "capture",
-    "car",
-    "caramel",
-    "carat",
-    "carats",
-    "caravan",
-    "carbon",
-    "card",
-    "cardiac",
-    "cardigan",
-    "cards",
-    "care",
-    "cared",
-    "career",
-    "careers",
-    "careful",
-    "carefully",
-    "careless",
-    "cares",
-    "caress",
-    "caressing",
-    "carets",
-    "cargos",
-    "caribbean",
-    "caring",
-    "carlo",
-    "carlos",
-    "carmelo",
-    "carnival",
-    "carolinas",
-    "caroline",
-    "caroliner",
-    "carpenter",
-    "carpet",
-    "carpets",
-    "carrera",
-    "carriage",
-    "carried",
-    "carrier",
-    "carriers",
-    "carrot",
-    "carrots",
-    "carry",
-    "carrying",
-    "cars",
-    "carson",
-    "cart",
-    "cartel",
-    "carter",
-    "carters",
-    "cartier",
-    "cartiers",
-    "carton",
-    "cartoon",
-    "cartoons",
-    "cartridge",
-    "cartwheels",
-    "carve",
-    "carved",
-    "casa",
-    "casanova",
-    "cascade",
-    "case",
-    "cased",
-    "cases",
-    "cash",
-    "cashed",
-    "cashews",
-    "cashier",
-    "cashing",
-    "cashmere",
-    "casino",
-    "casinos",
-    "cask",
-    "casket",
-    "caskets",
-    "casper",
-    "cassette",
-    "cassidy",
-    "cassius",
-    "cast",
-    "casting",
-    "castle",
-    "castor",
-    "castro",
-    "casually",
-    "casualties",
-    "casualty",
-    "cat",
-    "catalog",
-    "cataract",
-    "catch",
-    "catcher",
-    "catches",
-    "catching",
-    "category",
-    "cater",
-    "caterpillar",
-    "catfish",
-    "cathedral",
-    "catholic",
-    "catholics",
-    "cats",
-    "cattle",
-    "caucasian",
-    "caught",
-    "cause",
-    "caused",
-    "causing",
-    "caution",
-    "cautious",
-    "cavalier",
-    "cave",
-    "caviar",
-    "cavities",
-    "cavity",
-    "cayenne",
-    "cc",
-    "cd",
-    "cds",
-    "ce",
-    "cease",
-    "cedes",
-    "ceiling",
-    "ceilings",
-    "celebrate",
-    "celebrated",
-    "celebrating",
-    "celebration",
-    "celebrities",
-    "celebrity",
-    "celery",
-    "celibate",
-    "celine",
-    "cell",
-    "cellar",
-    "cello",
-    "cellphone",
-    "cells",
-    "cellular",
-    "celtics",
-    "cement",
-    "cemetery",
-    "censorship",
-    "cent",
-    "center",
-    "centerfold",
-    "centipede",
-    "central",
-    "centre",
-    "cents",
-    "centuries",
-    "century",
-    "ceo",
-    "ceramic",
-    "cereal",
-    "cerebellum",
-    "cerebral",
-    "ceremony",
-    "certain",
-    "certainly",
-    "certified",
-    "cha",
-    "chad",
-    "chain",
-    "chained",
-    "chains",
-    "chair",
-    "chairman",
-    "chairs",
-    "chalk",
-    "chalking",
-    "challenge",
-    "challenged",
-    "challenger",
-    "chamber",
-    "chamberlain",
-    "champ",
-    "champagne",
-    "champion",
-    "champions",
-    "championship",
-    "chan",
-    "chance",
-    "chances",
-    "chandelier",
-    "chandeliers",
-    "chanel",
-    "change",
-    "changed",
-    "changer",
-    "changes",
-    "changing",
-    "channel",
-    "channels",
-    "chant",
-    "chaos",
-    "chapo",
-    "chapstick",
-    "chapter",
-    "chapters",
-    "character",
-    "characters",
-    "charcoal",
-    "charge",
-    "charged",
-    "charger",
-    "charges",
-    "charging",
-    "chariot",
-    "charisma",
-    "charity",
-    "charles",
-    "charlie",
-    "charm",
-    "charming",
-    "charms",
-    "chart",
-    "charter",
-    "chartered",
-    "charts",
-    "chase",
-    "chased",
-    "chaser",
-    "chasers",
-    "chasing",
-    "chat",
-    "chatter",
-    "chatting",
-    "chatty",
-    "chauffeur",
-    "chauffeured",
-    "cheap",
-    "cheaper",
-    "cheat",
-    "cheated",
-    "cheater",
-    "cheating",
-    "check",
-    "checked",
-    "checkers",
-    "checking",
-    "checklist",
-    "checks",
-    "cheddar",
-    "cheek",
-    "cheeks",
-    "cheer",
-    "cheerios",
-    "cheerleader",
-    "cheerleaders",
-    "cheers",
-    "cheese",
-    "cheesecake",
-    "cheesing",
-    "cheesy",
-    "cheetah",
-    "chef",
-    "chemical",
-    "chemicals",
-    "chemist",
-    "chemistry",
-    "cheque",
-    "cheques",
-    "cherish",
-    "cherries",
-    "cherry",
-    "chess",
-    "chest",
-    "chests",
-    "chevron",
-    "chevy",
-    "chevys",
-    "chew",
-    "chewed",
-    "chewing",
-    "chi",
-    "chia",
-    "chic",
-    "chicago",
-    "chick",
-    "chicken",
-    "chickens",
-    "chicks",
-    "chico",
-    "chief",
-    "child",
-    "childhood",
-    "childish",
-    "children",
-    "chill",
-    "chilled",
-    "chiller",
-    "chilling",
-    "chills",
-    "chilly",
-    "chimney",
-    "chimp",
-    "china",
-    "chinchilla",
-    "chinchillas",
-    "chinese",
-    "ching",
-    "chink",
-    "chinky",
-    "chino",
-    "chip",
-    "chipped",
-    "chips",
-    "chiquita",
-    "chirp",
-    "chirping",
-    "chit",
-    "chitlins",
-    "chlorine",
-    "cho",
-    "chock",
-    "chocolate",
-    "choice",
-    "choices",
-    "choir",
-    "choke",
-    "choked",
-    "chokehold",
-    "choker",
-    "chokers",
-    "choking",
-    "chong",
-    "choose",
-    "choosey",
-    "choosing",
-    "choosy",
-    "chop",
-    "choppa",
-    "chopped",
-    "chopper",
-    "choppers",
-    "chopping",
-    "chops",
-    "chopsticks",
-    "chords",
-    "chores",
-    "chorus",
-    "chose",
-    "chosen",
-    "chow",
-    "chows",
-    "chris",
-    "chrissy",
-    "christ",
-    "christian",
-    "christians",
-    "christmas",
-    "christopher",
-    "chrome",
-    "chromed",
-    "chronic",
-    "chubby",
-    "chuck",
-    "chucking",
-    "chucks",
-    "chug",
-    "chugging",
-    "chump",
-    "chumps",
-    "chunk",
-    "chunky",
-    "church",
-    "churches",
-    "churn",
-    "ci",
-    "cider",
-    "cig",
-    "cigar",
-    "cigarette",
-    "cigarettes",
-    "cigarillo",
-    "cigarillos",
-    "cigars",
-    "cincinnati",
-    "cinco",
-    "cinderella",
-    "cinema",
-    "cinematic",
-    "cinnabon",
-    "cinnamon",
-    "cipher",
-    "circle",
-    "circles",
-    "circular",
-    "circumstances",
-    "circus",
-    "ciroc",
-    "cirque",
-    "cita",
-    "cities",
-    "citizens",
-    "city",
-    "citywide",
-    "civic",
-    "civil",
-    "civilian",
-    "civilians",
-    "civilized",
-    "cl",
-    "clack",
-    "claim",
-    "claimed",
-    "claiming",
-    "claims",
-    "claming",
-    "clams",
-    "clan",
-    "clank",
-    "clap",
-    "clapped",
-    "clapping",
-    "claps",
-    "clarity",
-    "clark",
-    "clash",
-    "clashing",
-    "class",
-    "classes",
-    "classic",
-    "classical",
-    "classics",
-    "classmates",
-    "classroom",
-    "classy",
-    "claus",
-    "clause",
-    "clay",
-    "clayco",
-    "clean",
-    "cleaned",
-    "cleaner",
-    "cleaners",
-    "cleanest",
-    "cleaning",
-    "cleansing",
-    "clear",
-    "clearance",
-    "cleared",
-    "clearer",
-    "clearing",
-    "clearly",
-    "cleat",
-    "cleats",
-    "cleavage",
-    "cleaver",
-    "cleo",
-    "cleveland",
-    "clever",
-    "cliche",
-    "click",
-    "clicking",
-    "clientele",
-    "cliff",
-    "climate",
-    "climax",
-    "climb",
-    "climbed",
-    "climbing",
-    "cling",
-    "clinic",
-    "clink",
-    "clinking",
-    "clinton",
-    "clip",
-    "clippers",
-    "clips",
-    "clique",
-    "clit",
-    "clitoris",
-    "clock",
-    "clocking",
-    "clocks",
-    "clockwork",
-    "clone",
-    "cloned",
-    "clones",
-    "cloning",
-    "close",
-    "closed",
-    "closely",
-    "closer",
-    "closes",
-    "closest",
-    "closet",
-    "closets",
-    "closing",
-    "closure",
-    "clot",
-    "cloth",
-    "clothes",
-    "clothing",
-    "cloud",
-    "clouded",
-    "clouds",
-    "cloudy",
-    "clout",
-    "clover",
-    "clown",
-    "clowning",
-    "clowns",
-    "club",
-    "clubbing",
-    "clubs",
-    "clucking",
-    "clue",
-    "clueless",
-    "clues",
-    "clutch",
-    "clutching",
-    "cluttered",
-    "clyde",
-    "cmb",
-    "co",
-    "coach",
-    "coaches",
-    "coaching",
-    "coals",
-    "coast",
-    "coaster",
-    "coasting",
-    "coat",
-    "coated",
-    "coats",
-    "cob",
-    "cobra",
-    "coca",
-    "cocaina",
-    "cocaine",
-    "cochran",
-    "cocina",
-    "cock",
-    "cocked",
-    "cocking",
-    "cockpit",
-    "cockroaches",
-    "cocksucker",
-    "cocksuckers",
-    "cocktail",
-    "cocktails",
-    "cocky",
-    "coco",
-    "cocoa",
-    "coconut",
-    "cocoon",
-    "code",
-    "codeine",
-    "codeing",
-    "codes",
-    "cody",
-    "coffee",
-    "coffin",
-    "coffins",
-    "cognac",
-    "coin",
-    "coincidental",
-    "coins",
-    "coke",
-    "cola",
-    "colada",
-    "cold",
-    "colder",
-    "coldest",
-    "cole",
-    "colgate",
-    "collab",
-    "collage",
-    "collagen",
-    "collapse",
-    "collar",
-    "collard",
-    "collared",
-    "collars",
-    "collect",
-    "collecting",
-    "collection",
-    "college",
-    "collide",
-    "collins",
-    "collision",
-    "cologne",
-    "colombia",
-    "colombian",
-    "colon",
-    "color",
-    "colorado",
-    "colorblind",
-    "colored",
-    "colorful",
-    "colors",
-    "colossal",
-    "colour",
-    "colours",
-    "columbine",
-    "columbus",
-    "column",
-    "coma",
-    "comatose",
-    "comb",
-    "combat",
-    "combination",
-    "combine",
-    "combined",
-    "combo",
-    "combs",
-    "come",
-    "comeback",
-    "comedy",
-    "comes",
-    "comet",
-    "comfort",
-    "comfortable",
-    "comfy",
-    "comic",
-    "comics",
-    "coming",
-    "comma",
-    "command",
-    "commander",
-    "commanding",
-    "commandments",
-    "commando",
-    "commands",
-    "commas",
-    "commence",
-    "comment",
-    "comments",
-    "commercial",
-    "commissary",
-    "commission",
-    "commit",
-    "commited",
-    "commitment",
-    "committed",
-    "committee",
-    "committing",
-    "common",
-    "commotion",
-    "communicate",
-    "communication",
-    "communities",
-    "community",
-    "companies",
-    "company",
-    "compare",
-    "compared",
-    "compares",
-    "comparing",
-    "comparison",
-    "compartment",
-    "compass",
-    "compete",
-    "competing",
-    "competition",
-    "competitors",
-    "complacent",
-    "complain",
-    "complaining",
-    "complains",
-    "complaints",
-    "complete",
-    "completed",
-    "completely",
-    "complex",
-    "complexion",
-    "complicated",
-    "compliment",
-    "complimenting",
-    "compliments",
-    "composure",
-    "compound",
-    "comprehend",
-    "compromise",
-    "compromising",
-    "compton",
-    "computer",
-    "computers",
-    "comrades",
-    "con",
-    "conceal",
-    "concealed",
-    "conceited",
-    "conceive",
-    "conceived",
-    "concentrate",
-    "concentrating",
-    "concentration",
-    "concept",
-    "conception",
-    "concern",
-    "concerned",
-    "concert",
-    "concerts",
-    "conclusion",
-    "concord",
-    "concrete",
-    "concur",
-    "concussion",
-    "condition",
-    "condo",
-    "condom",
-    "condoms",
-    "condone",
-    "condos",
-    "conduct",
-    "cone",
-    "confess",
-    "confessing",
-    "confession",
-    "confessions",
-    "confetti",
-    "confidence",
-    "confident",
-    "confidential",
-    "confined",
-    "confirm",
-    "confirmed",
-    "confiscated",
-    "conflict",
-    "confront",
-    "confrontation",
-    "confuse",
-    "confused",
-    "confusing",
-    "confusion",
-    "congratulations",
-    "congregation",
-    "conjure",
-    "connect",
-    "connected",
-    "connecting",
-    "connection",
-    "connections",
-    "connects",
-    "conniving",
-    "connoisseur",
-    "conquer",
-    "conquered",
-    "cons",
-    "conscience",
-    "conscious",
-    "consequences",
-    "consider",
-    "considered",
-    "considering",
-    "consignment",
-    "consist",
-    "consistent",
-    "consistently",
-    "console",
-    "conspicuous",
-    "conspiracy",
-    "constant",
-    "constantly",
-    "constipated",
-    "construction",
-    "contact",
-    "contacts",
-    "contagious",
-    "contain",
-    "contemplate",
-    "contemplating",
-    "content",
-    "contest",
-    "continental",
-    "continually",
-    "continue",
-    "continued",
-    "continues",
-    "contra",
-    "contract",
-    "contractor",
-    "contrast",
-    "contribution",
-    "control",
-    "controlled",
-    "controller",
-    "controlling",
-    "controversial",
-    "controversy",
-    "convenient",
-    "convention",
-    "conversate",
-    "conversating",
-    "conversation",
-    "conversations",
-    "converse",
-    "converted",
-    "convertible",
-    "convict",
-    "convicted",
-    "convicts",
-    "convince",
-    "convinced",
-    "convincing",
-    "convo",
-    "coo",
-    "cook",
-    "cooked",
-    "cookie",
-    "cookies",
-    "cooking",
-    "cooks",
-    "cool",
-    "cooled",
-    "cooler",
-    "coolest",
-    "cooling",
-    "cooly",
-    "coon",
-    "coop",
-    "cooper",
-    "cooperate",
-    "coops",
-    "coordinate",
-    "cop",
-    "cope",
-    "copies",
-    "coping",
-    "copped",
-    "copper",
-    "coppers",
-    "copping",
-    "cops",
-    "copy",
-    "copying",
-    "cord",
-    "cords",
-    "core",
-    "cork",
-    "corks",
-    "corn",
-    "cornbread",
-    "corner",
-    "corners",
-    "corny",
-    "corolla",
-    "coroner",
-    "corporate",
-    "corpse",
-    "corpses",
-    "corral",
-    "correct",
-    "correcting",
-    "correctional",
-    "correlating",
-    "corridors",
-    "corrupt",
-    "corrupted",
-    "corruption",
-    "corse",
-    "corvette",
-    "cos",
-    "cosign",
-    "cosigning",
-    "cost",
-    "costa",
-    "costing",
-    "costs",
-    "costume",
-    "cot",
-    "cotton",
-    "couch",
-    "couches",
-    "cougar",
-    "cougars",
-    "cough",
-    "coughing",
-    "could",
-    "coulda",
-    "counseling",
-    "counselor",
-    "count",
-    "countdown",
-    "counted",
-    "counter",
-    "counterfeit",
-    "counting",
-    "countries",
-    "country",
-    "counts",
-    "county",
-    "coupe",
-    "coupes",
-    "couple",
-    "coupon",
-    "coups",
-    "courage",
-    "courageous",
-    "course",
-    "courses",
-    "court",
-    "courtesy",
-    "courthouse",
-    "courtroom",
-    "courts",
-    "courtside",
-    "cousin",
-    "cousins",
-    "couture",
-    "cover",
-    "covered",
-    "covering",
-    "covers",
-    "cow",
-    "cowabunga",
-    "coward",
-    "cowards",
-    "cowboy",
-    "cowboys",
-    "cowgirl",
-    "cows",
-    "cozy",
-    "cpr",
-    "cr",
-    "crab",
-    "crabs",
-    "crack",
-    "cracked",
-    "cracker",
-    "crackers",
-    "cracking",
-    "cracks",
-    "cradle",
-    "craft",
-    "cram",
-    "cramp",
-    "cramped",
-    "cran",
-    "cranberry",
-    "cranium",
-    "crank",
-    "cranking",
-    "cranky",
-    "crap",
-    "crappy",
-    "craps",
-    "crash",
-    "crashed",
-    "crashing",
-    "crate",
-    "craters",
-    "crave",
-    "craving",
-    "crawl",
-    "crawling",
-    "craze",
-    "crazier",
-    "craziest",
-    "crazy",
-    "cream",
-    "crease",
-    "creases",
-    "create",
-    "created",
-    "creatine",
-    "creating",
-    "creation",
-    "creative",
-    "creator",
-    "creature",
-    "cred",
-    "credentials",
-    "credit",
-    "credits",
-    "creed",
-    "creek",
-    "creep",
-    "creeped",
-    "creeper",
-    "creeping",
-    "cremate",
-    "creme",
-    "creole",
-    "crept",
-    "crescent",
-    "crest",
-    "crew",
-    "crews",
-    "crib",
-    "cribs",
-    "cried",
-    "cries",
-    "crime",
-    "crimes",
-    "criminal",
-    "criminals",
-    "crip",
-    "cripping",
-    "crips",
-    "crisis",
-    "crisp",
-    "crispy",
-    "cristal",
-    "cristals",
-    "criteria",
-    "critic",
-    "critical",
-    "criticize",
-    "critics",
-    "critique",
-    "crocodile",
-    "crook",
-    "crooked",
-    "crooks",
-    "crop",
-    "cross",
-    "crossed",
-    "crosses",
-    "crossing",
-    "crossover",
-    "crossroads",
-    "crotch",
-    "crow",
-    "crowbar",
-    "crowd",
-    "crowded",
-    "crowding",
-    "crowds",
-    "crown",
-    "crowned",
-    "crowns",
-    "crows",
-    "crucial",
-    "crucified",
-    "crucifix",
-    "crucify",
-    "cruel",
-    "cruise",
-    "cruiser",
-    "cruising",
-    "crumb",
-    "crumble",
-    "crumbling",
-    "crumbs",
-    "crunch",
-    "crus",
-    "crush",
-    "crushed",
-    "crushers",
-    "crushing",
-    "crust",
-    "crutches",
-    "cry",
-    "crying",
-    "crys",
-    "crystal",
-    "crystals",
-    "cs",
-    "cub",
-    "cuba",
-    "cuban",
-    "cubans",
-    "cube",
-    "cubes",
-    "cubicle",
-    "cubs",
-    "cuchi",
-    "cuckoo",
-    "cud",
-    "cuddle",
-    "cuddy",
-    "cue",
-    "cuff",
-    "cuffed",
-    "cuffing",
-    "cuffs",
-    "cuisine",
-    "cul",
-    "culinary",
-    "culking",
-    "culprit",
-    "cult",
-    "culture",
-    "cum",
-    "cumin",
-    "cumming",
-    "cunt",
-    "cup",
-    "cupboard",
-    "cupid",
-    "cupped",
-    "cupping",
-    "cups",
-    "curb",
-    "curbs",
-    "cure",
-    "curfew",
-    "curiosity",
-    "curious",
-    "curl",
-    "curls",
-    "curly",
-    "currency",
-    "current",
-    "currently",
-    "curry",
-    "curse",
-    "cursed",
-    "curses",
-    "cursing",
-    "cursive",
-    "curtain",
-    "curtains",
-    "curtis",
-    "curve",
-    "curved",
-    "curves",
-    "curvy",
-    "cus",
-    "cushion",
-    "cuss",
-    "cussing",
-    "custody",
-    "custom",
-    "customer",
-    "customers",
-    "customs",
-    "cut",
-    "cute",
-    "cuter",
-    "cutest",
-    "cutie",
-    "cutlass",
-    "cutler",
-    "cuts",
-    "cutter",
-    "cutthroat",
-    "cutting",
-    "cycle",
-    "cyclone",
-    "cyclops",
-    "cypher",
-    "cyrus",
-    "c\u00e9line",
-    "d",
-    "dab",
-    "dabbed",
-    "dabbing",
-    "dad",
-    "dada",
-    "daddies",
-    "daddy",
-    "dads",
-    "dagger",
-    "dahmer",
-    "daily",
-    "daiquiri",
-    "dairy",
-    "daisies",
-    "daisy",
-    "dakota",
-    "dale",
-    "dallas",
-    "dam",
-    "damage",
-    "damaged",
-    "damaging",
-    "dame",
-    "dames",
-    "damn",
-    "damned",
-    "damon",
-    "damp",
-    "dance",
-    "danced",
-    "dancer",
-    "dancers",
-    "dances",
-    "dancing",
-    "dandruff",
-    "dandy",
-    "dang",
-    "danger",
-    "dangerous",
-    "dangle",
-    "dangled",
-    "dangling",
-    "daniel",
-    "daniels",
-    "dank",
-    "danny",
-    "dante",
-    "dapper",
-    "dare",
-    "dark",
-    "darken",
-    "darker",
-    "darkest",
-    "darkness",
-    "darling",
-    "dart",
-    "darts",
-    "das",
-    "dash",
-    "dashboard",
-    "dashing",
-    "dat",
-    "data",
-    "database",
-    "date",
-    "dated",
-    "dates",
-    "dating",
-    "dats",
-    "daughter",
-    "daughters",
-    "david",
-    "davis",
-    "dawn",
-    "day",
-    "daycare",
-    "daydream",
-    "daylight",
-    "days",
-    "daytime",
-    "daytons",
-    "daze",
-    "dazing",
-    "dc",
-    "de",
-    "dea",
-    "deacon",
-    "dead",
-    "deadbeat",
-    "deadline",
-    "deadly",
-    "deaf",
-    "deal",
-    "dealer",
-    "dealers",
-    "dealership",
-    "dealing",
-    "dealings",
-    "deals",
-    "dealt",
-    "dean",
-    "dear",
-    "dearly",
-    "death",
-    "deaths",
-    "debate",
-    "debated",
-    "debating",
-    "debit",
-    "debris",
-    "debt",
-    "debut",
-    "decade",
-    "decapitate",
-    "decatur",
-    "decay",
-    "deceased",
-    "deceitful",
-    "deceiving",
-    "december",
-    "decent",
-    "deception",
-    "decibels",
-    "decide",
-    "decided",
-    "decimal",
-    "decimals",
-    "decision",
-    "decisions",
-    "deck",
-    "declare",
-    "decline",
-    "declined",
-    "decor",
-    "decorated",
-    "decoration",
-    "decoy",
-    "dedicate",
-    "dedicated",
-    "dedicating",
-    "dedication",
-    "deebo",
-    "deed",
-    "deep",
-    "deeper",
-    "deepest",
-    "deer",
-    "deere",
-    "deers",
-    "defeat",
-    "defeated",
-    "defend",
-    "defendant",
-    "defender",
-    "defending",
-    "defense",
-    "defiant",
-    "define",
-    "defined",
-    "definitely",
-    "definition",
-    "deflate",
-    "defrost",
-    "defying",
-    "degree",
-    "degrees",
-    "delay",
-    "delayed",
-    "delete",
-    "deleted",
-    "deli",
-    "delicate",
-    "delicious",
-    "delight",
-    "delirious",
-    "deliver",
-    "delivered",
-    "delivery",
-    "delta",
-    "demand",
-    "demanded",
-    "demanding",
-    "demands",
-    "demeanor",
-    "demented",
-    "demise",
-    "demo",
-    "democrat",
-    "demolished",
-    "demon",
-    "demonic",
-    "demons",
-    "demonstration",
-    "den",
-    "denial",
-    "denied",
-    "denim",
-    "dennis",
-    "dense",
-    "dent",
-    "dental",
-    "dentist",
-    "dentures",
-    "denver",
-    "deny",
-    "denying",
-    "depart",
-    "departed",
-    "department",
-    "depend",
-    "depended",
-    "dependent",
-    "depending",
-    "depends",
-    "deport",
-    "deposit",
-    "deposits",
-    "depot",
-    "depressed",
-    "depressing",
-    "depression",
-    "deprived",
-    "depth",
-    "der",
-    "derail",
-    "deranged",
-    "derby",
-    "derrick",
-    "des",
-    "descent",
-    "describe",
-    "description",
-    "desert",
-    "deserted",
-    "deserve",
-    "deserved",
-    "deserves",
-    "design",
-    "designed",
-    "designer",
-    "designers",
-    "desire",
-    "desires",
-    "desk",
-    "despair",
-    "desperado",
-    "desperate",
-    "despise",
-    "despite",
-    "dessert",
-    "destination",
-    "destined",
-    "destiny",
-    "destroy",
-    "destroyed",
-    "destruction",
-    "detail",
-    "details",
-    "detectives",
-    "detector",
-    "detention",
-    "detergent",
-    "determination",
-    "determine",
-    "determined",
-    "detonation",
-    "detour",
-    "detox",
-    "detrimental",
-    "detroit",
-    "deuce",
-    "deuces",
-    "develop",
-    "developed",
-    "device",
-    "devil",
-    "devilish",
-    "devils",
-    "devoted",
-    "devotion",
-    "devoured",
-    "dew",
-    "dhabi",
-    "di",
-    "diablo",
-    "diagnosed",
-    "dial",
-    "dialing",
-    "diamond",
-    "diamonds",
-    "diana",
-    "diaper",
-    "diapers",
-    "diarrhea",
-    "diary",
-    "dice",
-    "dices",
-    "dick",
-    "dickie",
-    "dickies",
-    "dicking",
-    "dicks",
-    "dictionary",
-    "did",
-    "diddy",
-    "die",
-    "died",
-    "dieing",
-    "dies",
-    "diesel",
-    "diet",
-    "differ",
-    "difference",
-    "differences",
-    "different",
-    "differently",
-    "difficult",
-    "difficulties",
-    "dig",
-    "digest",
-    "digger",
-    "diggers",
-    "digging",
-    "diggy",
-    "digit",
-    "digital",
-    "digits",
-    "dignity",
-    "dike",
-    "dikes",
-    "dildo",
-    "dilemma",
-    "dill",
-    "dim",
-    "dime",
-    "dimension",
-    "dimensions",
-    "dimes",
-    "diminish",
-    "dimple",
-    "dimples",
-    "dine",
-    "diner",
-    "dinero",
-    "ding",
-    "dining",
-    "dinner",
-    "dinners",
-    "dinosaur",
-    "dior",
-    "dip",
-    "diploma",
-    "diplomas",
-    "dipped",
-    "dipper",
-    "dipping",
-    "dips",
-    "dipset",
-    "dire",
-    "direct",
-    "directing",
-    "direction",
-    "directions",
-    "directly",
-    "director",
-    "dirk",
-    "dirt",
-    "dirtier",
-    "dirtiest",
-    "dirty",
-    "dis",
-    "disa",
-    "disagree",
-    "disagreed",
-    "disappear",
-    "disappeared",
-    "disappearing",
-    "disappoint",
-    "disaster",
-    "disc",
-    "disciples",
-    "disco",
-    "disconnect",
-    "discouraged",
-    "discover",
-    "discovered",
-    "discreet",
-    "discretion",
-    "discriminate",
-    "discuss",
-    "discussing",
-    "discussion",
-    "disease",
-    "disgrace",
-    "disguise",
-    "disguised",
-    "disgust",
-    "disgusting",
-    "dish",
-    "dishes",
-    "dishing",
-    "dishonor",
-    "dismantle",
-    "dismiss",
-    "dismissed",
-    "disney",
-    "disown",
-    "disowned",
-    "display",
-    "dispose",
-    "disregard",
-    "disrespect",
-    "disrespected",
-    "disrespectful",
-    "disrespecting",
-    "diss",
-    "dissect",
-    "dissed",
-    "disses",
-    "dissing",
-    "dissolve",
-    "distance",
-    "distant",
-    "distorted",
-    "distracted",
-    "distractions",
-    "distress",
-    "distribute",
-    "distributing",
-    "distribution",
-    "district",
-    "disturb",
-    "disturbed",
-    "disturbing",
-    "ditch",
-    "ditches",
-    "diva",
-    "divas",
-    "dive",
-    "divide",
-    "divided",
-    "dividends",
-    "divine",
-    "diving",
-    "division",
-    "divorce",
-    "divorced",
-    "dixie",
-    "dixon",
-    "dizzy",
-    "dj",
-    "djs",
-    "dl",
-    "dm",
-    "dms",
-    "dna",
-    "do",
-    "doc",
-    "dock",
-    "docked",
-    "doctor",
-    "doctors",
-    "dodge",
-    "dodging",
-    "doe",
-    "does",
-    "dog",
-    "doge",
-    "doggie",
-    "dogging",
-    "doggy",
-    "doghouse",
-    "dogs",
-    "doing",
-    "doja",
-    "dolce",
-    "doll",
-    "dollar",
-    "dollars",
-    "dolls",
-    "dolly",
-    "dolphin",
-    "dolphins",
-    "dom",
-    "domain",
-    "dome",
-    "domes",
-    "domestic",
-    "dominate",
-    "dominican",
-    "dominicans",
-    "dominique",
-    "domino",
-    "dominoes",
-    "don",
-    "donald",
-    "done",
-    "dong",
-    "donkey",
-    "donna",
-    "donor",
-    "dons",
-    "donut",
-    "donuts",
-    "doobie",
-    "doodle",
-    "dookie",
-    "doom",
-    "doomed",
-    "door",
-    "doorbell",
-    "doorman",
-    "doormat",
-    "doors",
-    "doorstep",
-    "doorway",
-    "doot",
-    "dope",
-    "dopeboy",
-    "doped",
-    "dora",
-    "dork",
-    "dorks",
-    "dos",
-    "dosage",
-    "dose",
-    "dot",
-    "dots",
-    "dotted",
-    "double",
-    "doubled",
-    "doubles",
-    "doubling",
-    "doubt",
-    "doubted",
-    "doubting",
-    "doubts",
-    "dough",
-    "doughboy",
-    "doughnut",
-    "doughnuts",
-    "doughs",
-    "dove",
-    "doves",
-    "down",
-    "downers",
-    "downfall",
-    "downgraded",
-    "downing",
-    "download",
-    "downs",
-    "downstairs",
-    "downtime",
-    "downtown",
-    "doze",
-    "dozen",
-    "dozens",
-    "dr",
-    "dra",
-    "draco",
-    "dracos",
-    "dracula",
-    "draft",
-    "drafted",
-    "drag",
-    "dragged",
-    "dragging",
-    "dragon",
-    "dragons",
-    "drain",
-    "drake",
-    "drama",
-    "dramatic",
-    "drank",
-    "dranking",
-    "drape",
-    "draped",
-    "drapes",
-    "drastic",
-    "draw",
-    "drawer",
-    "drawers",
-    "drawing",
-    "drawl",
-    "drawls",
-    "drawn",
-    "draws",
-    "dread",
-    "dreaded",
-    "dreadlocks",
-    "dreads",
-    "dream",
-    "dreamed",
-    "dreamer",
-    "dreaming",
-    "dreams",
-    "dreamt",
-    "dreamy",
-    "drench",
-    "dress",
-    "dressed",
-    "dresser",
-    "dresses",
-    "dressing",
-    "drew",
-    "dribble",
-    "dried",
-    "dries",
-    "drift",
-    "drifting",
-    "drill",
-    "drilling",
-    "drills",
-    "drink",
-    "drinker",
-    "drinkers",
-    "drinking",
-    "drinks",
-    "drip",
-    "dripped",
-    "dripping",
-    "drive",
-    "driven",
-    "driver",
-    "drivers",
-    "drives",
-    "driveway",
-    "driveways",
-    "driving",
-    "drizzle",
-    "drones",
-    "drool",
-    "drooling",
-    "drop",
-    "dropout",
-    "dropped",
-    "dropping",
-    "drops",
-    "droptop",
-    "drought",
-    "droughts",
-    "drove",
-    "drown",
-    "drowned",
-    "drowning",
-    "drowsy",
-    "drug",
-    "drugged",
-    "drugs",
-    "drum",
-    "drummer",
-    "drumming",
-    "drums",
-    "drunk",
-    "dry",
-    "dryer",
-    "drying",
-    "ds",
-    "dual",
-    "dub",
-    "dubai",
-    "dubbed",
-    "dublin",
-    "dubs",
-    "duce",
-    "duck",
-    "ducked",
-    "ducking",
-    "ducks",
-    "duct",
-    "dud",
-    "dude",
-    "dudes",
-    "due",
-    "dues",
-    "duet",
-    "duff",
-    "duffel",
-    "duffle",
-    "duffled",
-    "dug",
-    "duke",
-    "dukes",
-    "dumb",
-    "dumber",
-    "dumbest",
-    "dummies",
-    "dummy",
-    "dump",
-    "dumped",
-    "dumping",
-    "dun",
-    "duncan",
-    "dundee",
-    "dungarees",
-    "dungeon",
-    "dungeons",
-    "dunk",
-    "dunking",
-    "dunno",
-    "duo",
-    "duplex",
-    "duplicate",
-    "dura",
-    "durant",
-    "during",
-    "dusk",
-    "dust",
-    "dusted",
-    "dusting",
-    "dusty",
-    "dutch",
-    "dutchies",
-    "duty",
-    "dvd",
-    "dwell",
-    "dweller",
-    "dwelling",
-    "dy",
-    "dye",
-    "dyed",
-    "dying",
-    "dyke",
-    "dykes",
-    "dynamite",
-    "dynasty",
-    "e",
-    "ea",
-    "each",
-    "eager",
-    "eagle",
-    "eagles",
-    "ear",
-    "eardrummers",
-    "earl",
-    "earlier",
-    "earlobe",
-    "early",
-    "earn",
-    "earned",
-    "earning",
-    "earring",
-    "earrings",
-    "ears",
-    "earth",
-    "earthquake",
-    "ease",
-    "easier",
-    "easily",
-    "east",
-    "easter",
-    "eastside",
-    "easy",
-    "eat",
-    "eater",
-    "eating",
-    "eats",
-    "eavesdropping",
-    "ebonics",
-    "ebony",
-    "echelon",
-    "echo",
-    "eclipse",
-    "economical",
-    "economy",
-    "ecstacy",
-    "ecstasy",
-    "ed",
-    "edd",
-    "eddie",
-    "eddy",
-    "edge",
-    "edges",
-    "edible",
-    "edison",
-    "edit",
-    "edition",
-    "educated",
-    "education",
-    "ee",
-    "eeny",
-    "effect",
-    "effects",
-    "effed",
-    "effing",
-    "effort",
-    "effortless",
-    "egg",
-    "eggbeater",
-    "eggs",
-    "ego",
-    "egypt",
-    "egyptian",
-    "egyptians",
-    "eh",
-    "eiffel",
-    "eight",
-    "eighteen",
-    "eighth",
-    "eights",
-    "eighty",
-    "eigth",
-    "einstein",
-    "either",
-    "ejected",
-    "el",
-    "elaborate",
-    "elastic",
-    "elated",
-    "elbow",
-    "elbows",
-    "elders",
-    "eldorado",
-    "elected",
-    "election",
-    "electric",
-    "elegant",
-    "element",
-    "elementary",
-    "elements",
-    "elephant",
-    "elephants",
-    "elevate",
-    "elevator",
-    "elevators",
-    "eleven",
-    "elite",
-    "ella",
-    "ellis",
-    "elm",
-    "else",
-    "elvis",
-    "em",
-    "email",
-    "embalming",
-    "embarrass",
-    "embarrassed",
-    "embarrassing",
-    "embassy",
-    "embody",
-    "embrace",
-    "embracing",
-    "embryo",
-    "emcee",
-    "emcees",
-    "emerge",
-    "emergency",
-    "emmy",
-    "emoji",
-    "emotion",
-    "emotional",
-    "emotionally",
-    "emotions",
-    "empathy",
-    "emphasis",
-    "empire",
-    "employ",
-    "employees",
-    "empty",
-    "emptying",
-    "ems",
-    "emulating",
-    "en",
-    "enchilada",
-    "encore",
-    "encourage",
-    "end",
-    "ended",
-    "ending",
-    "endings",
-    "endless",
-    "endlessly",
-    "endo",
-    "endorsements",
-    "ends",
-    "endurance",
-    "endure",
-    "enemies",
-    "enemy",
-    "energizer",
-    "energy",
-    "enforcement",
-    "engaged",
-    "engagement",
-    "engine",
-    "engineer",
-    "engines",
-    "england",
-    "english",
-    "engulfed",
-    "enhance",
-    "enjoy",
-    "enjoyed",
-    "enjoying",
-    "enlighten",
-    "enormous",
-    "enough",
-    "enter",
-    "entered",
-    "entering",
-    "entertain",
-    "entertained",
-    "entertainer",
-    "entertaining",
-    "entertainment",
-    "entice",
-    "entire",
-    "entirely",
-    "entitled",
-    "entourage",
-    "entrance",
-    "entree",
-    "entrepreneur",
-    "entry",
-    "envelope",
-    "envelopes",
-    "envious",
-    "environment",
-    "envision",
-    "envy",
-    "epic",
-    "epiphany",
-    "episode",
-    "epitome",
-    "equal",
-    "equality",
-    "equals",
-    "equipped",
-    "equity",
-    "equivalent",
-    "er",
-    "era",
-    "erase",
-    "erased",
-    "eraser",
-    "erect",
-    "erection",
-    "eres",
-    "erg",
-    "erica",
-    "erotic",
-    "err",
-    "error",
-    "erupt",
-    "erving",
-    "es",
-    "escalade",
-    "escalades",
-    "escalator",
-    "escape",
-    "escaped",
-    "escaping",
-    "escobar",
-    "ese",
-    "eses",
-    "eskimo",
-    "esophagus",
-    "esoteric",
-    "espanol",
-    "especially",
-    "espn",
-    "espy",
-    "essence",
-    "est",
-    "established",
-    "establishing",
-    "estate",
-    "estates",
-    "esteem",
-    "esther",
-    "estranged",
-    "estrogen",
-    "etcetera",
-    "eternal",
-    "eternity",
-    "ether",
-    "ethiopian",
-    "etiquette",
-    "euphoria",
-    "euro",
-    "europe",
-    "european",
-    "euros",
-    "eurostep",
-    "ev",
-    "evasive",
-    "eve",
-    "even",
-    "evening",
-    "evenings",
-    "event",
-    "events",
-    "eventually",
-    "ever",
-    "everest",
-    "everlasting",
-    "every",
-    "everybody",
-    "everyday",
-    "everynight",
-    "everyone",
-    "everything",
-    "everytime",
-    "everywhere",
-    "evict",
-    "evicted",
-    "evicting",
-    "eviction",
-    "evictions",
-    "evidence",
-    "evident",
-    "evil",
-    "evolve",
-    "evolving",
-    "ew",
-    "ex",
-    "exact",
-    "exactly",
-    "exaggeration",
-    "exam",
-    "examine",
-    "example",
-    "examples",
-    "excellence",
-    "excellent",
-    "except",
-    "exception",
-    "excess",
-    "excessive",
-    "exchange",
-    "exchanged",
-    "exchanging",
-    "excite",
-    "excited",
-    "excitement",
-    "exciting",
-    "exclusive",
-    "exclusives",
-    "excursion",
-    "excuse",
-    "excuses",
-    "execute",
-    "executive",
-    "exercise",
-    "exercising",
-    "exes",
-    "exhale",
-    "exhaust",
-    "exhausted",
-    "exhausting",
-    "exhibit",
-    "exist",
-    "existed",
-    "existence",
-    "exists",
-    "exit",
-    "exorcist",
-    "exotic",
-    "expand",
-    "expanded",
-    "expanding",
-    "expect",
-    "expectations",
-    "expected",
-    "expecting",
-    "expedition",
-    "expense",
-    "expenses",
-    "expensive",
-    "experience",
-    "experiment",
-    "expired",
-    "explain",
-    "explained",
-    "explaining",
-    "explains",
-    "explanation",
-    "explicit",
-    "explode",
-    "exploding",
-    "explore",
-    "explorer",
-    "exploring",
-    "explosive",
-    "export",
-    "expose",
-    "exposed",
-    "exposure",
-    "express",
-    "expression",
-    "expressions",
-    "exquisite",
-    "extend",
-    "extended",
-    "extendo",
-    "extendos",
-    "extension",
-    "extensions",
-    "extensive",
-    "exterior",
-    "extinct",
-    "extorted",
-    "extorting",
-    "extra",
-    "extraordinary",
-    "extras",
-    "extraterrestrial",
-    "extravagant",
-    "extremely",
-    "eye",
-    "eyeball",
-    "eyeballs",
-    "eyebrows",
-    "eyed",
-    "eyeful",
-    "eyeing",
-    "eyelids",
-    "eyes",
-    "eyesight",
-    "f",
-    "fa",
-    "fab",
-    "fable",
-    "fabo",
-    "fabric",
-    "fabricated",
-    "fabrics",
-    "fabulous",
-    "facade",
-    "face",
-    "faced",
-    "faceoff",
-    "faces",
-    "facetime",
-    "facial",
-    "facility",
-    "facing",
-    "fact",
-    "factor",
-    "factories",
-    "factory",
-    "facts",
-    "faculty",
-    "fade",
-    "fadeaway",
-    "faded",
-    "fades",
-    "fading",
-    "fag",
-    "faggot",
-    "faggots",
-    "fags",
-    "fail",
-    "failed",
-    "failing",
-    "fails",
-    "failure",
-    "faint",
-    "fainted",
-    "fainting",
-    "fair",
-    "fairies",
-    "fairy",
-    "fairytale",
-    "faith",
-    "faithful",
-    "faithfully",
-    "fake",
-    "faked",
-    "faker",
-    "fakers",
-    "fakery",
-    "fakes",
-    "faking",
-    "falcon",
-    "falcons",
-    "fall",
-    "fallen",
-    "falling",
-    "fallon",
-    "falls",
-    "false",
-    "fam",
-    "fame",
-    "familia",
-    "familiar",
-    "families",
-    "family",
-    "famous",
-    "fan",
-    "fanatic",
-    "fancy",
-    "fangs",
-    "fanny",
-    "fans",
-    "fanta",
-    "fantasia",
-    "fantasies",
-    "fantasize",
-    "fantasizing",
-    "fantastic",
-    "fantasy",
-    "far",
-    "fare",
-    "farewell",
-    "fargo",
-    "farm",
-    "farmer",
-    "farmers",
-    "fart",
-    "farted",
-    "farther",
-    "farting",
-    "fascinated",
-    "fashion",
-    "fashioned",
-    "fast",
-    "faster",
-    "fastest",
-    "fat",
-    "fatal",
-    "fate",
-    "father",
-    "fathered",
-    "fatherless",
-    "fathers",
-    "fathom",
-    "fatigue",
-    "fatigues",
-    "fatter",
-    "fattest",
-    "fatty",
-    "faucet",
-    "fault",
-    "favor",
-    "favorite",
-    "favors",
-    "favour",
-    "favourite",
-    "favours",
-    "fax",
-    "fay",
-    "faze",
-    "fdr",
-    "fe",
-    "fear",
-    "feared",
-    "fearing",
-    "fearless",
-    "fears",
-    "feast",
-    "feat",
-    "feather",
-    "feathers",
-    "feature",
-    "featured",
-    "features",
-    "featuring",
-    "febreeze",
-    "february",
-    "fed",
-    "federal",
-    "feds",
-    "fee",
-    "feed",
-    "feedback",
-    "feeding",
-    "feeds",
-    "feel",
-    "feeling",
-    "feelings",
-    "feels",
-    "fees",
-    "feet",
-    "feets",
-    "feigning",
-    "feisty",
-    "fela",
-    "felicia",
-    "feline",
-    "fell",
-    "fellas",
-    "fellatio",
-    "feller",
-    "felling",
-    "fellow",
-    "fellows",
-    "felon",
-    "felonies",
-    "felons",
-    "felony",
-    "felt",
-    "fema",
-    "female",
-    "females",
-    "feminine",
-    "fen",
-    "fence",
-    "fences",
-    "fend",
-    "fender",
-    "fendi",
-    "ferragamo",
-    "ferrari",
-    "ferraris",
-    "ferris",
-    "fetch",
-    "fetish",
-    "fetti",
-    "fettuccine",
-    "fetus",
-    "feuds",
-    "fever",
-    "few",
-    "fiber",
-    "fiction",
-    "fiddle",
-    "field",
-    "fields",
-    "fiend",
-    "fiending",
-    "fiends",
-    "fierce",
-    "fifteen",
-    "fifth",
-    "fifths",
-    "fifties",
-    "fifty",
-    "fight",
-    "fighter",
-    "fighters",
-    "fighting",
-    "fights",
-    "figure",
-    "figured",
-    "figures",
-    "fiji",
-    "file",
-    "filer",
-    "files",
-    "filet",
-    "filipino",
-    "fill",
-    "filled",
-    "filler",
-    "filling",
-    "fillings",
-    "fills",
-    "film",
-    "filter",
-    "filth",
-    "filthy",
-    "fin",
-    "final",
-    "finale",
-    "finally",
-    "finals",
-    "finance",
-    "financial",
-    "financially",
-    "find",
-    "finders",
-    "finding",
-    "finds",
-    "fine",
-    "finer",
-    "finesse",
-    "finessed",
-    "finessing",
-    "finest",
-    "finger",
-    "fingernails",
-    "fingerprints",
-    "fingers",
-    "fingertips",
-    "finish",
-    "finished",
-    "fins",
-    "fire",
-    "firearm",
-    "firecracker",
-    "fired",
-    "fireman",
-    "fireplace",
-    "fires",
-    "firework",
-    "fireworks",
-    "firing",
-    "firm",
-    "first",
-    "fish",
-    "fisher",
-    "fishes",
-    "fishing",
-    "fishscale",
-    "fishy",
-    "fist",
-    "fists",
-    "fit",
-    "fitness",
-    "fits",
-    "fitted",
-    "fittest",
-    "fitting",
-    "five",
-    "fives",
-    "fix",
-    "fixed",
-    "fixing",
-    "fl",
-    "flag",
-    "flagging",
-    "flagrant",
-    "flags",
-    "flair",
-    "flake",
-    "flakes",
-    "flame",
-    "flamed",
-    "flames",
-    "flaming",
-    "flamingos",
-    "flammable",
-    "flannel",
-    "flap",
-    "flapjack",
-    "flapjacks",
-    "flapping",
-    "flare",
-    "flaring",
-    "flash",
-    "flashbacks",
-    "flashed",
-    "flashes",
-    "flashing",
-    "flashlight",
-    "flashy",
-    "flat",
-    "flatline",
-    "flats",
-    "flatter",
-    "flattered",
-    "flattery",
-    "flaunt",
-    "flav",
-    "flavor",
-    "flavored",
-    "flavors",
-    "flavour",
-    "flaw",
-    "flawless",
-    "flaws",
-    "flea",
-    "fleas",
-    "fled",
-    "flee",
-    "fleece",
-    "fleeing",
-    "fleek",
-    "flees",
-    "fleet",
-    "flesh",
-    "flew",
-    "flex",
-    "flexed",
-    "flexible",
-    "flexing",
-    "flick",
-    "flicking",
-    "flicks",
-    "flier",
-    "flies",
-    "fliest",
-    "flight",
-    "flights",
-    "flinching",
-    "fling",
-    "flintstone",
-    "flintstones",
-    "flip",
-    "flipped",
-    "flipper",
-    "flippers",
-    "flipping",
-    "flips",
-    "flirt",
-    "flirting",
-    "flirty",
-    "float",
-    "floating",
-    "floats",
-    "flock",
-    "flocking",
-    "flocks",
-    "flood",
-    "flooded",
-    "flooding",
-    "floor",
-    "floors",
-    "flop",
-    "flops",
-    "florider",
-    "florist",
-    "floss",
-    "flossed",
-    "flossing",
-    "flossy",
-    "flounder",
-    "flour",
-    "flow",
-    "flower",
-    "flowers",
-    "flowing",
-    "flown",
-    "flows",
-    "floyd",
-    "flu",
-    "fluent",
-    "fluffy",
-    "fluid",
-    "fluke",
-    "flunk",
-    "flurry",
-    "flush",
-    "flushed",
-    "flushing",
-    "flute",
-    "flutes",
-    "fly",
-    "flyer",
-    "flyest",
-    "flying",
-    "fn",
-    "fo",
-    "foam",
-    "foaming",
-    "focus",
-    "focused",
-    "foe",
-    "foes",
-    "fog",
-    "foggy",
-    "foil",
-    "fold",
-    "folded",
-    "folder",
-    "folding",
-    "folds",
-    "folk",
-    "folks",
-    "follies",
-    "follow",
-    "followed",
-    "followers",
-    "following",
-    "follows",
-    "fond",
-    "foo",
-    "food",
-    "foods",
-    "fool",
-    "fooled",
-    "foolery",
-    "fooling",
-    "foolish",
-    "foolishness",
-    "fools",
-    "foot",
-    "footage",
-    "football",
-    "footprints",
-    "foots",
-    "for",
-    "forbes",
-    "force",
-    "forced",
-    "forces",
-    "ford",
-    "fore",
-    "forecast",
-    "forehead",
-    "foreign",
-    "foreigns",
-    "foreman",
-    "forensics",
-    "foreplay",
-    "forest",
-    "forever",
-    "forewarn",
-    "forfeit",
-    "forgave",
-    "forget",
-    "forgetting",
-    "forgiato",
-    "forgiatos",
-    "forgies",
-    "forgis",
-    "forgive",
-    "forgiven",
-    "forgiveness",
-    "forgiver",
-    "forgiving",
-    "forgot",
-    "forgotten",
-    "fork",
-    "forklift",
-    "forks",
-    "form",
-    "formal",
-    "format",
-    "formed",
-    "former",
-    "forms",
-    "formula",
-    "formulas",
-    "fornicate",
-    "forreal",
-    "fort",
-    "forte",
-    "forth",
-    "forties",
-    "fortress",
-    "forts",
-    "fortunate",
-    "fortune",
-    "fortunes",
-    "forty",
-    "forward",
-    "foster",
-    "fought",
-    "foul",
-    "found",
-    "foundation",
-    "founder",
-    "fountain",
-    "four",
-    "fours",
-    "foursome",
-    "fourteen",
-    "fourth",
-    "fowl",
-    "fox",
-    "foxy",
-    "fraction",
-    "fragrance",
-    "frail",
-    "frame",
-    "framed",
-    "frames",
-    "france",
-    "franchise",
-    "franck",
-    "frank",
-    "frankenstein",
-    "franklin",
-    "franklins",
-    "franks",
-    "frat",
-    "fraud",
-    "frauds",
-    "freak",
-    "freaked",
-    "freaking",
-    "freaks",
-    "freaky",
-    "freddy",
-    "free",
-    "freeband",
-    "freebands",
-    "freed",
-    "freedom",
-    "freely",
-    "freestyle",
-    "freeway",
-    "freeze",
-    "freezer",
-    "freezing",
-    "french",
-    "frenzy",
-    "frequency",
-    "frequent",
-    "fresh",
-    "freshen",
-    "fresher",
-    "freshest",
-    "freshly",
-    "freshman",
-    "fret",
-    "friction",
-    "friday",
-    "fridays",
-    "fridge",
-    "fried",
-    "friend",
-    "friendly",
-    "friends",
-    "friendship",
-    "fries",
-    "fright",
-    "frightened",
-    "frightening",
-    "frigid",
-    "frigidaire",
-    "frisk",
-    "frito",
-    "fro",
-    "frog",
-    "frogs",
-    "from",
-    "front",
-    "fronted",
-    "fronter",
-    "fronting",
-    "fronto",
-    "fronts",
-    "frost",
-    "frostbit",
-    "frostbite",
-    "frosted",
-    "frosting",
-    "frosty",
-    "frown",
-    "froze",
-    "frozen",
-    "fruit",
-    "fruits",
-    "fruity",
-    "frustrated",
-    "fry",
-    "frying",
-    "ft",
-    "fubu",
-    "fuck",
-    "fuckboy",
-    "fuckboys",
-    "fucked",
-    "fucker",
-    "fuckers",
-    "fucking",
-    "fucks",
-    "fuego",
-    "fuel",
-    "fugazi",
-    "fugitive",
-    "ful",
-    "fulfill",
-    "fulfilled",
-    "fulfilling",
-    "full",
-    "fuller",
-    "fullest",
-    "fully",
-    "fumble",
-    "fumbling",
-    "fume",
-    "fumes",
-    "fun",
-    "function",
-    "fund",
-    "funds",
-    "funeral",
-    "funerals",
-    "funk",
-    "funking",
-    "funky",
-    "funny",
-    "fur",
-    "furious",
-    "furnace",
-    "furniture",
-    "furry",
-    "furs",
-    "further",
-    "furthest",
-    "fuse",
-    "fuss",
-    "fussing",
-    "futon",
-    "futons",
-    "future",
-    "futures",
-    "futuristic",
-    "fuzz",
-    "fuzzy",
-    "f\u03bfr",
-    "g",
-    "ga",
-    "gabbana",
-    "gadget",
-    "gadgets",
-    "gag",
-    "gaga",
-    "gagging",
-    "gain",
-    "gained",
-    "gaining",
-    "gal",
-    "gala",
-    "galaxy",
-    "gale",
-    "gallery",
-    "gallon",
-    "galore",
-    "gals",
-    "gambino",
-    "gamble",
-    "gambling",
-    "game",
-    "games",
-    "gaming",
-    "gander",
-    "gang",
-    "gangbang",
-    "gangbangers",
-    "gangbanging",
-    "gangland",
-    "gangs",
-    "gangsta",
-    "gangstas",
-    "gangster",
-    "gangsters",
-    "ganja",
-    "gap",
-    "gar",
-    "garage",
-    "garages",
-    "garbage",
-    "garden",
-    "garfield",
-    "gargle",
-    "garlic",
-    "garment",
-    "garments",
-    "gars",
-    "garter",
-    "gary",
-    "gas",
-    "gasoline",
-    "gasping",
-    "gassed",
-    "gassing",
-    "gat",
-    "gate",
-    "gated",
-    "gates",
-    "gateway",
-    "gather",
-    "gathered",
-    "gathering",
-    "gator",
-    "gators",
-    "gats",
-    "gauge",
-    "gave",
-    "gavel",
-    "gay",
-    "gaze",
-    "gd",
-    "ge",
-    "gear",
-    "gears",
-    "gee",
-    "geek",
-    "geeked",
-    "geekers",
-    "geeking",
-    "gees",
-    "geese",
-    "geezer",
-    "geezy",
-    "gelatin",
-    "gelato",
-    "gems",
-    "gen",
-    "general",
-    "generally",
-    "generals",
-    "generation",
-    "generations",
-    "generator",
-    "generous",
-    "genes",
-    "genesis",
-    "genie",
-    "genitalia",
-    "genitals",
-    "genius",
-    "genocide",
-    "gent",
-    "gentle",
-    "gentleman",
-    "gentlemen",
-    "gently",
-    "genuine",
-    "george",
-    "georgetown",
-    "georgia",
-    "germ",
-    "german",
-    "germans",
-    "germany",
-    "germs",
-    "get",
-    "getcha",
-    "gets",
-    "getta",
-    "getter",
-    "getting",
-    "ghana",
-    "ghetto",
-    "ghettoes",
-    "ghettos",
-    "ghost",
-    "ghosts",
-    "gi",
-    "giant",
-    "giants",
-    "gibbs",
-    "gibraltar",
-    "gibson",
-    "giddy",
-    "gift",
-    "gifted",
-    "gifts",
-    "gig",
-    "gigantic",
-    "giggle",
-    "giggles",
-    "gilbert",
-    "gilligan",
-    "gimme",
-    "gimmick",
-    "gimmicks",
-    "gimmie",
-    "gin",
-    "ginger",
-    "gingerbread",
-    "giraffe",
-    "giraffes",
-    "girdle",
-    "girl",
-    "girlfriend",
-    "girlfriends",
-    "girlies",
-    "girls",
-    "girly",
-    "git",
-    "giuseppe",
-    "giuseppes",
-    "give",
-    "given",
-    "givenchy",
-    "givens",
-    "giver",
-    "gives",
-    "giving",
-    "glacier",
-    "glaciers",
-    "glad",
-    "gladiator",
-    "gladly",
-    "glah",
-    "glamour",
-    "glance",
-    "glare",
-    "glares",
-    "glaring",
-    "glass",
-    "glasses",
-    "glassy",
-    "gleam",
-    "gleaming",
-    "glee",
-    "glen",
-    "glide",
-    "gliding",
-    "glimmer",
-    "glimpse",
-    "glisten",
-    "glistening",
-    "glitch",
-    "glitter",
-    "glitz",
-    "global",
-    "globe",
-    "glock",
-    "glocks",
-    "glorify",
-    "glorious",
-    "glory",
-    "gloss",
-    "glove",
-    "glover",
-    "gloves",
-    "glow",
-    "glowing",
-    "glue",
-    "glued",
-    "gluteus",
-    "gm",
-    "gnarly",
-    "gnat",
-    "go",
-    "goal",
-    "goalie",
-    "goals",
-    "goat",
-    "goblin",
-    "goblins",
-    "god",
-    "goddamn",
-    "goddess",
-    "godfather",
-    "godly",
-    "gods",
-    "godzilla",
-    "goes",
-    "goggles",
-    "going",
-    "gold",
-    "golden",
-    "goldfish",
-    "goldie",
-    "golds",
-    "golf",
-    "golfer",
-    "golfing",
-    "goliath",
-    "gon",
-    "gone",
-    "goner",
-    "gong",
-    "gonna",
-    "gonzales",
-    "goo",
-    "good",
-    "goodbye",
-    "goodbyes",
-    "goodfellas",
-    "goodie",
-    "goodies",
-    "goodness",
-    "goods",
-    "goody",
-    "gooey",
-    "goof",
-    "goofies",
-    "goofy",
-    "google",
-    "goon",
-    "goonie",
-    "goonies",
-    "goons",
-    "goose",
-    "goosebumps",
-    "gorgeous",
-    "gorilla",
-    "gorillas",
-    "gospel",
-    "gossip",
-    "gossiping",
-    "got",
-    "gotcha",
-    "gotta",
-    "gotten",
-    "gotti",
-    "government",
-    "governor",
-    "gown",
-    "gowned",
-    "goyard",
-    "gps",
-    "grab",
-    "grabbed",
-    "grabbing",
-    "grace",
-    "gracious",
-    "grade",
-    "grades",
-    "graduate",
-    "graduated",
-    "graduation",
-    "graffiti",
-    "graham",
-    "grain",
-    "gram",
-    "grammar",
-    "grammy",
-    "grams",
-    "gran",
-    "grand",
-    "granddaddy",
-    "grande",
-    "grandfather",
-    "grandma",
-    "grandmother",
-    "grandpa",
-    "grands",
-    "grandson",
-    "granny",
-    "grant",
-    "granted",
-    "granting",
-    "grants",
-    "grape",
-    "grapes",
-    "grapevine",
-    "graphic",
-    "grasp",
-    "grass",
-    "grateful",
-    "gratitude",
-    "grave",
-    "gravel",
-    "graveyard",
-    "gravitate",
-    "gravity",
-    "gravitys",
-    "gravy",
-    "gray",
-    "graze",
-    "grease",
-    "greasy",
-    "great",
-    "greater",
-    "greatest",
-    "greatness",
-    "greats",
-    "greece",
-    "greed",
-    "greedy",
-    "greek",
-    "green",
-    "greener",
-    "greenery",
-    "greens",
-    "greet",
-    "greeted",
-    "greeting",
-    "grenade",
-    "grenades",
-    "gresham",
-    "grew",
-    "grey",
-    "greyhound",
-    "grid",
-    "grief",
-    "grieve",
-    "grieving",
-    "griffey",
-    "griffin",
-    "grill",
-    "grilling",
-    "grills",
-    "grim",
-    "grime",
-    "grimy",
-    "grin",
-    "grinch",
-    "grind",
-    "grinder",
-    "grinding",
-    "gringo",
-    "gringos",
-    "grinning",
-    "grip",
-    "gripping",
-    "grips",
-    "grits",
-    "gritting",
-    "gritty",
-    "grizzle",
-    "grizzles",
-    "grizzly",
-    "groceries",
-    "grocery",
-    "groom",
-    "groove",
-    "grooves",
-    "grooving",
-    "groovy",
-    "gross",
-    "grossed",
-    "ground",
-    "grounded",
-    "grounds",
-    "group",
-    "groupie",
-    "groupies",
-    "groups",
-    "grove",
-    "grow",
-    "growing",
-    "growling",
-    "grown",
-    "grows",
-    "growth",
-    "grub",
-    "grudge",
-    "grudges",
-    "grunge",
-    "gs",
-    "gt",
-    "gtv",
-    "gu",
-    "guacamole",
-    "guala",
-    "guap",
-    "guarantee",
-    "guaranteed",
-    "guard",
-    "guardian",
-    "guarding",
-    "guards",
-    "gucci",
-    "gudda",
-    "guerilla",
-    "guerillas",
-    "guerrilla",
-    "guess",
-    "guessed",
-    "guessing",
-    "guest",
-    "guests",
-    "guevara",
-    "guidance",
-    "guide",
-    "guiding",
-    "guillotine",
-    "guilt",
-    "guilty",
-    "guinness",
-    "guitar",
-    "guitars",
-    "gullible",
-    "gully",
-    "gum",
-    "gumbo",
-    "gummy",
-    "gums",
-    "gun",
-    "gunfight",
-    "gunfire",
-    "gunned",
-    "gunner",
-    "gunners",
-    "gunning",
-    "gunplay",
-    "guns",
-    "gunshot",
-    "gunshots",
-    "guru",
-    "gushing",
-    "gushy",
-    "gut",
-    "guts",
-    "gutter",
-    "guy",
-    "guys",
-    "gym",
-    "gymnastics",
-    "gynecologist",
-    "gypsy",
-    "h",
-    "ha",
-    "habit",
-    "habitat",
-    "habits",
-    "hack",
-    "hacking",
-    "had",
-    "haha",
-    "hail",
-    "hailing",
-    "hair",
-    "haircut",
-    "haired",
-    "hairline",
-    "hairpin",
-    "hairs",
-    "hairy",
-    "haiti",
-    "haitian",
-    "haitians",
-    "hakeem",
-    "hakuna",
-    "haley",
-    "half",
-    "halfs",
-    "halftime",
-    "halfway",
-    "hall",
-    "halle",
-    "hallelujah",
-    "hallmark",
-    "hallow",
-    "halloween",
-    "halls",
-    "hallucinating",
-    "hallway",
-    "hallways",
-    "halo",
-    "halt",
-    "halves",
-    "ham",
-    "hamburger",
-    "hammer",
-    "hammered",
-    "hammers",
-    "hammock",
-    "hammy",
-    "hamper",
-    "hampton",
-    "hamptons",
-    "han",
-    "hand",
-    "handcuff",
-    "handcuffs",
-    "handed",
-    "handful",
-    "handgun",
-    "handing",
-    "handkerchief",
-    "handle",
-    "handled",
-    "handles",
-    "handling",
-    "handmade",
-    "handout",
-    "handouts",
-    "hands",
-    "handshakes",
-    "handsome",
-    "handstand",
-    "handy",
-    "hang",
-    "hangers",
-    "hanging",
-    "hangover",
-    "hangs",
-    "hank",
-    "hanks",
-    "hanna",
-    "hannah",
-    "hannibal",
-    "hap",
-    "happen",
-    "happened",
-    "happening",
-    "happens",
-    "happier",
-    "happily",
-    "happiness",
-    "happy",
-    "harambe",
-    "harassing",
-    "harbor",
-    "hard",
-    "hardcore",
-    "harden",
-    "harder",
-    "hardest",
-    "hardly",
-    "hardtop",
-    "hardwood",
-    "hare",
-    "harlem",
-    "harley",
-    "harm",
-    "harming",
-    "harmony",
-    "harpo",
-    "harry",
-    "harsh",
-    "hart",
-    "harvard",
-    "harvest",
-    "harvey",
-    "has",
-    "hash",
-    "hashtag",
-    "hasta",
-    "hasty",
-    "hat",
-    "hatch",
-    "hate",
-    "hated",
-    "hateing",
-    "hater",
-    "haters",
-    "hates",
-    "hating",
-    "hatred",
-    "hats",
-    "haul",
-    "haunt",
-    "haunted",
-    "haunting",
-    "havana",
-    "have",
-    "haven",
-    "having",
-    "havoc",
-    "haw",
-    "hawaii",
-    "hawaiian",
-    "hawk",
-    "hawking",
-    "hawks",
-    "hay",
-    "hazard",
-    "haze",
-    "hazy",
-    "hb",
-    "hbo",
-    "he",
-    "head",
-    "headache",
-    "headaches",
-    "headband",
-    "headboard",
-    "headed",
-    "heading",
-    "headless",
-    "headlights",
-    "headline",
-    "headliner",
-    "headlock",
-    "headphones",
-    "headquarters",
-    "headrest",
-    "heads",
-    "headshot",
-    "headshots",
-    "heal",
-    "healed",
-    "healing",
-    "heals",
-    "health",
-    "healthy",
-    "hear",
-    "heard",
-    "hearing",
-    "hears",
-    "hearse",
-    "hearses",
-    "heart",
-    "heartbeat",
-    "heartbeats",
-    "heartbreak",
-    "heartbreaker",
-    "heartbroken",
-    "heartless",
-    "hearts",
-    "heartthrob",
-    "heat",
-    "heated",
-    "heater",
-    "heaters",
-    "heath",
-    "heathen",
-    "heating",
-    "heats",
-    "heaven",
-    "heavenly",
-    "heavens",
-    "heavily",
-    "heavy",
-    "heavyweight",
-    "heckler",
-    "hectic",
-    "hector",
-    "heed",
-    "heel",
-    "heels",
-    "heff",
-    "hefner",
-    "hefty",
-    "heh",
-    "height",
-    "heights",
-    "heir",
-    "heist",
-    "hela",
-    "held",
-    "helicopter",
-    "helicopters",
-    "helipad",
-    "hell",
-    "hellcat",
-    "heller",
-    "hello",
-    "hells",
-    "helluva",
-    "helmet",
-    "help",
-    "helped",
-    "helping",
-    "helpless",
-    "helps",
-    "hem",
-    "hen",
-    "henchmen",
-    "hendrix",
-    "hennessy",
-    "henny",
-    "henry",
-    "her",
-    "herb",
-    "herbal",
-    "herbs",
-    "hercules",
-    "herd",
-    "here",
-    "hereditary",
-    "heres",
-    "hermes",
-    "hero",
-    "heroes",
-    "heroic",
-    "heroin",
-    "heron",
-    "herr",
-    "herringbone",
-    "hers",
-    "herself",
-    "hershey",
-    "hes",
-    "hesitant",
-    "hesitate",
-    "hesitated",
-    "hesitating",
-    "hesitation",
-    "hex",
-    "hey",
-    "hi",
-    "hiatus",
-    "hibachi",
-    "hiccups",
-    "hickies",
-    "hid",
-    "hidden",
-    "hide",
-    "hideout",
-    "hides",
-    "hiding",
-    "high",
-    "higher",
-    "highest",
-    "highlight",
-    "highlights",
-    "highly",
-    "highness",
-    "highs",
-    "highway",
-    "highways",
-    "hijack",
-    "hike",
-    "hilarious",
-    "hill",
-    "hillary",
-    "hills",
-    "hilton",
-    "him",
-    "himself",
-    "hind",
-    "hinges",
-    "hint",
-    "hip",
-    "hippie",
-    "hippy",
-    "hips",
-    "hipster",
-    "hipsters",
-    "hire",
-    "hired",
-    "hiring",
-    "his",
-    "history",
-    "hit",
-    "hitched",
-    "hitchhiker",
-    "hitler",
-    "hitman",
-    "hits",
-    "hitter",
-    "hitters",
-    "hitting",
-    "hiv",
-    "hive",
-    "hm",
-    "ho",
-    "hoarse",
-    "hobbies",
-    "hobby",
-    "hobo",
-    "hockey",
-    "hocks",
-    "hocus",
-    "hoe",
-    "hoeing",
-    "hoes",
-    "hoffa",
-    "hog",
-    "hogan",
-    "hogging",
-    "hold",
-    "holder",
-    "holding",
-    "holds",
-    "hole",
-    "holes",
-    "holiday",
-    "holidays",
-    "holier",
-    "holland",
-    "holler",
-    "hollered",
-    "hollering",
-    "hollow",
-    "hollows",
-    "holly",
-    "hollywood",
-    "holmes",
-    "holocaust",
-    "holster",
-    "holy",
-    "homage",
-    "home",
-    "homeboy",
-    "homeboys",
-    "homecoming",
-    "homegirl",
-    "homegirls",
-    "homegrown",
-    "homeless",
-    "homer",
-    "homes",
-    "hometown",
-    "homework",
-    "homey",
-    "homicide",
-    "homicides",
-    "homie",
-    "homies",
-    "homo",
-    "homos",
-    "honda",
-    "honest",
-    "honestly",
-    "honesty",
-    "honey",
-    "honeymoon",
-    "honeys",
-    "honies",
-    "honk",
-    "honor",
-    "honored",
-    "honors",
-    "hooch",
-    "hood",
-    "hoodie",
-    "hoods",
-    "hook",
-    "hookah",
-    "hooked",
-    "hooker",
-    "hookers",
-    "hooks",
-    "hooligan",
-    "hooligans",
-    "hoop",
-    "hooping",
-    "hoops",
-    "hooray",
-    "hoot",
-    "hooter",
-    "hooters",
-    "hoover",
-    "hop",
-    "hope",
-    "hoped",
-    "hopefully",
-    "hopeing",
-    "hopeless",
-    "hopes",
-    "hoping",
-    "hopped",
-    "hopping",
-    "hops",
-    "hopscotch",
-    "horizon",
-    "horizontal",
-    "hormones",
-    "horn",
-    "hornet",
-    "hornets",
-    "horns",
-    "horny",
-    "horoscope",
-    "horrible",
-    "horror",
-    "horse",
-    "horses",
-    "hos",
-    "hose",
-    "hospital",
-    "hospitality",
-    "host",
-    "hostage",
-    "hostages",
-    "hostile",
-    "hosting",
-    "hot",
-    "hotbox",
-    "hotel",
-    "hotels",
-    "hotter",
-    "hottest",
-    "hotties",
-    "houdini",
-    "hound",
-    "hour",
-    "hours",
-    "house",
-    "household",
-    "housekeeper",
-    "housekeeping",
-    "houses",
-    "housewife",
-    "housewives",
-    "housing",
-    "houston",
-    "hov",
-    "hove",
-    "hover",
-    "how",
-    "howard",
-    "howdy",
-    "however",
-    "howl",
-    "hoya",
-    "hubby",
-    "hublot",
-    "hubris",
-    "huddle",
-    "huffy",
-    "hug",
-    "huge",
-    "hugged",
-    "hugging",
-    "hugh",
-    "hugo",
-    "hugs",
-    "huh",
-    "hula",
-    "hulk",
-    "hum",
-    "human",
-    "humanity",
-    "humans",
-    "humble",
-    "hummer",
-    "hummers",
-    "humongous",
-    "humor",
-    "hump",
-    "humped",
-    "humping",
-    "humvee",
-    "hun",
-    "hunchback",
-    "huncho",
-    "hundred",
-    "hundreds",
-    "hung",
-    "hunger",
-    "hungry",
-    "hunt",
-    "hunter",
-    "hunters",
-    "hunting",
-    "hurdle",
-    "hurl",
-    "hurled",
-    "hurricane",
-    "hurricanes",
-    "hurry",
-    "hurt",
-    "hurting",
-    "hurts",
-    "husband",
-    "hush",
-    "husky",
-    "hussein",
-    "hustle",
-    "hustled",
-    "hustler",
-    "hustlers",
-    "hustling",
-    "hut",
-    "hydrant",
-    "hydro",
-    "hydroplane",
-    "hyenas",
-    "hype",
-    "hyped",
-    "hyperventilate",
-    "hyphen",
-    "hypnotic",
-    "hypnotized",
-    "hypocrite",
-    "hysterical",
-    "i",
-    "ibiza",
-    "ice",
-    "iceberg",
-    "iced",
-    "iceland",
-    "icicle",
-    "icicles",
-    "icing",
-    "icky",
-    "icon",
-    "icons",
-    "icy",
-    "id",
-    "idea",
-    "ideas",
-    "identical",
-    "identify",
-    "identity",
-    "idiot",
-    "idle",
-    "idol",
-    "idols",
-    "ie",
-    "ier",
-    "if",
-    "iffy",
-    "ig",
-    "iggy",
-    "igloo",
-    "ignite",
-    "ignited",
-    "ignition",
-    "ignorance",
-    "ignorant",
-    "ignore",
-    "ignored",
-    "ignoring",
-    "ii",
-    "iii",
-    "ike",
-    "ikes",
-    "il",
-    "ill",
-    "illegal",
-    "iller",
-    "illest",
-    "illinois",
-    "illiterate",
-    "ills",
-    "illuminate",
-    "illuminati",
-    "illusion",
-    "image",
-    "images",
-    "imaginary",
-    "imagination",
-    "imagine",
-    "imagined",
-    "imitate",
-    "imitation",
-    "imitations",
-    "immaculate",
-    "immature",
-    "immigrant",
-    "immigrants",
-    "immigration",
-    "immortal",
-    "immune",
-    "impact",
-    "impala",
-    "impalas",
-    "impatient",
-    "impeccable",
-    "imperial",
-    "import",
-    "important",
-    "imported",
-    "impossible",
-    "imposters",
-    "impostors",
-    "impress",
-    "impressed",
-    "impressing",
-    "impression",
-    "improve",
-    "improved",
-    "improvement",
-    "improving",
-    "improvise",
-    "imus",
-    "in",
-    "inc",
-    "incase",
-    "incense",
-    "incest",
-    "inch",
-    "inches",
-    "incident",
-    "incidentals",
-    "including",
-    "income",
-    "incomplete",
-    "inconsiderate",
-    "incorrect",
-    "increase",
-    "incredible",
-    "indecisive",
-    "indeed",
-    "independence",
-    "independent",
-    "index",
-    "india",
-    "indian",
-    "indianer",
-    "indians",
-    "indicted",
-    "indictments",
-    "individual",
-    "individuals",
-    "indo",
-    "indoor",
-    "industries",
-    "industry",
-    "iner",
-    "inevitable",
-    "infamous",
-    "infant",
-    "infatuated",
-    "infatuation",
-    "infected",
-    "infection",
-    "inferior",
-    "inferno",
-    "infested",
-    "infiltrated",
-    "infinite",
-    "infinitely",
-    "infinity",
-    "inflation",
-    "influence",
-    "influenced",
-    "influential",
-    "info",
-    "informants",
-    "information",
-    "informed",
-    "infrared",
-    "inhale",
-    "inhaling",
-    "inherit",
-    "initial",
-    "initials",
-    "inject",
-    "injection",
-    "ink",
-    "inky",
-    "inn",
-    "inner",
-    "inning",
-    "innocence",
-    "innocent",
-    "innovative",
-    "insane",
-    "insanity",
-    "insecure",
-    "insecurities",
-    "insecurity",
-    "insensitive",
-    "inside",
-    "insides",
-    "insight",
-    "insist",
-    "insists",
-    "insomniac",
-    "inspector",
-    "inspiration",
-    "inspire",
-    "inspired",
-    "inspiring",
-    "instagram",
-    "instance",
-    "instant",
-    "instantly",
-    "instead",
-    "instigated",
-    "instinct",
-    "instincts",
-    "institution",
-    "instrumental",
-    "instrumentals",
-    "insult",
-    "insurance",
-    "insured",
-    "intact",
-    "integrity",
-    "intellect",
-    "intellectual",
-    "intelligence",
-    "intelligent",
-    "intend",
-    "intended",
-    "intense",
-    "intensive",
-    "intention",
-    "intentions",
-    "intercept",
-    "interception",
-    "intercontinental",
-    "interest",
-    "interesting",
-    "interfere",
-    "interior",
-    "international",
-    "internet",
-    "interrupt",
-    "interrupting",
-    "interstate",
-    "intertwined",
-    "intervene",
-    "intervention",
-    "interview",
-    "interviews",
-    "intimate",
-    "intimidated",
-    "into",
-    "intoxicated",
-    "intoxicating",
-    "intro",
-    "introduce",
-    "introduced",
-    "introducing",
-    "introduction",
-    "intrude",
-    "intuition",
-    "invade",
-    "invaded",
-    "invasion",
-    "invent",
-    "invented",
-    "invention",
-    "invest",
-    "invested",
-    "investigation",
-    "investing",
-    "investment",
-    "investments",
-    "invincible",
-    "invisible",
-    "invitation",
-    "invite",
-    "invited",
-    "inviting",
-    "involve",
-    "involved",
-    "io",
-    "ion",
-    "iou",
-    "iphone",
-    "ipod",
-    "iq",
-    "iran",
-    "iraq",
-    "irate",
-    "irish",
-    "irking",
-    "iron",
-    "ironic",
-    "irony",
-    "irregular",
-    "irrelevant",
-    "irreplaceable",
-    "irritating",
-    "irs",
-    "is",
-    "isaiah",
-    "isis",
-    "islam",
-    "islamic",
-    "island",
-    "islands",
-    "issue",
-    "issues",
-    "it",
-    "italian",
-    "italy",
-    "itch",
-    "itching",
-    "itchy",
-    "its",
-    "itself",
-    "itty",
-    "iv",
-    "ivory",
-    "ivy",
-    "j",
-    "jab",
-    "jabber",
-    "jabs",
-    "jack",
-    "jackass",
-    "jacked",
-    "jacket",
-    "jackets",
-    "jackie",
-    "jacking",
-    "jackknife",
-    "jackpot",
-    "jacks",
-    "jackson",
-    "jacksons",
-    "jacob",
-    "jacobs",
-    "jacuzzi",
-    "jaded",
-    "jader",
-    "jag",
-    "jagged",
-    "jagger",
-    "jags",
-    "jaguar",
-    "jail",
-    "jailhouse",
-    "jails",
-    "jalapeno",
-    "jam",
-    "jamaica",
-    "jamaican",
-    "james",
-    "jammed",
-    "jammies",
-    "jamming",
-    "jams",
-    "jane",
-    "janet",
-    "jangle",
-    "jangling",
-    "january",
-    "japan",
-    "japanese",
-    "jar",
-    "jars",
-    "jason",
-    "jasper",
-    "jaw",
-    "jaws",
-    "jay",
-    "jays",
-    "jazz",
-    "jazzy",
-    "jealous",
-    "jealousy",
-    "jean",
-    "jeans",
-    "jeep",
-    "jeeps",
-    "jeez",
-    "jefferson",
-    "jeffery",
-    "jehovah",
-    "jell",
-    "jello",
-    "jelly",
-    "jenner",
-    "jennifer",
-    "jenny",
-    "jeopardize",
-    "jericho",
-    "jerk",
-    "jerking",
-    "jerks",
-    "jerome",
-    "jerry",
-    "jersey",
-    "jerseys",
-    "jerusalem",
-    "jesse",
-    "jesus",
-    "jet",
-    "jeter",
-    "jets",
-    "jetson",
-    "jew",
-    "jewel",
-    "jeweler",
-    "jewelers",
-    "jewelery",
-    "jeweller",
-    "jewellery",
-    "jewelry",
-    "jewels",
-    "jewish",
-    "jews",
-    "jfk",
-    "ji",
-    "jiffy",
-    "jig",
-    "jigga",
-    "jiggle",
-    "jiggling",
-    "jiggy",
-    "jill",
-    "jim",
-    "jimi",
-    "jimmy",
-    "jingle",
-    "jit",
-    "jitsu",
-    "jive",
-    "job",
-    "jobs",
-    "jock",
-    "jocked",
-    "jocking",
-    "jodeci",
-    "joe",
-    "jog",
-    "jogging",
-    "john",
-    "johnny",
-    "johns",
-    "johnson",
-    "join",
-    "joint",
-    "joints",
-    "joke",
-    "joker",
-    "jokers",
-    "jokes",
-    "joking",
-    "jolly",
-    "jones",
-    "jooks",
-    "jordan",
-    "jordans",
-    "jot",
-    "journalists",
-    "journey",
-    "joy",
-    "joyce",
-    "jr",
-    "js",
-    "juan",
-    "judas",
-    "judge",
-    "judgement",
-    "judges",
-    "judging",
-    "judgment",
-    "judo",
-    "judy",
-    "jug",
-    "jugg",
-    "jugging",
-    "juggle",
-    "juggling",
-    "jugs",
-    "juice",
-    "juices",
-    "juicy",
-    "jujitsu",
-    "juke",
-    "julio",
-    "julius",
-    "july",
-    "jumanji",
-    "jump",
-    "jumped",
-    "jumper",
-    "jumping",
-    "jumpman",
-    "jumps",
-    "jumpstart",
-    "june",
-    "jungle",
-    "jungles",
-    "junior",
-    "junk",
-    "junkie",
-    "junkies",
-    "junky",
-    "junkyard",
-    "jupiter",
-    "jurassic",
-    "jury",
-    "just",
-    "justice",
-    "justify",
-    "justin",
-    "juug",
-    "juuged",
-    "juvenile",
-    "k",
-    "ka",
-    "kaboom",
-    "kama",
-    "kamasutra",
-    "kamikaze",
-    "kangaroo",
-    "kansas",
-    "kant",
-    "karaoke",
-    "karat",
-    "karate",
-    "karats",
-    "kardashian",
-    "kareem",
-    "karen",
-    "karl",
-    "karma",
-    "kat",
-    "katie",
-    "katrina",
-    "katy",
-    "kawasaki",
-    "kc",
-    "kd",
-    "keen",
-    "keep",
-    "keeper",
-    "keepers",
-    "keeping",
-    "keeps",
-    "keisha",
-    "keith",
-    "kelly",
-    "kemosabe",
-    "ken",
-    "kendall",
-    "kennedy",
-    "kenny",
-    "kensli",
-    "kent",
-    "kentucky",
-    "kenzo",
-    "kept",
-    "ketchup",
-    "kettle",
-    "kevin",
-    "key",
-    "keyboard",
-    "keyed",
-    "keys",
-    "khaki",
-    "khakis",
-    "khalifa",
-    "khloe",
-    "ki",
-    "kia",
-    "kick",
-    "kicked",
-    "kicker",
-    "kicking",
-    "kicks",
-    "kickstand",
-    "kid",
-    "kidd",
-    "kiddie",
-    "kiddies",
-    "kidding",
-    "kidnap",
-    "kidnapped",
-    "kidnappers",
-    "kidnapping",
-    "kidney",
-    "kidneys",
-    "kids",
-    "kill",
-    "killed",
-    "killer",
-    "killers",
-    "killing",
-    "killings",
-    "kills",
-    "kilo",
-    "kilos",
-    "kilt",
-    "kim",
-    "kimbo",
-    "kind",
-    "kinder",
-    "kindergarten",
-    "kindly",
-    "kindness",
-    "kinds",
-    "kinfolk",
-    "king",
-    "kingdom",
-    "kingpin",
-    "kings",
-    "kingston",
-    "kinks",
-    "kinky",
-    "kinte",
-    "kirk",
-    "kiss",
-    "kissed",
-    "kisser",
-    "kisses",
-    "kissing",
-    "kit",
-    "kitchen",
-    "kitchens",
-    "kite",
-    "kites",
-    "kitted",
-    "kitten",
-    "kitty",
-    "kiwi",
-    "kkk",
-    "klan",
-    "kleenex",
-    "klondike",
-    "klumps",
-    "knack",
-    "knapsack",
-    "knee",
-    "kneel",
-    "knees",
-    "knew",
-    "knick",
-    "knicks",
-    "knife",
-    "knight",
-    "knives",
-    "knob",
-    "knock",
-    "knocked",
-    "knockers",
-    "knocking",
-    "knockout",
-    "knocks",
-    "knot",
-    "knots",
-    "knotty",
-    "know",
-    "knowing",
-    "knowledge",
-    "known",
-    "knows",
-    "knuckle",
-    "knuckles",
-    "kobe",
-    "kongo",
-    "kongos",
-    "korea",
-    "kors",
-    "kosher",
-    "kris",
-    "kroger",
-    "krs",
-    "krueger",
-    "kubrick",
-    "kudos",
-    "kunta",
-    "kush",
-    "ky",
-    "kylie",
-    "kyrie",
-    "l",
-    "lab",
-    "label",
-    "labeled",
-    "labels",
-    "labor",
-    "lac",
-    "lace",
-    "laced",
-    "laces",
-    "lacing",
-    "lack",
-    "lacking",
-    "lacks",
-    "lacs",
-    "ladder",
-    "lade",
-    "laden",
-    "ladies",
-    "lady",
-    "lag",
-    "lah",
-    "laid",
-    "lair",
-    "lake",
-    "lakers",
-    "lakes",
-    "lam",
-    "lamb",
-    "lambo",
-    "lamborghini",
-    "lambs",
-    "lame",
-    "lamed",
-    "lames",
-    "lamp",
-    "lamps",
-    "lance",
-    "land",
-    "landed",
-    "landing",
-    "landlord",
-    "lands",
-    "lane",
-    "lanes",
-    "language",
-    "lap",
-    "lapped",
-    "laps",
-    "laptop",
-    "laptops",
-    "larceny",
-    "large",
-    "larger",
-    "largest",
-    "larry",
-    "las",
-    "lasagna",
-    "laser",
-    "lash",
-    "lashes",
-    "lashing",
-    "lassie",
-    "last",
-    "lasting",
-    "lasts",
-    "late",
-    "lately",
-    "later",
-    "latest",
-    "latex",
-    "latin",
-    "latinos",
-    "latitude",
-    "latter",
-    "laugh",
-    "laughed",
-    "laughing",
-    "laughs",
-    "laughter",
-    "launch",
-    "launching",
-    "laundering",
-    "laundry",
-    "laurens",
-    "laurent",
-    "lava",
-    "lavish",
-    "law",
-    "lawless",
-    "lawn",
-    "lawns",
-    "lawrence",
-    "laws",
-    "lawsuit",
-    "lawyer",
-    "lawyers",
-    "lax",
-    "lay",
-    "layaway",
-    "layed",
-    "layer",
-    "laying",
-    "layover",
-    "lays",
-    "layup",
-    "lazy",
-    "le",
-    "leach",
-    "lead",
-    "leader",
-    "leaders",
-    "leading",
-    "leads",
-    "leaf",
-    "leafs",
-    "league",
-    "leagues",
-    "leak",
-    "leaking",
-    "leaks",
-    "lean",
-    "leaned",
-    "leaning",
-    "leap",
-    "leaping",
-    "lear",
-    "learn",
-    "learned",
-    "learning",
-    "lease",
-    "leased",
-    "leash",
-    "leasing",
-    "least",
-    "leather",
-    "leathers",
-    "leave",
-    "leaves",
-    "leaving",
-    "lebanon",
-    "lecture",
-    "lectures",
-    "led",
-    "ledge",
-    "ledger",
-    "lee",
-    "leech",
-    "leeches",
-    "leer",
-    "left",
-    "leftovers",
-    "leg",
-    "legacy",
-    "legal",
-    "legally",
-    "legend",
-    "legendary",
-    "legends",
-    "legged",
-    "legible",
-    "legit",
-    "lego",
-    "legs",
-    "leisure",
-    "lemme",
-    "lemon",
-    "lemonade",
-    "lemons",
-    "lend",
-    "length",
-    "lennon",
-    "leno",
-    "lenox",
-    "lens",
-    "lense",
-    "lenses",
-    "lent",
-    "leo",
-    "leon",
-    "leonardo",
-    "leone",
-    "leopard",
-    "leprechaun",
-    "leprechauns",
-    "ler",
-    "les",
-    "lesbian",
-    "lesbians",
-    "less",
-    "lesser",
-    "lesson",
-    "lessons",
-    "let",
-    "lethal",
-    "lets",
-    "letter",
-    "letterman",
-    "letters",
-    "letting",
-    "lettuce",
-    "levee",
-    "levees",
-    "level",
-    "levels",
-    "lever",
-    "leverage",
-    "levis",
-    "levitate",
-    "lewis",
-    "lexus",
-    "li",
-    "liable",
-    "liar",
-    "liars",
-    "lib",
-    "liberated",
-    "liberty",
-    "libido",
-    "libra",
-    "library",
-    "lice",
-    "license",
-    "lick",
-    "licked",
-    "licking",
-    "licks",
-    "licky",
-    "licorice",
-    "lid",
-    "lids",
-    "lie",
-    "lied",
-    "lies",
-    "lieutenant",
-    "lieutenants",
-    "life",
-    "lifeguard",
-    "lifeless",
-    "lifers",
-    "lifes",
-    "lifespan",
-    "lifestyle",
-    "lifestyles",
-    "lifetime",
-    "lift",
-    "lifted",
-    "lifting",
-    "light",
-    "lightbulb",
-    "lighten",
-    "lightening",
-    "lighter",
-    "lighters",
-    "lighthouse",
-    "lighting",
-    "lightly",
-    "lightning",
-    "lights",
-    "lightskin",
-    "like",
-    "liked",
-    "likely",
-    "likes",
-    "liking",
-    "lil",
-    "lima",
-    "limb",
-    "limbo",
-    "limbs",
-    "lime",
-    "limelight",
-    "limit",
-    "limitation",
-    "limitations",
-    "limited",
-    "limitless",
-    "limits",
-    "limo",
-    "limousine",
-    "limp",
-    "limping",
-    "lincoln",
-    "lincolns",
-    "lindsay",
-    "line",
-    "lined",
-    "linen",
-    "linens",
-    "lines",
-    "ling",
-    "lingerie",
-    "lingo",
-    "lining",
-    "link",
-    "linked",
-    "linking",
-    "links",
-    "lint",
-    "lion",
-    "lionhearted",
-    "lions",
-    "lip",
-    "lips",
-    "lipstick",
-    "liquid",
-    "liquor",
-    "liquorice",
-    "liquors",
-    "lis",
-    "lisa",
-    "list",
-    "listen",
-    "listened",
-    "listening",
-    "listens",
-    "liston",
-    "lists",
-    "lit",
-    "lite",
-    "liter",
-    "literally",
-    "literary",
-    "litigation",
-    "litter",
-    "little",
-    "litty",
-    "liv",
-    "live",
-    "lived",
-    "liver",
-    "lives",
-    "livest",
-    "livid",
-    "living",
-    "lizard",
-    "llama",
-    "llamas",
-    "load",
-    "loaded",
-    "loading",
-    "loads",
-    "loaf",
-    "loafers",
-    "loafs",
-    "loan",
-    "loaned",
-    "loaner",
-    "loans",
-    "lobbies",
-    "lobby",
-    "lobster",
-    "lobsters",
-    "local",
-    "locals",
-    "locate",
-    "location",
-    "locations",
-    "loch",
-    "lock",
-    "lockdown",
-    "locked",
-    "locker",
-    "locking",
-    "lockjaw",
-    "locks",
-    "locksmith",
-    "loco",
-    "locomotion",
-    "locust",
-    "loft",
-    "log",
-    "logic",
-    "logo",
-    "logos",
-    "logs",
-    "lol",
-    "lollipop",
-    "lolly",
-    "lolo",
-    "lombardi",
-    "london",
-    "lone",
-    "loneliness",
-    "lonely",
-    "loner",
-    "long",
-    "longer",
-    "longest",
-    "longevity",
-    "longing",
-    "longitude",
-    "look",
-    "looked",
-    "looking",
-    "lookouts",
-    "looks",
-    "loop",
-    "loops",
-    "loose",
-    "loosen",
-    "looser",
-    "loosing",
-    "loot",
-    "lopes",
-    "lord",
-    "lords",
-    "lose",
-    "loser",
-    "losers",
-    "loses",
-    "losing",
-    "loss",
-    "losses",
-    "lost",
-    "lot",
-    "lotion",
-    "lots",
-    "lotta",
-    "lottery",
-    "lotto",
-    "lotus",
-    "lou",
-    "louboutin",
-    "louboutins",
-    "loubs",
-    "loud",
-    "louder",
-    "loudest",
-    "loudly",
-    "louie",
-    "louis",
-    "louisiana",
-    "louisville",
-    "lounge",
-    "lounging",
-    "louvre",
-    "love",
-    "loved",
-    "lovely",
-    "lover",
-    "lovers",
-    "loves",
-    "loving",
-    "low",
-    "lower",
-    "lowest",
-    "lowkey",
-    "lowry",
-    "lows",
-    "lox",
-    "loyal",
-    "loyalty",
-    "lp",
-    "ls",
-    "lu",
-    "lube",
-    "lucas",
-    "lucifer",
-    "luck",
-    "lucked",
-    "luckily",
-    "lucky",
-    "lucy",
-    "luda",
-    "ludicrous",
-    "lug",
-    "luggage",
-    "luke",
-    "lukewarm",
-    "lullaby",
-    "lumber",
-    "lump",
-    "lumps",
-    "lunatic",
-    "lunatics",
-    "lunch",
-    "lunchtime",
-    "lung",
-    "lunger",
-    "lungs",
-    "lure",
-    "lurk",
-    "lurking",
-    "lust",
-    "lusting",
-    "luther",
-    "luxury",
-    "lv",
-    "lye",
-    "lying",
-    "lynch",
-    "lyrical",
-    "lyrically",
-    "lyrics",
-    "m",
-    "ma",
-    "mac",
-    "macarena",
-    "macaroni",
-    "macaulay",
-    "mace",
-    "machete",
-    "machine",
-    "machines",
-    "macho",
-    "mack",
-    "macking",
-    "macs",
-    "mad",
-    "madden",
-    "madder",
-    "made",
-    "madison",
-    "madness",
-    "madonna",
-    "mae",
-    "mafia",
-    "mag",
-    "magazine",
-    "magazines",
-    "maggots",
-    "magic",
-    "magical",
-    "magician",
-    "magnet",
-    "magnificent",
-    "magnolia",
-    "magnum",
-    "magnums",
-    "mags",
-    "maid",
-    "maids",
-    "mail",
-    "mailbox",
-    "mailman",
-    "mails",
-    "maim",
-    "main",
-    "maine",
-    "mainly",
-    "mainstream",
-    "maintain",
-    "maintaining",
-    "maintenance",
-    "maison",
-    "majestic",
-    "majesty",
-    "major",
-    "majority",
-    "majors",
-    "makaveli",
-    "make",
-    "makeover",
-    "maker",
-    "makes",
-    "makeup",
-    "making",
-    "malaria",
-    "malcom",
-    "male",
-    "males",
-    "mali",
-    "maliah",
-    "malice",
-    "malik",
-    "mall",
-    "malls",
-    "malo",
-    "malone",
-    "mama",
-    "mamacita",
-    "mamas",
-    "mamba",
-    "mami",
-    "mamma",
-    "mammal",
-    "mammy",
-    "man",
-    "manage",
-    "managed",
-    "management",
-    "manager",
-    "managers",
-    "managing",
-    "manana",
-    "mandarin",
-    "mandatory",
-    "mane",
-    "maneuver",
-    "mango",
-    "manhattan",
-    "maniac",
-    "manicured",
-    "manicuring",
-    "manifest",
-    "manifested",
-    "manilla",
-    "mann",
-    "manners",
-    "mannie",
-    "manning",
-    "mannish",
-    "manolo",
-    "mans",
-    "mansion",
-    "mansions",
-    "manslaughter",
-    "manson",
-    "mantle",
-    "manual",
-    "manure",
-    "many",
-    "map",
-    "maple",
-    "mapped",
-    "maps",
-    "mar",
-    "maracas",
-    "marathon",
-    "marble",
-    "marbles",
-    "marc",
-    "march",
-    "marching",
-    "marcus",
-    "marcy",
-    "margarita",
-    "margaritas",
-    "marge",
-    "margiela",
-    "margielas",
-    "margin",
-    "maria",
-    "mariah",
-    "marijuana",
-    "marinate",
-    "mariner",
-    "mark",
-    "marked",
-    "markers",
-    "market",
-    "marketed",
-    "marketing",
-    "marking",
-    "marks",
-    "marl",
-    "marley",
-    "marly",
-    "marques",
-    "marriage",
-    "married",
-    "marrow",
-    "marry",
-    "mars",
-    "marshall",
-    "marshawn",
-    "marshmallow",
-    "mart",
-    "marta",
-    "martian",
-    "martin",
-    "martyr",
-    "martyrs",
-    "marvel",
-    "marvelous",
-    "marvin",
-    "mary",
-    "maryland",
-    "mas",
-    "mascara",
-    "mascato",
-    "mascot",
-    "mase",
-    "maserati",
-    "mash",
-    "mashed",
-    "mashing",
-    "mask",
-    "masked",
-    "masks",
-    "mason",
-    "mass",
-    "massachusetts",
-    "massacre",
-    "massage",
-    "massages",
-    "masses",
-    "massive",
-    "master",
-    "mastered",
-    "mastermind",
-    "masterpiece",
-    "masters",
-    "masturbate",
-    "masturbating",
-    "mat",
-    "matata",
-    "match",
-    "matchbox",
-    "matches",
-    "matching",
-    "mate",
-    "material",
-    "math",
-    "mathematician",
-    "mathematics",
-    "matinee",
-    "matrimony",
-    "matrix",
-    "mats",
-    "matt",
-    "matte",
-    "matter",
-    "mattered",
-    "matters",
-    "matthews",
-    "mattress",
-    "mattresses",
-    "mature",
-    "maui",
-    "maury",
-    "maverick",
-    "mavericks",
-    "max",
-    "maxi",
-    "maxing",
-    "may",
-    "mayans",
-    "maybach",
-    "maybachs",
-    "maybe",
-    "maybelline",
-    "mayer",
-    "mayhem",
-    "mayo",
-    "mayonnaise",
-    "mayor",
-    "mayweather",
-    "maze",
-    "mazi",
-    "mazzi",
-    "mc",
-    "mccartney",
-    "mcdonalds",
-    "mcgraw",
-    "mcknight",
-    "mcqueen",
-    "mcs",
-    "md",
-    "mdma",
-    "me",
-    "meagan",
-    "meal",
-    "meals",
-    "mean",
-    "meaner",
-    "meanest",
-    "meaning",
-    "means",
-    "meant",
-    "meantime",
-    "meanwhile",
-    "measure",
-    "meat",
-    "meatloaf",
-    "mecca",
-    "mechanics",
-    "medal",
-    "medallion",
-    "medals",
-    "media",
-    "medic",
-    "medical",
-    "medication",
-    "medicine",
-    "medieval",
-    "medina",
-    "mediocre",
-    "meditate",
-    "meditation",
-    "meds",
-    "medulla",
-    "medusa",
-    "meech",
-    "meechy",
-    "meek",
-    "meeny",
-    "meet",
-    "meeting",
-    "meetings",
-    "meets",
-    "megan",
-    "mel",
-    "melee",
-    "mellow",
-    "melodic",
-    "melodies",
-    "melody",
-    "melon",
-    "melt",
-    "melted",
-    "melting",
-    "melts",
-    "member",
-    "members",
-    "membrane",
-    "memo",
-    "memories",
-    "memorize",
-    "memorized",
-    "memory",
-    "memphis",
-    "men",
-    "menace",
-    "menacing",
-    "menage",
-    "mend",
-    "mens",
-    "menstrual",
-    "mental",
-    "mentality",
-    "mentally",
-    "mention",
-    "mentioned",
-    "mentioning",
-    "mentions",
-    "mentor",
-    "menu",
-    "mercedes",
-    "mercer",
-    "merch",
-    "mercury",
-    "mercy",
-    "merely",
-    "merge",
-    "merging",
-    "merk",
-    "merlot",
-    "mermaid",
-    "merrily",
-    "merry",
-    "mes",
-    "mesmerized",
-    "mess",
-    "message",
-    "messages",
-    "messaging",
-    "messed",
-    "messiah",
-    "messing",
-    "messy",
-    "met",
-    "metal",
-    "metaphor",
-    "metaphors",
-    "meter",
-    "meters",
-    "meth",
-    "method",
-    "methods",
-    "metro",
-    "metropolis",
-    "mets",
-    "mexican",
-    "mexicano",
-    "mexicans",
-    "mexico",
-    "mg",
-    "mi",
-    "miami",
-    "mic",
-    "mice",
-    "michael",
-    "michelin",
-    "michigan",
-    "mick",
-    "mickey",
-    "micky",
-    "microphone",
-    "microwave",
-    "mics",
-    "mid",
-    "midas",
-    "middle",
-    "middleman",
-    "midget",
-    "midgets",
-    "midnight",
-    "midst",
-    "midwest",
-    "might",
-    "mighty",
-    "migo",
-    "migos",
-    "mike",
-    "mikes",
-    "mil",
-    "milan",
-    "mild",
-    "mile",
-    "mileage",
-    "miles",
-    "miley",
-    "milf",
-    "military",
-    "militia",
-    "milk",
-    "milked",
-    "milkshake",
-    "milky",
-    "mill",
-    "millennium",
-    "miller",
-    "millers",
-    "milli",
-    "millimeter",
-    "millimeters",
-    "million",
-    "millionaire",
-    "millionaires",
-    "millions",
-    "millis",
-    "mills",
-    "milly",
-    "mils",
-    "mimi",
-    "mimic",
-    "mimicking",
-    "mimosa",
-    "mind",
-    "minded",
-    "minding",
-    "minds",
-    "mindset",
-    "mine",
-    "mines",
-    "ming",
-    "mingle",
-    "mingling",
-    "mini",
-    "minimal",
-    "minimum",
-    "minister",
-    "minivan",
-    "minivans",
-    "mink",
-    "minks",
-    "minnesota",
-    "minor",
-    "minority",
-    "minors",
-    "mint",
-    "minus",
-    "minute",
-    "minutes",
-    "miny",
-    "miracle",
-    "miracles",
-    "mirage",
-    "mirror",
-    "mirrors",
-    "mis",
-    "miscellaneous",
-    "misdemeanor",
-    "miserable",
-    "misery",
-    "misfit",
-    "misfits",
-    "mislead",
-    "misprint",
-    "miss",
-    "missed",
-    "misses",
-    "missile",
-    "missiles",
-    "missing",
-    "mission",
-    "missionary",
-    "missions",
-    "mississippi",
-    "missouri",
-    "missus",
-    "missy",
-    "mist",
-    "mistake",
-    "mistaken",
-    "mistakes",
-    "mistaking",
-    "mister",
-    "mistletoe",
-    "mistreat",
-    "mistress",
-    "misunderstanding",
-    "misunderstood",
-    "mitch",
-    "mitchell",
-    "mite",
-    "mittens",
-    "mitzvah",
-    "mitzvahs",
-    "mix",
-    "mixed",
-    "mixes",
-    "mixing",
-    "mixtape",
-    "mixtapes",
-    "mixture",
-    "miyagi",
-    "mj",
-    "mm",
-    "mmm",
-    "mo",
-    "moan",
-    "moaning",
-    "moat",
-    "mob",
-    "mobbing",
-    "mobile",
-    "mobster",
-    "mobsters",
-    "mocking",
-    "mode",
-    "model",
-    "modeling",
-    "modelling",
-    "models",
-    "modern",
-    "modest",
-    "moe",
-    "mogul",
-    "moist",
-    "mojo",
-    "mold",
-    "molded",
-    "molest",
-    "mollies",
-    "molly",
-    "mollys",
-    "molotov",
-    "mom",
-    "moment",
-    "momentarily",
-    "moments",
-    "momma",
-    "mommas",
-    "moms",
-    "mon",
-    "mona",
-    "monday",
-    "money",
-    "monica",
-    "monique",
-    "monitor",
-    "monk",
-    "monkey",
-    "monkeys",
-    "monogamous",
-    "monopoly",
-    "monotone",
-    "monroe",
-    "monsoon",
-    "monster",
-    "monsters",
-    "montaner",
-    "monte",
-    "month",
-    "months",
-    "monumental",
-    "moo",
-    "mood",
-    "moods",
-    "moolah",
-    "moon",
-    "moonlight",
-    "moonshine",
-    "moonwalk",
-    "moonwalking",
-    "moore",
-    "mop",
-    "mope",
-    "mopping",
-    "moral",
-    "morals",
-    "more",
-    "morgue",
-    "morn",
-    "morning",
-    "moron",
-    "morphine",
-    "morphing",
-    "mortal",
-    "mortgage",
-    "mos",
-    "moses",
-    "mosh",
-    "mosquito",
-    "moss",
-    "mossberg",
-    "most",
-    "mostly",
-    "motel",
-    "motels",
-    "moth",
-    "mother",
-    "motherfuck",
-    "motherfucker",
-    "motherfuckers",
-    "motherfucking",
-    "mothers",
-    "motion",
-    "motionless",
-    "motions",
-    "motivate",
-    "motivated",
-    "motivating",
-    "motivation",
-    "motivational",
-    "motive",
-    "motives",
-    "motor",
-    "motorcycle",
-    "motors",
-    "motown",
-    "motto",
-    "mound",
-    "mount",
-    "mountain",
-    "mountains",
-    "mounted",
-    "mourn",
-    "mourning",
-    "mouse",
-    "mouses",
-    "mouth",
-    "mouthpiece",
-    "mouths",
-    "move",
-    "moved",
-    "movement",
-    "mover",
-    "moves",
-    "movie",
-    "movies",
-    "moving",
-    "mow",
-    "mower",
-    "mozart",
-    "mr",
-    "mrs",
-    "ms",
-    "mtv",
-    "mu",
-    "much",
-    "mud",
-    "muddy",
-    "mufasa",
-    "muffing",
-    "muffins",
-    "muffler",
-    "mufflers",
-    "mug",
-    "mugging",
-    "mugs",
-    "muhammad",
-    "mula",
-    "mule",
-    "mullah",
-    "muller",
-    "mulsanne",
-    "multi",
-    "multiple",
-    "multiply",
-    "mumble",
-    "mumbling",
-    "mummy",
-    "munch",
-    "munching",
-    "mural",
-    "murcielago",
-    "murder",
-    "murdered",
-    "murderer",
-    "murderers",
-    "murdering",
-    "murderous",
-    "murders",
-    "murk",
-    "murked",
-    "murking",
-    "murky",
-    "murphy",
-    "muscle",
-    "muscles",
-    "museum",
-    "mushroom",
-    "mushrooms",
-    "music",
-    "musical",
-    "musician",
-    "musk",
-    "muslim",
-    "muslims",
-    "must",
-    "mustache",
-    "mustang",
-    "mustard",
-    "musty",
-    "mutant",
-    "mute",
-    "mutombo",
-    "mutt",
-    "mutual",
-    "muzzle",
-    "mvp",
-    "my",
-    "myers",
-    "mylanta",
-    "myrtle",
-    "myself",
-    "myspace",
-    "mysteries",
-    "mysterio",
-    "mystery",
-    "myth",
-    "m\u00e9nage",
-    "n",
-    "na",
-    "nab",
-    "nac",
-    "nacho",
-    "nada",
-    "nae",
-    "nag",
-    "nagging",
-    "nah",
-    "nail",
-    "nails",
-    "naive",
-    "naked",
-    "name",
-    "named",
-    "nameless",
-    "names",
-    "naming",
-    "nan",
-    "nana",
-    "nancy",
-    "nanna",
-    "nanny",
-    "naomi",
-    "nap",
-    "napkin",
-    "napkins",
-    "napping",
-    "nappy",
-    "naps",
-    "narc",
-    "narcissists",
-    "narcotics",
-    "narcs",
-    "narrative",
-    "nas",
-    "nasa",
-    "nascar",
-    "nasdaq",
-    "nash",
-    "nast",
-    "nasty",
-    "nat",
-    "nate",
-    "nation",
-    "national",
-    "nations",
-    "natives",
-    "natural",
-    "nature",
-    "naughty",
-    "nauseous",
-    "naval",
-    "navel",
-    "navigate",
-    "navigated",
-    "navigation",
-    "navigator",
-    "navy",
-    "nay",
-    "nazi",
-    "nazis",
-    "nba",
-    "nc",
-    "nd",
-    "ne",
-    "near",
-    "nearer",
-    "nearest",
-    "nearly",
-    "neat",
-    "necessary",
-    "necessities",
-    "necessity",
-    "neck",
-    "necklace",
-    "necklaces",
-    "necks",
-    "need",
-    "needed",
-    "needer",
-    "needing",
-    "needle",
-    "needles",
-    "needs",
-    "needy",
-    "negative",
-    "negatives",
-    "negativity",
-    "neglect",
-    "neglected",
-    "neglecting",
-    "negro",
-    "neighbor",
-    "neighborhood",
-    "neighbors",
-    "neighbours",
-    "neither",
-    "nelly",
-    "nemo",
-    "neo",
-    "neon",
-    "nephew",
-    "nephews",
-    "neptune",
-    "neptunes",
-    "nerd",
-    "nerds",
-    "nerdy",
-    "nero",
-    "nerve",
-    "nerves",
-    "nervous",
-    "ness",
-    "nest",
-    "net",
-    "netflix",
-    "nets",
-    "network",
-    "neutral",
-    "neva",
-    "nevada",
-    "never",
-    "nevermind",
-    "new",
-    "newborn",
-    "newborns",
-    "newer",
-    "newest",
-    "newly",
-    "newport",
-    "news",
-    "newspaper",
-    "newton",
-    "next",
-    "nexus",
-    "nfl",
-    "ni",
-    "nice",
-    "nicely",
-    "nicer",
-    "nicest",
-    "nicholas",
-    "nick",
-    "nickel",
-    "nickels",
-    "nickle",
-    "nickles",
-    "nickname",
-    "nicknamed",
-    "nicks",
-    "nicotine",
-    "niece",
-    "nieces",
-    "nigerian",
-    "nigha",
-    "night",
-    "nightclub",
-    "nightly",
-    "nightmare",
-    "nightmares",
-    "nights",
-    "nighttime",
-    "nike",
-    "nikes",
-    "nimrod",
-    "ninas",
-    "nine",
-    "niner",
-    "nines",
-    "nineteen",
-    "nineties",
-    "ninety",
-    "ninja",
-    "ninjas",
-    "nintendo",
-    "ninth",
-    "nip",
-    "nipples",
-    "nirvana",
-    "nissan",
-    "nitrous",
-    "nixon",
-    "ni\u00f1o",
-    "no",
-    "noah",
-    "nobodies",
-    "nobody",
-    "nobodys",
-    "nobu",
-    "nod",
-    "nodded",
-    "nodding",
-    "noel",
-    "nogging",
-    "noise",
-    "nominated",
-    "non",
-    "nonchalant",
-    "none",
-    "nonner",
-    "nonsense",
-    "noodle",
-    "noodles",
-    "noon",
-    "noose",
-    "nope",
-    "nor",
-    "norm",
-    "normal",
-    "normally",
-    "norman",
-    "norris",
-    "north",
-    "northern",
-    "northside",
-    "nose",
-    "nosebleeds",
-    "nosey",
-    "nostrils",
-    "nosy",
-    "not",
-    "notch",
-    "note",
-    "notebook",
-    "notepad",
-    "notes",
-    "nother",
-    "nothing",
-    "nothings",
-    "notice",
-    "noticed",
-    "notices",
-    "notion",
-    "notorious",
-    "nouns",
-    "nourishment",
-    "nova",
-    "november",
-    "now",
-    "nowadays",
-    "nowhere",
-    "nu",
-    "nubians",
-    "nude",
-    "nuff",
-    "nugget",
-    "nuggets",
-    "nuisance",
-    "numb",
-    "number",
-    "numbers",
-    "numerous",
-    "nun",
-    "nuns",
-    "nurse",
-    "nursed",
-    "nursery",
-    "nurses",
-    "nut",
-    "nuts",
-    "nutted",
-    "nutting",
-    "nutty",
-    "ny",
-    "nylon",
-    "nympho",
-    "oak",
-    "oakland",
-    "oakley",
-    "oasis",
-    "oath",
-    "oats",
-    "ob",
-    "obama",
-    "obese",
-    "obey",
-    "obituary",
-    "object",
-    "objects",
-    "obligated",
-    "obliterated",
-    "obnoxious",
-    "observe",
-    "obsessed",
-    "obsession",
-    "obsolete",
-    "obstacle",
-    "obstacles",
-    "obtain",
-    "obvious",
-    "obviously",
-    "oc",
-    "occasion",
-    "occasions",
-    "occupation",
-    "occupy",
-    "occur",
-    "ocean",
-    "octagon",
-    "octane",
-    "october",
-    "octopus",
-    "od",
-    "odd",
-    "odds",
-    "ode",
-    "odor",
-    "odyssey",
-    "of",
-    "off",
-    "offed",
-    "offend",
-    "offended",
-    "offender",
-    "offenders",
-    "offending",
-    "offense",
-    "offensive",
-    "offer",
-    "offered",
-    "offering",
-    "offers",
-    "office",
-    "officer",
-    "officers",
-    "official",
-    "officially",
-    "offs",
-    "offset",
-    "offspring",
-    "offsprings",
-    "often",
-    "og",
-    "oh",
-    "ohio",
-    "oil",
-    "oink",
-    "oj",
-    "ok",
-    "okay",
-    "okey",
-    "oklahoma",
-    "old",
-    "older",
-    "oldest",
-    "olive",
-    "oliver",
-    "olympians",
-    "olympics",
-    "omega",
-    "omelette",
-    "omen",
-    "on",
-    "once",
-    "one",
-    "oner",
-    "ones",
-    "onion",
-    "onions",
-    "online",
-    "only",
-    "onset",
-    "onto",
-    "onyx",
-    "oodles",
-    "ooh",
-    "oops",
-    "ooze",
-    "oozy",
-    "open",
-    "opened",
-    "opening",
-    "openly",
-    "opens",
-    "opera",
-    "operate",
-    "operation",
-    "operator",
-    "opinion",
-    "opinionated",
-    "opinions",
-    "opponent",
-    "opponents",
-    "opportunity",
-    "oppose",
-    "opposite",
-    "opposites",
-    "opposition",
-    "oprah",
-    "ops",
-    "optimistic",
-    "option",
-    "options",
-    "opus",
-    "or",
-    "oracle",
-    "oral",
-    "orange",
-    "orbit",
-    "orbits",
-    "order",
-    "ordered",
-    "ordering",
-    "orders",
-    "ordinary",
-    "ore",
-    "organized",
-    "organs",
-    "orgasm",
-    "orgy",
-    "orientated",
-    "original",
-    "originator",
-    "orlando",
-    "orleans",
-    "ornament",
-    "orphan",
-    "orphans",
-    "os",
-    "osama",
-    "oscar",
-    "ostrich",
-    "ot",
-    "other",
-    "others",
-    "otherwise",
-    "ought",
-    "oui",
-    "ounce",
-    "ounces",
-    "our",
-    "ours",
-    "out",
-    "outbreak",
-    "outcast",
-    "outcome",
-    "outdated",
-    "outdoors",
-    "outer",
-    "outfielder",
-    "outfit",
-    "outfits",
-    "outgrew",
-    "outlandish",
-    "outlast",
-    "outlaw",
-    "outlet",
-    "outline",
-    "outrageous",
-    "outs",
-    "outshine",
-    "outside",
-    "outsiders",
-    "outstanding",
-    "outta",
-    "ov",
-    "ova",
-    "oval",
-    "ovaries",
-    "ovation",
-    "oven",
-    "over",
-    "overachiever",
-    "overall",
-    "overboard",
-    "overcharging",
-    "overcome",
-    "overcrowded",
-    "overdoing",
-    "overdose",
-    "overdosed",
-    "overdosing",
-    "overdrive",
-    "overdue",
-    "overflow",
-    "overflowing",
-    "overgrown",
-    "overheard",
-    "overload",
-    "overlook",
-    "overly",
-    "overnight",
-    "overrated",
-    "overseas",
-    "oversee",
-    "overtime",
-    "overzealous",
-    "ow",
-    "owe",
-    "owed",
-    "owens",
-    "owl",
-    "owls",
-    "own",
-    "owned",
-    "owner",
-    "owners",
-    "owning",
-    "owns",
-    "ox",
-    "oxycontin",
-    "oxygen",
-    "ozone",
-    "ozzy",
-    "p",
-    "pa",
-    "pablo",
-    "pac",
-    "pace",
-    "pacer",
-    "paces",
-    "pacific",
-    "pacifier",
-    "pacing",
-    "pacino",
-    "pack",
-    "package",
-    "packages",
-    "packaging",
-    "packed",
-    "packer",
-    "packers",
-    "packing",
-    "packs",
-    "pacquiao",
-    "pact",
-    "pad",
-    "padded",
-    "paddle",
-    "paddy",
-    "pads",
-    "page",
-    "pager",
-    "pagers",
-    "pages",
-    "paging",
-    "paid",
-    "pain",
-    "painkiller",
-    "painkillers",
-    "pains",
-    "paint",
-    "painted",
-    "painter",
-    "painters",
-    "painting",
-    "pair",
-    "pairs",
-    "pajamas",
-    "pakistan",
-    "pal",
-    "palace",
-    "pale",
-    "pall",
-    "pallbearer",
-    "palm",
-    "palmer",
-    "palms",
-    "pamper",
-    "pampered",
-    "pampers",
-    "pan",
-    "panamera",
-    "pancake",
-    "pancakes",
-    "pander",
-    "pandora",
-    "pane",
-    "panel",
-    "panic",
-    "panorama",
-    "panoramic",
-    "pans",
-    "pant",
-    "panther",
-    "panthers",
-    "panties",
-    "pantries",
-    "pantry",
-    "pants",
-    "panty",
-    "pap",
-    "papa",
-    "paparazzi",
-    "paper",
-    "papers",
-    "paperwork",
-    "papi",
-    "papoose",
-    "par",
-    "para",
-    "parachute",
-    "parade",
-    "paradise",
-    "parakeet",
-    "parallel",
-    "paralyze",
-    "paralyzed",
-    "paramedics",
-    "paranoia",
-    "paranoid",
-    "paraphernalia",
-    "paraplegic",
-    "pardon",
-    "parent",
-    "parents",
-    "pari",
-    "paris",
-    "park",
-    "parka",
-    "parkay",
-    "parked",
-    "parker",
-    "parking",
-    "parks",
-    "parlay",
-    "parliament",
-    "parlor",
-    "parlors",
-    "parole",
-    "parrot",
-    "part",
-    "parted",
-    "participation",
-    "particular",
-    "partied",
-    "parties",
-    "partition",
-    "partly",
-    "partner",
-    "partners",
-    "parts",
-    "party",
-    "partying",
-    "pas",
-    "pass",
-    "passed",
-    "passenger",
-    "passengers",
-    "passes",
-    "passing",
-    "passion",
-    "passionate",
-    "passive",
-    "passport",
-    "passports",
-    "password",
-    "past",
-    "pasta",
-    "pastel",
-    "pastor",
-    "pastors",
-    "pastry",
-    "pat",
-    "patch",
-    "patches",
-    "patek",
-    "patent",
-    "path",
-    "pathetic",
-    "pathfinder",
-    "patience",
-    "patient",
-    "patiently",
-    "patients",
-    "patio",
-    "patricia",
-    "patrick",
-    "patrol",
-    "patr\u00f3n",
-    "pattern",
-    "patty",
-    "paul",
-    "pause",
-    "paused",
-    "pausing",
-    "paved",
-    "pavement",
-    "paving",
-    "paw",
-    "pawn",
-    "pay",
-    "payback",
-    "paycheck",
-    "paychecks",
-    "payday",
-    "payed",
-    "paying",
-    "payment",
-    "payments",
-    "payola",
-    "payroll",
-    "payrolls",
-    "pays",
-    "pc",
-    "pe",
-    "pea",
-    "peace",
-    "peaceful",
-    "peach",
-    "peaches",
-    "peachtree",
-    "peacoat",
-    "peacock",
-    "peak",
-    "peaking",
-    "peanut",
-    "peanuts",
-    "pear",
-    "pearl",
-    "pearls",
-    "pearly",
-    "peas",
-    "peasant",
-    "peasants",
-    "pebble",
-    "pebbles",
-    "pecan",
-    "pecking",
-    "pedal",
-    "pedals",
-    "peddling",
-    "pedestal",
-    "pedestrian",
-    "pedestrians",
-    "pedicure",
-    "pedicured",
-    "pedigree",
-    "pee",
-    "peeing",
-    "peek",
-    "peeking",
-    "peel",
-    "peeled",
-    "peelers",
-    "peeling",
-    "peep",
-    "peeped",
-    "peephole",
-    "peeping",
-    "peeps",
-    "peers",
-    "peewee",
-    "pelican",
-    "pen",
-    "penalty",
-    "pencil",
-    "pencils",
-    "pendant",
-    "pendent",
-    "penetrate",
-    "penetrating",
-    "penetration",
-    "penguin",
-    "penis",
-    "penitentiary",
-    "penn",
-    "penned",
-    "pennies",
-    "penny",
-    "pens",
-    "pension",
-    "pent",
-    "penthouse",
-    "peons",
-    "people",
-    "peoples",
-    "pep",
-    "pepper",
-    "peppermint",
-    "peppers",
-    "pepsi",
-    "perc",
-    "percent",
-    "percentage",
-    "perception",
-    "percocet",
-    "percocets",
-    "percs",
-    "perfect",
-    "perfected",
-    "perfecting",
-    "perfection",
-    "perfectly",
-    "perform",
-    "performance",
-    "performed",
-    "performing",
-    "perfume",
-    "perhaps",
-    "perignon",
-    "perimeter",
-    "period",
-    "peripheral",
-    "perish",
-    "perishing",
-    "perk",
-    "perks",
-    "perky",
-    "perkys",
-    "perm",
-    "permanent",
-    "permanently",
-    "permission",
-    "perms",
-    "perpetrators",
-    "perry",
-    "persian",
-    "persistence",
-    "persistent",
-    "person",
-    "persona",
-    "personal",
-    "personalities",
-    "personality",
-    "personally",
-    "persons",
-    "perspective",
-    "peru",
-    "pervert",
-    "peso",
-    "pesos",
-    "pessimistic",
-    "pest",
-    "pet",
-    "petal",
-    "petals",
-    "pete",
-    "peter",
-    "petite",
-    "petrified",
-    "petrol",
-    "petty",
-    "pew",
-    "peyton",
-    "ph",
-    "pha",
-    "phantom",
-    "phantoms",
-    "pharaoh",
-    "pharaohs",
-    "pharmacy",
-    "phase",
-    "phases",
-    "phenomenal",
-    "phenomenon",
-    "phifer",
-    "philanthropist",
-    "philippe",
-    "philly",
-    "philosophy",
-    "phlegm",
-    "phoenix",
-    "phone",
-    "phones",
-    "phoney",
-    "phonics",
-    "phonies",
-    "phony",
-    "photo",
-    "photos",
-    "phrase",
-    "phrases",
-    "physical",
-    "physically",
-    "physician",
-    "physics",
-    "physique",
-    "pi",
-    "piano",
-    "pic",
-    "picasso",
-    "piccadilly",
-    "pick",
-    "picked",
-    "picker",
-    "picket",
-    "picking",
-    "pickle",
-    "pickles",
-    "picks",
-    "picky",
-    "picnic",
-    "pico",
-    "pics",
-    "picture",
-    "pictures",
-    "picturing",
-    "pie",
-    "piece",
-    "pieces",
-    "pied",
-    "pier",
-    "pierce",
-    "pierced",
-    "piercing",
-    "pierre",
-    "pies",
-    "pig",
-    "pigeon",
-    "pigeons",
-    "piggy",
-    "pigment",
-    "pigs",
-    "pikachu",
-    "pilates",
-    "pile",
-    "piles",
-    "pilgrim",
-    "pilgrims",
-    "piling",
-    "pill",
-    "pillar",
-    "pillars",
-    "pillies",
-    "pillow",
-    "pillowcase",
-    "pillows",
-    "pills",
-    "pillsbury",
-    "pilot",
-    "pilots",
-    "pimp",
-    "pimped",
-    "pimping",
-    "pimple",
-    "pimples",
-    "pimps",
-    "pinch",
-    "pinched",
-    "pinching",
-    "pine",
-    "pineapple",
-    "ping",
-    "pink",
-    "pinker",
-    "pinkie",
-    "pinkies",
-    "pinky",
-    "pinned",
-    "pinocchio",
-    "pinot",
-    "pins",
-    "pint",
-    "pinto",
-    "pints",
-    "pioneer",
-    "pious",
-    "pipe",
-    "piped",
-    "piper",
-    "pipes",
-    "piping",
-    "pippen",
-    "pips",
-    "piranha",
-    "piranhas",
-    "pirate",
-    "pisa",
-    "pisces",
-    "piss",
-    "pissed",
-    "pissing",
-    "pissy",
-    "pistol",
-    "pistols",
-    "piston",
-    "pistons",
-    "pit",
-    "pita",
-    "pitch",
-    "pitcher",
-    "pitchfork",
-    "pitching",
-    "pitiful",
-    "pits",
-    "pitt",
-    "pittsburgh",
-    "pity",
-    "pivot",
-    "pizza",
-    "pi\u00f1a",
-    "pi\u00f1ata",
-    "pj",
-    "place",
-    "placed",
-    "placement",
-    "places",
-    "placing",
-    "plaid",
-    "plain",
-    "plaintiff",
-    "plan",
-    "plane",
-    "planes",
-    "planet",
-    "plank",
-    "planking",
-    "planks",
-    "planned",
-    "planning",
-    "plans",
-    "plant",
-    "planted",
-    "planters",
-    "planting",
-    "plants",
-    "plaque",
-    "plaques",
-    "plasma",
-    "plastered",
-    "plastic",
-    "plat",
-    "plate",
-    "plateau",
-    "plated",
-    "plates",
-    "platinum",
-    "plats",
-    "platter",
-    "play",
-    "playboy",
-    "played",
-    "player",
-    "players",
-    "playground",
-    "playgrounds",
-    "playing",
-    "playlist",
-    "plays",
-    "playstation",
-    "plaza",
-    "plea",
-    "plead",
-    "pleading",
-    "pleasant",
-    "please",
-    "pleased",
-    "pleaser",
-    "pleasing",
-    "pleasure",
-    "pleasures",
-    "pledge",
-    "plenty",
-    "plies",
-    "plot",
-    "plotted",
-    "plotting",
-    "pluck",
-    "plucked",
-    "plug",
-    "plugged",
-    "plugging",
-    "plugs",
-    "plum",
-    "plumber",
-    "plummer",
-    "plump",
-    "plunger",
-    "plural",
-    "plus",
-    "plush",
-    "pluto",
-    "pm",
-    "pms",
-    "pneumonia",
-    "po",
-    "pocket",
-    "pocketbook",
-    "pockets",
-    "pocus",
-    "podium",
-    "poems",
-    "poet",
-    "poetry",
-    "pogo",
-    "point",
-    "pointed",
-    "pointers",
-    "pointing",
-    "pointless",
-    "points",
-    "poison",
-    "poisoned",
-    "poke",
-    "poked",
-    "poker",
-    "pokey",
-    "poking",
-    "poland",
-    "polar",
-    "polaroid",
-    "pole",
-    "poler",
-    "poles",
-    "police",
-    "polices",
-    "policy",
-    "polish",
-    "polished",
-    "polite",
-    "politely",
-    "politic",
-    "political",
-    "politically",
-    "politician",
-    "politicians",
-    "politics",
-    "polka",
-    "polluting",
-    "pollution",
-    "polo",
-    "polos",
-    "pom",
-    "poms",
-    "ponder",
-    "pong",
-    "pony",
-    "ponytail",
-    "poodles",
-    "poof",
-    "pookie",
-    "pool",
-    "pools",
-    "poon",
-    "poop",
-    "poor",
-    "poorer",
-    "pop",
-    "popcorn",
-    "pope",
-    "popeye",
-    "popeyes",
-    "poping",
-    "popped",
-    "popper",
-    "poppers",
-    "popping",
-    "poppy",
-    "pops",
-    "popsicle",
-    "popular",
-    "population",
-    "porcelain",
-    "porch",
-    "porches",
-    "porcupine",
-    "porcupines",
-    "pores",
-    "pork",
-    "porn",
-    "porno",
-    "pornography",
-    "pornstar",
-    "porridge",
-    "porsche",
-    "porsches",
-    "port",
-    "porta",
-    "portal",
-    "porter",
-    "portion",
-    "portland",
-    "portrait",
-    "portraits",
-    "portray",
-    "ports",
-    "pose",
-    "posed",
-    "poser",
-    "posers",
-    "posing",
-    "position",
-    "positions",
-    "positive",
-    "positively",
-    "posse",
-    "possess",
-    "possessed",
-    "possession",
-    "possessive",
-    "possible",
-    "possibly",
-    "possum",
-    "post",
-    "postal",
-    "postcard",
-    "posted",
-    "poster",
-    "posters",
-    "posting",
-    "postman",
-    "posture",
-    "pot",
-    "potato",
-    "potatoes",
-    "potent",
-    "potential",
-    "pothole",
-    "potholes",
-    "potion",
-    "pots",
-    "potter",
-    "potty",
-    "pouch",
-    "pound",
-    "pounding",
-    "pounds",
-    "pour",
-    "poured",
-    "pouring",
-    "pours",
-    "pout",
-    "pouting",
-    "poverty",
-    "pow",
-    "powder",
-    "power",
-    "powerful",
-    "powers",
-    "practically",
-    "practice",
-    "practicing",
-    "prada",
-    "praise",
-    "praises",
-    "praising",
-    "prancer",
-    "prancing",
-    "pray",
-    "prayed",
-    "prayer",
-    "prayers",
-    "praying",
-    "pre",
-    "preach",
-    "preacher",
-    "preachers",
-    "preaching",
-    "precinct",
-    "precious",
-    "precise",
-    "precision",
-    "predator",
-    "predicament",
-    "predicate",
-    "predict",
-    "predicted",
-    "prefer",
-    "preferably",
-    "preference",
-    "pregnant",
-    "premature",
-    "premeditated",
-    "premier",
-    "premium",
-    "prepare",
-    "prepared",
-    "preparing",
-    "prescribe",
-    "prescription",
-    "prescriptions",
-    "presence",
-    "present",
-    "presents",
-    "preservation",
-    "presidencies",
-    "president",
-    "presidential",
-    "presidents",
-    "press",
-    "pressed",
-    "pressing",
-    "pressure",
-    "prestigious",
-    "pretend",
-    "pretended",
-    "pretender",
-    "pretending",
-    "prettiest",
-    "pretty",
-    "prevail",
-    "prevent",
-    "preview",
-    "previous",
-    "prey",
-    "price",
-    "priceless",
-    "prices",
-    "pricing",
-    "prick",
-    "pricks",
-    "pride",
-    "priest",
-    "prima",
-    "prime",
-    "primo",
-    "prince",
-    "princess",
-    "principal",
-    "principle",
-    "principles",
-    "pringles",
-    "print",
-    "printed",
-    "printing",
-    "prints",
-    "prior",
-    "priorities",
-    "priority",
-    "prison",
-    "prisoner",
-    "prisoners",
-    "prisons",
-    "prissy",
-    "privacy",
-    "private",
-    "privates",
-    "privilege",
-    "prize",
-    "pro",
-    "prob",
-    "probably",
-    "probation",
-    "problem",
-    "problems",
-    "procedure",
-    "proceed",
-    "process",
-    "prodigy",
-    "produce",
-    "produced",
-    "producer",
-    "producers",
-    "product",
-    "production",
-    "profess",
-    "profession",
-    "professional",
-    "professionals",
-    "professor",
-    "profile",
-    "profit",
-    "profits",
-    "profound",
-    "program",
-    "progress",
-    "progressing",
-    "progression",
-    "project",
-    "projectors",
-    "projects",
-    "prolly",
-    "prolong",
-    "prom",
-    "prometh",
-    "promethazine",
-    "promise",
-    "promised",
-    "promises",
-    "promising",
-    "promo",
-    "promote",
-    "promoter",
-    "promoters",
-    "promoting",
-    "promotion",
-    "promotions",
-    "prone",
-    "pronounce",
-    "pronto",
-    "proof",
-    "prop",
-    "propaganda",
-    "propane",
-    "propellers",
-    "proper",
-    "properly",
-    "property",
-    "prophecies",
-    "prophecy",
-    "prophet",
-    "propose",
-    "props",
-    "pros",
-    "prosecutor",
-    "prosper",
-    "prostitute",
-    "prostituting",
-    "prostitution",
-    "protect",
-    "protected",
-    "protecting",
-    "protection",
-    "prototype",
-    "proud",
-    "prove",
-    "proved",
-    "proven",
-    "provide",
-    "provided",
-    "provider",
-    "providing",
-    "proving",
-    "provoke",
-    "provoked",
-    "provoking",
-    "prowl",
-    "prowler",
-    "prozac",
-    "pry",
-    "ps",
-    "psh",
-    "psyche",
-    "psychiatrist",
-    "psychic",
-    "psycho",
-    "psychopath",
-    "psychopathic",
-    "pt",
-    "pu",
-    "pub",
-    "public",
-    "publicity",
-    "publicly",
-    "publishing",
-    "pucci",
-    "puck",
-    "pucker",
-    "pudding",
-    "puddle",
-    "puerto",
-    "puff",
-    "puffing",
-    "puffs",
-    "puffy",
-    "pull",
-    "pulled",
-    "pulling",
-    "pulpit",
-    "pulse",
-    "puma",
-    "pumas",
-    "pump",
-    "pumped",
-    "pumping",
-    "pumpkin",
-    "pumps",
-    "pun",
-    "punch",
-    "punchanella",
-    "punches",
-    "punching",
-    "punish",
-    "punished",
-    "punishment",
-    "punk",
-    "punks",
-    "punt",
-    "punting",
-    "pup",
-    "pupils",
-    "puppet",
-    "puppies",
-    "puppy",
-    "purchase",
-    "purchased",
-    "pure",
-    "purest",
-    "purp",
-    "purple",
-    "purpose",
-    "purposely",
-    "purr",
-    "purse",
-    "purses",
-    "pursue",
-    "pursuing",
-    "pursuit",
-    "push",
-    "pushed",
-    "pusher",
-    "pushing",
-    "puss",
-    "pussies",
-    "pussy",
-    "pussycat",
-    "put",
-    "puts",
-    "putt",
-    "putting",
-    "putty",
-    "puzzle",
-    "pyramid",
-    "pyramids",
-    "pyrex",
-    "pyro",
-    "python",
-    "q",
-    "qaeda",
-    "qb",
-    "qs",
-    "quad",
-    "qualified",
-    "qualities",
-    "quality",
-    "quan",
-    "quarantine",
-    "quarter",
-    "quarterback",
-    "quarters",
-    "queen",
-    "queens",
-    "queso",
-    "quest",
-    "question",
-    "questioning",
-    "questions",
-    "quick",
-    "quicker",
-    "quickest",
-    "quickie",
-    "quickly",
-    "quickness",
-    "quicksand",
-    "quiet",
-    "quietly",
-    "quincy",
-    "quit",
-    "quite",
-    "quits",
-    "quitter",
-    "quitting",
-    "quo",
-    "quota",
-    "quote",
-    "quoted",
-    "quotes",
-    "quoting",
-    "r",
-    "ra",
-    "rabbit",
-    "rabbits",
-    "rabies",
-    "race",
-    "racer",
-    "races",
-    "racing",
-    "racist",
-    "racists",
-    "rack",
-    "racked",
-    "racket",
-    "racking",
-    "racks",
-    "rad",
-    "rada",
-    "radar",
-    "radical",
-    "radio",
-    "rae",
-    "raf",
-    "rag",
-    "rage",
-    "raging",
-    "rags",
-    "raid",
-    "raider",
-    "rail",
-    "rain",
-    "rainbow",
-    "rainbows",
-    "raincoat",
-    "raindrops",
-    "rained",
-    "raining",
-    "rainman",
-    "rains",
-    "rainy",
-    "raise",
-    "raised",
-    "raising",
-    "rake",
-    "raking",
-    "rallies",
-    "rally",
-    "ralo",
-    "ram",
-    "ramadan",
-    "rambling",
-    "ramen",
-    "ramming",
-    "ramp",
-    "rampage",
-    "rams",
-    "ran",
-    "ranch",
-    "ranchers",
-    "random",
-    "randomly",
-    "randy",
-    "rang",
-    "range",
-    "ranger",
-    "rank",
-    "ranking",
-    "ranks",
-    "ransom",
-    "rap",
-    "rape",
-    "raped",
-    "rapid",
-    "raping",
-    "rapped",
-    "rapper",
-    "rappers",
-    "rapping",
-    "raps",
-    "rapture",
-    "rare",
-    "rarely",
-    "rari",
-    "raris",
-    "ras",
-    "rash",
-    "rasta",
-    "rastafari",
-    "rat",
-    "ratchet",
-    "ratchets",
-    "rate",
-    "rated",
-    "rates",
-    "rather",
-    "rating",
-    "ratio",
-    "rats",
-    "ratting",
-    "rattle",
-    "rattling",
-    "raven",
-    "ravioli",
-    "raw",
-    "raws",
-    "ray",
-    "rays",
-    "razor",
-    "razors",
-    "re",
-    "reach",
-    "reached",
-    "reaching",
-    "react",
-    "reacting",
-    "reaction",
-    "read",
-    "reader",
-    "reading",
-    "ready",
-    "reagan",
-    "real",
-    "realer",
-    "realest",
-    "realist",
-    "realistic",
-    "reality",
-    "realize",
-    "realized",
-    "realizing",
-    "really",
-    "realness",
-    "reals",
-    "realtor",
-    "reap",
-    "reaper",
-    "reappear",
-    "rear",
-    "rearrange",
-    "reason",
-    "reasonable",
-    "reasons",
-    "rebel",
-    "rebellion",
-    "rebellious",
-    "rebels",
-    "rebirth",
-    "reborn",
-    "rebound",
-    "rebuild",
-    "rebuking",
-    "recall",
-    "receipt",
-    "receipts",
-    "receive",
-    "received",
-    "receiver",
-    "receiving",
-    "recent",
-    "recently",
-    "recess",
-    "recession",
-    "recipe",
-    "recite",
-    "reciting",
-    "reckless",
-    "reckon",
-    "reclaim",
-    "recline",
-    "reclining",
-    "recognise",
-    "recognition",
-    "recognize",
-    "recognized",
-    "recognizing",
-    "recollect",
-    "recollection",
-    "recommended",
-    "reconsider",
-    "record",
-    "recorded",
-    "recording",
-    "recordings",
-    "records",
-    "recoup",
-    "recover",
-    "recovering",
-    "recovery",
-    "recruit",
-    "recruiter",
-    "recruiting",
-    "rectum",
-    "recycle",
-    "recycling",
-    "red",
-    "redbone",
-    "redbones",
-    "redder",
-    "redeem",
-    "redefine",
-    "redemption",
-    "reduction",
-    "reeboks",
-    "reed",
-    "reef",
-    "reefa",
-    "reefer",
-    "reek",
-    "reeking",
-    "reel",
-    "reeves",
-    "ref",
-    "refer",
-    "referee",
-    "refill",
-    "reflect",
-    "reflecting",
-    "reflection",
-    "reflex",
-    "reflux",
-    "refresh",
-    "refrigerator",
-    "refs",
-    "refugee",
-    "refugees",
-    "refund",
-    "refusal",
-    "refuse",
-    "refused",
-    "refusing",
-    "regal",
-    "regard",
-    "regardless",
-    "reggie",
-    "regime",
-    "register",
-    "registration",
-    "regret",
-    "regretful",
-    "regrets",
-    "regretting",
-    "regroup",
-    "regular",
-    "regularly",
-    "rehab",
-    "rehabilitated",
-    "rehabilitation",
-    "rehearse",
-    "rehearsing",
-    "reid",
-    "reign",
-    "reimburse",
-    "reincarnated",
-    "reindeer",
-    "reins",
-    "reinvent",
-    "reject",
-    "rejected",
-    "rejection",
-    "rejoice",
-    "relapse",
-    "relate",
-    "related",
-    "relation",
-    "relations",
-    "relationship",
-    "relationships",
-    "relatives",
-    "relax",
-    "relaxed",
-    "relaxing",
-    "relay",
-    "release",
-    "released",
-    "releases",
-    "releasing",
-    "relentless",
-    "relevant",
-    "relief",
-    "relieve",
-    "religion",
-    "religions",
-    "religious",
-    "reload",
-    "reloaded",
-    "relocate",
-    "reluctantly",
-    "rely",
-    "relying",
-    "remain",
-    "remained",
-    "remaining",
-    "remains",
-    "remarkable",
-    "rembrandt",
-    "remedy",
-    "remember",
-    "remembered",
-    "remembering",
-    "remembers",
-    "remi",
-    "remind",
-    "reminded",
-    "reminder",
-    "reminders",
-    "reminding",
-    "reminds",
-    "reminisce",
-    "reminiscent",
-    "reminiscing",
-    "remix",
-    "remorse",
-    "remote",
-    "remove",
-    "removed",
-    "remy",
-    "renaissance",
-    "renegade",
-    "renew",
-    "rent",
-    "rental",
-    "rentals",
-    "rented",
-    "renting",
-    "rep",
-    "repair",
-    "repay",
-    "repeat",
-    "repeatedly",
-    "repeats",
-    "repent",
-    "repentance",
-    "repercussions",
-    "repertoire",
-    "repetition",
-    "replace",
-    "replaced",
-    "replacement",
-    "replacements",
-    "replacing",
-    "replay",
-    "replied",
-    "reply",
-    "report",
-    "reporting",
-    "represent",
-    "representing",
-    "reps",
-    "reptile",
-    "republic",
-    "republican",
-    "reputation",
-    "request",
-    "require",
-    "required",
-    "reruns",
-    "rescue",
-    "research",
-    "resemble",
-    "reservations",
-    "reserve",
-    "reserved",
-    "reset",
-    "reside",
-    "residence",
-    "resident",
-    "residential",
-    "resides",
-    "residue",
-    "resist",
-    "resolution",
-    "resort",
-    "respect",
-    "respected",
-    "respectful",
-    "respecting",
-    "respond",
-    "response",
-    "responsibility",
-    "responsible",
-    "rest",
-    "restaurant",
-    "restaurants",
-    "resting",
-    "restless",
-    "restore",
-    "restored",
-    "restraining",
-    "restroom",
-    "result",
-    "results",
-    "resume",
-    "resurrect",
-    "retail",
-    "retard",
-    "retarded",
-    "retards",
-    "rethink",
-    "retire",
-    "retired",
-    "retirement",
-    "retiring",
-    "retract",
-    "retreat",
-    "retro",
-    "return",
-    "reunion",
-    "reunite",
-    "reveal",
-    "revelations",
-    "revenge",
-    "revenue",
-    "reverend",
-    "reverse",
-    "review",
-    "revisit",
-    "revival",
-    "revive",
-    "revolution",
-    "revolutionary",
-    "revolver",
-    "revolving",
-    "reward",
-    "rewarded",
-    "rewind",
-    "rewinding",
-    "rewrite",
-    "rex",
-    "rhetoric",
-    "rhine",
-    "rhinestone",
-    "rhino",
-    "rhyme",
-    "rhymed",
-    "rhymer",
-    "rhymes",
-    "rhyming",
-    "rhythm",
-    "ri",
-    "rib",
-    "ribbon",
-    "ribbons",
-    "ribs",
-    "ricardo",
-    "rice",
-    "rich",
-    "richer",
-    "riches",
-    "richest",
-    "richmond",
-    "richter",
-    "rick",
-    "ricky",
-    "rico",
-    "rid",
-    "riddance",
-    "riddle",
-    "ride",
-    "rider",
-    "riders",
-    "rides",
-    "ridge",
-    "ridicule",
-    "ridiculous",
-    "riding",
-    "riesling",
-    "riff",
-    "rifle",
-    "rifles",
-    "right",
-    "righteous",
-    "rights",
-    "rigor",
-    "riley",
-    "rillo",
-    "rim",
-    "rims",
-    "rinds",
-    "ring",
-    "ringer",
-    "ringing",
-    "ringleader",
-    "rings",
-    "rink",
-    "rinse",
-    "rio",
-    "riot",
-    "riots",
-    "rip",
-    "ripe",
-    "ripped",
-    "ripper",
-    "ripping",
-    "rise",
-    "rising",
-    "risk",
-    "risked",
-    "risking",
-    "risks",
-    "risky",
-    "ritalin",
-    "rite",
-    "ritual",
-    "ritz",
-    "rival",
-    "rivalry",
-    "rivals",
-    "river",
-    "riverdale",
-    "rivers",
-    "riverside",
-    "ro",
-    "roach",
-    "roaches",
-    "road",
-    "roads",
-    "roadster",
-    "roam",
-    "roaming",
-    "roar",
-    "roaring",
-    "roars",
-    "roast",
-    "roasted",
-    "roaster",
-    "roasting",
-    "rob",
-    "robbed",
-    "robber",
-    "robbers",
-    "robbery",
-    "robbing",
-    "robe",
-    "robert",
-    "robes",
-    "robing",
-    "robins",
-    "robinson",
-    "robitussin",
-    "robot",
-    "robotic",
-    "robs",
-    "roc",
-    "rock",
-    "rocked",
-    "rocker",
-    "rocket",
-    "rockets",
-    "rocking",
-    "rocko",
-    "rocks",
-    "rockstar",
-    "rocky",
-    "rod",
-    "rode",
-    "rodents",
-    "rodeo",
-    "rodham",
-    "rodman",
-    "rodney",
-    "roger",
-    "rogers",
-    "rogue",
-    "role",
-    "roleplay",
-    "roles",
-    "rolex",
-    "roll",
-    "rolled",
-    "roller",
-    "rollers",
-    "rollie",
-    "rollies",
-    "rolling",
-    "rolls",
-    "rom",
-    "roman",
-    "romance",
-    "romancing",
-    "romantic",
-    "rome",
-    "romeo",
-    "ron",
-    "ronald",
-    "ronda",
-    "rondo",
-    "roof",
-    "rooftop",
-    "rookie",
-    "rookies",
-    "room",
-    "roommate",
-    "rooms",
-    "rooster",
-    "root",
-    "rooting",
-    "roots",
-    "rope",
-    "ropes",
-    "rosa",
-    "roscoe",
-    "rose",
-    "roses",
-    "ross",
-    "roster",
-    "ros\u00e9",
-    "ros\u00e9s",
-    "rot",
-    "rotate",
-    "rotation",
-    "rotten",
-    "rottweiler",
-    "rouge",
-    "rough",
-    "rougher",
-    "roulette",
-    "round",
-    "rounded",
-    "rounds",
-    "route",
-    "routes",
-    "routine",
-    "rove",
-    "rover",
-    "rovers",
-    "row",
-    "rowdy",
-    "rows",
-    "royal",
-    "royalty",
-    "royce",
-    "rozay",
-    "ru",
-    "rub",
-    "rubbed",
-    "rubber",
-    "rubbers",
-    "rubbing",
-    "rubbish",
-    "rubble",
-    "rubies",
-    "rubs",
-    "ruby",
-    "ruck",
-    "ruckus",
-    "rude",
-    "ruff",
-    "rug",
-    "ruga",
-    "rugby",
-    "ruger",
-    "rugged",
-    "rugs",
-    "ruined",
-    "ruing",
-    "rule",
-    "ruled",
-    "ruler",
-    "rulers",
-    "rules",
-    "rum",
-    "rumble",
-    "rumbles",
-    "rumor",
-    "rumors",
-    "rumours",
-    "rump",
-    "run",
-    "runaway",
-    "rung",
-    "runner",
-    "runners",
-    "running",
-    "runny",
-    "runs",
-    "runt",
-    "runway",
-    "rush",
-    "rushed",
-    "rushing",
-    "russell",
-    "russia",
-    "russian",
-    "russians",
-    "rust",
-    "rusty",
-    "ruth",
-    "ruthless",
-    "s",
-    "sa",
-    "sabotage",
-    "sabotages",
-    "sac",
-    "sack",
-    "sacked",
-    "sacks",
-    "sacred",
-    "sacrifice",
-    "sacrificed",
-    "sad",
-    "saddam",
-    "sadder",
-    "saddest",
-    "saddle",
-    "sade",
-    "sadly",
-    "safari",
-    "safe",
-    "safely",
-    "safer",
-    "safest",
-    "safety",
-    "sag",
-    "sagging",
-    "said",
-    "sail",
-    "sailing",
-    "sailor",
-    "saint",
-    "saints",
-    "sake",
-    "sakes",
-    "saki",
-    "salad",
-    "salads",
-    "salary",
-    "sale",
-    "sales",
-    "saliva",
-    "sally",
-    "salmon",
-    "salon",
-    "salsa",
-    "salt",
-    "salty",
-    "salute",
-    "sam",
-    "same",
-    "samoan",
-    "sample",
-    "sampled",
-    "samples",
-    "sams",
-    "samson",
-    "samsung",
-    "samuel",
-    "samurai",
-    "sand",
-    "sandals",
-    "sanders",
-    "sands",
-    "sandwich",
-    "sandwiches",
-    "sandy",
-    "sane",
-    "sang",
-    "sanitize",
-    "sanitized",
-    "sanity",
-    "sank",
-    "santa",
-    "santana",
-    "sap",
-    "sarah",
-    "saran",
-    "sarcastic",
-    "sardines",
-    "sassy",
-    "sat",
-    "satan",
-    "satellite",
-    "satellites",
-    "sating",
-    "satisfaction",
-    "satisfied",
-    "satisfy",
-    "saturday",
-    "saturn",
-    "sauce",
-    "sauced",
-    "saucing",
-    "saucy",
-    "saudi",
-    "sauna",
-    "sausage",
-    "savage",
-    "savages",
-    "savannah",
-    "save",
-    "saved",
-    "saver",
-    "savers",
-    "saving",
-    "savings",
-    "savior",
-    "saviour",
-    "savvy",
-    "saw",
-    "sawed",
-    "sax",
-    "say",
-    "sayers",
-    "saying",
-    "sayonara",
-    "says",
-    "sbe",
-    "scab",
-    "scale",
-    "scales",
-    "scam",
-    "scammers",
-    "scamming",
-    "scampi",
-    "scams",
-    "scan",
-    "scandal",
-    "scandalous",
-    "scandals",
-    "scanners",
-    "scapegoat",
-    "scar",
-    "scare",
-    "scarecrow",
-    "scared",
-    "scarf",
-    "scarface",
-    "scarier",
-    "scaring",
-    "scarlet",
-    "scarred",
-    "scars",
-    "scary",
-    "scatter",
-    "scattered",
-    "scenario",
-    "scene",
-    "scenery",
-    "scenes",
-    "scenic",
-    "scent",
-    "scented",
-    "schedule",
-    "scheduled",
-    "scheme",
-    "schemes",
-    "scheming",
-    "schizophrenic",
-    "scholar",
-    "scholars",
-    "scholarship",
-    "school",
-    "schoolboy",
-    "schooled",
-    "schooling",
-    "schools",
-    "schwarzenegger",
-    "science",
-    "scientist",
-    "scientists",
-    "scissors",
-    "scoob",
-    "scooby",
-    "scoop",
-    "scooped",
-    "scooping",
-    "scoot",
-    "scooter",
-    "scope",
-    "scorching",
-    "score",
-    "scoreboard",
-    "scored",
-    "scores",
-    "scoring",
-    "scorpio",
-    "scorsese",
-    "scotch",
-    "scott",
-    "scottie",
-    "scotty",
-    "scout",
-    "scram",
-    "scramble",
-    "scrambled",
-    "scrambling",
-    "scrap",
-    "scrape",
-    "scraper",
-    "scraping",
-    "scrapped",
-    "scrapping",
-    "scrappy",
-    "scraps",
-    "scratch",
-    "scratched",
-    "scratches",
-    "scratching",
-    "scream",
-    "screamed",
-    "screaming",
-    "screams",
-    "screech",
-    "screen",
-    "screens",
-    "screw",
-    "screwdriver",
-    "screwed",
-    "screwing",
-    "screws",
-    "scrimmage",
-    "script",
-    "scripted",
-    "scripture",
-    "scriptures",
-    "scroll",
-    "scrolling",
-    "scrooge",
-    "scrotum",
-    "scrub",
-    "scrubs",
-    "scrutinize",
-    "scuba",
-    "scud",
-    "scuff",
-    "scummy",
-    "scuse",
-    "se",
-    "sea",
-    "seafood",
-    "seal",
-    "sealed",
-    "seals",
-    "seam",
-    "seams",
-    "seamstress",
-    "search",
-    "searched",
-    "searching",
-    "seas",
-    "seashells",
-    "seashore",
-    "seasick",
-    "season",
-    "seasoned",
-    "seasons",
-    "seat",
-    "seatbelt",
-    "seated",
-    "seater",
-    "seats",
-    "seattle",
-    "seaweed",
-    "sec",
-    "second",
-    "seconds",
-    "secret",
-    "secretary",
-    "secrets",
-    "section",
-    "secure",
-    "security",
-    "sedan",
-    "sedated",
-    "seduce",
-    "seducing",
-    "seduction",
-    "see",
-    "seed",
-    "seeds",
-    "seeing",
-    "seek",
-    "seeking",
-    "seem",
-    "seemed",
-    "seeming",
-    "seems",
-    "seen",
-    "seersuckers",
-    "sees",
-    "segregated",
-    "segregation",
-    "seize",
-    "seized",
-    "seizure",
-    "seizures",
-    "seldom",
-    "selection",
-    "self",
-    "selfish",
-    "sell",
-    "seller",
-    "selling",
-    "sells",
-    "semen",
-    "semester",
-    "semi",
-    "semis",
-    "send",
-    "sending",
-    "sends",
-    "senior",
-    "sensation",
-    "sense",
-    "senseless",
-    "senses",
-    "sensitive",
-    "sensuous",
-    "sent",
-    "sentence",
-    "sentenced",
-    "sentences",
-    "sentimental",
-    "separate",
-    "separated",
-    "september",
-    "sequel",
-    "serenade",
-    "serener",
-    "sergeant",
-    "serial",
-    "serious",
-    "seriously",
-    "sermon",
-    "serpent",
-    "serve",
-    "served",
-    "serves",
-    "service",
-    "services",
-    "serving",
-    "sesame",
-    "sess",
-    "session",
-    "sessions",
-    "set",
-    "setbacks",
-    "seth",
-    "sets",
-    "setting",
-    "settle",
-    "settled",
-    "settlement",
-    "settles",
-    "settling",
-    "setup",
-    "seven",
-    "seventeen",
-    "seventh",
-    "seventy",
-    "several",
-    "severe",
-    "severed",
-    "seville",
-    "sew",
-    "sewed",
-    "sewer",
-    "sewers",
-    "sewing",
-    "sex",
-    "sexing",
-    "sexual",
-    "sexually",
-    "sexy",
-    "sg",
-    "shackled",
-    "shackles",
-    "shade",
-    "shaded",
-    "shades",
-    "shadow",
-    "shadows",
-    "shady",
-    "shaft",
-    "shaggy",
-    "shake",
-    "shaken",
-    "shaker",
-    "shakes",
-    "shakespeare",
-    "shaking",
-    "shallow",
-    "shame",
-    "shameless",
-    "shampoo",
-    "shank",
-    "shape",
-    "shaped",
-    "shaq",
-    "share",
-    "shared",
-    "sharing",
-    "shark",
-    "sharks",
-    "sharp",
-    "sharpen",
-    "sharpening",
-    "sharper",
-    "shatter",
-    "shattered",
-    "shave",
-    "shaved",
-    "shaving",
-    "shaw",
-    "shawn",
-    "shawty",
-    "she",
-    "shed",
-    "shedding",
-    "sheen",
-    "sheep",
-    "sheesh",
-    "sheet",
-    "sheets",
-    "sheisty",
-    "shelf",
-    "shell",
-    "shells",
-    "shelves",
-    "shepard",
-    "sherbert",
-    "sheriff",
-    "sherman",
-    "shield",
-    "shift",
-    "shifting",
-    "shifts",
-    "shimmy",
-    "shin",
-    "shine",
-    "shined",
-    "shines",
-    "shining",
-    "shinning",
-    "shiny",
-    "ship",
-    "shipment",
-    "shipped",
-    "shipping",
-    "ships",
-    "shirt",
-    "shirts",
-    "shit",
-    "shits",
-    "shitted",
-    "shitting",
-    "shitty",
-    "shiver",
-    "shivering",
-    "shivers",
-    "sho",
-    "shock",
-    "shocked",
-    "shocking",
-    "shoe",
-    "shoes",
-    "shoo",
-    "shook",
-    "shoot",
-    "shooter",
-    "shooters",
-    "shooting",
-    "shootout",
-    "shootouts",
-    "shoots",
-    "shop",
-    "shopaholic",
-    "shopper",
-    "shopping",
-    "shops",
-    "shore",
-    "shores",
-    "short",
-    "shorter",
-    "shortly",
-    "shorts",
-    "shot",
-    "shotgun",
-    "shotguns",
-    "shots",
-    "shotta",
-    "should",
-    "shoulder",
-    "shoulders",
-    "shout",
-    "shouting",
-    "shoutout",
-    "shouts",
-    "shove",
-    "shovel",
-    "shoving",
-    "show",
-    "showboat",
-    "showed",
-    "shower",
-    "showers",
-    "showing",
-    "shown",
-    "shows",
-    "showtime",
-    "shrimp",
-    "shrimps",
-    "shrink",
-    "shrinking",
-    "shrugs",
-    "shuck",
-    "shucks",
-    "shudder",
-    "shut",
-    "shutting",
-    "shuttle",
-    "shy",
-    "si",
-    "sia",
-    "siamese",
-    "siblings",
-    "sic",
-    "sicilian",
-    "sicily",
-    "sick",
-    "sickening",
-    "sicker",
-    "sickest",
-    "sickle",
-    "sickness",
-    "side",
-    "sidekick",
-    "sideline",
-    "sidelines",
-    "sides",
-    "sidetracked",
-    "sidewalk",
-    "sideways",
-    "sierra",
-    "sighed",
-    "sight",
-    "sighting",
-    "sights",
-    "sign",
-    "signal",
-    "signals",
-    "signature",
-    "signed",
-    "significant",
-    "signing",
-    "signs",
-    "silence",
-    "silencer",
-    "silent",
-    "silhouette",
-    "silicone",
-    "silk",
-    "silky",
-    "silly",
-    "silver",
-    "similar",
-    "simmer",
-    "simmons",
-    "simon",
-    "simons",
-    "simple",
-    "simply",
-    "simpson",
-    "sinatra",
-    "since",
-    "sincere",
-    "sincerely",
-    "sincerity",
-    "sing",
-    "singapore",
-    "singer",
-    "singers",
-    "singing",
-    "single",
-    "singles",
-    "sings",
-    "sinister",
-    "sink",
-    "sinking",
-    "sinned",
-    "sinner",
-    "sinners",
-    "sinning",
-    "sins",
-    "sinus",
-    "sip",
-    "sipped",
-    "sipper",
-    "sippers",
-    "sipping",
-    "sips",
-    "sir",
-    "sire",
-    "siren",
-    "sirens",
-    "sirloin",
-    "sis",
-    "sissy",
-    "sister",
-    "sisters",
-    "sit",
-    "site",
-    "sits",
-    "sitter",
-    "sitting",
-    "situation",
-    "situations",
-    "six",
-    "sixer",
-    "sixes",
-    "sixteen",
-    "sixth",
-    "sixty",
-    "size",
-    "sized",
-    "sizzle",
-    "sizzling",
-    "skate",
-    "skateboard",
-    "skated",
-    "skater",
-    "skaters",
-    "skates",
-    "skating",
-    "skeet",
-    "skeleton",
-    "skeletons",
-    "skeptic",
-    "sketch",
-    "sketchy",
-    "skewed",
-    "ski",
-    "skies",
-    "skiing",
-    "skill",
-    "skilled",
-    "skillet",
-    "skills",
-    "skin",
-    "skinned",
-    "skinnies",
-    "skinny",
-    "skinnys",
-    "skins",
-    "skip",
-    "skipped",
-    "skipper",
-    "skipping",
-    "skips",
-    "skirt",
-    "skirts",
-    "skis",
-    "skits",
-    "skittle",
-    "skittles",
-    "skrrt",
-    "skull",
-    "skunk",
-    "sky",
-    "skydive",
-    "skyline",
-    "skype",
-    "skyscrapers",
-    "slab",
-    "slabs",
-    "slack",
-    "slackers",
-    "slacking",
-    "slacks",
-    "slain",
-    "slalom",
-    "slam",
-    "slammed",
-    "slammer",
-    "slamming",
-    "slang",
-    "slanging",
-    "slant",
-    "slanted",
-    "slap",
-    "slapped",
-    "slapping",
-    "slaps",
-    "slash",
-    "slatt",
-    "slaughter",
-    "slaughtered",
-    "slaughterhouse",
-    "slave",
-    "slaved",
-    "slavery",
-    "slaves",
-    "slay",
-    "slayed",
-    "slaying",
-    "sleazy",
-    "sled",
-    "sledgehammer",
-    "sleep",
-    "sleeper",
-    "sleeping",
-    "sleepless",
-    "sleeps",
-    "sleepy",
-    "sleet",
-    "sleeve",
-    "sleeved",
-    "sleeveless",
-    "sleeves",
-    "sleigh",
-    "slept",
-    "slew",
-    "slice",
-    "slices",
-    "slick",
-    "slicker",
-    "slickest",
-    "slid",
-    "slide",
-    "slides",
-    "sliding",
-    "slight",
-    "slightest",
-    "slightly",
-    "slim",
-    "slime",
-    "slimes",
-    "sliming",
-    "sling",
-    "slinging",
-    "slip",
-    "slipped",
-    "slippers",
-    "slippery",
-    "slipping",
-    "slips",
-    "slit",
-    "slither",
-    "slob",
-    "slop",
-    "slope",
-    "sloppy",
-    "slot",
-    "slouch",
-    "slow",
-    "slowed",
-    "slower",
-    "slowing",
-    "slowly",
-    "slug",
-    "slugged",
-    "slugging",
-    "slugs",
-    "slum",
-    "slumber",
-    "slump",
-    "slumped",
-    "slums",
-    "slung",
-    "slur",
-    "slurp",
-    "slurping",
-    "slurred",
-    "slurring",
-    "slut",
-    "sluts",
-    "slutty",
-    "smack",
-    "smacked",
-    "smacking",
-    "small",
-    "smaller",
-    "smallest",
-    "smalls",
-    "smart",
-    "smarter",
-    "smartest",
-    "smarts",
-    "smash",
-    "smashed",
-    "smashing",
-    "smear",
-    "smell",
-    "smelled",
-    "smelling",
-    "smells",
-    "smelly",
-    "smile",
-    "smiles",
-    "smiley",
-    "smiling",
-    "smirk",
-    "smith",
-    "smithereens",
-    "smoke",
-    "smoked",
-    "smokeing",
-    "smoker",
-    "smokers",
-    "smokes",
-    "smoking",
-    "smooches",
-    "smooth",
-    "smoother",
-    "smoothest",
-    "smoothie",
-    "smother",
-    "smothered",
-    "smugglers",
-    "smuggling",
-    "snack",
-    "snacks",
-    "snaggle",
-    "snail",
-    "snails",
-    "snake",
-    "snakes",
-    "snaking",
-    "snap",
-    "snapchat",
-    "snapped",
-    "snapping",
-    "snappy",
-    "snaps",
-    "snare",
-    "snares",
-    "snatch",
-    "snatched",
-    "snatcher",
-    "snatchers",
-    "snatching",
-    "sneak",
-    "sneaker",
-    "sneakers",
-    "sneaking",
-    "sneaks",
-    "sneaky",
-    "sneeze",
-    "sneezed",
-    "sneezing",
-    "snicker",
-    "snickers",
-    "sniff",
-    "sniffing",
-    "snipe",
-    "sniper",
-    "snipers",
-    "snitch",
-    "snitched",
-    "snitches",
-    "snitching",
-    "snobby",
-    "snoop",
-    "snoopy",
-    "snooze",
-    "snoozing",
-    "snore",
-    "snoring",
-    "snort",
-    "snorter",
-    "snorting",
-    "snot",
-    "snotty",
-    "snow",
-    "snowball",
-    "snowed",
-    "snowflake",
-    "snowflakes",
-    "snowing",
-    "snowman",
-    "snowy",
-    "snub",
-    "snuck",
-    "snug",
-    "snuggle",
-    "so",
-    "soak",
-    "soaked",
-    "soaker",
-    "soaking",
-    "soap",
-    "soar",
-    "soaring",
-    "sober",
-    "sobriety",
-    "soccer",
-    "social",
-    "socialite",
-    "socialize",
-    "society",
-    "sock",
-    "socked",
-    "socket",
-    "sockets",
-    "socks",
-    "socrates",
-    "soda",
-    "sodas",
-    "sofa",
-    "soft",
-    "softball",
-    "soften",
-    "softer",
-    "softly",
-    "soho",
-    "soil",
-    "solar",
-    "sold",
-    "soldier",
-    "soldiers",
-    "sole",
-    "solemnly",
-    "soles",
-    "solid",
-    "solitaire",
-    "solitaires",
-    "solo",
-    "solution",
-    "solutions",
-    "solve",
-    "solved",
-    "solving",
-    "some",
-    "somebody",
-    "someday",
-    "somehow",
-    "someone",
-    "something",
-    "sometime",
-    "sometimes",
-    "somewhat",
-    "somewhere",
-    "son",
-    "song",
-    "songs",
-    "sonic",
-    "sonny",
-    "sons",
-    "sony",
-    "soon",
-    "sooner",
-    "soothe",
-    "sophisticated",
-    "sophomore",
-    "soprano",
-    "sore",
-    "sorrow",
-    "sorry",
-    "sort",
-    "sorta",
-    "sorted",
-    "sorting",
-    "sorts",
-    "sos",
-    "soul",
-    "soulful",
-    "souls",
-    "sound",
-    "sounded",
-    "sounding",
-    "sounds",
-    "soundtrack",
-    "soup",
-    "souped",
-    "sour",
-    "source",
-    "sources",
-    "south",
-    "southern",
-    "southerner",
-    "southpaw",
-    "southside",
-    "southwest",
-    "souvenir",
-    "sow",
-    "soy",
-    "spa",
-    "space",
-    "spaced",
-    "spaces",
-    "spaceship",
-    "spaceships",
-    "spacious",
-    "spade",
-    "spades",
-    "spaghetti",
-    "spain",
-    "spam",
-    "span",
-    "spangled",
-    "spanish",
-    "spank",
-    "spanked",
-    "spanking",
-    "spar",
-    "spare",
-    "sparing",
-    "spark",
-    "sparking",
-    "sparkle",
-    "sparkles",
-    "sparkling",
-    "sparks",
-    "sparring",
-    "sparrow",
-    "spas",
-    "spat",
-    "spatula",
-    "spaz",
-    "speak",
-    "speaker",
-    "speakers",
-    "speaking",
-    "speaks",
-    "spears",
-    "special",
-    "specialize",
-    "specially",
-    "species",
-    "specific",
-    "specifically",
-    "specs",
-    "spectacular",
-    "speculation",
-    "sped",
-    "speech",
-    "speeches",
-    "speechless",
-    "speed",
-    "speedboat",
-    "speeding",
-    "speedy",
-    "spell",
-    "spelled",
-    "spelling",
-    "spells",
-    "spend",
-    "spender",
-    "spenders",
-    "spending",
-    "spent",
-    "sperm",
-    "spew",
-    "sphinx",
-    "spice",
-    "spider",
-    "spiders",
-    "spiffy",
-    "spike",
-    "spiked",
-    "spikes",
-    "spill",
-    "spilled",
-    "spilling",
-    "spills",
-    "spilt",
-    "spin",
-    "spinach",
-    "spine",
-    "spinner",
-    "spinners",
-    "spinning",
-    "spins",
-    "spirit",
-    "spirits",
-    "spiritual",
-    "spiritually",
-    "spit",
-    "spite",
-    "spiteful",
-    "spits",
-    "spitted",
-    "spitter",
-    "spitting",
-    "splash",
-    "splashed",
-    "splashing",
-    "splat",
-    "splatter",
-    "splattered",
-    "spleen",
-    "splendid",
-    "spliff",
-    "spliffs",
-    "split",
-    "splits",
-    "splitting",
-    "splurge",
-    "splurging",
-    "spock",
-    "spoil",
-    "spoiled",
-    "spoke",
-    "spoken",
-    "spokes",
-    "sponsor",
-    "sponsored",
-    "spontaneous",
-    "spoof",
-    "spook",
-    "spooked",
-    "spoon",
-    "spooning",
-    "sport",
-    "sporting",
-    "sports",
-    "sportscenter",
-    "sporty",
-    "spot",
-    "spotlight",
-    "spotlights",
-    "spots",
-    "spotted",
-    "spotting",
-    "spouse",
-    "spout",
-    "sprain",
-    "sprained",
-    "spray",
-    "sprayed",
-    "spraying",
-    "spread",
-    "spreading",
-    "spree",
-    "sprees",
-    "spring",
-    "springer",
-    "springs",
-    "sprinkle",
-    "sprinkled",
-    "sprinkler",
-    "sprinklers",
-    "sprinkles",
-    "sprint",
-    "sprinter",
-    "sprinting",
-    "sprite",
-    "sprung",
-    "spud",
-    "spun",
-    "spur",
-    "spurs",
-    "spurts",
-    "spy",
-    "spying",
-    "squad",
-    "square",
-    "squares",
-    "squaring",
-    "squash",
-    "squat",
-    "squeak",
-    "squeaking",
-    "squeal",
-    "squeeze",
-    "squeezed",
-    "squeezing",
-    "squirrel",
-    "squirt",
-    "squirting",
-    "ss",
-    "stab",
-    "stabbed",
-    "stabbing",
-    "stable",
-    "stacey",
-    "stack",
-    "stacked",
-    "stacking",
-    "stacks",
-    "stadium",
-    "stadiums",
-    "staff",
-    "stage",
-    "staged",
-    "stages",
-    "stagnant",
-    "stain",
-    "stained",
-    "stainless",
-    "stains",
-    "staircase",
-    "stairs",
-    "stake",
-    "stakes",
-    "stale",
-    "stalk",
-    "stalker",
-    "stalking",
-    "stall",
-    "stalling",
-    "stallion",
-    "stamina",
-    "stamp",
-    "stamped",
-    "stamps",
-    "stan",
-    "stance",
-    "stand",
-    "standard",
-    "standards",
-    "standby",
-    "standing",
-    "standoff",
-    "stands",
-    "stank",
-    "stanking",
-    "stanky",
-    "stanley",
-    "staple",
-    "staples",
-    "star",
-    "starburst",
-    "starch",
-    "stardom",
-    "stare",
-    "stared",
-    "stares",
-    "starfish",
-    "staring",
-    "stark",
-    "starring",
-    "stars",
-    "start",
-    "started",
-    "starter",
-    "starters",
-    "starting",
-    "starts",
-    "starve",
-    "starved",
-    "starving",
-    "stash",
-    "stashed",
-    "stashes",
-    "stashing",
-    "state",
-    "statement",
-    "statements",
-    "states",
-    "static",
-    "station",
-    "stations",
-    "statistic",
-    "statistics",
-    "stats",
-    "statue",
-    "statues",
-    "status",
-    "statute",
-    "statutory",
-    "stay",
-    "stayed",
-    "staying",
-    "stays",
-    "stead",
-    "steadily",
-    "steady",
-    "steak",
-    "steaks",
-    "steal",
-    "stealing",
-    "steam",
-    "steamboat",
-    "steamer",
-    "steaming",
-    "steel",
-    "steeped",
-    "steeper",
-    "steer",
-    "steering",
-    "stefani",
-    "stem",
-    "stems",
-    "step",
-    "stepped",
-    "stepping",
-    "steps",
-    "stereo",
-    "stereotype",
-    "sternum",
-    "steroids",
-    "steve",
-    "stevie",
-    "stew",
-    "stewardess",
-    "stewart",
-    "stick",
-    "sticker",
-    "stickers",
-    "sticking",
-    "sticks",
-    "sticky",
-    "stiff",
-    "stilettos",
-    "still",
-    "sting",
-    "stinging",
-    "stingray",
-    "stingy",
-    "stink",
-    "stinking",
-    "stinky",
-    "stir",
-    "stirring",
-    "stitch",
-    "stitched",
-    "stitches",
-    "stock",
-    "stocked",
-    "stocking",
-    "stocks",
-    "stogie",
-    "stoked",
-    "stokes",
-    "stole",
-    "stolen",
-    "stomach",
-    "stomachs",
-    "stomp",
-    "stomped",
-    "stomping",
-    "stone",
-    "stoned",
-    "stoner",
-    "stones",
-    "stood",
-    "stool",
-    "stoop",
-    "stop",
-    "stoplight",
-    "stopped",
-    "stopper",
-    "stopping",
-    "stops",
-    "store",
-    "stored",
-    "stores",
-    "stories",
-    "stork",
-    "storm",
-    "storming",
-    "stormy",
-    "story",
-    "stove",
-    "stoves",
-    "straddle",
-    "straight",
-    "straighten",
-    "straightened",
-    "straightjacket",
-    "strain",
-    "straining",
-    "strait",
-    "stranded",
-    "strange",
-    "stranger",
-    "strangers",
-    "strangle",
-    "strap",
-    "strapped",
-    "strapping",
-    "straps",
-    "straw",
-    "strawberries",
-    "strawberry",
-    "straws",
-    "stray",
-    "streaks",
-    "stream",
-    "street",
-    "streets",
-    "strength",
-    "strep",
-    "stress",
-    "stressed",
-    "stressing",
-    "stretch",
-    "stretched",
-    "stretcher",
-    "stretches",
-    "stretching",
-    "strict",
-    "strictly",
-    "stride",
-    "strike",
-    "strikes",
-    "striking",
-    "string",
-    "strings",
-    "strip",
-    "stripe",
-    "striped",
-    "stripes",
-    "stripped",
-    "stripper",
-    "strippers",
-    "stripping",
-    "strips",
-    "strive",
-    "striving",
-    "strobe",
-    "stroke",
-    "strokes",
-    "stroking",
-    "stroll",
-    "stroller",
-    "strolling",
-    "strong",
-    "stronger",
-    "strongest",
-    "struck",
-    "strudel",
-    "struggle",
-    "struggled",
-    "struggling",
-    "strung",
-    "strut",
-    "stubborn",
-    "stuck",
-    "stud",
-    "studded",
-    "student",
-    "students",
-    "studied",
-    "studio",
-    "studios",
-    "studs",
-    "study",
-    "studying",
-    "stuff",
-    "stuffed",
-    "stuffing",
-    "stumble",
-    "stumbled",
-    "stumbling",
-    "stun",
-    "stung",
-    "stunk",
-    "stunned",
-    "stunner",
-    "stunning",
-    "stunt",
-    "stunting",
-    "stunts",
-    "stupid",
-    "sturdy",
-    "stutter",
-    "stuttering",
-    "sty",
-    "style",
-    "styled",
-    "styles",
-    "styling",
-    "stylish",
-    "stylist",
-    "styrofoam",
-    "styrofoams",
-    "suave",
-    "sub",
-    "subaru",
-    "subdued",
-    "subject",
-    "sublime",
-    "subliminal",
-    "submarine",
-    "submission",
-    "substance",
-    "substances",
-    "substitute",
-    "subtle",
-    "subtract",
-    "suburban",
-    "suburbs",
-    "subway",
-    "succeed",
-    "succeeding",
-    "success",
-    "successful",
-    "succumb",
-    "such",
-    "suck",
-    "sucka",
-    "sucked",
-    "sucker",
-    "suckers",
-    "sucking",
-    "sucks",
-    "sudan",
-    "sudden",
-    "suddenly",
-    "sue",
-    "sued",
-    "suede",
-    "suffer",
-    "suffering",
-    "sufficient",
-    "suffocate",
-    "sugar",
-    "suggest",
-    "suggested",
-    "suggestions",
-    "suicidal",
-    "suicide",
-    "suing",
-    "suit",
-    "suitcase",
-    "suite",
-    "suited",
-    "suites",
-    "suits",
-    "sum",
-    "summer",
-    "summers",
-    "summertime",
-    "summing",
-    "sumo",
-    "sun",
-    "sundae",
-    "sunday",
-    "sundays",
-    "sung",
-    "sunk",
-    "sunlight",
-    "sunny",
-    "sunrise",
-    "sunroof",
-    "suns",
-    "sunset",
-    "sunsets",
-    "sunshine",
-    "sup",
-    "super",
-    "superhuman",
-    "superior",
-    "superman",
-    "supermarket",
-    "supermodel",
-    "supermodels",
-    "supersonic",
-    "superstar",
-    "superstars",
-    "superstitious",
-    "supervised",
-    "supper",
-    "supplier",
-    "supply",
-    "supplying",
-    "support",
-    "supported",
-    "supporting",
-    "supportive",
-    "suppose",
-    "supposed",
-    "supposedly",
-    "supreme",
-    "sure",
-    "surely",
-    "surf",
-    "surface",
-    "surfboard",
-    "surfing",
-    "surgeon",
-    "surgery",
-    "surprise",
-    "surprised",
-    "surprising",
-    "surrender",
-    "surround",
-    "surrounded",
-    "surrounding",
-    "surveillance",
-    "survey",
-    "survival",
-    "survive",
-    "survived",
-    "surviving",
-    "survivor",
-    "sus",
-    "sushi",
-    "susie",
-    "suspect",
-    "suspended",
-    "suspenders",
-    "suspension",
-    "suspicious",
-    "sutra",
-    "suv",
-    "swag",
-    "swagged",
-    "swagger",
-    "swagging",
-    "swallow",
-    "swallowed",
-    "swallowing",
-    "swallows",
-    "swam",
-    "swamp",
-    "swang",
-    "swap",
-    "swapped",
-    "swapping",
-    "swarm",
-    "swarms",
-    "swat",
-    "swats",
-    "sway",
-    "swayed",
-    "swayze",
-    "swear",
-    "swearing",
-    "swears",
-    "sweat",
-    "sweater",
-    "sweaters",
-    "sweating",
-    "sweatpants",
-    "sweats",
-    "sweep",
-    "sweeper",
-    "sweeping",
-    "sweet",
-    "sweeter",
-    "sweetest",
-    "sweetheart",
-    "sweethearts",
-    "sweetie",
-    "sweets",
-    "swell",
-    "swept",
-    "swerve",
-    "swerved",
-    "swerves",
-    "swerving",
-    "swift",
-    "swiftly",
-    "swim",
-    "swimmers",
-    "swimming",
-    "swimwear",
-    "swine",
-    "swing",
-    "swingers",
-    "swinging",
-    "swings",
-    "swipe",
-    "swish",
-    "swisher",
-    "swishers",
-    "swishes",
-    "swiss",
-    "switch",
-    "switched",
-    "switcheroo",
-    "switches",
-    "switching",
-    "switzerland",
-    "swivel",
-    "swole",
-    "swollen",
-    "swoop",
-    "swooped",
-    "swoosh",
-    "sword",
-    "swordfish",
-    "swords",
-    "swore",
-    "sworn",
-    "swung",
-    "sydney",
-    "syllable",
-    "syllables",
-    "symbol",
-    "symbolic",
-    "symbolism",
-    "sympathy",
-    "symphony",
-    "symptoms",
-    "synagogue",
-    "sync",
-    "syndrome",
-    "synonym",
-    "synonyms",
-    "synopsis",
-    "syntax",
-    "synthetic",
-    "syringes",
-    "syrup",
-    "system",
-    "t",
-    "ta",
-    "tab",
-    "tabernacle",
-    "table",
-    "tables",
-    "tablet",
-    "tabs",
-    "tack",
-    "tackle",
-    "tacky",
-    "taco",
-    "tacos",
-    "tact",
-    "tactician",
-    "tactics",
-    "tad",
-    "tag",
-    "tagged",
-    "tagging",
-    "tags",
-    "tahiti",
-    "tai",
-    "tail",
-    "tailor",
-    "tailored",
-    "tails",
-    "taint",
-    "tainted",
-    "take",
-    "taken",
-    "takeoff",
-    "takeover",
-    "taker",
-    "takers",
-    "takes",
-    "taki",
-    "taking",
-    "tale",
-    "talent",
-    "talented",
-    "talents",
-    "tales",
-    "taliban",
-    "talk",
-    "talked",
-    "talker",
-    "talkie",
-    "talking",
-    "talks",
-    "tall",
-    "tallahassee",
-    "taller",
-    "tallied",
-    "tamale",
-    "tambourine",
-    "tame",
-    "tamed",
-    "tammy",
-    "tampa",
-    "tampon",
-    "tan",
-    "tandem",
-    "tang",
-    "tangerine",
-    "tangle",
-    "tangled",
-    "tango",
-    "tank",
-    "tanks",
-    "tanned",
-    "tanning",
-    "tantrum",
-    "tantrums",
-    "tap",
-    "tape",
-    "taped",
-    "tapes",
-    "taping",
-    "tapped",
-    "tapping",
-    "taps",
-    "tar",
-    "tarantino",
-    "tarantula",
-    "target",
-    "targeted",
-    "targets",
-    "tart",
-    "tarts",
-    "tarzan",
-    "tas",
-    "task",
-    "taste",
-    "tastes",
-    "tasting",
-    "tasty",
-    "tat",
-    "tater",
-    "tats",
-    "tatted",
-    "tattle",
-    "tattoo",
-    "tattooed",
-    "tattoos",
-    "taught",
-    "tax",
-    "taxes",
-    "taxi",
-    "taxing",
-    "tay",
-    "taylor",
-    "taylors",
-    "te",
-    "tea",
-    "teach",
-    "teacher",
-    "teachers",
-    "teaching",
-    "team",
-    "teams",
-    "tear",
-    "teardrops",
-    "tearing",
-    "tears",
-    "tease",
-    "teased",
-    "teaser",
-    "teasing",
-    "tec",
-    "tech",
-    "technical",
-    "technically",
-    "technique",
-    "technology",
-    "techs",
-    "tecs",
-    "ted",
-    "teddy",
-    "tee",
-    "teen",
-    "teenage",
-    "teenager",
-    "teenagers",
-    "teens",
-    "teeny",
-    "teepee",
-    "tees",
-    "teeth",
-    "teething",
-    "telephone",
-    "televised",
-    "television",
-    "tell",
-    "teller",
-    "telling",
-    "tells",
-    "telly",
-    "temp",
-    "temper",
-    "temperature",
-    "tempers",
-    "temple",
-    "tempo",
-    "temporary",
-    "tempt",
-    "temptation",
-    "temptations",
-    "tempted",
-    "ten",
-    "tenacity",
-    "tenant",
-    "tenants",
-    "tend",
-    "tendencies",
-    "tender",
-    "tenderness",
-    "tenement",
-    "tennessee",
-    "tennis",
-    "tens",
-    "tense",
-    "tension",
-    "tent",
-    "tenth",
-    "tequila",
-    "teriyaki",
-    "term",
-    "terminate",
-    "terminator",
-    "terms",
-    "terrapins",
-    "terrible",
-    "terrific",
-    "terrified",
-    "territory",
-    "terror",
-    "terrorist",
-    "terry",
-    "tes",
-    "tesla",
-    "test",
-    "testament",
-    "tested",
-    "testify",
-    "testimony",
-    "testing",
-    "texas",
-    "text",
-    "texting",
-    "texts",
-    "th",
-    "thailand",
-    "than",
-    "thank",
-    "thanked",
-    "thankful",
-    "thanking",
-    "thanks",
-    "thanksgiving",
-    "that",
-    "thawed",
-    "thc",
-    "the",
-    "theater",
-    "theft",
-    "their",
-    "theirs",
-    "them",
-    "theme",
-    "themselves",
-    "then",
-    "theory",
-    "therapist",
-    "therapy",
-    "there",
-    "therefore",
-    "theres",
-    "thermal",
-    "thermometer",
-    "these",
-    "theses",
-    "thespian",
-    "they",
-    "thick",
-    "thicker",
-    "thicky",
-    "thief",
-    "thieves",
-    "thieving",
-    "thigh",
-    "thighs",
-    "thin",
-    "thing",
-    "things",
-    "think",
-    "thinker",
-    "thinking",
-    "thinks",
-    "thinner",
-    "thinnest",
-    "thinning",
-    "third",
-    "thirst",
-    "thirsty",
-    "thirteen",
-    "thirties",
-    "thirty",
-    "this",
-    "tho",
-    "thomas",
-    "thong",
-    "thongs",
-    "thorough",
-    "thoroughbred",
-    "those",
-    "thot",
-    "thots",
-    "thottie",
-    "thotties",
-    "thotty",
-    "thou",
-    "though",
-    "thought",
-    "thoughts",
-    "thousand",
-    "thousands",
-    "thrash",
-    "thrashing",
-    "thrax",
-    "thread",
-    "threads",
-    "threat",
-    "threaten",
-    "threatened",
-    "threatening",
-    "threats",
-    "three",
-    "threes",
-    "threesome",
-    "threesomes",
-    "threw",
-    "thrift",
-    "thrill",
-    "thriller",
-    "throat",
-    "throats",
-    "throne",
-    "throttle",
-    "through",
-    "throughout",
-    "throw",
-    "throwaway",
-    "throwback",
-    "throwed",
-    "thrower",
-    "throwing",
-    "thrown",
-    "throws",
-    "thrust",
-    "thug",
-    "thugger",
-    "thugging",
-    "thugs",
-    "thumb",
-    "thumbing",
-    "thumbs",
-    "thump",
-    "thumping",
-    "thunder",
-    "thunderous",
-    "thunderstorm",
-    "thursday",
-    "thursdays",
-    "thus",
-    "ti",
-    "tic",
-    "tick",
-    "ticket",
-    "tickets",
-    "ticking",
-    "tickle",
-    "tickles",
-    "ticklish",
-    "ticks",
-    "tics",
-    "tidal",
-    "tide",
-    "tides",
-    "tie",
-    "tied",
-    "tier",
-    "ties",
-    "tiffany",
-    "tiger",
-    "tigers",
-    "tight",
-    "tighter",
-    "tightest",
-    "tightly",
-    "tights",
-    "tijuana",
-    "till",
-    "tilt",
-    "timber",
-    "timberland",
-    "timberlands",
-    "timbs",
-    "time",
-    "timeless",
-    "timeline",
-    "timepiece",
-    "timer",
-    "times",
-    "timid",
-    "timing",
-    "tina",
-    "tinder",
-    "ting",
-    "tingle",
-    "tings",
-    "tink",
-    "tint",
-    "tinted",
-    "tints",
-    "tiny",
-    "tip",
-    "tipped",
-    "tipper",
-    "tipping",
-    "tippy",
-    "tips",
-    "tipsy",
-    "tire",
-    "tired",
-    "tires",
-    "tis",
-    "tissue",
-    "tissues",
-    "tit",
-    "titanic",
-    "titans",
-    "tithes",
-    "title",
-    "titles",
-    "tito",
-    "tits",
-    "titties",
-    "titty",
-    "tity",
-    "tlc",
-    "tms",
-    "tnt",
-    "to",
-    "toast",
-    "toasted",
-    "toaster",
-    "toasters",
-    "toasting",
-    "toasts",
-    "tobacco",
-    "tock",
-    "today",
-    "todd",
-    "toddler",
-    "toe",
-    "toed",
-    "toeing",
-    "toenails",
-    "toes",
-    "together",
-    "toilet",
-    "toke",
-    "token",
-    "tokyo",
-    "told",
-    "tolerance",
-    "toll",
-    "tolls",
-    "tom",
-    "tomahawk",
-    "tomato",
-    "tomatoes",
-    "tomb",
-    "tombs",
-    "tombstone",
-    "tommy",
-    "tomorrow",
-    "ton",
-    "tone",
-    "tones",
-    "tongue",
-    "tongues",
-    "toni",
-    "tonic",
-    "tonight",
-    "tons",
-    "tony",
-    "too",
-    "took",
-    "tool",
-    "tools",
-    "toon",
-    "toot",
-    "tooth",
-    "toothpick",
-    "tootsie",
-    "top",
-    "topic",
-    "topless",
-    "topped",
-    "topping",
-    "toppy",
-    "tops",
-    "torch",
-    "torching",
-    "tore",
-    "torn",
-    "tornado",
-    "toronto",
-    "torpedo",
-    "torso",
-    "tortoise",
-    "torture",
-    "tortured",
-    "toss",
-    "tossed",
-    "tossing",
-    "total",
-    "totally",
-    "tote",
-    "totem",
-    "toting",
-    "toucan",
-    "touch",
-    "touchdown",
-    "touched",
-    "touches",
-    "touching",
-    "tough",
-    "tougher",
-    "toupee",
-    "tour",
-    "touring",
-    "tourist",
-    "tourists",
-    "tours",
-    "tow",
-    "towed",
-    "towel",
-    "towels",
-    "tower",
-    "towers",
-    "town",
-    "towns",
-    "toxic",
-    "toy",
-    "toya",
-    "toying",
-    "toys",
-    "trace",
-    "track",
-    "tracking",
-    "tracks",
-    "traction",
-    "tracy",
-    "trade",
-    "traded",
-    "trading",
-    "tradition",
-    "traffic",
-    "trafficking",
-    "tragedy",
-    "tragic",
-    "trail",
-    "trailer",
-    "train",
-    "trained",
-    "trainer",
-    "training",
-    "trains",
-    "trait",
-    "traitors",
-    "traits",
-    "tramp",
-    "trampoline",
-    "trance",
-    "trans",
-    "transactions",
-    "transfer",
-    "transform",
-    "transformer",
-    "transition",
-    "translate",
-    "translation",
-    "translations",
-    "translator",
-    "translucent",
-    "transmission",
-    "transport",
-    "transportation",
-    "transporter",
-    "trap",
-    "traphouse",
-    "trapped",
-    "trapper",
-    "trappers",
-    "trapping",
-    "traps",
-    "trash",
-    "trauma",
-    "traumatic",
-    "traumatized",
-    "travel",
-    "traveled",
-    "traveling",
-    "travelled",
-    "travelling",
-    "travels",
-    "tray",
-    "trays",
-    "treacherous",
-    "treadmill",
-    "treason",
-    "treasure",
-    "treasures",
-    "treat",
-    "treated",
-    "treaties",
-    "treating",
-    "treatment",
-    "treats",
-    "treble",
-    "tree",
-    "trees",
-    "trek",
-    "trembling",
-    "trench",
-    "trenches",
-    "trend",
-    "trending",
-    "trends",
-    "trendsetter",
-    "trendsetters",
-    "trey",
-    "treys",
-    "trial",
-    "trials",
-    "tribe",
-    "tribeca",
-    "tribes",
-    "tribulations",
-    "triceps",
-    "triceratops",
-    "trick",
-    "tricked",
-    "trickery",
-    "tricking",
-    "trickle",
-    "tricks",
-    "tricky",
-    "tried",
-    "tries",
-    "trifling",
-    "trigger",
-    "triggers",
-    "trill",
-    "triller",
-    "trillest",
-    "trillion",
-    "trim",
-    "trimmed",
-    "trinidad",
-    "trinity",
-    "trio",
-    "trip",
-    "triple",
-    "tripled",
-    "tripped",
-    "tripping",
-    "trips",
-    "triumph",
-    "trois",
-    "trojan",
-    "trojans",
-    "trolling",
-    "troop",
-    "trooper",
-    "troopers",
-    "troops",
-    "tropes",
-    "trophies",
-    "trophy",
-    "tropic",
-    "tropical",
-    "tropicana",
-    "tropics",
-    "trot",
-    "trotter",
-    "trouble",
-    "troubled",
-    "troublemaker",
-    "troubles",
-    "trough",
-    "trousers",
-    "trout",
-    "troy",
-    "truancy",
-    "truce",
-    "truck",
-    "trucker",
-    "trucking",
-    "truckload",
-    "trucks",
-    "true",
-    "trues",
-    "truest",
-    "truly",
-    "trump",
-    "trumpet",
-    "trumpets",
-    "trunk",
-    "trunks",
-    "trust",
-    "trusting",
-    "truth",
-    "truthful",
-    "truthfully",
-    "truths",
-    "try",
-    "trying",
-    "tryna",
-    "tsa",
-    "tsunami",
-    "tub",
-    "tube",
-    "tubes",
-    "tubs",
-    "tuck",
-    "tucked",
-    "tucker",
-    "tucking",
-    "tuesday",
-    "tuesdays",
-    "tug",
-    "tugging",
-    "tuition",
-    "tumbling",
-    "tummy",
-    "tumor",
-    "tune",
-    "tunechi",
-    "tuned",
-    "tuner",
-    "tunes",
-    "tuning",
-    "tunnel",
-    "tunnels",
-    "turban",
-    "turbo",
-    "turbos",
-    "turbulence",
-    "turd",
-    "turds",
-    "turf",
-    "turk",
-    "turkey",
-    "turkeys",
-    "turks",
-    "turmoil",
-    "turn",
-    "turned",
-    "turner",
-    "turning",
-    "turnpike",
-    "turns",
-    "turnt",
-    "turpentine",
-    "turtle",
-    "turtles",
-    "tush",
-    "tusk",
-    "tussle",
-    "tut",
-    "tutor",
-    "tutu",
-    "tux",
-    "tuxedo",
-    "tuxedos",
-    "tuxes",
-    "tv",
-    "twain",
-    "twat",
-    "tweak",
-    "tweaked",
-    "tweaking",
-    "tweet",
-    "tweeters",
-    "tweeting",
-    "tweets",
-    "twelve",
-    "twenties",
-    "twenty",
-    "twentys",
-    "twerking",
-    "twice",
-    "twilight",
-    "twin",
-    "twinkle",
-    "twins",
-    "twirl",
-    "twist",
-    "twisted",
-    "twister",
-    "twisting",
-    "twitch",
-    "twitching",
-    "twitter",
-    "two",
-    "twos",
-    "ty",
-    "tycoon",
-    "tying",
-    "tylenol",
-    "tyler",
-    "type",
-    "types",
-    "typhoon",
-    "typical",
-    "typing",
-    "typo",
-    "tyson",
-    "ufo",
-    "uganda",
-    "ugly",
-    "uh",
-    "uk",
-    "um",
-    "uma",
-    "umbilical",
-    "umbrella",
-    "umbrellas",
-    "umma",
-    "umpire",
-    "un",
-    "unattractive",
-    "unbelievable",
-    "unbreakable",
-    "unbutton",
-    "uncle",
-    "uncles",
-    "uncomfortable",
-    "unconditional",
-    "uncouth",
-    "uncut",
-    "undefeated",
-    "under",
-    "underage",
-    "underarm",
-    "underarms",
-    "undercover",
-    "underdog",
-    "underestimate",
-    "underestimated",
-    "underground",
-    "underneath",
-    "underrated",
-    "understand",
-    "understanding",
-    "understands",
-    "understood",
-    "undertaker",
-    "underwater",
-    "underwear",
-    "underworld",
-    "undeveloped",
-    "undisputed",
-    "undivided",
-    "undone",
-    "undress",
-    "undressed",
-    "undressing",
-    "unearthly",
-    "unemployed",
-    "unexpected",
-    "unfair",
-    "unfaithful",
-    "unfold",
-    "unforgettable",
-    "unforgiving",
-    "unfortunate",
-    "unfortunately",
-    "unhealthy",
-    "unheard",
-    "unicorn",
-    "uniform",
-    "uninvited",
-    "union",
-    "unique",
-    "unit",
-    "united",
-    "units",
-    "unity",
-    "universal",
-    "universe",
-    "university",
-    "unkind",
-    "unknown",
-    "unleaded",
-    "unleash",
-    "unless",
-    "unlike",
-    "unlikely",
-    "unlimited",
-    "unload",
-    "unlock",
-    "unlocked",
-    "unlucky",
-    "uno",
-    "unplug",
-    "unplugged",
-    "unpredictable",
-    "unraveling",
-    "unreal",
-    "unruly",
-    "unspoken",
-    "unstable",
-    "unstoppable",
-    "unsure",
-    "untamed",
-    "unthinkable",
-    "until",
-    "unto",
-    "untouchable",
-    "untucked",
-    "unusual",
-    "unwind",
-    "unworthy",
-    "unwrap",
-    "up",
-    "upgrade",
-    "upgraded",
-    "upholstered",
-    "upon",
-    "upper",
-    "uppercut",
-    "ups",
-    "upset",
-    "upside",
-    "upstairs",
-    "uptight",
-    "uptown",
-    "ur",
-    "urban",
-    "urge",
-    "urgent",
-    "urine",
-    "urn",
-    "us",
-    "usa",
-    "use",
-    "used",
-    "useless",
-    "user",
-    "usher",
-    "using",
-    "usual",
-    "usually",
-    "utter",
-    "utterly",
-    "uzi",
-    "uzis",
-    "v",
-    "va",
-    "vacancy",
-    "vacant",
-    "vacate",
-    "vacation",
-    "vacations",
-    "vacay",
-    "vaccine",
-    "vacuum",
-    "vagina",
-    "vain",
-    "valentine",
-    "valentines",
-    "valet",
-    "valid",
-    "valley",
-    "valuable",
-    "value",
-    "valued",
-    "values",
-    "valve",
-    "vamoose",
-    "vamp",
-    "vampire",
-    "vampires",
-    "vamps",
-    "van",
-    "vandal",
-    "vanessa",
-    "vanilla",
-    "vanish",
-    "vanished",
-    "vanity",
-    "vans",
-    "vapors",
-    "vapours",
-    "varsity",
-    "vas",
-    "vase",
-    "vaseline",
-    "vault",
-    "vegan",
-    "vegas",
-    "vegetable",
-    "vegetables",
-    "vegetarian",
-    "vehicle",
-    "vehicles",
-    "vehicular",
-    "vein",
-    "veins",
-    "velcro",
-    "velour",
-    "velvet",
-    "vendetta",
-    "vending",
-    "veneers",
-    "venereal",
-    "venezuela",
-    "venice",
-    "venom",
-    "vent",
-    "ventilation",
-    "venues",
-    "venus",
-    "vera",
-    "verb",
-    "verbal",
-    "verbs",
-    "verdict",
-    "verge",
-    "veronica",
-    "versace",
-    "versaces",
-    "versatile",
-    "verse",
-    "verses",
-    "version",
-    "versus",
-    "vert",
-    "vertical",
-    "very",
-    "vessel",
-    "vest",
-    "vet",
-    "veteran",
-    "veterans",
-    "vets",
-    "vette",
-    "vi",
-    "via",
-    "viagra",
-    "vibe",
-    "vibes",
-    "vibing",
-    "vibrant",
-    "vibrate",
-    "vibrating",
-    "vibrations",
-    "vice",
-    "vices",
-    "vicinity",
-    "vicious",
-    "vick",
-    "vicodin",
-    "victim",
-    "victims",
-    "victor",
-    "victoria",
-    "victories",
-    "victorious",
-    "victory",
-    "video",
-    "videos",
-    "vie",
-    "vietnam",
-    "view",
-    "viewed",
-    "viewing",
-    "views",
-    "viking",
-    "villa",
-    "village",
-    "villain",
-    "villains",
-    "ville",
-    "villian",
-    "vine",
-    "vino",
-    "vintage",
-    "vinyl",
-    "violate",
-    "violated",
-    "violation",
-    "violations",
-    "violence",
-    "violent",
-    "violets",
-    "violin",
-    "violins",
-    "vip",
-    "viper",
-    "viral",
-    "virgil",
-    "virgin",
-    "virginia",
-    "virginity",
-    "virgins",
-    "virgo",
-    "virtue",
-    "virus",
-    "visa",
-    "visibly",
-    "vision",
-    "visioning",
-    "visions",
-    "visit",
-    "visitation",
-    "visiting",
-    "visits",
-    "visor",
-    "visual",
-    "vital",
-    "vitals",
-    "vitamin",
-    "vivid",
-    "vixen",
-    "vocabulary",
-    "vocal",
-    "vocals",
-    "vodka",
-    "vogue",
-    "vogues",
-    "voice",
-    "voicemail",
-    "voices",
-    "void",
-    "voil\u00e0",
-    "volcano",
-    "volume",
-    "vomit",
-    "voodoo",
-    "vote",
-    "voted",
-    "votes",
-    "voting",
-    "vouch",
-    "vouchers",
-    "vow",
-    "vowel",
-    "vowels",
-    "vows",
-    "vroom",
-    "vs",
-    "vuitton",
-    "vulcan",
-    "vulture",
-    "vultures",
-    "vv",
-    "vvs",
-    "w",
-    "wa",
-    "wack",
-    "wacked",
-    "waco",
-    "waddup",
-    "wade",
-    "waffle",
-    "waffles",
-    "wage",
-    "wages",
-    "wagon",
-    "wagons",
-    "waist",
-    "waistline",
-    "wait",
-    "waited",
-    "waiter",
-    "waiters",
-    "waiting",
-    "waitress",
-    "waitresses",
-    "waits",
-    "waiver",
-    "wake",
-    "waken",
-    "waking",
-    "wale",
-    "walk",
-    "walked",
-    "walker",
-    "walkie",
-    "walking",
-    "walks",
-    "wall",
-    "wallace",
-    "wallet",
-    "wallets",
-    "walls",
-    "wally",
-    "walnuts",
-    "walter",
-    "wamp",
-    "wan",
-    "wander",
-    "wandering",
-    "waner",
-    "wannabe",
-    "wanner",
-    "want",
-    "wanted",
-    "wanting",
-    "wants",
-    "war",
-    "ward",
-    "warden",
-    "wardrobe",
-    "ware",
-    "warfare",
-    "warhol",
-    "warm",
-    "warmer",
-    "warming",
-    "warmth",
-    "warn",
-    "warned",
-    "warner",
-    "warning",
-    "warrant",
-    "warrants",
-    "warren",
-    "warring",
-    "warrior",
-    "warriors",
-    "wars",
-    "was",
-    "wasabi",
-    "wash",
-    "washed",
-    "washer",
-    "washes",
-    "washing",
-    "washington",
-    "washingtons",
-    "washy",
-    "wasp",
-    "wassup",
-    "waste",
-    "wasted",
-    "wasting",
-    "watch",
-    "watched",
-    "watchers",
-    "watches",
-    "watching",
-    "water",
-    "watered",
-    "waterfall",
-    "waters",
-    "watery",
-    "wats",
-    "watson",
-    "watts",
-    "wave",
-    "waved",
-    "waves",
-    "waving",
-    "wavy",
-    "wax",
-    "way",
-    "wayne",
-    "waynes",
-    "ways",
-    "we",
-    "weak",
-    "weaker",
-    "weakness",
-    "wealth",
-    "wealthy",
-    "weapon",
-    "weaponry",
-    "weapons",
-    "wear",
-    "wearing",
-    "wears",
-    "weasel",
-    "weather",
-    "weave",
-    "weaves",
-    "weaving",
-    "web",
-    "webb",
-    "website",
-    "wedding",
-    "wednesday",
-    "wednesdays",
-    "wee",
-    "weed",
-    "week",
-    "weekday",
-    "weekend",
-    "weekends",
-    "weeks",
-    "weep",
-    "weezy",
-    "weigh",
-    "weighed",
-    "weighing",
-    "weighs",
-    "weight",
-    "weights",
-    "weird",
-    "weirdo",
-    "weirdos",
-    "welcome",
-    "welfare",
-    "well",
-    "wells",
-    "wen",
-    "wendy",
-    "went",
-    "wept",
-    "were",
-    "wesley",
-    "west",
-    "western",
-    "weston",
-    "westside",
-    "wet",
-    "wetted",
-    "wetter",
-    "wetting",
-    "whack",
-    "whacked",
-    "whale",
-    "wham",
-    "what",
-    "whatcha",
-    "whatchamacallit",
-    "whatchu",
-    "whatever",
-    "wheaties",
-    "wheel",
-    "wheelchair",
-    "wheeler",
-    "wheelers",
-    "wheelie",
-    "wheeling",
-    "wheels",
-    "wheezing",
-    "wheezy",
-    "when",
-    "whenever",
-    "where",
-    "wherever",
-    "whether",
-    "whew",
-    "which",
-    "whichever",
-    "while",
-    "whine",
-    "whined",
-    "whining",
-    "whip",
-    "whipped",
-    "whipping",
-    "whips",
-    "whirlwind",
-    "whiskers",
-    "whiskey",
-    "whisky",
-    "whisper",
-    "whispered",
-    "whispering",
-    "whispers",
-    "whistle",
-    "whistling",
-    "white",
-    "whiter",
-    "whites",
-    "whitest",
-    "whitey",
-    "whitney",
-    "who",
-    "whoa",
-    "whoever",
-    "whole",
-    "wholesome",
-    "whoo",
-    "whoop",
-    "whooping",
-    "whopper",
-    "whore",
-    "whores",
-    "whos",
-    "whose",
-    "why",
-    "whys",
-    "wi",
-    "wick",
-    "wicked",
-    "wickedness",
-    "wide",
-    "widow",
-    "wieners",
-    "wife",
-    "wifey",
-    "wifeys",
-    "wifi",
-    "wig",
-    "wiggle",
-    "wigs",
-    "wild",
-    "wilder",
-    "wildest",
-    "wilding",
-    "wile",
-    "will",
-    "williams",
-    "willie",
-    "willies",
-    "willing",
-    "willis",
-    "wills",
-    "wilt",
-    "wimp",
-    "wind",
-    "winding",
-    "window",
-    "windows",
-    "winds",
-    "windshield",
-    "windy",
-    "wine",
-    "wines",
-    "wing",
-    "wings",
-    "wining",
-    "wink",
-    "winked",
-    "winnebago",
-    "winner",
-    "winners",
-    "winning",
-    "wins",
-    "winslow",
-    "winter",
-    "winters",
-    "wintertime",
-    "wipe",
-    "wiped",
-    "wipes",
-    "wiping",
-    "wire",
-    "wired",
-    "wires",
-    "wis",
-    "wisdom",
-    "wise",
-    "wisely",
-    "wiser",
-    "wish",
-    "wished",
-    "wishes",
-    "wishing",
-    "wishy",
-    "wit",
-    "witch",
-    "witches",
-    "with",
-    "withdrawals",
-    "within",
-    "without",
-    "witness",
-    "witnessed",
-    "witnesses",
-    "wits",
-    "witty",
-    "wives",
-    "wizard",
-    "woah",
-    "wobble",
-    "wobbling",
-    "wobbly",
-    "woe",
-    "woes",
-    "woke",
-    "wolf",
-    "wolverine",
-    "wolves",
-    "woman",
-    "womb",
-    "women",
-    "won",
-    "wonder",
-    "wondered",
-    "wonderful",
-    "wondering",
-    "wonders",
-    "wonner",
-    "wont",
-    "woo",
-    "wood",
-    "wooden",
-    "woodgrain",
-    "woods",
-    "woody",
-    "woof",
-    "woofers",
-    "wool",
-    "wooly",
-    "woozy",
-    "wop",
-    "wops",
-    "word",
-    "wordplay",
-    "words",
-    "wore",
-    "work",
-    "worked",
-    "worker",
-    "workers",
-    "working",
-    "workout",
-    "workplace",
-    "works",
-    "world",
-    "worlds",
-    "worldwide",
-    "worm",
-    "worms",
-    "worn",
-    "worried",
-    "worries",
-    "worry",
-    "worrying",
-    "worse",
-    "worser",
-    "worsest",
-    "worship",
-    "worst",
-    "worth",
-    "worthless",
-    "worthy",
-    "would",
-    "woulda",
-    "wound",
-    "wounds",
-    "wow",
-    "wraith",
-    "wrap",
-    "wrapped",
-    "wrapper",
-    "wrappers",
-    "wrapping",
-    "wraps",
-    "wrath",
-    "wreck",
-    "wrecked",
-    "wrecking",
-    "wrestle",
-    "wrestler",
-    "wrestling",
-    "wright",
-    "wrinkle",
-    "wrinkles",
-    "wrist",
-    "wristband",
-    "wrists",
-    "write",
-    "writer",
-    "writers",
-    "writing",
-    "written",
-    "wrong",
-    "wrongs",
-    "wrote",
-    "wu",
-    "wus",
-    "x",
-    "xan",
-    "xanax",
-    "xannies",
-    "xanny",
-    "xans",
-    "xl",
-    "xxl",
-    "y",
-    "yacht",
-    "yachts",
-    "yack",
-    "yak",
-    "yam",
-    "yams",
-    "yang",
-    "yankee",
-    "yankees",
-    "yap",
-    "yappa",
-    "yapping",
-    "yard",
-    "yards",
-    "yawn",
-    "yawning",
-    "yay",
-    "yayo",
-    "ye",
-    "yeah",
-    "year",
-    "years",
-    "yeast",
-    "yell",
-    "yelled",
-    "yeller",
-    "yelling",
-    "yellow",
-    "yells",
-    "yen",
-    "yep",
-    "yes",
-    "yesterday",
-    "yet",
-    "yi",
-    "yin",
-    "yo",
-    "yoda",
-    "yoga",
-    "yogi",
-    "yolanda",
-    "yolk",
-    "yonce",
-    "yopper",
-    "york",
-    "yosemite",
-    "you",
-    "young",
-    "younger",
-    "youngest",
-    "youngin",
-    "youngins",
-    "your",
-    "yours",
-    "yourself",
-    "youth",
-    "ysl",
-    "yuck",
-    "yuh",
-    "yummy",
-    "yup",
-    "zag",
-    "zags",
-    "zebra",
-    "zero",
-    "zeroes",
-    "zeros",
-    "zig",
-    "zillion",
-    "zion",
-    "zip",
-    "ziploc",
-    "zipped",
-    "zipper",
-    "zippers",
-    "zipping",
-    "zit",
-    "zombie",
-    "zombies",
-    "zone",
-    "zones",
-    "zoning",
-    "zoo",
-    "zoom",
-    "zooming",
-    "zu",
-    "zulu"
-  ]
-}
+from app.corpus import get_corpus
+from app.main.rhyme_repository import rhyme_repository, RhymeRanges, links_array, links_in_ranges
+from app.fanout import fan_out
+from app.jobs import submit_job, on_worker
+from app.word_index import word_index
+from app.storage import storage, table_metadata
+
+lyric_table = storage.table("Lyric")
+lyrics_table = storage.table("Lyrics")
+lyric_link_table = storage.table("LyricLink")
+
+logger = logging.getLogger(__name__)
+
+
+def random_viable_word():
+    """Returns a random word from the viable words list, i.e. words that have sentences in the database"""
+    viable_words = get_corpus().table('viable_words')
+    return viable_words.key_at(random.randint(0, len(viable_words) - 1))
+
 
 def list_of_rhymes(word):
     """Returns list of words that rhyme with word=word.
     Returns -1 if word is not in database"""
-    try:
-        response = rhyme_table.get_item(
-            Key={
-                'id': word
-            }
-        )
-        return response['Item']['rhymes']
-    except KeyError:
-        return -1
+    return rhyme_repository.attribute(word, 'rhymes', -1)
 
 
 def list_of_sent_id(word):
     """Returns a list of ids for sentences that end with word=word.
     Returns an empty list if no sentences end with word=word.
     Returns -1 if word is not in database"""
-
-    try:
-        response = rhyme_table.get_item(
-            Key={
-                'id': word
-            }
-        )
-        return response['Item']['sent_ids']
-    except KeyError:
-        return ''
+    return rhyme_repository.attribute(word, 'sent_ids', '')
 
 def list_of_similar_words(word):
     """Returns list of words similar to input word"""
-    try:
-        response = rhyme_table.get_item(
-            Key={
-                'id': word
-            }
-        )
-        return response['Item']['syns']
-    except KeyError:
-        return -1
+    return rhyme_repository.attribute(word, 'syns', -1)
 
 
 
-def get_sent_by_id(id):
-    """Returns sentence correponding to id=id. Returns -1 if id is not in table"""
+SENT_CACHE_SIZE = 20000
 
-    response = lyrics_table.get_item(
-        Key={
-            'id_': id
-        }
-    )
+# sentences of the Lyrics table never change, so they are kept in a process-wide LRU
+_sent_cache = OrderedDict()
+_sent_cache_lock = Lock()
 
-    temp = response['Item']['sent_']
 
-    sent = ''
-    for word in temp:
-        sent += word + ' '
+def get_sents_by_ids(ids):
+    """Returns the sentences corresponding to ids, in the same order. Sentences are -1 for ids not in table"""
 
+    ids = [int(id) for id in ids]
+    sents = {}
+
+    with _sent_cache_lock:
+        for id in ids:
+            if id in _sent_cache:
+                _sent_cache.move_to_end(id)
+                sents[id] = _sent_cache[id]
+
+    missing = [id for id in ids if id not in sents]
+    if missing:
+        items = lyrics_table.batch_get_item(missing)
+
+        with _sent_cache_lock:
+            for id in missing:
+                item = items.get(id)
+                if item is None:
+                    sents[id] = -1
+                    continue
+
+                sents[id] = ' '.join(item['sent_']) + ' '
+                _sent_cache[id] = sents[id]
+                while len(_sent_cache) > SENT_CACHE_SIZE:
+                    _sent_cache.popitem(last=False)
+
+    return [sents[id] for id in ids]
+
+
+def get_sent_by_id(id):
+    """Returns the sentence corresponding to id. Raises KeyError if id is not in table"""
+    sent = get_sents_by_ids([id])[0]
+    if sent == -1:
+        raise KeyError(id)
     return sent
 
-def get_rhyme_sent(word):
-    """Generates a sentence that rhymes with a given sentence ending with word=word"""
-    rhymes = list_of_rhymes(word)
-    rhymes_keys = list(rhymes.keys())
 
-    if len(rhymes_keys) != 0:
+def first_sent(ids):
+    """Returns [sentence, id] for the first of ids that is in table, or None if none is. The sentences are fetched
+    together"""
+    for sent, id in zip(get_sents_by_ids(ids), ids):
+        if sent != -1:
+            return [sent, id]
+    return None
+
+
+LINKS_CACHE_SIZE = 5000000
+LINKS_SEEN_SIZE = 100000
+
+# LyricLink pages never change either. Converting the Decimal links of a page costs much more than searching them
+# once, so a page read for the first time is searched as it is (see links_in_ranges), and only the pages read again
+# are converted to arrays (see links_array) and cached. The cache is bounded by the total number of links it holds,
+# and at most LINKS_SEEN_SIZE pages read once are remembered
+_links_cache = OrderedDict()
+_links_seen = OrderedDict()
+_links_cache_lock = Lock()
+_links_cache_size = 0
+
+
+def get_links_by_pages(pages):
+    """Returns the links of LyricLink pages=pages as a dictionary page -> array of sentence ids, or the links as they
+    are read for pages read for the first time. Both can be searched with links_in_ranges"""
+    global _links_cache_size
+
+    links = {}
+    with _links_cache_lock:
+        for page in pages:
+            if page in _links_cache:
+                _links_cache.move_to_end(page)
+                links[page] = _links_cache[page]
+
+    missing = [page for page in pages if page not in links]
+    if missing:
+        items = lyric_link_table.batch_get_item(missing, consistent_read=True)
+
+        with _links_cache_lock:
+            for page, item in items.items():
+                if page not in _links_seen:
+                    _links_seen[page] = True
+                    while len(_links_seen) > LINKS_SEEN_SIZE:
+                        _links_seen.popitem(last=False)
+                    links[page] = item.get('links', [])
+                    continue
 
-        # Picks a random word that rhymes with word=word.
-        id = []
-        while id == []:
-            rand = random.randint(0, len(rhymes_keys) - 1)
-            rhyme = rhymes_keys[rand]
-            id = rhymes[rhyme]
+                del _links_seen[page]
+                links[page] = links_array(item.get('links', []))
+                if page not in _links_cache:
+                    _links_cache[page] = links[page]
+                    _links_cache_size += len(links[page])
+            while _links_cache_size > LINKS_CACHE_SIZE:
+                _links_cache_size -= len(_links_cache.popitem(last=False)[1])
 
-        # Picks a random sentence that ends with rhyme
-        rand = random.randint(int(id[0]), int(id[1]))
-        sent = [get_sent_by_id(rand), rand]
+    return links
+
+
+def rhyme_ranges(word):
+    """Returns the RhymeRanges of word=word, or None if word is not in database"""
+    return rhyme_repository.derived(word, 'rhyme_ranges', RhymeRanges.from_item)
+
+
+def rhyme_sent_id(word):
+    """Picks the id of a sentence that rhymes with a given sentence ending with word=word"""
+    ranges = rhyme_ranges(word)
+
+    # Picks a random sentence among all the sentences that end with a rhyme of word=word.
+    if ranges:
+        return ranges.sample()[1]
 
     # if no rhymes are found, generate sentence that ends with same word
     else:
         rhyme_word = word
         sent_ids = list_of_sent_id(rhyme_word)
 
-        if sent_ids != []:
-            rand = random.randint(sent_ids[0], sent_ids[1])
-            sent = [get_sent_by_id(rand), rand]
+        if sent_ids:
+            return random.randint(int(sent_ids[0]), int(sent_ids[1]))
 
         else:
-            return random_sent()
+            return random_sent_id()
 
-    return sent
 
+def get_rhyme_sent(word):
+    """Generates a sentence that rhymes with a given sentence ending with word=word"""
+    rand = rhyme_sent_id(word)
+    return [get_sent_by_id(rand), rand]
+
+
+def random_sent_id():
+    return random.randint(*table_metadata.id_range('Lyric'))
 
-def random_sent():
 
-    num_items = lyric_table.item_count
-    rand = random.randint(0, num_items - 1)
+def random_sent():
+    rand = random_sent_id()
     return [get_sent_by_id(rand), rand]
 
 def generate_sentence_lastword(last_word):
     """Does the same as generate_sentence, but its given last word instead"""
     return get_rhyme_sent(last_word)
 
-def generate_sentence(sent = ''):
-    """Generates sentence that rhymes with sent"""
+def sentence_id(sent=''):
+    """Picks the id of a sentence that rhymes with sent"""
 
     if sent == '':
-        return random_sent()
+        return random_sent_id()
 
     else:
 
@@ -13292,15 +208,23 @@ def generate_sentence(sent = ''):
         last_word = last_word.replace(',', '')
         last_word = last_word.replace('!', '')
 
-        return get_rhyme_sent(last_word)
+        return rhyme_sent_id(last_word)
+
+
+def generate_sentence(sent = ''):
+    """Generates sentence that rhymes with sent"""
+    rand = sentence_id(sent)
+    return [get_sent_by_id(rand), rand]
 
 
 def find_suggestions(prec='', suc='', curr=''):
     """Finds suitable replacements for current=curr sentence based on
     preceding=prec and succeding=suc sentences in song"""
-    sug_1 = generate_sentence(prec)
-    sug_2 = generate_sentence(suc)
-    suggestions = [[sug_1[0], sug_1[1]], [sug_2[0], sug_2[1]]]
+    ids = fan_out((sentence_id, prec), (sentence_id, suc))
+    sents = get_sents_by_ids(ids)
+    if -1 in sents:
+        raise KeyError(ids[sents.index(-1)])
+    suggestions = [[sents[0], ids[0]], [sents[1], ids[1]]]
     return suggestions
 
 
@@ -13309,15 +233,7 @@ def update_table(table, id: str, key: str, value: str):
     Args: table is the table we are updating, id is the id of the item we are updating, key is the attribute name, and
     value is the attribute value.
     """
-    table.update_item(
-        Key={
-            'id': id,
-        },
-        UpdateExpression='SET ' + key + ' = :val1',
-        ExpressionAttributeValues={
-            ':val1': value
-        }
-    )
+    table.update_item(id, key, value)
     return
 
 def change_sent(new, old_id):
@@ -13340,14 +256,8 @@ def sent_has_word(id, word):
     """checks if sentence with id=id has word=word"""
 
     try:
-        response = lyric_table.get_item(
-            Key={
-                'id': id
-            }
-        )
-
-        return response['Item'][word]
-    except KeyError:
+        return lyric_table.get_item(id)[word]
+    except (KeyError, TypeError):
         return 0
 
 
@@ -13357,19 +267,9 @@ def get_good_sent_batch_helper(temp, rhyme, rand_i, syns):
         return []
 
     good_sent = []
-    response = dynamodb.meta.client.batch_get_item(
-        RequestItems={
-            'Lyric': {
-                'Keys': [
-                    {'id': id} for id in temp
-                ],
-                'ConsistentRead': True
-            }
-        },
-        ReturnConsumedCapacity='TOTAL'
-    )
-
-    for item in response['Responses']['Lyric']:
+    items = lyric_table.batch_get_item(temp, consistent_read=True)
+
+    for item in items.values():
 
         for h in syns:
             try:
@@ -13412,10 +312,79 @@ def get_good_sent_rand(syns, ids, t_lim, rhyme, rand_i):
     return good_sent
 
 
+def sample_postings(postings, k, ranges=None):
+    """Returns up to k distinct ids drawn at random from the union of postings, restricted to the
+    inclusive id ranges [[r1, r2], ...] if ranges is given. The work done does not depend on the number of ids"""
+
+    spans = []
+    for posting in postings:
+        if ranges is None:
+            spans.append((posting, 0, len(posting)))
+        else:
+            for lo, hi in ranges:
+                spans.append((posting, posting.bisect_left(int(lo)), posting.bisect_left(int(hi) + 1)))
+
+    spans = [span for span in spans if span[2] > span[1]]
+    cumulative = []
+    total = 0
+    for posting, lo, hi in spans:
+        total += hi - lo
+        cumulative.append(total)
+
+    if total <= k:
+        return list(dict.fromkeys(posting[i] for posting, lo, hi in spans for i in range(lo, hi)))
+
+    # sentences containing several of the words are a bit more likely to be drawn, which is fine here
+    ids = []
+    for attempt in range(3 * k):
+        r = random.randrange(total)
+        j = bisect.bisect_right(cumulative, r)
+        posting, lo, hi = spans[j]
+        id = posting[lo + r - (cumulative[j] - (hi - lo))]
+        if id not in ids:
+            ids.append(id)
+            if len(ids) == k:
+                break
+
+    return ids
+
+
 def sentence_with(words, rhyme=[], t_lim=7):
     """Generates a sentence that contains one of the input words.
     mod takes a list of rhymes instead. Assume all entries in rhyme = [] are single words
 
+    Sentences are sampled from the word index. If it was not built, falls back to scan_sentence_with"""
+
+    index = word_index()
+    if index is None:
+        return scan_sentence_with(words, rhyme, t_lim)
+
+    if not words:
+        words = ['bitch']
+    postings = [posting for posting in map(index.postings_of, set(words)) if posting is not None]
+
+    if rhyme == []:
+        ids = sample_postings(postings, 10)
+        return [[sent, id] for sent, id in zip(get_sents_by_ids(ids), ids) if sent != -1]
+
+    ids = []
+    for rhyme_word in random.sample(rhyme, len(rhyme)):
+        rhymes = list_of_rhymes(rhyme_word)
+        if rhymes == -1:
+            continue
+
+        ranges = list(filter(None, rhymes.values()))
+        ids += [(id, rhyme_word) for id in sample_postings(postings, 3, ranges)]
+        if len(ids) > 8:
+            break
+
+    sents = get_sents_by_ids([id for id, rhyme_word in ids])
+    return [[sent, id, rhyme_word] for sent, (id, rhyme_word) in zip(sents, ids) if sent != -1]
+
+
+def scan_sentence_with(words, rhyme=[], t_lim=7):
+    """sentence_with for when the word index was not built: scans the Lyric table.
+
     Time complexity: due to call to get_good_sent_rand(words, ids, t_lim, rhyme, rand_i).
     limit time is 3*t_lim. """
 
@@ -13426,19 +395,11 @@ def sentence_with(words, rhyme=[], t_lim=7):
         if not words:
             words = ['bitch']
 
-        filt = Key(words[0]).eq(1)
-        for word in words:
-            filt |= Key(word).eq(1)
-
         while items == []:
 
-            r1 = random.randint(1, lyric_table.item_count - 1)
+            r1 = random.randint(1, table_metadata.id_range('Lyric')[1])
 
-            response = lyric_table.scan(
-                FilterExpression=filt,
-                ExclusiveStartKey={'id': r1},
-                )
-            items = response['Items']
+            items = lyric_table.scan_by_word(words, start=r1)
 
         sentences = []
         for item in items:
@@ -13477,7 +438,7 @@ def sentence_with(words, rhyme=[], t_lim=7):
 
 
 # --------------------------------------------- Scrapping methods
-proxy_table = dynamodb.Table("Proxy")
+proxy_table = storage.table("Proxy")
 from bs4 import BeautifulSoup
 import requests
 import inflect
@@ -13487,35 +448,16 @@ def get_proxy():
     Looks up a random proxy from DynamoDB table and returns it
     :returns array of two strings, IP and port:
     """
-    response = proxy_table.get_item(
-        Key={
-            'id': "num_proxies"
-        }
-    )
-    item = response['Item']
+    item = proxy_table.get_item("num_proxies")
     num_proxies = int(item['value'])
     choice = random.randint(0, num_proxies-1)
-    response = proxy_table.get_item(
-        Key={
-            'id': str(choice)
-        }
-    )
-    item = response['Item']
+    item = proxy_table.get_item(str(choice))
     proxy_response = [item["ip"], item["port"]]
     return proxy_response
 
 def word_in_rhyme(word):
     """Check if word is in rhyme table"""
-    try:
-        response = rhyme_table.get_item(
-            Key={
-                'id': word
-            }
-        )
-        response['Item']
-        return 1
-    except KeyError:
-        return -1
+    return 1 if word in rhyme_repository else -1
 
 
 def synonym_scrape(word: str, lim=10):
@@ -13605,7 +547,7 @@ def list_of_similar_words_updated(word):
 
     except AttributeError:
         syns = initialize_syns(word, w2vec_syns=syns)
-        update_table(rhyme_table, word, 'syns', syns)
+        rhyme_repository.update(word, 'syns', syns)
 
     syns[0][word] = 0
 
@@ -13697,7 +639,7 @@ def update_syns_rank(word, lyric):
                 syns[1][w] += 1
 
     print(syns)
-    update_table(rhyme_table, word, 'syns', syns)
+    rhyme_repository.update(word, 'syns', syns)
     return
 
 def update_rhyme_ids(word):
@@ -13711,12 +653,13 @@ def update_rhyme_ids(word):
             ids = []
         new_rhyme_list[r] = ids
 
-    update_table(rhyme_table, word, 'rhymes', new_rhyme_list)
+    rhyme_repository.update(word, 'rhymes', new_rhyme_list)
+    rhyme_repository.update(word, 'rhyme_ranges', RhymeRanges.from_rhymes(new_rhyme_list).to_attribute())
 
 
 def populate_custom_song_async(syns, song_id, thread=True, first=False):
-    """"populates related_thr and rhyme_related_thr columns of Song table.
-    syns the list of synonims of a given word (along with their scores)"""
+    """"populates the related and rhyme related candidates of pool thread (related_thr and rhyme_related_thr columns
+    of Song table if thread is True). syns the list of synonims of a given word (along with their scores)"""
 
     song = Songs.query.filter_by(id=song_id).first()
     related = sentence_related(syns)
@@ -13733,7 +676,7 @@ def populate_custom_song_async(syns, song_id, thread=True, first=False):
         sent[word] = []
 
     for i in range(1):
-        print('thread happening')
+        logger.debug('Finding the rhyme candidates of song %s', song_id)
         temp = sentence_related(list_of_similar_words_updated(song.song_about()), rhyme=last_words, num_words=10)
         for s in temp:
             sent[s[2]].append([s[0], s[1]])
@@ -13741,21 +684,38 @@ def populate_custom_song_async(syns, song_id, thread=True, first=False):
     first_to_add = song.update_related(related, last_words, sent, thread=thread)
     db.session.commit()
 
+    # the first lines of the song are taken from the pool just filled
     if first:
-        song.update_related_id(id=0, action='used', line_being_used=1)
+        song.active_pool = thread
+        song.update_related_id(id=0, action='used', line_being_used=1, thread=thread)
         lyric = [related[first_to_add][0], int(related[first_to_add][1])]
         song.update_lyric(lyric)
-        song.about = song.about[1:]
-        print('----------------------------------------------- MAIN THREAD ENDED')
-        print('song_about: ', song.about)
+        logger.debug('First line of song %s taken from pool %s', song_id, thread)
 
     db.session.commit()
 
 
 
+def refill_custom_song(syns, song_id, thread, first):
+    """Runs populate_custom_song_async, then clears the refill mark of the song (see CandidatePool), even if it
+    failed. When it runs inline, the session is the one of the request: it is neither rolled back nor committed here,
+    the request does it"""
+    try:
+        populate_custom_song_async(syns, song_id, thread, first)
+    finally:
+        worker = on_worker()
+        if worker:
+            db.session.rollback()
+        Songs.query.filter_by(id=song_id).update({'refill_requested_at': None}, synchronize_session=False)
+        if worker:
+            db.session.commit()
+
+
 def populate_custom_song(syns, song_id, thread=True, first=False):
+    """Runs populate_custom_song_async on the job queue, once per song at a time. Returns False if it was not queued,
+    see JobQueue.submit"""
 
-    Thread(target=populate_custom_song_async, args=(syns, song_id, thread, first, )).start()
+    return submit_job(('populate_custom_song', song_id), refill_custom_song, syns, song_id, thread, first)
 
 
 def song_id_encoder(id):
@@ -13786,23 +746,8 @@ def song_id_decoder(encoded_id):
     return out
 
 
-def get_sent_with_rhyme(word='', rhyme='', num_words=10):
-    """Returns sentence(s) that rhyme with rhyme and that are related to word"""
-
-    global viable_words
-
-    if not word:
-        rand = random.randint(0,len(viable_words['words'])-1)
-        word = viable_words['words'][rand]
-
-        if not rhyme:
-            response = rhyme_table.get_item(
-              Key={'id': word}
-            )
-            ids = response['Item']['sent_ids']
-            if ids:
-                rand = random.randint(int(ids[0]), int(ids[1]))
-                return [get_sent_by_id(rand), rand, word]
+def top_synonyms(word, num_words=10):
+    """Returns the num_words words most similar to word=word, best ranked first"""
 
     syns = list_of_similar_words_updated(word)
 
@@ -13841,111 +786,94 @@ def get_sent_with_rhyme(word='', rhyme='', num_words=10):
                 words = [word]
                 break
 
-    response = dynamodb.meta.client.batch_get_item(
-        RequestItems={
-            'LyricLink': {
-                'Keys': [
-                    {'id': id} for id in words
-                ],
-                'ConsistentRead': True
-            }
-        },
-        #ReturnConsumedCapacity='TOTAL'
-    )
-
-    for i in range(len(response['Responses']['LyricLink'])):
-        curr = response['Responses']['LyricLink'][i]['counts']
-        words[i] = response['Responses']['LyricLink'][i]['id'] + '-' + str(random.randint(1,curr))
-
-    related_ids_response = dynamodb.meta.client.batch_get_item(
-        RequestItems={
-            'LyricLink': {
-                'Keys': [
-                    {'id': id } for id in words
-                ],
-                'ConsistentRead': True
-            }
-        },
-        ReturnConsumedCapacity='TOTAL'
-    )
-
-    if not rhyme:
-
-        rand = random.randint(0, len(viable_words['words'])-1)
-        rhyme_response = rhyme_table.get_item(
-            Key={'id': viable_words['words'][rand]}
-        )
-
-    else:
-        rhyme_response = rhyme_table.get_item(
-            Key={'id': rhyme}
-        )
-
-    try:
-        rhyme_ids = list(rhyme_response['Item']['rhymes'].values())
-    except KeyError:
-        return -1
-
-    random.shuffle(rhyme_ids)
-    related_ids = related_ids_response['Responses']['LyricLink']
-
-    for k in rhyme_ids:
+    return words
 
-        if k:
-            for j in related_ids:
 
-                curr_word = j['id']
-                curr_word = curr_word[:curr_word.find('-')]
+GET_SENT_DEADLINE = 8
+LINK_PAGES_PER_BATCH = 25
+RANDOM_RHYME_ATTEMPTS = 5
+# number of ids tried at once when the sentence of an id may be missing from the Lyrics table
+SENT_ATTEMPTS = 5
 
-                try:
-                    # -1 offset since ids in lyric_link are off by 1
-                    if j['links'][-1] - 1 < k[0] or j['links'][0] - 1 > k[1]:
-                        continue
+# number of get_sent calls, of calls that found a related sentence, of LyricLink pages tested and of calls that
+# fell back to an unrelated sentence
+get_sent_stats = {'calls': 0, 'successes': 0, 'pages': 0, 'fallbacks': 0}
+_get_sent_stats_lock = Lock()
 
-                    # do binary search
-                    else:
-                        index = binarySearch(j['links'], 0, len(j['links'])-1, [int(k[0]), int(k[1])])
 
-                        if index != -1:
-                            return [get_sent_by_id(index), index, word]
+def count_get_sent(success, pages, fallback):
+    with _get_sent_stats_lock:
+        get_sent_stats['calls'] += 1
+        get_sent_stats['successes'] += success
+        get_sent_stats['pages'] += pages
+        get_sent_stats['fallbacks'] += fallback
 
-                except KeyError:
-                    continue
+        logger.debug('get_sent: %d pages tested, %.1f pages per success overall', pages,
+                     get_sent_stats['pages'] / max(get_sent_stats['successes'], 1))
 
-    return -1
 
+def get_sent(word='', rhyme='', num_words=10, deadline=GET_SENT_DEADLINE):
+    """Returns [sentence, id, word] where sentence is related to word=word and rhymes with rhyme=rhyme (with a random
+    word if rhyme is empty). Returns 1 if there is no such sentence.
 
-def binarySearch(ids, l, r, range):
+    The synonyms of word, their LyricLink page counts and the id ranges of the rhymes are computed once. Pages of
+    links are then read in a random order, a batch at a time, until a batch has sentences in the ranges, and one of
+    them is picked. If none does before deadline seconds, a sentence that rhymes with rhyme but is not related to word
+    is returned instead, as [sentence, id, rhyme word]. Ids whose sentence is missing from the Lyrics table are
+    skipped"""
 
-    if r >= l:
+    t = time.time()
 
-        mid = l + int((r - l)/ 2)
+    if not word:
+        word = random_viable_word()
 
-        # If element is present at the middle itself
-        if int(ids[mid]) - 1 <= range[1] and int(ids[mid]) - 1 >= range[0]:
-            return ids[mid] - 1
+        if not rhyme:
+            ids = list_of_sent_id(word)
+            if ids:
+                sent = first_sent([random.randint(int(ids[0]), int(ids[1])) for _ in range(SENT_ATTEMPTS)])
+                if sent is not None:
+                    count_get_sent(True, 0, False)
+                    return sent + [word]
 
-        # If element is smaller than mid, then it
-        # can only be present in left subarray
-        elif int(ids[mid]) - 1 > range[1]:
-            return binarySearch(ids, l, mid - 1, range)
+    words = top_synonyms(word, num_words)
 
-            # Else the element can only be present
-        # in right subarray
-        else:
-            return binarySearch(ids, mid + 1, r, range)
+    # the rhymes of rhyme do not depend on the LyricLink lookups, so they are fetched at the same time
+    links, ranges = fan_out((lyric_link_table.batch_get_item, words, True),
+                            (rhyme_ranges, rhyme if rhyme else random_viable_word()))
+    if not rhyme:
+        for attempt in range(RANDOM_RHYME_ATTEMPTS):
+            if ranges:
+                break
+            ranges = rhyme_ranges(random_viable_word())
 
-    else:
-        # Element is not present in the array
-        return -1
+    pages = []
+    if ranges:
+        pages = [item['id'] + '-' + str(page) for item in links.values() for page in range(1, int(item['counts']) + 1)]
+        random.shuffle(pages)
 
-def get_sent(word='', rhyme=''):
+    tested = 0
+    for i in range(0, len(pages), LINK_PAGES_PER_BATCH):
+        if time.time() - t > deadline:
+            break
 
-    t = time.time()
-    new_sent = -1
-    while new_sent == -1:
-        if time.time() - t > 8:
-            return 1
-        new_sent = get_sent_with_rhyme(word=word, rhyme=rhyme)
+        hits = []
+        for page_links in get_links_by_pages(pages[i:i + LINK_PAGES_PER_BATCH]).values():
+            tested += 1
+            hits.extend(links_in_ranges(page_links, ranges).tolist())
+
+        sent = first_sent(random.sample(hits, min(len(hits), SENT_ATTEMPTS))) if hits else None
+        if sent is not None:
+            count_get_sent(True, tested, False)
+            return sent + [word]
+
+    sent = None
+    if ranges:
+        rhyme_words = {index: rhyme_word for rhyme_word, index in (ranges.sample() for _ in range(SENT_ATTEMPTS))}
+        sent = first_sent(list(rhyme_words))
+    if sent is None:
+        count_get_sent(False, tested, False)
+        return 1
 
-    return new_sent
+    # the sentence is not related to word, it is tagged with the rhyme it ends with instead
+    count_get_sent(False, tested, True)
+    return sent + [rhyme_words[sent[1]]]
@@ -3,11 +3,12 @@ from hashlib import md5
 from time import time
 from flask import current_app, flash
 from flask_login import UserMixin
+from sqlalchemy.orm.attributes import flag_dirty
 from werkzeug.security import generate_password_hash, check_password_hash
 import jwt
 from app import db, login
 from app.search import add_to_index, remove_from_index, query_index
-import re
+import ast
 import random
 
 
@@ -139,49 +140,100 @@ class Post(SearchableMixin, db.Model):
     def __repr__(self):
         return '<Post {}>'.format(self.body)
 
-class Songs(db.Model):
-
-    id = db.Column(db.Integer, primary_key=True)
-
-    # These store the currently used lyrics for the song. part_1 stores each line, separeated
-    # by ';'. part_1_ids stores the dynamodb id of each line in part_1
-    part_1 = db.Column(db.String(10000))
-    part_1_ids = db.Column(db.String(10000))
 
-    # These store lines used in the custom mode in a way analagous to part_1 above
-    # TODO: Storing duplicate of song in custom mode. Need fix.
-    related = db.Column(db.String(10000))
-    related_ids = db.Column(db.String(10000))
+# size of the legacy string columns of Songs
+LEGACY_COLUMN_SIZE = 10000
 
-    # These store sentences that rhyme with the sentences stored in related
-    # batches of sentence that rhyme with each sentence in related are
-    # separated by ';' . Within batch, sentences are separated by '&'
-    rhyme_related = db.Column(db.String(10000))
-    rhyme_related_ids = db.Column(db.String(10000))
 
-    # These are duplicate of related, rhyme_related variables to allow for threading
-    related_thr = db.Column(db.String(10000))
-    related_ids_thr = db.Column(db.String(10000))
+class Songs(db.Model):
 
-    rhyme_related_thr = db.Column(db.String(10000))
-    rhyme_related_ids_thr = db.Column(db.String(10000))
+    id = db.Column(db.Integer, primary_key=True)
 
+    # The lines of the song and the candidate sentences of the custom mode are rows of song_line, related_candidate
+    # and rhyme_candidate (see below), read through a SongState. The columns below are where they used to be stored,
+    # as strings separated by ';' and '&'. They are kept for the versions of the app that still read them: they are
+    # not read anymore, and only the parts that changed are written, when the song is flushed (see
+    # serialize_song_states). They are deferred, so loading a song does not read them.
+    part_1 = db.deferred(db.Column(db.String(LEGACY_COLUMN_SIZE)), group='legacy')
+    part_1_ids = db.deferred(db.Column(db.String(LEGACY_COLUMN_SIZE)), group='legacy')
+    related = db.deferred(db.Column(db.String(LEGACY_COLUMN_SIZE)), group='legacy')
+    related_ids = db.deferred(db.Column(db.String(LEGACY_COLUMN_SIZE)), group='legacy')
+    rhyme_related = db.deferred(db.Column(db.String(LEGACY_COLUMN_SIZE)), group='legacy')
+    rhyme_related_ids = db.deferred(db.Column(db.String(LEGACY_COLUMN_SIZE)), group='legacy')
+    related_thr = db.deferred(db.Column(db.String(LEGACY_COLUMN_SIZE)), group='legacy')
+    related_ids_thr = db.deferred(db.Column(db.String(LEGACY_COLUMN_SIZE)), group='legacy')
+    rhyme_related_thr = db.deferred(db.Column(db.String(LEGACY_COLUMN_SIZE)), group='legacy')
+    rhyme_related_ids_thr = db.deferred(db.Column(db.String(LEGACY_COLUMN_SIZE)), group='legacy')
 
     # stores what song is about and similar words to what song is about
     about = db.Column(db.String(10000))
 
+    # the pool of related candidates (thread) the next lines of the custom mode are taken from, and when a refill of
+    # one of them was queued (None when none is pending), see CandidatePool
+    active_pool = db.Column(db.Boolean, default=False)
+    refill_requested_at = db.Column(db.DateTime)
+
+    lines = db.relationship('SongLine', backref='song', cascade='all, delete-orphan', order_by='SongLine.position')
+    related_candidates = db.relationship('RelatedCandidate', cascade='all, delete-orphan',
+                                         order_by='RelatedCandidate.position')
+    rhyme_candidates = db.relationship('RhymeCandidate', cascade='all, delete-orphan',
+                                       order_by='RhymeCandidate.position')
+
+    @property
+    def state(self):
+        """The SongState of the song, loaded the first time it is needed after the song is loaded or committed"""
+        state = self.__dict__.get('_state')
+        if state is None:
+            state = self.__dict__['_state'] = SongState(self)
+        return state
+
+    def _line(self, line_id):
+        """Returns the SongLine at position line_id. Negative positions count from the end, as in a list"""
+        return self.state.lines[line_id]
+
+    def _related(self, id, thread=False):
+        """Returns the RelatedCandidate at position id of related (thread=False) or related_thr (thread=True)"""
+        return self.state.related[thread][id]
+
+    def _rhyme_related(self, ind_sub_ind, thread=False):
+        """Returns the RhymeCandidate at position ind_sub_ind[1] of the ones rhyming with related candidate
+        ind_sub_ind[0]"""
+        return self.state.rhymes[thread][ind_sub_ind[0]][ind_sub_ind[1]]
+
+    def lyric(self):
+        """Returns the lines of the song, in order"""
+        return [line.text for line in self.state.lines]
+
     def update_lyric(self, new_line, related=''):
         """Adds new_line to song lyrics and updates correspoding dynamodb id"""
-        self.part_1 = self.part_1 + ';' + new_line[0]
-        self.part_1_ids = self.part_1_ids + ';' + str(new_line[1])
-        self.related = self.related + ';' + related
+        self.state.add_line(SongLine(position=self.get_num_lines(), text=new_line[0], sentence_id=int(new_line[1]),
+                                     related=related))
+
 
+    def _parsed_about(self):
+        """Returns the parts of about parsed so far. They are parsed again only when about is assigned (or loaded)
+        again, not each time they are read"""
+        parsed = self.__dict__.get('_about')
+        if parsed is None or parsed['about'] is not self.about:
+            parsed = self.__dict__['_about'] = {'about': self.about}
+        return parsed
 
     def song_about(self):
         """Returns what current song is about"""
-        ind = self.about.find(';')
-        ind_2 = self.about.rfind('=')
-        return self.about[ind_2+1:ind]
+        parsed = self._parsed_about()
+        if 'word' not in parsed:
+            ind = self.about.find(';')
+            parsed['word'] = self.about[:ind]
+        return parsed['word']
+
+    def about_syns(self):
+        """Returns the two dictionaries of words similar to what the song is about stored in about
+        ('<word>;<dic1>;<dic2>'), as string_to_dic does. They are copies, sentence_related may change them"""
+        parsed = self._parsed_about()
+        if 'syns' not in parsed:
+            t = self.about.split(';')
+            parsed['syns'] = [ast.literal_eval(t[1]), ast.literal_eval(t[2])]
+        return [dict(syns) for syns in parsed['syns']]
 
 
     def update_related(self, new_related, last_words, rhyming_sent, thread = False):
@@ -193,222 +245,111 @@ class Songs(db.Model):
 
         first_that_has_rhymes = 0
         not_yet = True
-        if thread == False:
-            for i in range(len(new_related)):
-
-                # only add sentences that have rhyming sentences
-                if rhyming_sent[last_words[i]] != []:
-                    self.related = self.related + ';' + new_related[i][0]
-                    self.update_related_id(sentence_id=int(new_related[i][1]))
-                    self.update_rhyme_related(rhyming_sent[last_words[i]])
-                    not_yet=False
-                else:
-                    if not_yet:
-                        first_that_has_rhymes = i+1
 
+        # candidates are inserted in bulk, without creating their objects, after the last one in the database. The
+        # song is flushed first, so it has an id and its pending candidates are in the database
+        db.session.add(self)
+        db.session.flush()
+        position = db.session.query(db.func.max(RelatedCandidate.position)).filter_by(
+            song_id=self.id, thread=thread).scalar()
+        if position is None:
+            position = -1
+
+        related, rhymes = [], []
+        for i in range(len(new_related)):
+
+            # only add sentences that have rhyming sentences
+            if rhyming_sent[last_words[i]] != []:
+                position += 1
+                related.append({'song_id': self.id, 'thread': thread, 'position': position,
+                                'text': new_related[i][0], 'sentence_id': int(new_related[i][1]), 'used_by_line': 0})
+                rhymes.extend({'song_id': self.id, 'thread': thread, 'related_position': position, 'position': j,
+                               'text': sent[0], 'sentence_id': int(sent[1]), 'used_by_line': 0}
+                              for j, sent in enumerate(rhyming_sent[last_words[i]]))
+                not_yet = False
+            else:
+                if not_yet:
+                    first_that_has_rhymes = i+1
 
-        else:
-            for i in range(len(new_related)):
-
-                # only add sentences that have rhyming sentences
-                if rhyming_sent[last_words[i]] != []:
-                    self.related_thr = self.related_thr + ';' + new_related[i][0]
-                    self.update_related_id(sentence_id=int(new_related[i][1]), thread=True)
-                    self.update_rhyme_related(rhyming_sent[last_words[i]], thread=True)
-                    not_yet=False
-                else:
-                    if not_yet:
-                        first_that_has_rhymes = i+1
+        if related:
+            db.session.execute(RelatedCandidate.__table__.insert(), related)
+            db.session.execute(RhymeCandidate.__table__.insert(), rhymes)
+            # the candidates are read again, with the new ones
+            db.session.expire(self, ['related_candidates', 'rhyme_candidates'])
+            self.state.changed(('related', thread), ('rhymes', thread))
 
         return first_that_has_rhymes
 
 
     def update_rhyme_related(self, sentences, related_id = -1, thread = False):
-        """Given list of sentences that rhyme with an entry of self.related, updated rhyme_related column"""
+        """Given list of sentences that rhyme with an entry of self.related, adds them to the ones rhyming with
+        related_id (the last entry if related_id is -1)"""
 
-        if thread == False:
-            # if we are appending at end (called from update_related())
-            if related_id == -1:
-                self.rhyme_related = self.rhyme_related + ';'
-                self.rhyme_related_ids = self.rhyme_related_ids + ';'
-                for sent in sentences:
-                    self.rhyme_related = self.rhyme_related + '&' + sent[0]
-                    self.update_rhyme_related_id(sentence_id=int(sent[1]))
+        if related_id == -1:
+            related_id = len(self.state.related[thread]) - 1
 
-            # TODO update an existing entry of related column
-
-        else:
-            # if we are appending at end (called from update_related())
-            if related_id == -1:
-                self.rhyme_related_thr = self.rhyme_related_thr + ';'
-                self.rhyme_related_ids_thr = self.rhyme_related_ids_thr + ';'
-                for sent in sentences:
-                    self.rhyme_related_thr = self.rhyme_related_thr + '&' + sent[0]
-                    self.update_rhyme_related_id(sentence_id=int(sent[1]), thread=True)
-
-            # TODO update an existing entry of related column
+        for sent in sentences:
+            self.state.add_rhyme(RhymeCandidate(thread=thread, related_position=related_id,
+                                                position=len(self.state.rhymes[thread][related_id]), text=sent[0],
+                                                sentence_id=int(sent[1]), used_by_line=0))
 
 
     def change_related(self, related_id, new_sent, thre=False):
         """This is used in the manual edit mode. Method changes the sentence stored in related/related_thr field"""
-        if not thre:
-            all_index = [m.start() for m in re.finditer(';', self.related)]
-            if len(all_index) == related_id + 1:
-                self.related = self.related[:all_index[related_id]+1] + new_sent
-            else:
-                self.related = self.related[:all_index[related_id]+1] + new_sent + self.related[all_index[related_id+1]:]
-
-        else:
-            all_index = [m.start() for m in re.finditer(';', self.related_thr)]
-            if len(all_index) == related_id + 1:
-                self.related_thr = self.related_thr[:all_index[related_id] + 1] + new_sent
-            else:
-                self.related_thr = self.related_thr[:all_index[related_id] + 1] + new_sent + self.related_thr[
-                                                                                     all_index[related_id + 1]:]
+        self._related(related_id, thread=thre).text = new_sent
+        self.state.changed(('related', thre))
 
     def change_rhyme_related(self, rhyme_related_ids, new_sent, thre=False):
         """This is used in the manual edit mode. Method changes the sentence stored in rhyme_related/rhyme_related_thr field"""
-        if not thre:
-            all_index_1 = [m.start() for m in re.finditer(';', self.rhyme_related)]
-            if len(all_index_1) == rhyme_related_ids[0] + 1:
-                all_index_2 = [m.start() for m in re.finditer('&', self.rhyme_related[all_index_1[rhyme_related_ids[0]]+1:])]
-            else:
-                all_index_2 = [m.start() for m in
-                               re.finditer('&', self.rhyme_related[all_index_1[rhyme_related_ids[0]]
-                                                                   +1:all_index_1[rhyme_related_ids[0]+1]])]
-
-            offset = all_index_1[rhyme_related_ids[0]]+1
-            if len(all_index_2) == rhyme_related_ids[1] + 1:
-                self.rhyme_related = self.rhyme_related[:offset + all_index_2[rhyme_related_ids[1]]+1] + new_sent
-            else:
-                self.rhyme_related = self.rhyme_related[:offset + all_index_2[rhyme_related_ids[1]]+1] + \
-                                     new_sent + self.rhyme_related[offset + all_index_2[rhyme_related_ids[1]+1]:]
-
-        else:
-            return
-
+        self._rhyme_related(rhyme_related_ids, thread=thre).text = new_sent
+        self.state.changed(('rhymes', thre))
 
 
     def clear_lyrics(self):
-        """self.related is initialized as '=' to indicate we start by using self.related instead of self.related_thr
-        We iterate between each having the '=' in the beggining. """
-        self.part_1 = ''
-        self.part_1_ids = ''
-        self.related = ''
-        self.related_ids = ''
-        self.rhyme_related = ''
-        self.rhyme_related_ids = ''
-
-        self.related_thr = ''
-        self.related_ids_thr = ''
-        self.rhyme_related_thr = ''
-        self.rhyme_related_ids_thr = ''
+        """Deletes the lines and the candidate sentences of the song"""
+        self.lines = []
+        self.related_candidates = []
+        self.rhyme_candidates = []
+        self.__dict__['_state'] = SongState(self)
+        self.state.changed('lines', *[(part, thread) for part in ('related', 'rhymes') for thread in (False, True)])
 
     def get_last_line(self):
-        sep = self.part_1.rfind(';')
-
-        return self.part_1[sep+1:]
+        if self.get_num_lines() == 0:
+            return ''
+        return self._line(-1).text
 
     def del_last_line(self):
-        sep = self.part_1.rfind(';')
 
         # if lyric has only one sentence
-        if sep == 0:
+        if self.get_num_lines() <= 1:
             self.clear_lyrics()
         else:
-            self.part_1 = self.part_1[:sep]
+            self.state.del_line(-1)
 
     def get_num_lines(self):
-        return len([m.start() for m in re.finditer(';', self.part_1_ids)])
+        return len(self.state.lines)
 
 
     def update_rhyme_related_id(self, sentence_id=-1, ind_sub_ind=[], line_being_used = -1, action='new', thread = False):
-        """ Updates the dynamodb id and line_being_used id of sentences in song.related column
+        """ Updates the dynamodb id and line_being_used id of sentences in song.rhyme_related column
                 Inputs:
                 sentence_id = dynamodb id of sentence
-
+                ind_sub_ind = [position of the related sentence, position among the ones rhyming with it]
                 line_being_used = line in song that sentence is being used (index starts at 1)
                 action = what to to with sentence
                 """
 
-        if not thread:
-            # adds new sentence. this is only called from update_related
-            if action == 'new':
-                self.rhyme_related_ids = self.rhyme_related_ids + '&0-' + str(sentence_id)
+        # adds new sentence to the ones rhyming with the last related sentence
+        if action == 'new':
+            self.update_rhyme_related([['', sentence_id]], thread=thread)
 
+        # updates status of sentence when sentence is added to ongoing lyrics
+        elif action == 'used':
+            self.state.use(self._rhyme_related(ind_sub_ind, thread=thread), line_being_used)
 
-            # updates status of sentence when sentence is added to ongoing lyrics
-            elif action == 'used':
-                """
-                ind = [m.start() for m in re.finditer('-' + str(sentence_id), self.rhyme_related_ids)]
-                for inde in ind:
-                    self.rhyme_related_ids = self.rhyme_related_ids[:inde - 1] + str(line_being_used) + \
-                                             self.rhyme_related_ids[inde:]
-                                             """
-                ind_1 = [m.start() for m in re.finditer(';', self.rhyme_related_ids)]
-                ind_2 = [m.start() for m in re.finditer('&', self.rhyme_related_ids[ind_1[ind_sub_ind[0]]:])]
-
-                self.rhyme_related_ids = self.rhyme_related_ids[:ind_1[ind_sub_ind[0]] + ind_2[ind_sub_ind[1]] + 1] \
-                                         + str(line_being_used) \
-                                         + self.rhyme_related_ids[ind_1[ind_sub_ind[0]]
-                                                                  + ind_2[ind_sub_ind[1]] + 2:]
-
-
-            # when user deletes sentence from rhyme_related_ids, we simply set its flag to 0 (as unused)
-            elif action == 'del':
-                """
-                ind = [m.start() for m in re.finditer('-' + str(sentence_id), self.rhyme_related_ids)]
-                for inde in ind:
-                    self.rhyme_related_ids = self.rhyme_related_ids[:inde - 1] + '0' + \
-                                             self.rhyme_related_ids[inde:]
-                                             """
-                ind_1 = [m.start() for m in re.finditer(';', self.rhyme_related_ids)]
-                ind_2 = [m.start() for m in re.finditer('&', self.rhyme_related_ids[ind_1[ind_sub_ind[0]]:])]
-
-                self.rhyme_related_ids = self.rhyme_related_ids[:ind_1[ind_sub_ind[0]] + ind_2[ind_sub_ind[1]] + 1] \
-                                         + '0' \
-                                         + self.rhyme_related_ids[ind_1[ind_sub_ind[0]]
-                                                                  + ind_2[ind_sub_ind[1]] + 2:]
-
-        else:
-            # adds new sentence. this is only called from update_related
-            if action == 'new':
-                self.rhyme_related_ids_thr = self.rhyme_related_ids_thr + '&0-' + str(sentence_id)
-
-
-            # updates status of sentence when sentence is added to ongoing lyrics
-            elif action == 'used':
-                """
-                ind = [m.start() for m in re.finditer('-' + str(sentence_id), self.rhyme_related_ids_thr)]
-                for inde in ind:
-                    self.rhyme_related_ids_thr = self.rhyme_related_ids_thr[:inde - 1] + str(line_being_used) + \
-                                             self.rhyme_related_ids_thr[inde:]
-                                             """
-                ind_1 = [m.start() for m in re.finditer(';', self.rhyme_related_ids_thr)]
-                ind_2 = [m.start() for m in re.finditer('&', self.rhyme_related_ids_thr[ind_1[ind_sub_ind[0]]:])]
-
-                self.rhyme_related_ids_thr = self.rhyme_related_ids_thr[:ind_1[ind_sub_ind[0]] + ind_2[ind_sub_ind[1]] + 1] \
-                                         + str(line_being_used) \
-                                         + self.rhyme_related_ids_thr[ind_1[ind_sub_ind[0]]
-                                                                  + ind_2[ind_sub_ind[1]] + 2:]
-
-
-            # when user deletes sentence from rhyme_related_ids, we simply set its flag to 0 (as unused)
-            elif action == 'del':
-                """
-                ind = [m.start() for m in re.finditer('-' + str(sentence_id), self.rhyme_related_ids_thr)]
-                for inde in ind:
-                    self.rhyme_related_ids_thr = self.rhyme_related_ids_thr[:inde - 1] + '0' + \
-                                                 self.rhyme_related_ids_thr[inde:]
-                                                 """
-                ind_1 = [m.start() for m in re.finditer(';', self.rhyme_related_ids_thr)]
-                ind_2 = [m.start() for m in re.finditer('&', self.rhyme_related_ids_thr[ind_1[ind_sub_ind[0]]:])]
-
-                self.rhyme_related_ids_thr = self.rhyme_related_ids_thr[
-                                             :ind_1[ind_sub_ind[0]] + ind_2[ind_sub_ind[1]] + 1] \
-                                             + '0' \
-                                             + self.rhyme_related_ids_thr[ind_1[ind_sub_ind[0]]
-                                                                          + ind_2[ind_sub_ind[1]] + 2:]
+        # when user deletes sentence from rhyme_related_ids, we simply set its flag to 0 (as unused)
+        elif action == 'del':
+            self.state.use(self._rhyme_related(ind_sub_ind, thread=thread), 0)
 
 
     def update_related_id(self, sentence_id=-1, id=-1, line_being_used = -1, action='new', thread = False):
@@ -420,401 +361,400 @@ class Songs(db.Model):
         action = what to to with sentence
         """
 
-        if thread == False:
-            all_index = [m.start() for m in re.finditer(';', self.related_ids)]
-
-            # adds new sentence. this is only called from update_related
-            if action == 'new':
-                self.related_ids += ';0-' + str(sentence_id)
-
-            # updates status of sentence when sentence is added to ongoing lyrics
-            elif action == 'used':
-
-                if len(all_index) == id + 1:
-                    self.related_ids = self.related_ids[:all_index[id]+1] + str(line_being_used) + '-' + self.related_ids[all_index[id]+3:]
-                else:
-                    self.related_ids = self.related_ids[:all_index[id]+1] + str(line_being_used) + '-' + self.related_ids[all_index[id]+3:]
-
-            # deletes sentence from both related and related_ids
-            # TODO need to delete the corresponding rhyme_related and rhyme_related_ids
-            elif action == 'del':
-
-                all_index_related = [m.start() for m in re.finditer(';', self.related)]
-                all_index_rhyme_related = [m.start() for m in re.finditer(';', self.rhyme_related)]
-                all_index_rhyme_related_ids = [m.start() for m in re.finditer(';', self.rhyme_related_ids)]
-                if len(all_index) == id + 1:
-                    self.related_ids = self.related_ids[:all_index[id]]
-                    self.related = self.related[:all_index_related[id]]
-                    self.rhyme_related = self.rhyme_related[:all_index_rhyme_related[id]]
-                    self.rhyme_related_ids = self.rhyme_related_ids[:all_index_rhyme_related_ids[id]]
-                else:
-                    self.related_ids = self.related_ids[:all_index[id]] + self.related_ids[all_index[id + 1]:]
-                    self.related = self.related[:all_index_related[id]] + self.related[all_index_related[id + 1]:]
-                    self.rhyme_related = self.rhyme_related[:all_index_rhyme_related[id]] +\
-                                         self.rhyme_related[all_index_rhyme_related[id + 1]:]
-                    self.rhyme_related_ids = self.rhyme_related_ids[:all_index_rhyme_related_ids[id]] + \
-                                         self.rhyme_related_ids[all_index_rhyme_related_ids[id + 1]:]
-
-            elif action == 'unused':
-                sep = self.related_ids[all_index[id]:].find('-')
-                self.related_ids = self.related_ids[:all_index[id]+1] + '0' + self.related_ids[all_index[id]+sep:]
-
-        else:
-            all_index = [m.start() for m in re.finditer(';', self.related_ids_thr)]
-
-            # adds new sentence. this is only called from update_related
-            if action == 'new':
-                self.related_ids_thr += ';0-' + str(sentence_id)
-
-            # updates status of sentence when sentence is added to ongoing lyrics
-            elif action == 'used':
-
-                if len(all_index) == id + 1:
-                    self.related_ids_thr = self.related_ids_thr[:all_index[id] + 1] + str(
-                        line_being_used) + '-' + self.related_ids_thr[all_index[id] + 3:]
-                else:
-                    self.related_ids_thr = self.related_ids_thr[:all_index[id] + 1] + str(
-                        line_being_used) + '-' + self.related_ids_thr[all_index[id] + 3:]
-
-            # deletes sentence from both related and related_ids
-            elif action == 'del':
-
-                all_index_related = [m.start() for m in re.finditer(';', self.related_thr)]
-                all_index_rhyme_related = [m.start() for m in re.finditer(';', self.rhyme_related_thr)]
-                all_index_rhyme_related_ids = [m.start() for m in re.finditer(';', self.rhyme_related_ids_thr)]
-                if len(all_index) == id + 1:
-                    self.related_ids_thr = self.related_ids_thr[:all_index[id]]
-                    self.related_thr = self.related_thr[:all_index_related[id]]
-                    self.rhyme_related_thr = self.rhyme_related_thr[:all_index_rhyme_related[id]]
-                    self.rhyme_related_ids_thr = self.rhyme_related_ids_thr[:all_index_rhyme_related_ids[id]]
-                else:
-                    self.related_ids_thr = self.related_ids_thr[:all_index[id]] + self.related_ids_thr[all_index[id + 1]:]
-                    self.related_thr = self.related_thr[:all_index_related[id]] + self.related_thr[all_index_related[id + 1]:]
-                    self.rhyme_related_thr = self.rhyme_related_thr[:all_index_rhyme_related[id]] + \
-                                         self.rhyme_related_thr[all_index_rhyme_related[id + 1]:]
-                    self.rhyme_related_ids_thr = self.rhyme_related_ids_thr[:all_index_rhyme_related_ids[id]] + \
-                                             self.rhyme_related_ids_thr[all_index_rhyme_related_ids[id + 1]:]
-
-
-    def non_used(self, thread= False):
-        """Returns sentences from related column that have not yet been used along with their local id."""
-
-        if thread == False:
-            all_index = [m.start() for m in re.finditer(';', self.related_ids)]
-            non_used = []
-            i = 0
-
-            for index in all_index:
+        # adds new sentence
+        if action == 'new':
+            self.state.add_related(RelatedCandidate(thread=thread, position=len(self.state.related[thread]), text='',
+                                                    sentence_id=int(sentence_id), used_by_line=0))
 
-                if self.related_ids[index + 1] == '0':
-                    non_used.append([self.get_related_by_id(i), i])
-                i += 1
+        # updates status of sentence when sentence is added to ongoing lyrics
+        elif action == 'used':
+            self.state.use(self._related(id, thread=thread), line_being_used)
 
-        else:
-            all_index = [m.start() for m in re.finditer(';', self.related_ids_thr)]
-            non_used = []
-            i = 0
+        # deletes sentence from related, with the sentences rhyming with it
+        elif action == 'del':
+            self.state.del_related(id, thread)
 
-            for index in all_index:
+        elif action == 'unused':
+            self.state.use(self._related(id, thread=thread), 0)
 
-                if self.related_ids_thr[index + 1] == '0':
-                    non_used.append([self.get_related_by_id(i, thread=True), i])
-                i += 1
 
-        return non_used
+    def non_used(self, thread= False):
+        """Returns sentences from related column that have not yet been used along with their local id."""
+        return [[candidate.text, candidate.position] for candidate in self.state.related[thread]
+                if not candidate.used_by_line]
 
 
     def num_related(self):
         """Returns the current number of related sentences"""
-        return len([m.start() for m in re.finditer(';', self.related_ids)])
+        return len(self.state.related[False])
 
     def update_line(self, line_id, new_line):
-
-        to_change = self.get_line_by_id(line_id)
-        start = self.part_1.find(to_change)
-        end = start + len(to_change)
-        self.part_1 = self.part_1[:start] + new_line + self.part_1[end:]
+        self._line(line_id).text = new_line
+        self.state.changed('lines')
 
     def del_line(self, line_id):
 
         line_id = int(line_id)
 
-        if line_id == 0 and self.get_num_lines() == 0:
+        if self.get_num_lines() == 0:
             self.clear_lyrics()
-
-        elif line_id == self.get_num_lines() - 1:
-            ind = self.part_1.rfind(';')
-            self.part_1 = self.part_1[:ind]
-            ind = self.part_1_ids.rfind(';')
-            self.part_1_ids = self.part_1_ids[:ind]
-            ind = self.related.rfind(';')
-            self.related = self.related[:ind]
-
         else:
-            to_change = self.get_line_by_id(line_id)
-            start = self.part_1.find(to_change)
-            end = start + len(to_change)
-            self.part_1 = self.part_1[:start] + self.part_1[end+1:]
-
-            to_change = self.get_line_id_by_id(line_id)
-            start = self.part_1_ids.find(to_change)
-            end = start + len(to_change)
-            self.part_1_ids = self.part_1_ids[:start] + self.part_1_ids[end+1:]
-
-            to_change = self.get_related_by_id_new(line_id)
-            start = self.related.find(to_change)
-            end = start + len(to_change)
-            self.related = self.related[:start] + self.related[end + 1:]
+            self.state.del_line(line_id)
 
 
     def update_line_id(self, line_id, new_id):
-
-        to_change = self.get_line_id_by_id(line_id)
-        start = self.part_1_ids.find(to_change)
-        end = start + len(to_change)
-        self.part_1_ids = self.part_1_ids[:start] + new_id + self.part_1_ids[end:]
+        self._line(line_id).sentence_id = int(new_id)
+        self.state.changed('lines')
 
     def get_line_by_id(self, line_id):
-
-        all_index = [m.start() for m in re.finditer(';', self.part_1)]
-
-        if len(all_index) == line_id + 1:
-            return self.part_1[all_index[line_id]+1:]
-
-        return self.part_1[all_index[line_id] + 1:all_index[line_id+1]]
+        return self._line(line_id).text
 
     def get_related_by_id_new(self, line_id):
-
-        all_index = [m.start() for m in re.finditer(';', self.related)]
-
-        if len(all_index) == line_id + 1:
-            return self.related[all_index[line_id]+1:]
-
-        return self.related[all_index[line_id] + 1:all_index[line_id+1]]
+        return self._line(line_id).related
 
     def get_line_related(self, line_id):
-        all_index = [m.start() for m in re.finditer(';', self.related)]
-
-        if len(all_index) == line_id + 1:
-            return self.related[all_index[line_id] + 1:]
-
-        return self.related[all_index[line_id] + 1:all_index[line_id + 1]]
+        return self._line(line_id).related
 
     def get_line_id_by_id(self, line_id):
-        """line_id here is the dynamodb id"""
-
-        all_index = [m.start() for m in re.finditer(';', self.part_1_ids)]
-
-        if len(all_index) == line_id + 1:
-            return self.part_1_ids[all_index[line_id]+1:]
-
-        return self.part_1_ids[all_index[line_id] + 1:all_index[line_id+1]]
+        """Returns the dynamodb id of line line_id"""
+        return str(self._line(line_id).sentence_id)
 
 
     def get_related_id_by_line_id(self, line_id):
-        #line_id is assumed to start at 1. related_id is the positional id of sentence
-
-        # TODO Need to check if this is going to cause problems if we try to access while thread is happening
-        #  TODO if it does, the idea is to return -1 and generate a new rhyming sentence.
-        index_1 = self.related_ids.find(str(line_id)+'-')
-        index_2 = self.related_ids_thr.find(str(line_id) + '-')
-
-        # found in the non-thread
-        if index_1 != -1:
-            all_index = [m.start() for m in re.finditer(';', self.related_ids)]
-
-            for i in range(len(all_index)):
-                if all_index[i] > index_1:
-                    return [i - 1, False]
-
-            return [len(all_index) - 1, False]
-
-        if index_2 != -1:
-            all_index = [m.start() for m in re.finditer(';', self.related_ids_thr)]
-
-            for i in range(len(all_index)):
-                if all_index[i] > index_2:
-                    return [i - 1, True]
-
-            return [len(all_index) - 1, True]
-
-        # not found in any
-        if index_1 == -1 and index_2 == -1:
-            return[-1,-1]
+        """Returns [position, thread] of the related sentence used in line line_id (starting at 1),
+        or [-1, -1] if there is none"""
+        candidates = self.state.used_related.get(int(line_id))
+        if not candidates:
+            return [-1, -1]
+        return [candidates[0].position, candidates[0].thread]
 
     def get_rhyme_related_id_by_line_id(self, line_id):
-        #line_id is assumed to start at 1. related_id is the positional id of sentence
-
-        # TODO Need to check if this is going to cause problems if we try to access while thread is happening
-        #  TODO if it does, the idea is to return -1 and generate a new rhyming sentence.
-        index_1 = self.rhyme_related_ids.find(str(line_id)+'-')
-        index_2 = self.rhyme_related_ids_thr.find(str(line_id) + '-')
-
-        # found in the non-thread
-        if index_1 != -1:
-            all_index = [m.start() for m in re.finditer(';', self.rhyme_related_ids)]
-
-            for i in range(len(all_index)):
-                if all_index[i] > index_1:
-
-                    # find subindex (related to & flag)
-                    all_index_2 = [m.start() for m in
-                                   re.finditer('&', self.rhyme_related_ids[all_index[i - 1]:all_index[i]])]
-                    for j in range(len(all_index_2)):
-
-                        if self.rhyme_related_ids[
-                           all_index_2[j] + all_index[i - 1] + 1:all_index_2[j] + all_index[i - 1] + 1 + len
-                               (str(line_id))] == str(line_id):
-                            return [i - 1, j, False]
-
-            i = len(all_index)
-            all_index_2 = [m.start() for m in re.finditer('&', self.rhyme_related_ids[all_index[i - 1]:])]
-            for j in range(len(all_index_2)):
-
-                if self.rhyme_related_ids[
-                   all_index_2[j] + all_index[i - 1] + 1:all_index_2[j] + all_index[i - 1] + 1 + len(
-                       str(line_id))] == str(line_id):
-                    return [len(all_index) - 1, j, False]
-
-        if index_2 != -1:
-            all_index = [m.start() for m in re.finditer(';', self.rhyme_related_ids_thr)]
-
-            for i in range(len(all_index)):
-                if all_index[i] > index_2:
-
-                    # find subindex (related to & flag)
-                    all_index_2 = [m.start() for m in
-                                   re.finditer('&', self.rhyme_related_ids_thr[all_index[i - 1]:all_index[i]])]
-                    for j in range(len(all_index_2)):
-
-                        if self.rhyme_related_ids_thr[all_index_2[j] + all_index[i - 1] + 1:
-                                all_index_2[j] + all_index[i - 1] + 1 + len(str(line_id))] == str(line_id):
-                            return [i - 1, j, True]
-
-            i = len(all_index)
-            all_index_2 = [m.start() for m in re.finditer('&', self.rhyme_related_ids_thr[all_index[i - 1]:])]
-            for j in range(len(all_index_2)):
-
-                if self.rhyme_related_ids_thr[all_index_2[j] + all_index[i - 1] + 1:all_index_2[j] +
-                            all_index[i - 1] + 1 + len(str(line_id))] == str(line_id):
-                    return [len(all_index) - 1, j, True]
+        """Returns [position of the related sentence, position among the ones rhyming with it, thread] of the rhyming
+        sentence used in line line_id (starting at 1), or None if there is none"""
+        candidates = self.state.used_rhymes.get(int(line_id))
+        if not candidates:
+            return None
+        return [candidates[0].related_position, candidates[0].position, candidates[0].thread]
 
 
     def get_rhyme_related_by_id(self, id, sub_id=-1, thresh=False):
         """sub_id is only used when we wish to avoid using a certain sentence already present in
         rhyme_related/rhyme_related_thr"""
 
-        if not thresh:
-            all_index = [m.start() for m in re.finditer(';', self.rhyme_related)]
-            if id + 1 == len(all_index):
-                possible_rhyme_related = self.rhyme_related[all_index[id]+1:]
-            else:
-                possible_rhyme_related = self.rhyme_related[all_index[id]+1: all_index[id+1]]
-
-            all_index_2 = [m.start() for m in re.finditer(';', self.rhyme_related_ids)]
-            if id + 1 == len(all_index_2):
-                possible_rhyme_related_ids = self.rhyme_related_ids[all_index_2[id]+1:]
-            else:
-                possible_rhyme_related_ids = self.rhyme_related_ids[all_index_2[id]+1: all_index_2[id+1]]
-
-        else:
-            all_index = [m.start() for m in re.finditer(';', self.rhyme_related_thr)]
-            if id + 1 == len(all_index):
-                possible_rhyme_related = self.rhyme_related_thr[all_index[id] + 1:]
-            else:
-                possible_rhyme_related = self.rhyme_related_thr[all_index[id] + 1: all_index[id + 1]]
-
-            all_index_2 = [m.start() for m in re.finditer(';', self.rhyme_related_ids_thr)]
-            if id + 1 == len(all_index_2):
-                possible_rhyme_related_ids = self.rhyme_related_ids_thr[all_index_2[id] + 1:]
-            else:
-                possible_rhyme_related_ids = self.rhyme_related_ids_thr[all_index_2[id] + 1: all_index_2[id + 1]]
-
-
-        all_index = [m.start() for m in re.finditer('&', possible_rhyme_related)]
-        all_index_2 = [m.start() for m in re.finditer('&', possible_rhyme_related_ids)]
-
-        # flag to indicate whether same line is already
-        used_elsewhere = False
-
-        # pick sentence that has not been used
-        c = 0
-        id_new = -1
-        for i in all_index_2:
-            if possible_rhyme_related_ids[i + 1] == '0':
-                id_new = c
-                break
-            c += 1
-
-        # no available related word, pick random that's already used
-        if id_new == -1:
-            used_elsewhere = True
-            id_new = random.randint(0,len(all_index_2)-1)
-
-        if id_new + 1 == len(all_index):
-            sent = possible_rhyme_related[all_index[id_new] + 1:]
-            possible_rhyme_related_clean = possible_rhyme_related[:all_index[id_new]]
+        candidates = self.state.rhymes[thresh][id]
 
-        else:
-            sent = possible_rhyme_related[all_index[id_new] + 1: all_index[id_new + 1]]
-            possible_rhyme_related_clean = possible_rhyme_related[:all_index[id_new]] + \
-                                           possible_rhyme_related[all_index[id_new + 1]:]
-
-        #TODO possible_rhyme_related_ids_clean is not correct.
-        # perhaps think about finding the & symbols in the range of possible_rhyme_related and use id_new
-        # to scrape the correct ..._clean
-        if id_new + 1 == len(all_index_2):
-            temp = possible_rhyme_related_ids[all_index_2[id_new] + 1:].find('-') + all_index_2[id_new] + 1
-            sent_id = possible_rhyme_related_ids[temp + 1:]
-            possible_rhyme_related_ids_clean = possible_rhyme_related_ids[:all_index_2[id_new]]
+        # pick sentence that has not been used. If there is none, pick random that's already used
+        picked = next((candidate for candidate in candidates if not candidate.used_by_line), None)
+        used_elsewhere = picked is None
+        if used_elsewhere:
+            picked = random.choice(candidates)
 
-        else:
-            temp = possible_rhyme_related_ids[all_index_2[id_new] + 1:].find('-') + all_index_2[id_new] + 1
-            sent_id = possible_rhyme_related_ids[temp + 1: all_index_2[id_new + 1]]
-            possible_rhyme_related_ids_clean = possible_rhyme_related_ids[:all_index_2[id_new]] + \
-                                               possible_rhyme_related_ids[all_index_2[id_new + 1]:]
+        # the other sentences, in the format of the rhyme_related/rhyme_related_ids columns
+        others = [candidate for candidate in candidates if candidate is not picked]
+        possible_rhyme_related_clean = ''.join('&' + candidate.text for candidate in others)
+        possible_rhyme_related_ids_clean = ''.join('&{}-{}'.format(candidate.used_by_line, candidate.sentence_id)
+                                                   for candidate in others)
 
         # second part of output is to be used in jinni_implement_recom_custom (if recom == '-none-').
-        return [[sent, sent_id], [possible_rhyme_related_clean, possible_rhyme_related_ids_clean], id_new, used_elsewhere]
+        return [[picked.text, str(picked.sentence_id)], [possible_rhyme_related_clean, possible_rhyme_related_ids_clean],
+                picked.position, used_elsewhere]
 
 
     def get_related_by_id(self, id, thread = False):
         """Returns sentence from related column by their id
         (i.e. position within related string.  NOT dynamodb id NOR line_being_used id)"""
-
-        if thread == False:
-            all_index = [m.start() for m in re.finditer(';', self.related)]
-
-            if len(all_index) == id + 1:
-                return self.related[all_index[id]+1:]
-
-            return self.related[all_index[id] + 1:all_index[id+1]]
-        else:
-            all_index = [m.start() for m in re.finditer(';', self.related_thr)]
-
-            if len(all_index) == id + 1:
-                return self.related_thr[all_index[id] + 1:]
-
-            return self.related_thr[all_index[id] + 1:all_index[id + 1]]
+        return self._related(id, thread=thread).text
 
     def get_related_id_by_id(self, id, thread=False):
         """related_id here corresponds to id in dynamodb"""
+        return str(self._related(id, thread=thread).sentence_id)
+
+
+class SongState(object):
+    """The lines and candidate sentences of a song, read once per request into lists where list index = position, so
+    every Songs accessor is a list lookup. Each of the three parts (lines, related candidates and rhyme candidates) is
+    read with one query the first time it is needed. Mutators keep the lists, the positions of the rows and the
+    relationships of the song in step.
+
+    used_related and used_rhymes map each line to the candidates used in it, built from the lists the first time
+    they are needed. The used_by_line of a candidate is only changed through use, which keeps them in step.
+
+    The legacy columns of the song are only written when the song is flushed (see serialize_song_states), and only
+    those of the parts that changed"""
+
+    def __init__(self, song):
+        self.song = song
+        self._lines = None
+        self._related = None
+        self._rhymes = None
+        self._used_related = None
+        self._used_rhymes = None
+        self.dirty = set()
+
+    # the lists are read without flushing the session first, the flush would write the legacy columns from lists
+    # that are not built yet (see serialize_song_states)
+
+    @property
+    def lines(self):
+        if self._lines is None:
+            with db.session.no_autoflush:
+                self._lines = list(self.song.lines)
+        return self._lines
+
+    @property
+    def related(self):
+        """{thread: related candidates of the pool}"""
+        if self._related is None:
+            self._related = {False: [], True: []}
+            with db.session.no_autoflush:
+                for candidate in self.song.related_candidates:
+                    self._related[candidate.thread].append(candidate)
+        return self._related
+
+    @property
+    def rhymes(self):
+        """{thread: for each related candidate of the pool, the candidates rhyming with it}"""
+        if self._rhymes is None:
+            self._rhymes = {thread: [[] for _ in related] for thread, related in self.related.items()}
+            with db.session.no_autoflush:
+                for candidate in self.song.rhyme_candidates:
+                    self._rhymes[candidate.thread][candidate.related_position].append(candidate)
+        return self._rhymes
+
+    @property
+    def used_related(self):
+        """{line (starting at 1): related candidates used in it, the last one used first}"""
+        if self._used_related is None:
+            self._used_related = {}
+            for thread in (False, True):
+                for candidate in self.related[thread]:
+                    self._remember(candidate)
+        return self._used_related
+
+    @property
+    def used_rhymes(self):
+        """{line (starting at 1): rhyme candidates used in it, the last one used first}"""
+        if self._used_rhymes is None:
+            self._used_rhymes = {}
+            for thread in (False, True):
+                for group in self.rhymes[thread]:
+                    for candidate in group:
+                        self._remember(candidate)
+        return self._used_rhymes
+
+    def _used_map(self, candidate):
+        """Returns the used_* map of the kind of candidate, None if it was not built yet"""
+        return self._used_rhymes if isinstance(candidate, RhymeCandidate) else self._used_related
+
+    def _remember(self, candidate, first=False):
+        used = self._used_map(candidate)
+        if used is not None and candidate.used_by_line:
+            candidates = used.setdefault(candidate.used_by_line, [])
+            if first:
+                candidates.insert(0, candidate)
+            else:
+                candidates.append(candidate)
+
+    def _forget(self, candidate):
+        used = self._used_map(candidate)
+        if used is not None and candidate.used_by_line:
+            candidates = used[candidate.used_by_line]
+            candidates.remove(candidate)
+            if not candidates:
+                del used[candidate.used_by_line]
+
+    def changed(self, *parts):
+        """Marks parts of the song as changed: 'lines', or ('related', thread) and ('rhymes', thread) for the
+        candidates of a pool. The session is told the first time, see serialize_song_states. The song is marked as
+        dirty too, so it is flushed even if no row was changed through the session (see Songs.update_related)"""
+        if not self.dirty:
+            db.session.info.setdefault(DIRTY_SONG_STATES, set()).add(self)
+            if self.song in db.session:
+                flag_dirty(self.song)
+        self.dirty.update(parts)
+
+    def use(self, candidate, line):
+        """Marks candidate as used in line (starting at 1), or as unused if line is 0"""
+        self._forget(candidate)
+        candidate.used_by_line = line
+        self._remember(candidate, first=True)
+        self.changed(('rhymes' if isinstance(candidate, RhymeCandidate) else 'related', candidate.thread))
+
+    # the lists are built before the relationships are changed, building them after would read the new rows twice
+
+    def add_line(self, line):
+        lines = self.lines
+        self.song.lines.append(line)
+        lines.append(line)
+        self.changed('lines')
+
+    def del_line(self, position):
+        line = self.lines.pop(position)
+        self.song.lines.remove(line)
+        for later in self.lines[line.position:]:
+            later.position -= 1
+        self.changed('lines')
+
+    def add_related(self, candidate):
+        related = self.related[candidate.thread]
+        self.song.related_candidates.append(candidate)
+        related.append(candidate)
+        if self._rhymes is not None:
+            self._rhymes[candidate.thread].append([])
+        self._remember(candidate)
+        self.changed(('related', candidate.thread))
+
+    def add_rhyme(self, candidate):
+        rhymes = self.rhymes[candidate.thread][candidate.related_position]
+        self.song.rhyme_candidates.append(candidate)
+        rhymes.append(candidate)
+        self._remember(candidate)
+        self.changed(('rhymes', candidate.thread))
+
+    def del_related(self, position, thread):
+        """Deletes the related candidate at position, with the candidates rhyming with it"""
+        rhymes = self.rhymes[thread].pop(position)
+        related = self.related[thread].pop(position)
+        self.song.related_candidates.remove(related)
+        self._forget(related)
+        for candidate in rhymes:
+            self.song.rhyme_candidates.remove(candidate)
+            self._forget(candidate)
+
+        for candidate in self.related[thread][position:]:
+            candidate.position -= 1
+        for group in self.rhymes[thread][position:]:
+            for candidate in group:
+                candidate.related_position -= 1
+        self.changed(('related', thread), ('rhymes', thread))
+
+    def _pool(self, thread, rhymes=False):
+        """Returns the related candidates of a pool, or for each of them the candidates rhyming with it. When the lists
+        are not built (the candidates were inserted in bulk, see Songs.update_related), they are read from the tables
+        as rows with the same attributes, without creating their objects"""
+        if self._related is not None or self.song.id is None:
+            return self.rhymes[thread] if rhymes else self.related[thread]
+
+        related = db.session.execute(db.select([RelatedCandidate.text, RelatedCandidate.used_by_line,
+                                                RelatedCandidate.sentence_id])
+                                     .where(RelatedCandidate.song_id == self.song.id)
+                                     .where(RelatedCandidate.thread == thread)
+                                     .order_by(RelatedCandidate.position)).fetchall()
+        if not rhymes:
+            return related
+
+        groups = [[] for _ in related]
+        for row in db.session.execute(db.select([RhymeCandidate.related_position, RhymeCandidate.text,
+                                                 RhymeCandidate.used_by_line, RhymeCandidate.sentence_id])
+                                      .where(RhymeCandidate.song_id == self.song.id)
+                                      .where(RhymeCandidate.thread == thread)
+                                      .order_by(RhymeCandidate.related_position, RhymeCandidate.position)):
+            groups[row.related_position].append(row)
+        return groups
+
+    def legacy_columns(self):
+        """Returns the values of the legacy columns of the parts that changed, in the format the older versions of the
+        app read. Values that do not fit in the columns are None"""
+
+        def join(entries, sep=';'):
+            return ''.join(sep + entry for entry in entries)
+
+        def ids(candidates, sep=';'):
+            return join(('{}-{}'.format(candidate.used_by_line, candidate.sentence_id) for candidate in candidates), sep)
+
+        pools = {}
+
+        def pool(thread, rhymes=False):
+            if (thread, rhymes) not in pools:
+                pools[thread, rhymes] = self._pool(thread, rhymes)
+            return pools[thread, rhymes]
+
+        columns = {}
+        if 'lines' in self.dirty:
+            columns['part_1'] = join(line.text for line in self.lines)
+            columns['part_1_ids'] = join(str(line.sentence_id) for line in self.lines)
+
+        for thread, suffix in [(False, ''), (True, '_thr')]:
+            if ('related', thread) in self.dirty:
+                related = pool(thread)
+                columns['related' + suffix] = join(candidate.text for candidate in related)
+                columns['related_ids' + suffix] = ids(related)
+            if ('rhymes', thread) in self.dirty:
+                groups = pool(thread, rhymes=True)
+                columns['rhyme_related' + suffix] = join(join((candidate.text for candidate in group), '&')
+                                                         for group in groups)
+                columns['rhyme_related_ids' + suffix] = join(ids(group, '&') for group in groups)
+
+        # related stores the word each line was generated from, unless it stores the related candidates
+        if self.dirty & {'lines', ('related', False)} and not pool(False):
+            columns['related'] = join(line.related or '' for line in self.lines)
+
+        return {column: value if len(value) <= LEGACY_COLUMN_SIZE else None for column, value in columns.items()}
+
+
+# key of the session info the states with changes are kept in
+DIRTY_SONG_STATES = 'dirty_song_states'
+
+
+def serialize_song_states(session, flush_context, instances):
+    # only the states that changed since the last flush are written. A state replaced since (the song was committed
+    # or rolled back) is dropped, its song is read again anyway
+    for state in session.info.pop(DIRTY_SONG_STATES, ()):
+        if state.song.__dict__.get('_state') is state:
+            for column, value in state.legacy_columns().items():
+                setattr(state.song, column, value)
+        state.dirty = set()
+
+
+def reset_song_state(song, attrs):
+    # the lists are read again after a commit or a rollback, which expire the song
+    song.__dict__.pop('_state', None)
+
+db.event.listen(db.session, 'before_flush', serialize_song_states)
+db.event.listen(Songs, 'expire', reset_song_state)
+
+
+class SongLine(db.Model):
+    """A line of a song. position starts at 0"""
+    id = db.Column(db.Integer, primary_key=True)
+    song_id = db.Column(db.Integer, db.ForeignKey('songs.id'), nullable=False)
+    position = db.Column(db.Integer, nullable=False)
+    text = db.Column(db.String(1000))
+    # dynamodb id of the sentence
+    sentence_id = db.Column(db.Integer)
+    # word the line was generated from
+    related = db.Column(db.String(140))
 
-        if thread == False:
-            all_index = [m.start() for m in re.finditer(';', self.related_ids)]
-            begin = self.related_ids.find('-', all_index[id], len(self.related_ids))
-
-            if len(all_index) == id + 1:
-                return self.related_ids[begin+1:]
+    __table_args__ = (db.Index('ix_song_line_song_id_position', 'song_id', 'position'),)
 
-            return self.related_ids[begin+1:all_index[id + 1]]
 
-        else:
-            all_index = [m.start() for m in re.finditer(';', self.related_ids_thr)]
-            begin = self.related_ids_thr.find('-', all_index[id], len(self.related_ids_thr))
+class RelatedCandidate(db.Model):
+    """A sentence related to what a song is about, offered for the next lines in the custom mode. There are two
+    pools of candidates, related (thread=False) and related_thr (thread=True), used in turns"""
+    id = db.Column(db.Integer, primary_key=True)
+    song_id = db.Column(db.Integer, db.ForeignKey('songs.id'), nullable=False)
+    thread = db.Column(db.Boolean, nullable=False, default=False)
+    position = db.Column(db.Integer, nullable=False)
+    text = db.Column(db.String(1000))
+    sentence_id = db.Column(db.Integer)
+    # line of the song (starting at 1) the sentence is used in, 0 if it is not used
+    used_by_line = db.Column(db.Integer, nullable=False, default=0)
 
-            if len(all_index) == id + 1:
-                return self.related_ids_thr[begin + 1:]
+    __table_args__ = (db.Index('ix_related_candidate_song_id_thread_position', 'song_id', 'thread', 'position'),
+                      db.Index('ix_related_candidate_song_id_used_by_line', 'song_id', 'used_by_line'))
 
-            return self.related_ids_thr[begin + 1:all_index[id + 1]]
 
+class RhymeCandidate(db.Model):
+    """A sentence that rhymes with the related candidate at related_position, of the same pool"""
+    id = db.Column(db.Integer, primary_key=True)
+    song_id = db.Column(db.Integer, db.ForeignKey('songs.id'), nullable=False)
+    thread = db.Column(db.Boolean, nullable=False, default=False)
+    related_position = db.Column(db.Integer, nullable=False)
+    position = db.Column(db.Integer, nullable=False)
+    text = db.Column(db.String(1000))
+    sentence_id = db.Column(db.Integer)
+    used_by_line = db.Column(db.Integer, nullable=False, default=0)
+
+    __table_args__ = (db.Index('ix_rhyme_candidate_song_id_thread_related_position', 'song_id', 'thread',
+                               'related_position', 'position'),
+                      db.Index('ix_rhyme_candidate_song_id_used_by_line', 'song_id', 'used_by_line'))
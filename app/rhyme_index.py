@@ -0,0 +1,232 @@
+import json
+import mmap
+import os
+import struct
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from app.corpus import basedir, get_corpus
+from app.rhyme_distances import phonetic_store, dist_many
+
+# The rhyme index stores, for every word of the phonetic corpus, its k closest words under dist(). It is a local
+# alternative to the 'rhymes' attribute of the Rhyme table, built offline with 'flask corpus index'.
+#
+# Layout (little-endian):
+#   header:     magic, format version, k, number of words and digest of the corpus it was built from  <4sHHI20s
+#   rhyme mode:        for each word (in corpus order), k neighbours
+#   alliteration mode: same as above
+# A neighbour is the position of the word in the corpus and its distance, as float32                <If
+# Words with less than k neighbours are padded with NO_NEIGHBOUR.
+
+INDEX_PATH = os.path.join(basedir, 'rhyme_index.bin')
+MATRIX_DIR = os.path.join(basedir, 'rhyme_matrix')
+
+MAGIC = b'PNLN'
+VERSION = 2
+HEADER = struct.Struct('<4sHHI20s')
+NEIGHBOUR = struct.Struct('<If')
+NO_NEIGHBOUR = 0xFFFFFFFF
+
+
+def closest_words(position, k, alliteration=False):
+    """Returns the k words of the corpus closest to the word at position=position,
+    as a list of (distance, position)"""
+
+    store = phonetic_store()
+    distances = dist_many(store.key_at(position), alliteration=alliteration)
+    distances[position] = np.inf
+
+    closest = np.argsort(distances, kind='stable')[:k]
+    return [(float(distances[i]), int(i)) for i in closest if i != position]
+
+
+def build_rhyme_index(k=20, path=INDEX_PATH, progress=None):
+    """Computes the k closest words of every word in the corpus, in rhyme and alliteration modes, and writes them
+    to path. This compares every pair of words, so it takes a while. progress, if given, is called with the
+    number of words done after each word"""
+
+    num_words = len(phonetic_store())
+
+    tmp_path = '{}.{}.tmp'.format(path, os.getpid())
+    with open(tmp_path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, k, num_words, bytes.fromhex(get_corpus().digest())))
+
+        for alliteration in (False, True):
+            for position in range(num_words):
+                neighbours = closest_words(position, k, alliteration)
+                neighbours += [(1, NO_NEIGHBOUR)] * (k - len(neighbours))
+                f.write(b''.join(NEIGHBOUR.pack(i, distance) for distance, i in neighbours))
+
+                if progress is not None:
+                    progress(position + 1 + (num_words if alliteration else 0))
+
+    os.replace(tmp_path, path)
+
+
+class RhymeIndex(object):
+    """Memory-mapped view of a file written by build_rhyme_index()"""
+
+    def __init__(self, path):
+        with open(path, 'rb') as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, self.k, self.num_words, digest = HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError('{} is not a version {} rhyme index'.format(path, VERSION))
+
+        # positions of the index are only valid in the same corpus, in the same order
+        self.words = phonetic_store()
+        if digest.hex() != get_corpus().digest():
+            raise ValueError('{} was built from another corpus, rebuild it with flask corpus index'.format(path))
+
+    def nearest(self, word, k, alliteration=False):
+        position = self.words.index(word)
+        if position == -1:
+            return -1
+
+        offset = HEADER.size + NEIGHBOUR.size * self.k * (position + (self.num_words if alliteration else 0))
+        neighbours = []
+        for j in range(min(k, self.k)):
+            i, distance = NEIGHBOUR.unpack_from(self._mm, offset + j * NEIGHBOUR.size)
+            if i == NO_NEIGHBOUR:
+                break
+            neighbours.append((self.words.key_at(i), distance))
+
+        return neighbours
+
+
+_rhyme_index = None
+_rhyme_index_lock = threading.Lock()
+
+
+def nearest_rhymes(word, k=10, alliteration=False):
+    """Returns the k words closest to word=word as a list of (word, distance), closest first.
+    Returns -1 if word is not in database. At most the k the index was built with are returned"""
+    global _rhyme_index
+
+    if _rhyme_index is None:
+        with _rhyme_index_lock:
+            if _rhyme_index is None:
+                _rhyme_index = RhymeIndex(INDEX_PATH)
+
+    return _rhyme_index.nearest(word, k, alliteration)
+
+
+# --------------------------------------------- All-pairs distance matrix
+# build_rhyme_matrix() keeps every pair of corpus words whose distance is below a cutoff. Rows of the matrix are
+# split in shards that are computed by a pool of processes. Each shard is saved to its own file as soon as it is
+# done, so a run that is killed resumes from the shards that are already on disk. The parameters of the run and the
+# digest of the corpus are saved in the manifest of the directory, and a run with other ones does not resume from
+# its shards.
+
+MANIFEST = 'manifest.json'
+
+
+def shard_path(out_dir, shard):
+    return os.path.join(out_dir, 'shard_{:05d}.npz'.format(shard))
+
+
+def read_manifest(out_dir):
+    """Returns the manifest saved by build_rhyme_matrix() in out_dir, or None if there is none"""
+    try:
+        with open(os.path.join(out_dir, MANIFEST)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def clear_rhyme_matrix(out_dir=MATRIX_DIR):
+    """Removes the shards and the manifest saved in out_dir"""
+    for name in os.listdir(out_dir):
+        if name == MANIFEST or name.startswith('shard_'):
+            os.remove(os.path.join(out_dir, name))
+
+
+def compute_matrix_shard(out_dir, shard, start, end, cutoff, alliteration):
+    """Computes rows start to end - 1 of the matrix and saves the pairs below cutoff to the shard file.
+    Returns the number of pairs compared"""
+
+    rows, cols, dists = [], [], []
+    for position in range(start, end):
+        distances = dist_many(phonetic_store().key_at(position), alliteration=alliteration)
+        distances[position] = np.inf
+
+        close = np.flatnonzero(distances < cutoff)
+        rows.append(np.full(len(close), position, dtype=np.uint32))
+        cols.append(close.astype(np.uint32))
+        dists.append(distances[close].astype(np.float32))
+
+    path = shard_path(out_dir, shard)
+    tmp_path = '{}.{}.tmp.npz'.format(path[:-4], os.getpid())
+    np.savez_compressed(tmp_path, rows=np.concatenate(rows), cols=np.concatenate(cols),
+                        dists=np.concatenate(dists))
+    os.replace(tmp_path, path)
+
+    return (end - start) * (len(phonetic_store()) - 1)
+
+
+def build_rhyme_matrix(out_dir=MATRIX_DIR, cutoff=0.3, alliteration=False, num_shards=256, workers=None,
+                       progress=None):
+    """Computes all pairs of words with dist() < cutoff and saves them to out_dir, one file per shard of rows.
+    Shards already in out_dir are skipped. Raises ValueError if they were computed with other parameters or from
+    another corpus (see clear_rhyme_matrix). progress, if given, is called after each shard with the number of
+    shards done, the total number of shards and the pairs per second compared so far in this run"""
+
+    os.makedirs(out_dir, exist_ok=True)
+    num_words = len(phonetic_store())
+    num_shards = min(num_shards, num_words)
+    bounds = [num_words * shard // num_shards for shard in range(num_shards + 1)]
+
+    manifest = {'cutoff': cutoff, 'alliteration': alliteration, 'num_shards': num_shards,
+                'corpus': get_corpus().digest()}
+    saved = read_manifest(out_dir)
+    if saved is None:
+        if any(name.startswith('shard_') for name in os.listdir(out_dir)):
+            raise ValueError('{} has shards of an unknown run'.format(out_dir))
+        tmp_path = os.path.join(out_dir, '{}.{}.tmp'.format(MANIFEST, os.getpid()))
+        with open(tmp_path, 'w') as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, os.path.join(out_dir, MANIFEST))
+    elif saved != manifest:
+        raise ValueError('{} has shards computed with {}, not {}'.format(out_dir, saved, manifest))
+
+    todo = [shard for shard in range(num_shards) if not os.path.exists(shard_path(out_dir, shard))]
+    done = num_shards - len(todo)
+    pairs = 0
+    t = time.time()
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(compute_matrix_shard, out_dir, shard, bounds[shard], bounds[shard + 1],
+                                   cutoff, alliteration) for shard in todo]
+
+        for future in as_completed(futures):
+            pairs += future.result()
+            done += 1
+            if progress is not None:
+                progress(done, num_shards, pairs / (time.time() - t))
+
+
+def load_rhyme_matrix(out_dir=MATRIX_DIR):
+    """Returns the pairs saved by build_rhyme_matrix() as three arrays: rows, columns (both are corpus positions)
+    and distances. Raises ValueError if the matrix is not complete or was computed from another corpus"""
+
+    manifest = read_manifest(out_dir)
+    if manifest is None:
+        raise ValueError('{} has no rhyme matrix'.format(out_dir))
+    if manifest['corpus'] != get_corpus().digest():
+        raise ValueError('{} was computed from another corpus, rebuild it with flask corpus matrix'.format(out_dir))
+
+    rows, cols, dists = [], [], []
+    for shard in range(manifest['num_shards']):
+        path = shard_path(out_dir, shard)
+        if not os.path.exists(path):
+            raise ValueError('{} is missing, finish it with flask corpus matrix'.format(path))
+        with np.load(path) as saved:
+            rows.append(saved['rows'])
+            cols.append(saved['cols'])
+            dists.append(saved['dists'])
+
+    return np.concatenate(rows), np.concatenate(cols), np.concatenate(dists)
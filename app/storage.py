@@ -0,0 +1,394 @@
+import json
+import logging
+import random
+import sqlite3
+import threading
+import time
+from decimal import Decimal
+
+import boto3
+from boto3.dynamodb.conditions import Attr
+
+logger = logging.getLogger(__name__)
+
+# Every read and write of the lyric tables (Lyric, Lyrics, Rhyme, LyricLink and Proxy) goes through a storage
+# backend. DynamoStorage is the production DynamoDB tables. SQLiteStorage is an embedded copy of them in a single
+# file, filled with 'flask storage export', for running without DynamoDB in dev and CI or for serving the read-mostly
+# corpus from each web node. The backend is SQLite when LYRIC_STORE_PATH is set.
+#
+# The storage is opened by create_app from the config of the app (see AppStorage). Modules take their tables from
+# it at import time, before it is opened.
+#
+# Both return items as DynamoDB does, i.e. numbers are Decimal.
+
+TABLES = ['Lyric', 'Lyrics', 'Rhyme', 'LyricLink', 'Proxy']
+KEY_NAMES = {'Lyrics': 'id_'}
+
+# attributes of Lyric items that are not words. Every other attribute set to 1 is a word of the sentence
+NON_WORD_ATTRIBUTES = {'id', 'sent', 'len'}
+
+BATCH_GET_SIZE = 100
+BATCH_GET_ATTEMPTS = 6
+
+
+def key_name(table_name):
+    return KEY_NAMES.get(table_name, 'id')
+
+
+class DynamoTable(object):
+
+    def __init__(self, dynamodb, name):
+        self.name = name
+        self.key_name = key_name(name)
+        self.table = dynamodb.Table(name)
+        self.client = dynamodb.meta.client
+
+    def get_item(self, key):
+        """Returns the item whose key is key, or None"""
+        return self.table.get_item(Key={self.key_name: key}).get('Item')
+
+    def batch_get_item(self, keys, consistent_read=False, backoff=0.05):
+        """Returns the items whose key is in keys, as a dictionary key -> item. Keys are requested 100 at a time
+        (the batch_get_item limit). Keys DynamoDB leaves unprocessed are requested again with exponential backoff"""
+
+        keys = list(dict.fromkeys(keys))
+        items = {}
+
+        for i in range(0, len(keys), BATCH_GET_SIZE):
+            request = {self.name: {'Keys': [{self.key_name: key} for key in keys[i:i + BATCH_GET_SIZE]],
+                                   'ConsistentRead': consistent_read}}
+
+            for attempt in range(BATCH_GET_ATTEMPTS):
+                response = self.client.batch_get_item(RequestItems=request)
+                for item in response['Responses'].get(self.name, []):
+                    items[item[self.key_name]] = item
+
+                request = response.get('UnprocessedKeys')
+                if not request:
+                    break
+                time.sleep(backoff * 2 ** attempt * (1 + random.random()))
+            else:
+                raise RuntimeError('{} keys of {} still unprocessed after {} attempts'.format(
+                    len(request[self.name]['Keys']), self.name, BATCH_GET_ATTEMPTS))
+
+        return items
+
+    def update_item(self, key, attribute, value):
+        """Sets attribute of the item whose key is key to value"""
+        self.table.update_item(
+            Key={
+                self.key_name: key,
+            },
+            UpdateExpression='SET ' + attribute + ' = :val1',
+            ExpressionAttributeValues={
+                ':val1': value
+            }
+        )
+
+    def scan_by_word(self, words, start=None):
+        """Returns one page of the items that contain one of words, starting after key start"""
+        filt = Attr(words[0]).eq(1)
+        for word in words[1:]:
+            filt |= Attr(word).eq(1)
+
+        kwargs = {'FilterExpression': filt}
+        if start is not None:
+            kwargs['ExclusiveStartKey'] = {self.key_name: start}
+        return self.table.scan(**kwargs)['Items']
+
+    @property
+    def item_count(self):
+        """Number of items, as last updated by DynamoDB (about every six hours). This is a DescribeTable call, use
+        table_metadata on the request path"""
+        return self.client.describe_table(TableName=self.name)['Table']['ItemCount']
+
+    def id_range(self):
+        """Returns the smallest and largest key of a table with contiguous integer keys starting at 0"""
+        return 0, self.item_count - 1
+
+    def scan(self):
+        """Yields every item of the table"""
+        kwargs = {}
+        while True:
+            response = self.table.scan(**kwargs)
+            yield from response['Items']
+            if 'LastEvaluatedKey' not in response:
+                return
+            kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+    def put_items(self, items):
+        with self.table.batch_writer() as batch:
+            for item in items:
+                batch.put_item(Item=item)
+
+
+class DynamoStorage(object):
+
+    def __init__(self):
+        self.dynamodb = boto3.resource("dynamodb")
+
+    def table(self, name):
+        return DynamoTable(self.dynamodb, name)
+
+
+# --------------------------------------------- SQLite
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS items (
+    tbl TEXT NOT NULL, key NOT NULL, item TEXT NOT NULL,
+    PRIMARY KEY (tbl, key)) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS words (
+    tbl TEXT NOT NULL, word TEXT NOT NULL, key NOT NULL,
+    PRIMARY KEY (tbl, word, key)) WITHOUT ROWID;
+'''
+
+
+def to_plain(value):
+    """Decimal -> int or float, for sqlite3 and json"""
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else float(value)
+    if isinstance(value, set):
+        return sorted(value)
+    raise TypeError('{!r} cannot be stored'.format(value))
+
+
+def dump_item(item):
+    return json.dumps(item, default=to_plain)
+
+
+def load_item(data):
+    return json.loads(data, parse_int=Decimal, parse_float=Decimal)
+
+
+def item_words(item):
+    return [word for word, value in item.items() if word not in NON_WORD_ATTRIBUTES and value == 1]
+
+
+class SQLiteTable(object):
+
+    def __init__(self, storage, name):
+        self.storage = storage
+        self.name = name
+        self.key_name = key_name(name)
+
+    def _key(self, key):
+        return to_plain(key) if isinstance(key, Decimal) else key
+
+    def get_item(self, key):
+        row = self.storage.connection().execute(
+            'SELECT item FROM items WHERE tbl = ? AND key = ?', (self.name, self._key(key))).fetchone()
+        return None if row is None else load_item(row[0])
+
+    def batch_get_item(self, keys, consistent_read=False):
+        keys = list(dict.fromkeys(self._key(key) for key in keys))
+        items = {}
+
+        # stay under the default limit of 999 bound parameters
+        for i in range(0, len(keys), 900):
+            chunk = keys[i:i + 900]
+            rows = self.storage.connection().execute(
+                'SELECT item FROM items WHERE tbl = ? AND key IN ({})'.format(','.join('?' * len(chunk))),
+                [self.name] + chunk)
+            for row in rows:
+                item = load_item(row[0])
+                items[item[self.key_name]] = item
+
+        return items
+
+    def update_item(self, key, attribute, value):
+        conn = self.storage.connection()
+        with conn:
+            conn.execute('BEGIN IMMEDIATE')
+            item = self.get_item(key) or {self.key_name: key}
+            item[attribute] = value
+            self._put(conn, item)
+
+    def _put(self, conn, item):
+        key = self._key(item[self.key_name])
+        conn.execute('INSERT OR REPLACE INTO items VALUES (?, ?, ?)', (self.name, key, dump_item(item)))
+        conn.execute('DELETE FROM words WHERE tbl = ? AND key = ?', (self.name, key))
+        conn.executemany('INSERT INTO words VALUES (?, ?, ?)', [(self.name, word, key) for word in item_words(item)])
+
+    def scan_by_word(self, words, start=None, limit=100):
+        rows = self.storage.connection().execute(
+            'SELECT DISTINCT key FROM words WHERE tbl = ? AND word IN ({}) AND key > ? ORDER BY key LIMIT ?'.format(
+                ','.join('?' * len(words))),
+            [self.name] + list(words) + [self._key(start) if start is not None else -1, limit])
+        items = self.batch_get_item([row[0] for row in rows])
+        return [items[key] for key in sorted(items)]
+
+    @property
+    def item_count(self):
+        return self.storage.connection().execute(
+            'SELECT COUNT(*) FROM items WHERE tbl = ?', (self.name,)).fetchone()[0]
+
+    def id_range(self):
+        return tuple(self.storage.connection().execute(
+            'SELECT MIN(key), MAX(key) FROM items WHERE tbl = ?', (self.name,)).fetchone())
+
+    def scan(self):
+        for row in self.storage.connection().execute('SELECT item FROM items WHERE tbl = ? ORDER BY key',
+                                                     (self.name,)):
+            yield load_item(row[0])
+
+    def put_items(self, items):
+        conn = self.storage.connection()
+        with conn:
+            conn.execute('BEGIN')
+            for item in items:
+                self._put(conn, item)
+
+
+class SQLiteStorage(object):
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self.connection().executescript(SCHEMA)
+
+    def connection(self):
+        """sqlite3 connections cannot be shared between threads, so each thread gets its own"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            self._local.conn = conn
+        return conn
+
+    def table(self, name):
+        return SQLiteTable(self, name)
+
+
+def open_storage(path=None):
+    """Returns the SQLite storage at path, or DynamoDB if path is None"""
+    return SQLiteStorage(path) if path else DynamoStorage()
+
+
+class AppTable(object):
+    """A table of the storage of the app, bound to it the first time it is used. Same interface as the tables of
+    the backends"""
+
+    def __init__(self, app_storage, name):
+        self.app_storage = app_storage
+        self.name = name
+        self._bound = None
+
+    def _table(self):
+        storage = self.app_storage.storage
+        if storage is None:
+            raise RuntimeError('The lyric storage is not open, create the app first')
+        if self._bound is None or self._bound[0] is not storage:
+            self._bound = (storage, storage.table(self.name))
+        return self._bound[1]
+
+    def __getattr__(self, attribute):
+        return getattr(self._table(), attribute)
+
+
+class AppStorage(object):
+    """The storage of the app, opened by init_app from LYRIC_STORE_PATH. It is opened again only when the path
+    changes, so apps created with the same config share it"""
+
+    def __init__(self):
+        self.storage = None
+        self.path = None
+
+    def init_app(self, app):
+        path = app.config['LYRIC_STORE_PATH']
+        if self.storage is None or path != self.path:
+            self.storage = open_storage(path)
+            self.path = path
+        app.storage = self.storage
+
+    def table(self, name):
+        return AppTable(self, name)
+
+
+def copy_tables(source, destination, tables=TABLES, progress=None, chunk_size=1000):
+    """Copies tables from storage source to storage destination. progress, if given, is called with the table
+    name and the number of items copied so far"""
+
+    for name in tables:
+        items = []
+        copied = 0
+        destination_table = destination.table(name)
+
+        for item in source.table(name).scan():
+            items.append(item)
+            if len(items) == chunk_size:
+                destination_table.put_items(items)
+                copied += len(items)
+                items = []
+                if progress is not None:
+                    progress(name, copied)
+
+        destination_table.put_items(items)
+        if progress is not None:
+            progress(name, copied + len(items))
+
+
+# tables whose metadata is loaded when the app is created
+METADATA_TABLES = ['Lyric', 'Lyrics', 'Rhyme']
+
+
+class TableMetadata(object):
+    """Item counts and id ranges of the tables of a storage. start loads the tables read on the request path and
+    starts a background thread that refreshes them every interval seconds, so readers never wait on DescribeTable.
+    Other tables are loaded the first time they are asked for"""
+
+    def __init__(self, storage, interval=3600):
+        self.storage = storage
+        self.interval = interval
+        self._data = {}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def _load(self, name):
+        table = self.storage.table(name)
+        return {'item_count': table.item_count, 'id_range': table.id_range(), 'loaded_at': time.time()}
+
+    def get(self, name):
+        data = self._data.get(name)
+        if data is None:
+            with self._lock:
+                data = self._data.get(name)
+                if data is None:
+                    data = self._data[name] = self._load(name)
+        return data
+
+    def start(self, names=METADATA_TABLES):
+        """Loads the tables names and starts the refresher thread, once per process. A table that cannot be loaded
+        is loaded again the first time it is asked for"""
+        for name in names:
+            try:
+                self._data[name] = self._load(name)
+            except Exception:
+                logger.exception('Could not load the metadata of %s', name)
+
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._refresh_forever, name='table-metadata', daemon=True)
+                self._thread.start()
+
+    def item_count(self, name):
+        return self.get(name)['item_count']
+
+    def id_range(self, name):
+        """Smallest and largest id of the table. Every id in between is an item"""
+        return self.get(name)['id_range']
+
+    def refresh(self):
+        for name in list(self._data):
+            try:
+                self._data[name] = self._load(name)
+            except Exception:
+                # keep the last known values, they are good enough until the next refresh
+                logger.exception('Could not refresh the metadata of %s', name)
+
+    def _refresh_forever(self):
+        while True:
+            time.sleep(self.interval)
+            self.refresh()
+
+
+storage = AppStorage()
+table_metadata = TableMetadata(storage)
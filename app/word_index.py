@@ -0,0 +1,146 @@
+import bisect
+import os
+import struct
+import threading
+
+from app.corpus import basedir, CorpusFile, write_corpus
+from app.storage import item_words
+
+# The word index maps every word of the Lyric table to the sorted ids of the sentences containing it, so
+# sentence_with() can sample sentences directly instead of scanning the table. It is built offline from a scan of
+# the Lyric table with 'flask corpus word-index' and saved as a corpus file with a single 'postings' table.
+#
+# A posting list (the value stored for a word) is:
+#   header: number of ids, number of blocks                                              <II
+#   blocks: per block of BLOCK_SIZE ids, its first id and the offset of the rest of
+#           the block in the deltas                                                      <II
+#   deltas: for each block, the differences between consecutive ids as varints
+# Reading one id only decodes the block it is in, so lookups cost the same whatever the size of the table.
+
+WORD_INDEX_PATH = os.path.join(basedir, 'word_index.bin')
+
+BLOCK_SIZE = 128
+POSTINGS_HEADER = struct.Struct('<II')
+BLOCK = struct.Struct('<II')
+
+
+def encode_postings(ids):
+    """Encodes a sorted list of distinct ids as a posting list"""
+
+    blocks = []
+    deltas = bytearray()
+    for start in range(0, len(ids), BLOCK_SIZE):
+        block = ids[start:start + BLOCK_SIZE]
+        blocks.append(BLOCK.pack(block[0], len(deltas)))
+
+        for previous, current in zip(block, block[1:]):
+            delta = current - previous
+            while delta >= 0x80:
+                deltas.append(delta & 0x7F | 0x80)
+                delta >>= 7
+            deltas.append(delta)
+
+    return POSTINGS_HEADER.pack(len(ids), len(blocks)) + b''.join(blocks) + bytes(deltas)
+
+
+class PostingList(object):
+    """Sorted ids of the sentences containing a word, read from an encoded posting list"""
+
+    def __init__(self, data):
+        self._data = data
+        self._count, self._num_blocks = POSTINGS_HEADER.unpack_from(data, 0)
+        self._deltas = POSTINGS_HEADER.size + BLOCK.size * self._num_blocks
+
+    def __len__(self):
+        return self._count
+
+    def _block(self, b):
+        """Returns the ids of the b-th block"""
+        first, offset = BLOCK.unpack_from(self._data, POSTINGS_HEADER.size + BLOCK.size * b)
+        size = min(BLOCK_SIZE, self._count - b * BLOCK_SIZE)
+
+        ids = [first]
+        position = self._deltas + offset
+        while len(ids) < size:
+            delta, shift = 0, 0
+            while True:
+                byte = self._data[position]
+                position += 1
+                delta |= (byte & 0x7F) << shift
+                if byte < 0x80:
+                    break
+                shift += 7
+            ids.append(ids[-1] + delta)
+
+        return ids
+
+    def __getitem__(self, i):
+        if not 0 <= i < self._count:
+            raise IndexError(i)
+        return self._block(i // BLOCK_SIZE)[i % BLOCK_SIZE]
+
+    def __iter__(self):
+        for b in range(self._num_blocks):
+            yield from self._block(b)
+
+    def bisect_left(self, id):
+        """Returns the position of the first id >= id"""
+        lo, hi = 0, self._num_blocks
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if BLOCK.unpack_from(self._data, POSTINGS_HEADER.size + BLOCK.size * mid)[0] <= id:
+                lo = mid + 1
+            else:
+                hi = mid
+
+        if lo == 0:
+            return 0
+        return (lo - 1) * BLOCK_SIZE + bisect.bisect_left(self._block(lo - 1), id)
+
+
+def build_word_index(table, path=WORD_INDEX_PATH, progress=None):
+    """Scans the Lyric table and writes the word index to path. progress, if given, is called with the number
+    of sentences read every 10000 sentences"""
+
+    postings = {}
+    num_items = 0
+
+    for item in table.scan():
+        id = int(item['id'])
+        for word in item_words(item):
+            postings.setdefault(word, []).append(id)
+
+        num_items += 1
+        if progress is not None and num_items % 10000 == 0:
+            progress(num_items)
+
+    write_corpus(path, {'postings': {word: encode_postings(sorted(set(ids))) for word, ids in postings.items()}})
+
+
+class WordIndex(object):
+
+    def __init__(self, path):
+        self.postings = CorpusFile(path).table('postings')
+
+    def postings_of(self, word):
+        """Returns the PostingList of word=word, or None if no sentence contains it"""
+        i = self.postings.index(word)
+        if i == -1:
+            return None
+        return PostingList(self.postings.value_view(i))
+
+
+_word_index = None
+_word_index_lock = threading.Lock()
+
+
+def word_index():
+    """Returns the word index shared by all threads of the process, or None if it was not built"""
+    global _word_index
+
+    if _word_index is None and os.path.exists(WORD_INDEX_PATH):
+        with _word_index_lock:
+            if _word_index is None:
+                _word_index = WordIndex(WORD_INDEX_PATH)
+
+    return _word_index
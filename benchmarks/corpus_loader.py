@@ -0,0 +1,59 @@
+"""Load time and memory per worker of the phonetic corpus: Python dictionaries (what the old source literals
+and the JSON files materialize in every worker) against the memory-mapped corpus file.
+
+Each variant runs in a fresh interpreter. Run from the project root with:
+    python -m benchmarks.corpus_loader
+"""
+import subprocess
+import sys
+
+LOADERS = {
+    'dict': '''
+import json
+from app.corpus import PHONETIC_JSON, VIABLE_WORDS_JSON
+phonetics = json.load(open(PHONETIC_JSON))
+viable_words = json.load(open(VIABLE_WORDS_JSON))
+phonetics['zoo']
+''',
+    'mmap': '''
+from app.corpus import get_corpus
+get_corpus().table('phonetics')['zoo']
+''',
+}
+
+MEASURE = '''
+import time
+
+def memory():
+    """Rss, Pss and private memory of this process, in kB"""
+    out = {}
+    with open('/proc/self/smaps_rollup') as f:
+        for line in f:
+            key, value = line.split(':', 1)
+            if key in ('Rss', 'Pss', 'Private_Clean', 'Private_Dirty'):
+                out[key] = int(value.split()[0])
+    out['Private'] = out.pop('Private_Clean') + out.pop('Private_Dirty')
+    return out
+
+import app.corpus
+before = memory()
+t = time.perf_counter()
+exec(LOADER)
+elapsed = time.perf_counter() - t
+after = memory()
+print('{:.1f} ms'.format(elapsed * 1000), ' '.join('{}=+{} kB'.format(k, after[k] - before[k]) for k in after))
+'''
+
+
+def main():
+    from app.corpus import build_corpus
+    build_corpus()
+
+    for name, loader in LOADERS.items():
+        out = subprocess.run([sys.executable, '-c', 'LOADER = {!r}\n'.format(loader) + MEASURE],
+                             stdout=subprocess.PIPE, universal_newlines=True, check=True).stdout
+        print('{:<5} {}'.format(name, out.strip()))
+
+
+if __name__ == '__main__':
+    main()
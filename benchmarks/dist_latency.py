@@ -0,0 +1,46 @@
+"""Per-call latency of app.rhyme_distances.dist.
+
+Run from the project root with:
+    python -m benchmarks.dist_latency
+"""
+import random
+import time
+
+from app.rhyme_distances import dist, get_all_phonetic_array, phonetic_store, phonetic_dist, \
+    metaphone_dist, adjust_range
+
+
+def old_dist(word_1, word_2, alliteration=False):
+    """dist() as it used to be: the whole corpus is rebuilt on every call"""
+    all_phonetics = get_all_phonetic_array()
+    info_1 = all_phonetics[word_1]
+    info_2 = all_phonetics[word_2]
+    return adjust_range(phonetic_dist(info_1[0], info_2[0], alliteration),
+                        metaphone_dist(info_1[1], info_2[1], alliteration))
+
+
+def per_call(func, pairs):
+    t = time.perf_counter()
+    for word_1, word_2 in pairs:
+        func(word_1, word_2)
+    return (time.perf_counter() - t) / len(pairs)
+
+
+def main(num_pairs=200):
+    t = time.perf_counter()
+    words = sorted(phonetic_store())
+    print('first use of phonetic_store(): {:.1f} ms'.format((time.perf_counter() - t) * 1000))
+
+    # edit_dist is memoized, so each variant gets its own pairs to keep the comparison fair
+    random.seed(0)
+    pairs = [(random.choice(words), random.choice(words)) for _ in range(2 * num_pairs)]
+
+    before = per_call(old_dist, pairs[:num_pairs])
+    after = per_call(dist, pairs[num_pairs:])
+    print('dist() per call, corpus rebuilt every call: {:.3f} ms'.format(before * 1000))
+    print('dist() per call, shared phonetic store:     {:.3f} ms'.format(after * 1000))
+    print('speedup: {:.1f}x'.format(before / after))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,31 @@
+"""Throughput of scoring one word against the whole phonetic corpus: dist() in a loop against dist_many().
+
+Run from the project root with:
+    python -m benchmarks.dist_many
+"""
+import time
+
+from app.rhyme_distances import dist, dist_many, phonetic_store, edit_dist
+
+
+def main(queries=('love', 'money', 'street', 'a')):
+    words = list(phonetic_store())
+
+    for alliteration in (False, True):
+        for word in queries:
+            edit_dist.cache_clear()
+            t = time.perf_counter()
+            for other in words:
+                dist(word, other, alliteration)
+            loop = time.perf_counter() - t
+
+            t = time.perf_counter()
+            dist_many(word, alliteration=alliteration)
+            batch = time.perf_counter() - t
+
+            print('{:<7} alliteration={:<5}  dist() loop: {:>7.0f} pairs/s  dist_many: {:>7.0f} pairs/s'.format(
+                word, str(alliteration), len(words) / loop, len(words) / batch))
+
+
+if __name__ == '__main__':
+    main()
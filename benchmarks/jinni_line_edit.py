@@ -0,0 +1,102 @@
+"""p50/p99 latency of the jinni_line_edit route with the fan-out pool disabled (FANOUT_WORKERS=0, every lookup
+runs one after another) and enabled.
+
+DynamoDB is replaced by in-memory tables that sleep for a simulated round trip (LATENCY seconds, with jitter), so
+the numbers show the effect of overlapping the lookups, not the latency of a real table. The Rhyme cache is
+cleared before every request so each request pays for its lookups.
+
+Run from the project root with:
+    python -m benchmarks.jinni_line_edit
+"""
+import random
+import time
+
+import numpy as np
+
+from app import create_app, db
+from app.models import Songs
+from app.main import sentence_generator
+from app.main.rhyme_repository import rhyme_repository
+from app.storage import table_metadata
+from config import Config
+
+LATENCY = 0.02
+WORDS = ['zoo', 'blue', 'true', 'you', 'night', 'light', 'fight', 'right']
+
+
+def round_trip():
+    time.sleep(LATENCY * (0.5 + random.random()))
+
+
+class SlowRhymeTable(object):
+    def get_item(self, key):
+        round_trip()
+        rhymes = {word: [10 * i, 10 * i + 9] for i, word in enumerate(WORDS) if word != key}
+        return {'id': key, 'rhymes': rhymes, 'sent_ids': [0, 9]}
+
+
+class LyricTable(object):
+    item_count = 10 * len(WORDS)
+
+    def id_range(self):
+        return 0, self.item_count - 1
+
+
+class LyricStorage(object):
+    """Only used for the table metadata, which is never read on the request path"""
+
+    def table(self, name):
+        return LyricTable()
+
+
+class SlowLyricsTable(object):
+    def batch_get_item(self, keys, consistent_read=False):
+        round_trip()
+        return {key: {'id_': key, 'sent_': ['line', str(key), WORDS[int(key) // 10]]} for key in keys}
+
+
+class BenchmarkConfig(Config):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+
+
+def measure(workers, num_requests):
+    BenchmarkConfig.FANOUT_WORKERS = workers
+    app = create_app(BenchmarkConfig)
+
+    with app.app_context():
+        db.create_all()
+        song = Songs()
+        db.session.add(song)
+        for i in range(8):
+            song.update_lyric(['line {} {} '.format(i, WORDS[i % len(WORDS)]), i])
+        db.session.commit()
+        song_id = song.id
+
+    client = app.test_client()
+    latencies = []
+    for i in range(num_requests):
+        rhyme_repository.clear()
+        sentence_generator._sent_cache.clear()
+
+        t = time.perf_counter()
+        response = client.get('/jinni_line_edit/{}/{}'.format(song_id, 1 + i % 6))
+        latencies.append(time.perf_counter() - t)
+        assert response.status_code == 200
+
+    return np.percentile(latencies, 50) * 1000, np.percentile(latencies, 99) * 1000
+
+
+def main(num_requests=200):
+    rhyme_repository.table = SlowRhymeTable()
+    sentence_generator.lyrics_table = SlowLyricsTable()
+    table_metadata.storage = LyricStorage()
+
+    random.seed(0)
+    for workers in (0, 8):
+        p50, p99 = measure(workers, num_requests)
+        print('FANOUT_WORKERS={}: p50 {:.1f} ms, p99 {:.1f} ms'.format(workers, p50, p99))
+
+
+if __name__ == '__main__':
+    main()
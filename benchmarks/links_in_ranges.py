@@ -0,0 +1,84 @@
+"""Time to test LyricLink pages against the id ranges of a word's rhymes: the loop get_sent_with_rhyme used
+(shuffled ranges, then pages, then a recursive binary search with int() on every probe, stopping at the first hit)
+against links_in_ranges, which returns every hit. A page read for the first time (cold) is bisected as it is read,
+a list of Decimals. Pages read again are converted with links_array, timed on its own, and kept by
+get_links_by_pages as arrays (cached).
+
+Run from the project root with:
+    python -m benchmarks.links_in_ranges
+"""
+import random
+import time
+from decimal import Decimal
+
+from app.main.rhyme_repository import RhymeRanges, links_array, links_in_ranges
+
+
+def binarySearch(ids, l, r, range):
+    """binarySearch as it was in sentence_generator"""
+    if r >= l:
+        mid = l + int((r - l) / 2)
+        if int(ids[mid]) - 1 <= range[1] and int(ids[mid]) - 1 >= range[0]:
+            return ids[mid] - 1
+        elif int(ids[mid]) - 1 > range[1]:
+            return binarySearch(ids, l, mid - 1, range)
+        else:
+            return binarySearch(ids, mid + 1, r, range)
+    else:
+        return -1
+
+
+def old_first_hit(pages, rhyme_ids):
+    rhyme_ids = list(rhyme_ids)
+    random.shuffle(rhyme_ids)
+    for k in rhyme_ids:
+        for j in pages:
+            if j['links'][-1] - 1 < k[0] or j['links'][0] - 1 > k[1]:
+                continue
+            index = binarySearch(j['links'], 0, len(j['links']) - 1, [int(k[0]), int(k[1])])
+            if index != -1:
+                return index
+    return -1
+
+
+def convert(pages):
+    return [links_array(page['links']) for page in pages]
+
+
+def new_all_hits(arrays, ranges):
+    return [links_in_ranges(links, ranges) for links in arrays]
+
+
+def timed(func, *args, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        t = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - t)
+    return best
+
+
+def main(num_pages=10, num_ranges=50, space=10 ** 7):
+    random.seed(0)
+    # ranges are rare in the id space, so most pages have no hit and the old loop has to try every range
+    starts = sorted(random.sample(range(0, space, 1000), num_ranges))
+    rhyme_ids = [[Decimal(start), Decimal(start + random.randint(0, 50))] for start in starts]
+    ranges = RhymeRanges.from_rhymes({'w{}'.format(i): ids for i, ids in enumerate(rhyme_ids)})
+
+    for num_links in (10 ** 3, 10 ** 4, 10 ** 5, 10 ** 6):
+        pages = [{'links': [Decimal(link) for link in sorted(random.sample(range(1, space), num_links))]}
+                 for _ in range(num_pages)]
+        arrays = convert(pages)
+        hits = sum(len(page_hits) for page_hits in new_all_hits(arrays, ranges))
+
+        old = timed(old_first_hit, pages, rhyme_ids)
+        cold = timed(new_all_hits, [page['links'] for page in pages], ranges)
+        conversion = timed(convert, pages)
+        new = timed(new_all_hits, arrays, ranges)
+        print('{:>8} links x {} pages: old (first hit) {:8.2f} ms, cold pages {:8.2f} ms, links_array {:8.2f} ms, '
+              'cached pages (all {} hits) {:8.2f} ms'.format(
+                  num_links, num_pages, old * 1000, cold * 1000, conversion * 1000, hits, new * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""Micro-benchmark of phonetic normalization: the old character-by-character phonetic_clean against the
+str.translate one, and the cost of cleaning inside phonetic_dist against using the pre-cleaned corpus.
+
+Run from the project root with:
+    python -m benchmarks.phonetic_clean
+"""
+import timeit
+
+from app.helper_lyric_generator import phonetic_clean
+from app.rhyme_distances import get_all_phonetic_array, lookup, phonetic_dist
+
+
+def old_phonetic_clean(word: str):
+    """phonetic_clean as it used to be: one slice per erased character"""
+    initial_length = len(word)
+    modified_word = word
+    counter = 0
+
+    while (counter < initial_length):
+        current = modified_word[counter:counter + 1]
+        if (current == "[" or current == "]" or current == " " or
+                current == "," or current == "-" or current == ";"):
+            modified_word = modified_word[:counter] + modified_word[counter + 1:]
+            counter -= 1
+
+        counter += 1
+    return modified_word
+
+
+def main():
+    raw = [str(info[0]) for info in get_all_phonetic_array().values()]
+    assert [old_phonetic_clean(p) for p in raw] == [phonetic_clean(p) for p in raw]
+
+    old = min(timeit.repeat(lambda: [old_phonetic_clean(p) for p in raw], number=1, repeat=5)) / len(raw)
+    new = min(timeit.repeat(lambda: [phonetic_clean(p) for p in raw], number=1, repeat=5)) / len(raw)
+    print('phonetic_clean per phonetic: slicing {:.2f} us, translate {:.2f} us'.format(old * 1e6, new * 1e6))
+
+    # phonetic_dist of a pair, cleaning raw phonetics on every call against the pre-cleaned corpus entries
+    raw_1, raw_2 = str(get_all_phonetic_array()['yourself'][0]), str(get_all_phonetic_array()['shelf'][0])
+    info_1, info_2 = lookup('yourself'), lookup('shelf')
+    cleaning = min(timeit.repeat(lambda: phonetic_dist(raw_1, raw_2), number=10000, repeat=5)) / 10000
+    cleaned = min(timeit.repeat(lambda: phonetic_dist(info_1.phonetic, info_2.phonetic, clean=False),
+                                number=10000, repeat=5)) / 10000
+    print('phonetic_dist per pair: cleaning on each call {:.2f} us, pre-cleaned {:.2f} us'.format(
+        cleaning * 1e6, cleaned * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""Hit rate and p50/p99 latency of adding a line (sent_prefetch.get_sent) with the prefetch pool disabled
+(PREFETCH_WORKERS=0, every line waits on get_sent) and enabled.
+
+get_sent is replaced by a function that sleeps for a simulated run (LATENCY seconds, with jitter), so the numbers
+show the effect of prefetching, not the latency of the real tables. Each simulated user writes a song about one word,
+adding a line every THINK_TIME seconds that rhymes with one of a few words or with nothing.
+
+Run from the project root with:
+    python -m benchmarks.sent_prefetch
+"""
+import random
+import threading
+import time
+
+import numpy as np
+
+from app import create_app
+from app.main import sent_prefetch
+from config import Config
+
+LATENCY = 0.2
+THINK_TIME = 0.3
+WORDS = ['love', 'night', 'road', 'fire', 'rain']
+RHYMES = ['', 'zoo', 'blue', 'light']
+
+
+def slow_get_sent(word='', rhyme=''):
+    time.sleep(LATENCY * (0.5 + random.random()))
+    return ['line ', 0, word]
+
+
+class BenchmarkConfig(Config):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+
+
+def write_song(app, prefetcher, about, num_lines, latencies):
+    with app.app_context():
+        for _ in range(num_lines):
+            t = time.perf_counter()
+            prefetcher.get_sent(word=about, rhyme=random.choice(RHYMES))
+            latencies.append(time.perf_counter() - t)
+            time.sleep(THINK_TIME)
+
+
+def measure(workers, num_lines):
+    BenchmarkConfig.PREFETCH_WORKERS = workers
+    app = create_app(BenchmarkConfig)
+    prefetcher = sent_prefetch.SentPrefetcher()
+
+    latencies = []
+    users = [threading.Thread(target=write_song, args=(app, prefetcher, about, num_lines, latencies))
+             for about in WORDS]
+    for user in users:
+        user.start()
+    for user in users:
+        user.join()
+
+    if app.prefetch:
+        app.prefetch.shutdown()
+    return prefetcher.stats()['hit_rate'], np.percentile(latencies, 50) * 1000, np.percentile(latencies, 99) * 1000
+
+
+def main(num_lines=16):
+    sent_prefetch.get_sent = slow_get_sent
+
+    random.seed(0)
+    for workers in (0, 2, 4):
+        hit_rate, p50, p99 = measure(workers, num_lines)
+        print('PREFETCH_WORKERS={}: hit rate {:.0%}, p50 {:.1f} ms, p99 {:.1f} ms'.format(workers, hit_rate, p50, p99))
+
+
+if __name__ == '__main__':
+    main()
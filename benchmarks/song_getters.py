@@ -0,0 +1,138 @@
+"""Time of the Songs getters on large songs: get_related_by_id, get_rhyme_related_by_id and non_used as they were,
+rescanning the ';' and '&' separated columns for every lookup, against the same getters reading the SongState lists,
+and parsing about (song_about and the synonyms passed to populate_custom_song) on every call against once per value.
+
+The string version is a copy of the Songs methods as they were (related column only). The SongState version reads
+a song committed to an in-memory SQLite database, with its candidates loaded before the getters are timed.
+
+Run from the project root with:
+    python -m benchmarks.song_getters
+"""
+import ast
+import random
+import re
+import time
+
+from app import create_app, db
+from app.models import Songs
+from benchmarks.song_state import StringSong, candidates, BenchmarkConfig
+
+CALLS = 100
+SYNONYMS = 200
+
+
+class StringGetters(StringSong):
+
+    def __init__(self, about):
+        super(StringGetters, self).__init__()
+        self.about = about
+
+    def song_about(self):
+        ind = self.about.find(';')
+        ind_2 = self.about.rfind('=')
+        return self.about[ind_2+1:ind]
+
+    def about_syns(self):
+        t = self.about.split(';')
+        return [ast.literal_eval(t[1]), ast.literal_eval(t[2])]
+
+    def get_rhyme_related_by_id(self, id, sub_id=-1, thresh=False):
+        all_index = [m.start() for m in re.finditer(';', self.rhyme_related)]
+        if id + 1 == len(all_index):
+            possible_rhyme_related = self.rhyme_related[all_index[id]+1:]
+        else:
+            possible_rhyme_related = self.rhyme_related[all_index[id]+1: all_index[id+1]]
+
+        all_index_2 = [m.start() for m in re.finditer(';', self.rhyme_related_ids)]
+        if id + 1 == len(all_index_2):
+            possible_rhyme_related_ids = self.rhyme_related_ids[all_index_2[id]+1:]
+        else:
+            possible_rhyme_related_ids = self.rhyme_related_ids[all_index_2[id]+1: all_index_2[id+1]]
+
+        all_index = [m.start() for m in re.finditer('&', possible_rhyme_related)]
+        all_index_2 = [m.start() for m in re.finditer('&', possible_rhyme_related_ids)]
+
+        used_elsewhere = False
+        c = 0
+        id_new = -1
+        for i in all_index_2:
+            if possible_rhyme_related_ids[i + 1] == '0':
+                id_new = c
+                break
+            c += 1
+
+        if id_new == -1:
+            used_elsewhere = True
+            id_new = random.randint(0, len(all_index_2)-1)
+
+        if id_new + 1 == len(all_index):
+            sent = possible_rhyme_related[all_index[id_new] + 1:]
+            possible_rhyme_related_clean = possible_rhyme_related[:all_index[id_new]]
+        else:
+            sent = possible_rhyme_related[all_index[id_new] + 1: all_index[id_new + 1]]
+            possible_rhyme_related_clean = possible_rhyme_related[:all_index[id_new]] + \
+                                           possible_rhyme_related[all_index[id_new + 1]:]
+
+        if id_new + 1 == len(all_index_2):
+            temp = possible_rhyme_related_ids[all_index_2[id_new] + 1:].find('-') + all_index_2[id_new] + 1
+            sent_id = possible_rhyme_related_ids[temp + 1:]
+            possible_rhyme_related_ids_clean = possible_rhyme_related_ids[:all_index_2[id_new]]
+        else:
+            temp = possible_rhyme_related_ids[all_index_2[id_new] + 1:].find('-') + all_index_2[id_new] + 1
+            sent_id = possible_rhyme_related_ids[temp + 1: all_index_2[id_new + 1]]
+            possible_rhyme_related_ids_clean = possible_rhyme_related_ids[:all_index_2[id_new]] + \
+                                               possible_rhyme_related_ids[all_index_2[id_new + 1]:]
+
+        return [[sent, sent_id], [possible_rhyme_related_clean, possible_rhyme_related_ids_clean], id_new,
+                used_elsewhere]
+
+
+def about():
+    syns = [{'word{}'.format(i): i for i in range(SYNONYMS)}, {'other{}'.format(i): i for i in range(SYNONYMS)}]
+    return 'love;{};{}'.format(syns[0], syns[1])
+
+
+def time_getters(song, num_related):
+    """Returns the ms per call of each getter"""
+    ids = [random.randrange(num_related) for _ in range(CALLS)]
+    getters = [('get_related_by_id', lambda id: song.get_related_by_id(id)),
+               ('get_rhyme_related_by_id', lambda id: song.get_rhyme_related_by_id(id)),
+               ('non_used', lambda id: song.non_used()),
+               ('song_about', lambda id: song.song_about()),
+               ('about_syns', lambda id: song.about_syns())]
+
+    times = {}
+    for name, getter in getters:
+        t = time.perf_counter()
+        for id in ids:
+            getter(id)
+        times[name] = (time.perf_counter() - t) * 1000 / CALLS
+    return times
+
+
+def main():
+    app = create_app(BenchmarkConfig)
+    with app.app_context():
+        db.create_all()
+
+        random.seed(0)
+        for num_related in (100, 300, 1000):
+            strings = StringGetters(about())
+            strings.update_related(*candidates(num_related))
+
+            song = Songs(about=about())
+            song.update_related(*candidates(num_related))
+            db.session.add(song)
+            db.session.commit()
+            song.non_used()
+            song.get_rhyme_related_by_id(0)
+
+            string_times = time_getters(strings, num_related)
+            state_times = time_getters(song, num_related)
+            for name in string_times:
+                print('{:>5} related, {:<24} strings {:8.4f} ms, SongState {:8.4f} ms'.format(
+                    num_related, name, string_times[name], state_times[name]))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,150 @@
+"""Time to fill the related/rhyme_related candidates of a song and then use some of them (what
+populate_custom_song_async and get_related do in the custom mode), with the ';'/'&' separated string columns Songs
+used to be read and written through, and with SongState.
+
+The string version is a copy of the Songs methods involved as they were (related column only), reading and writing
+the legacy columns of a row of songs. Both versions read the song and commit it to an in-memory SQLite database.
+Filling runs in a background job (populate_custom_song), using the candidates is on the request path (get_related),
+with a commit per line.
+
+Run from the project root with:
+    python -m benchmarks.song_state
+"""
+import random
+import re
+import time
+
+from app import create_app, db
+from app.models import Songs
+from config import Config
+
+RHYMES_PER_RELATED = 5
+USED = 20
+
+
+class StringSong(object):
+    """The columns are read from and written to the legacy columns of a row of songs, as Songs used to"""
+
+    def __init__(self, song=None):
+        self.song = song if song is not None else Songs(related='', related_ids='', rhyme_related='',
+                                                         rhyme_related_ids='')
+
+    def __getattr__(self, name):
+        return getattr(self.song, name)
+
+    def __setattr__(self, name, value):
+        if name == 'song':
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.song, name, value)
+
+    def update_related(self, new_related, last_words, rhyming_sent):
+        for i in range(len(new_related)):
+            if rhyming_sent[last_words[i]] != []:
+                self.related = self.related + ';' + new_related[i][0]
+                self.update_related_id(sentence_id=int(new_related[i][1]))
+                self.update_rhyme_related(rhyming_sent[last_words[i]])
+
+    def update_rhyme_related(self, sentences):
+        self.rhyme_related = self.rhyme_related + ';'
+        self.rhyme_related_ids = self.rhyme_related_ids + ';'
+        for sent in sentences:
+            self.rhyme_related = self.rhyme_related + '&' + sent[0]
+            self.rhyme_related_ids = self.rhyme_related_ids + '&0-' + str(int(sent[1]))
+
+    def update_related_id(self, sentence_id=-1, id=-1, line_being_used=-1, action='new'):
+        all_index = [m.start() for m in re.finditer(';', self.related_ids)]
+        if action == 'new':
+            self.related_ids += ';0-' + str(sentence_id)
+        elif action == 'used':
+            self.related_ids = self.related_ids[:all_index[id]+1] + str(line_being_used) + '-' + \
+                               self.related_ids[all_index[id]+3:]
+
+    def non_used(self):
+        all_index = [m.start() for m in re.finditer(';', self.related_ids)]
+        non_used = []
+        for i, index in enumerate(all_index):
+            if self.related_ids[index + 1] == '0':
+                non_used.append([self.get_related_by_id(i), i])
+        return non_used
+
+    def get_related_by_id(self, id):
+        all_index = [m.start() for m in re.finditer(';', self.related)]
+        if len(all_index) == id + 1:
+            return self.related[all_index[id]+1:]
+        return self.related[all_index[id] + 1:all_index[id+1]]
+
+    def get_related_id_by_id(self, id):
+        all_index = [m.start() for m in re.finditer(';', self.related_ids)]
+        begin = self.related_ids.find('-', all_index[id], len(self.related_ids))
+        if len(all_index) == id + 1:
+            return self.related_ids[begin+1:]
+        return self.related_ids[begin+1:all_index[id + 1]]
+
+
+def candidates(num_related):
+    related = [['related sentence number {} '.format(i), 1000 + i] for i in range(num_related)]
+    last_words = [str(i) for i in range(num_related)]
+    rhyming = {word: [['rhyming sentence {} {} '.format(word, j), 10 ** 6 + j] for j in range(RHYMES_PER_RELATED)]
+               for word in last_words}
+    return related, last_words, rhyming
+
+
+def use_some(song, commit=lambda: None):
+    """What get_related does for each new line"""
+    for line in range(USED):
+        picked = random.choice([item[1] for item in song.non_used()])
+        song.get_related_by_id(picked)
+        song.get_related_id_by_id(picked)
+        song.update_related_id(id=picked, action='used', line_being_used=line + 1)
+        commit()
+
+
+def time_strings(num_related):
+    song = StringSong()
+    db.session.add(song.song)
+    db.session.commit()
+
+    t = time.perf_counter()
+    song.update_related(*candidates(num_related))
+    db.session.commit()
+    filled = time.perf_counter() - t
+    use_some(song, db.session.commit)
+    return filled, time.perf_counter() - t - filled
+
+
+def time_song_state(num_related):
+    song = Songs()
+    db.session.add(song)
+    db.session.commit()
+
+    t = time.perf_counter()
+    song.update_related(*candidates(num_related))
+    db.session.commit()
+    filled = time.perf_counter() - t
+    use_some(song, db.session.commit)
+    return filled, time.perf_counter() - t - filled
+
+
+class BenchmarkConfig(Config):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+
+
+def main():
+    app = create_app(BenchmarkConfig)
+    with app.app_context():
+        db.create_all()
+
+        random.seed(0)
+        for num_related in (100, 300, 1000):
+            strings = time_strings(num_related)
+            state = time_song_state(num_related)
+            print('{:>5} related x {} rhymes: fill strings {:8.1f} ms, SongState {:8.1f} ms | use {} strings '
+                  '{:8.1f} ms, SongState {:8.1f} ms'.format(num_related, RHYMES_PER_RELATED, strings[0] * 1000,
+                                                            state[0] * 1000, USED, strings[1] * 1000,
+                                                            state[1] * 1000))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+"""Speed and ranking quality of the two phonetic modes of dist(): fixed 4-character chunks ('chunk') against
+the syllables of the corpus ('syllable').
+
+Ranking quality is measured against RHYME_GROUPS, sets of words labelled by hand as perfect rhymes of each other,
+so the reference does not depend on the phonetics of the corpus. Each word of the groups is a query: the other
+labelled words are ranked by dist(), and we report the fraction of its group among the first len(group) - 1 of
+them (R-precision), averaged over the queries.
+
+Run from the project root with:
+    python -m benchmarks.syllable_dist
+"""
+import random
+import time
+
+from app.rhyme_distances import dist, edit_dist, lookup, phonetic_store, rhyme_dist, syllable_dist
+
+RHYME_GROUPS = [
+    'bout shout doubt out about scout spout trout',
+    'night light fight might right sight bright tight flight',
+    'day way play say stay pay gray away okay',
+    'love above dove glove shove',
+    'heart part start apart art smart',
+    'fire desire higher wire tire',
+    'rain pain chain brain train plain vain',
+    'fall call all wall small ball tall crawl',
+    'time rhyme crime climb',
+    'go know show slow though below snow flow',
+    'me free see be tree sea three key',
+    'blue true you do through new too two',
+    'cold gold old hold told bold sold',
+    'ring sing thing bring king wing',
+    'feel real deal heal steal wheel',
+    'moon soon tune june noon spoon',
+    'dance chance glance trance',
+    'door floor more before four core',
+    'hand land stand band sand understand',
+    'cry die fly high lie sky why goodbye',
+]
+
+
+def main(num_pairs=20000):
+    words = [w for w in phonetic_store() if lookup(w).syllables]
+    random.seed(0)
+    pairs = [(random.choice(words), random.choice(words)) for _ in range(num_pairs)]
+
+    for mode in ('chunk', 'syllable'):
+        edit_dist.cache_clear()
+        t = time.perf_counter()
+        for word_1, word_2 in pairs:
+            dist(word_1, word_2, mode=mode)
+        print('{:<8} dist() per call: {:.1f} us'.format(mode, (time.perf_counter() - t) / num_pairs * 1e6))
+
+    # phonetic part only, on entries that were already looked up
+    infos = [(lookup(word_1), lookup(word_2)) for word_1, word_2 in pairs]
+    for mode, func in (('chunk', lambda a, b: rhyme_dist(a.phonetic, b.phonetic)),
+                       ('syllable', lambda a, b: syllable_dist(a.syllables, b.syllables))):
+        edit_dist.cache_clear()
+        t = time.perf_counter()
+        for info_1, info_2 in infos:
+            func(info_1, info_2)
+        print('{:<8} phonetic distance per call: {:.1f} us'.format(mode, (time.perf_counter() - t) / num_pairs * 1e6))
+
+    groups = [[w for w in group.split() if w in phonetic_store() and lookup(w).syllables] for group in RHYME_GROUPS]
+    labelled = [w for group in groups for w in group]
+
+    for mode in ('chunk', 'syllable'):
+        precision = 0
+        for group in groups:
+            for query in group:
+                ranked = sorted((dist(query, c, mode=mode), c) for c in labelled if c != query)[:len(group) - 1]
+                precision += sum(c in group for _, c in ranked) / (len(group) - 1)
+        print('{:<8} R-precision over {} labelled words in {} rhyme groups: {:.2f}'.format(
+            mode, len(labelled), len(groups), precision / len(labelled)))
+
+
+if __name__ == '__main__':
+    main()
@@ -23,3 +23,11 @@ class Config(object):
     MS_TRANSLATOR_KEY = os.environ.get('MS_TRANSLATOR_KEY')
     ELASTICSEARCH_URL = os.environ.get('ELASTICSEARCH_URL')
     LOG_TO_STDOUT = os.environ.get('LOG_TO_STDOUT')
+    DIST_CACHE_PATH = os.environ.get('DIST_CACHE_PATH')
+    LYRIC_STORE_PATH = os.environ.get('LYRIC_STORE_PATH')
+    TABLE_METADATA_INTERVAL = int(os.environ.get('TABLE_METADATA_INTERVAL') or 3600)
+    FANOUT_WORKERS = int(os.environ.get('FANOUT_WORKERS') or 8)
+    PREFETCH_WORKERS = int(os.environ.get('PREFETCH_WORKERS') or 2)
+    JOB_WORKERS = int(os.environ.get('JOB_WORKERS') or 2)
+    JOB_QUEUE_SIZE = int(os.environ.get('JOB_QUEUE_SIZE') or 100)
+    JOB_DRAIN_TIMEOUT = int(os.environ.get('JOB_DRAIN_TIMEOUT') or 30)
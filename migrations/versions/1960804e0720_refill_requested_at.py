@@ -0,0 +1,26 @@
+"""refill requested at
+
+Revision ID: 1960804e0720
+Revises: f45df5a0a809
+Create Date: 2026-10-17 20:32:08.419714
+
+Marks the songs whose candidates are being refilled, so a refill is queued once, see CandidatePool.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1960804e0720'
+down_revision = 'f45df5a0a809'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column('songs', sa.Column('refill_requested_at', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('songs') as batch_op:
+        batch_op.drop_column('refill_requested_at')
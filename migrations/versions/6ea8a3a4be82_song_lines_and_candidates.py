@@ -0,0 +1,204 @@
+"""song lines and candidates
+
+Revision ID: 6ea8a3a4be82
+Revises: 4ad8688f58dd
+Create Date: 2026-10-17 10:12:41.318207
+
+Moves the lines of the songs and the candidate sentences of the custom mode out of the ';' and '&' separated
+columns of songs into the song_line, related_candidate and rhyme_candidate tables. The old columns are left as
+they are. The downgrade writes the rows of the tables back into them before dropping the tables.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6ea8a3a4be82'
+down_revision = '4ad8688f58dd'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    song_line = op.create_table('song_line',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('song_id', sa.Integer(), nullable=False),
+    sa.Column('position', sa.Integer(), nullable=False),
+    sa.Column('text', sa.String(length=1000), nullable=True),
+    sa.Column('sentence_id', sa.Integer(), nullable=True),
+    sa.Column('related', sa.String(length=140), nullable=True),
+    sa.ForeignKeyConstraint(['song_id'], ['songs.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_song_line_song_id_position', 'song_line', ['song_id', 'position'], unique=False)
+    related_candidate = op.create_table('related_candidate',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('song_id', sa.Integer(), nullable=False),
+    sa.Column('thread', sa.Boolean(), nullable=False),
+    sa.Column('position', sa.Integer(), nullable=False),
+    sa.Column('text', sa.String(length=1000), nullable=True),
+    sa.Column('sentence_id', sa.Integer(), nullable=True),
+    sa.Column('used_by_line', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['song_id'], ['songs.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_related_candidate_song_id_thread_position', 'related_candidate',
+                    ['song_id', 'thread', 'position'], unique=False)
+    op.create_index('ix_related_candidate_song_id_used_by_line', 'related_candidate',
+                    ['song_id', 'used_by_line'], unique=False)
+    rhyme_candidate = op.create_table('rhyme_candidate',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('song_id', sa.Integer(), nullable=False),
+    sa.Column('thread', sa.Boolean(), nullable=False),
+    sa.Column('related_position', sa.Integer(), nullable=False),
+    sa.Column('position', sa.Integer(), nullable=False),
+    sa.Column('text', sa.String(length=1000), nullable=True),
+    sa.Column('sentence_id', sa.Integer(), nullable=True),
+    sa.Column('used_by_line', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['song_id'], ['songs.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_rhyme_candidate_song_id_thread_related_position', 'rhyme_candidate',
+                    ['song_id', 'thread', 'related_position', 'position'], unique=False)
+    op.create_index('ix_rhyme_candidate_song_id_used_by_line', 'rhyme_candidate',
+                    ['song_id', 'used_by_line'], unique=False)
+
+    songs = songs_table()
+    for song in op.get_bind().execute(sa.select([songs])).fetchall():
+        lines, related, rhymes = song_rows(song)
+        op.bulk_insert(song_line, lines)
+        op.bulk_insert(related_candidate, related)
+        op.bulk_insert(rhyme_candidate, rhymes)
+
+
+# size of the old columns. Longer values are written as NULL, as the app does
+COLUMN_SIZE = 10000
+
+
+def songs_table():
+    return sa.table('songs', sa.column('id', sa.Integer), *[sa.column(name, sa.String) for name in [
+        'part_1', 'part_1_ids', 'related', 'related_ids', 'rhyme_related', 'rhyme_related_ids', 'related_thr',
+        'related_ids_thr', 'rhyme_related_thr', 'rhyme_related_ids_thr']])
+
+
+def split(column):
+    """Entries of a column. Every entry starts with ';', including the first"""
+    return (column or '').split(';')[1:]
+
+
+def to_int(value):
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def used_and_id(entry):
+    """An entry of the *_ids columns of the candidates is '<line it is used in, 0 if none>-<dynamodb id>'"""
+    used, _, id = entry.partition('-')
+    return to_int(used) or 0, to_int(id)
+
+
+def song_rows(song):
+    """Returns the song_line, related_candidate and rhyme_candidate rows of a row of songs"""
+
+    # related stores the word each line was generated from, except in the custom mode (where related_ids is set)
+    # that stores the related candidates in it instead
+    line_related = split(song.related) if not song.related_ids else []
+    lines = [{'song_id': song.id, 'position': i, 'text': text, 'sentence_id': to_int(id),
+              'related': line_related[i] if i < len(line_related) else ''}
+             for i, (text, id) in enumerate(zip(split(song.part_1), split(song.part_1_ids)))]
+
+    related, rhymes = [], []
+    for thread, texts, ids, rhyme_texts, rhyme_ids in [
+            (False, song.related, song.related_ids, song.rhyme_related, song.rhyme_related_ids),
+            (True, song.related_thr, song.related_ids_thr, song.rhyme_related_thr, song.rhyme_related_ids_thr)]:
+        if not ids:
+            continue
+
+        for i, (text, entry) in enumerate(zip(split(texts), split(ids))):
+            used, id = used_and_id(entry)
+            related.append({'song_id': song.id, 'thread': thread, 'position': i, 'text': text, 'sentence_id': id,
+                            'used_by_line': used})
+
+        # the candidates rhyming with each related candidate are separated by '&'
+        for i, (group, group_ids) in enumerate(zip(split(rhyme_texts), split(rhyme_ids))):
+            for j, (text, entry) in enumerate(zip(group.split('&')[1:], group_ids.split('&')[1:])):
+                used, id = used_and_id(entry)
+                rhymes.append({'song_id': song.id, 'thread': thread, 'related_position': i, 'position': j,
+                               'text': text, 'sentence_id': id, 'used_by_line': used})
+
+    return lines, related, rhymes
+
+
+def join(entries, sep=';'):
+    return ''.join(sep + entry for entry in entries)
+
+
+def ids(candidates, sep=';'):
+    return join(('{}-{}'.format(candidate.used_by_line, '' if candidate.sentence_id is None else candidate.sentence_id)
+                 for candidate in candidates), sep)
+
+
+def song_columns(lines, related, rhymes):
+    """Returns the old columns of a song from its song_line, related_candidate and rhyme_candidate rows, each in
+    order of position. The inverse of song_rows"""
+
+    columns = {'part_1': join(line.text or '' for line in lines),
+               'part_1_ids': join('' if line.sentence_id is None else str(line.sentence_id) for line in lines)}
+
+    for thread, suffix in [(False, ''), (True, '_thr')]:
+        pool = [candidate for candidate in related if candidate.thread == thread]
+        groups = [[] for _ in pool]
+        for candidate in rhymes:
+            if candidate.thread == thread:
+                groups.extend([] for _ in range(candidate.related_position + 1 - len(groups)))
+                groups[candidate.related_position].append(candidate)
+
+        columns['related' + suffix] = join(candidate.text or '' for candidate in pool)
+        columns['related_ids' + suffix] = ids(pool)
+        columns['rhyme_related' + suffix] = join(join((candidate.text or '' for candidate in group), '&')
+                                                 for group in groups)
+        columns['rhyme_related_ids' + suffix] = join(ids(group, '&') for group in groups)
+
+    # related stores the word each line was generated from, unless it stores the related candidates
+    if not columns['related_ids']:
+        columns['related'] = join(line.related or '' for line in lines)
+
+    return {column: value if len(value) <= COLUMN_SIZE else None for column, value in columns.items()}
+
+
+def downgrade():
+    conn = op.get_bind()
+    songs = songs_table()
+    song_line, related_candidate, rhyme_candidate = [
+        sa.table(name, *[sa.column(column) for column in columns]) for name, columns in [
+            ('song_line', ['song_id', 'position', 'text', 'sentence_id', 'related']),
+            ('related_candidate', ['song_id', 'thread', 'position', 'text', 'sentence_id', 'used_by_line']),
+            ('rhyme_candidate', ['song_id', 'thread', 'related_position', 'position', 'text', 'sentence_id',
+                                 'used_by_line'])]]
+
+    def rows_by_song(table, *order_by):
+        rows = {}
+        for row in conn.execute(sa.select([table]).order_by(table.c.song_id, *order_by)):
+            rows.setdefault(row.song_id, []).append(row)
+        return rows
+
+    lines = rows_by_song(song_line, song_line.c.position)
+    related = rows_by_song(related_candidate, related_candidate.c.thread, related_candidate.c.position)
+    rhymes = rows_by_song(rhyme_candidate, rhyme_candidate.c.thread, rhyme_candidate.c.related_position,
+                          rhyme_candidate.c.position)
+
+    # songs without rows keep the columns they have
+    for song_id in set(lines) | set(related) | set(rhymes):
+        columns = song_columns(lines.get(song_id, []), related.get(song_id, []), rhymes.get(song_id, []))
+        conn.execute(songs.update().where(songs.c.id == song_id).values(**columns))
+
+    op.drop_index('ix_rhyme_candidate_song_id_used_by_line', table_name='rhyme_candidate')
+    op.drop_index('ix_rhyme_candidate_song_id_thread_related_position', table_name='rhyme_candidate')
+    op.drop_table('rhyme_candidate')
+    op.drop_index('ix_related_candidate_song_id_used_by_line', table_name='related_candidate')
+    op.drop_index('ix_related_candidate_song_id_thread_position', table_name='related_candidate')
+    op.drop_table('related_candidate')
+    op.drop_index('ix_song_line_song_id_position', table_name='song_line')
+    op.drop_table('song_line')
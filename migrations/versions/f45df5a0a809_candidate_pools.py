@@ -0,0 +1,51 @@
+"""candidate pools
+
+Revision ID: f45df5a0a809
+Revises: 6ea8a3a4be82
+Create Date: 2026-10-17 20:11:45.766250
+
+The pool the lines of a custom song are taken from used to be marked by a leading '=' in about (related when it
+is there, related_thr when it is not), and a second '=' while the song waited for its first candidates. It is
+moved to the active_pool column, and the marks are removed from about.
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f45df5a0a809'
+down_revision = '6ea8a3a4be82'
+branch_labels = None
+depends_on = None
+
+
+songs = sa.table('songs', sa.column('id', sa.Integer), sa.column('about', sa.String),
+                 sa.column('active_pool', sa.Boolean))
+song_line = sa.table('song_line', sa.column('song_id', sa.Integer))
+
+
+def custom_songs():
+    """Returns the rows of the songs of the custom mode, the ones whose about stores the similar words too"""
+    return op.get_bind().execute(sa.select([songs]).where(songs.c.about.like('%;%'))).fetchall()
+
+
+def upgrade():
+    op.add_column('songs', sa.Column('active_pool', sa.Boolean(), nullable=True))
+
+    for song in custom_songs():
+        about = song.about.lstrip('=')
+        op.execute(songs.update().where(songs.c.id == song.id).values(
+            about=about, active_pool=about == song.about))
+
+
+def downgrade():
+    with_lines = {row.song_id for row in op.get_bind().execute(sa.select([song_line.c.song_id]).distinct())}
+    for song in custom_songs():
+        if song.id not in with_lines:
+            marks = '=='
+        else:
+            marks = '' if song.active_pool else '='
+        op.execute(songs.update().where(songs.c.id == song.id).values(about=marks + song.about))
+
+    with op.batch_alter_table('songs') as batch_op:
+        batch_op.drop_column('active_pool')
@@ -1,8 +1,34 @@
 #!/usr/bin/env python
+import os
+import random
+import tempfile
+import threading
+from decimal import Decimal
+import time
 from datetime import datetime, timedelta
 import unittest
+from functools import lru_cache
+import numpy as np
+from flask import has_app_context
 from app import create_app, db
-from app.models import User, Post
+from app.models import User, Post, Songs, SongLine, RelatedCandidate, RhymeCandidate
+from app import corpus as corpus_module
+from app.corpus import CorpusFile, write_corpus
+from app.rhyme_distances import dist, dist_many, lookup, lookup_many, phonetic_store, edit_dist, \
+    batch_edit_dist, syllable_dist, rime, EDIT_DIST_CACHE_SIZE
+from app.helper_lyric_generator import phonetic_clean, phonetic_syllables
+from app import rhyme_index
+from app.rhyme_index import closest_words, build_rhyme_index, RhymeIndex, build_rhyme_matrix, load_rhyme_matrix, \
+    clear_rhyme_matrix, shard_path
+from app.dist_cache import DistCache, cache_key
+from app.main.rhyme_repository import RhymeRepository, RhymeRanges, links_array, links_in_ranges
+from app.storage import DynamoStorage, SQLiteStorage, TableMetadata, AppStorage, copy_tables
+from app.fanout import fan_out
+from app.jobs import JobQueue
+from app.word_index import encode_postings, PostingList, WordIndex
+from app.main import sentence_generator, sent_prefetch, candidate_pool
+from app.main.sentence_generator import sample_postings, get_sent
+from app.main.rhyme_repository import rhyme_repository
 from config import Config
 
 
@@ -97,5 +123,1097 @@ class UserModelCase(unittest.TestCase):
         self.assertEqual(f4, [p4])
 
 
+class SongsModelCase(unittest.TestCase):
+    def setUp(self):
+        self.app = create_app(TestConfig)
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+
+    def tearDown(self):
+        db.session.remove()
+        db.drop_all()
+        self.app_context.pop()
+
+    def test_lines(self):
+        song = Songs()
+        db.session.add(song)
+        for i in range(12):
+            song.update_lyric(['line {} '.format(i), i], 'word{}'.format(i))
+        db.session.commit()
+
+        self.assertEqual(song.get_num_lines(), 12)
+        self.assertEqual(song.get_line_by_id(10), 'line 10 ')
+        self.assertEqual(song.get_line_related(-1), 'word11')
+
+        song.del_line(3)
+        song.update_line(3, 'new line ')
+        song.update_line_id(3, '40')
+        db.session.commit()
+        self.assertEqual(song.lyric()[2:5], ['line 2 ', 'new line ', 'line 5 '])
+        self.assertEqual(song.get_line_id_by_id(3), '40')
+        self.assertEqual(song.get_last_line(), 'line 11 ')
+
+    def test_candidates(self):
+        song = Songs()
+        db.session.add(song)
+        song.update_related([['a ', 1], ['b ', 2], ['c ', 3]], ['a', 'b', 'c'],
+                            {'a': [['ra ', 10], ['ra too ', 11]], 'b': [], 'c': [['rc ', 12]]})
+        db.session.commit()
+        self.assertEqual(song.non_used(), [['a ', 0], ['c ', 1]])
+        self.assertEqual(song.get_related_id_by_id(1), '3')
+
+        song.update_related_id(id=1, action='used', line_being_used=11)
+        song.update_rhyme_related_id(ind_sub_ind=[0, 0], action='used', line_being_used=1)
+        self.assertEqual(song.get_related_id_by_line_id(11), [1, False])
+        self.assertEqual(song.get_related_id_by_line_id(1), [-1, -1])
+        self.assertEqual(song.get_rhyme_related_id_by_line_id(1), [0, 0, False])
+        self.assertEqual(song.get_rhyme_related_by_id(0), [['ra too ', '11'], ['&ra ', '&1-10'], 1, False])
+
+        # deleting a candidate moves the next ones, and the sentences rhyming with them, back one position
+        song.update_related_id(id=0, action='del')
+        db.session.commit()
+        self.assertEqual(song.get_related_id_by_line_id(11), [0, False])
+        self.assertEqual(song.get_rhyme_related_by_id(0)[0], ['rc ', '12'])
+
+        song.clear_lyrics()
+        db.session.commit()
+        self.assertEqual(song.num_related(), 0)
+
+    def test_used_by_line(self):
+        song = Songs()
+        db.session.add(song)
+        words = ['w{}'.format(i) for i in range(12)]
+        song.update_related([['{} '.format(word), i] for i, word in enumerate(words)], words,
+                            {word: [['r{} '.format(word), 100 + i]] for i, word in enumerate(words)})
+        for i in range(12):
+            song.update_related_id(id=i, action='used', line_being_used=12 - i)
+        song.update_rhyme_related_id(ind_sub_ind=[2, 0], action='used', line_being_used=11)
+        self.assertEqual(song.get_related_id_by_line_id(1), [11, False])
+        self.assertEqual(song.get_related_id_by_line_id(11), [1, False])
+        self.assertEqual(song.get_rhyme_related_id_by_line_id(11), [2, 0, False])
+        self.assertIsNone(song.get_rhyme_related_id_by_line_id(1))
+
+        # the map is built again from the candidates after a commit
+        db.session.commit()
+        self.assertEqual(song.get_related_id_by_line_id(12), [0, False])
+        song.update_related_id(id=0, action='unused')
+        song.update_related_id(id=1, action='del')
+        song.update_rhyme_related_id(ind_sub_ind=[1, 0], action='del')
+        self.assertEqual(song.get_related_id_by_line_id(12), [-1, -1])
+        self.assertEqual(song.get_related_id_by_line_id(11), [-1, -1])
+        self.assertEqual(song.get_related_id_by_line_id(1), [10, False])
+        self.assertIsNone(song.get_rhyme_related_id_by_line_id(11))
+
+    def test_update_related(self):
+        song = Songs()
+        song.update_lyric(['a b ', 5], 'love')
+        self.assertEqual(song.update_related([['r0 ', 9], ['r1 ', 10]], ['r0', 'r1'],
+                                             {'r0': [], 'r1': [['s1 ', 20], ['s2 ', 21]]}, thread=True), 1)
+        song.update_rhyme_related_id(ind_sub_ind=[0, 1], action='used', line_being_used=1, thread=True)
+
+        # candidates added later go after the ones in the database
+        song.update_related([['r2 ', 11]], ['r2'], {'r2': [['s3 ', 22]]}, thread=True)
+        db.session.commit()
+        self.assertEqual(song.non_used(thread=True), [['r1 ', 0], ['r2 ', 1]])
+        self.assertEqual(song.get_rhyme_related_by_id(1, thresh=True)[0], ['s3 ', '22'])
+        self.assertEqual(song.get_rhyme_related_id_by_line_id(1), [0, 1, True])
+        self.assertEqual(song.lyric(), ['a b '])
+        self.assertEqual((song.related_thr, song.related_ids_thr), (';r1 ;r2 ', ';0-10;0-11'))
+
+    def test_legacy_columns(self):
+        song = Songs()
+        db.session.add(song)
+        song.update_lyric(['a b ', 5], 'love')
+        song.update_lyric(['c d ', 6])
+        db.session.commit()
+        self.assertEqual((song.part_1, song.part_1_ids, song.related), (';a b ;c d ', ';5;6', ';love;'))
+
+        song.update_related([['r1 ', 10], ['r2 ', 11]], ['r1', 'r2'], {'r1': [['s1 ', 20], ['s2 ', 21]],
+                                                                       'r2': [['s3 ', 22]]}, thread=True)
+        song.update_rhyme_related_id(ind_sub_ind=[0, 1], action='used', line_being_used=2, thread=True)
+        db.session.commit()
+        self.assertEqual((song.related_thr, song.related_ids_thr), (';r1 ;r2 ', ';0-10;0-11'))
+        self.assertEqual((song.rhyme_related_thr, song.rhyme_related_ids_thr),
+                         (';&s1 &s2 ;&s3 ', ';&0-20&2-21;&0-22'))
+
+        # only the columns of the parts that changed are written
+        song.part_1 = 'older'
+        db.session.commit()
+        song.update_related_id(id=0, action='used', line_being_used=1, thread=True)
+        db.session.commit()
+        self.assertEqual((song.part_1, song.related_ids_thr), ('older', ';1-10;0-11'))
+
+        song.del_line(0)
+        db.session.commit()
+        self.assertEqual((song.part_1, song.part_1_ids, song.related), (';c d ', ';6', ';'))
+
+        # values too long for the columns are not written
+        song.update_lyric(['x' * 10000, 7])
+        db.session.commit()
+        self.assertEqual((song.part_1, song.part_1_ids), (None, ';6;7'))
+
+    def test_add_before_reading(self):
+        song = Songs()
+        db.session.add(song)
+        song.update_lyric(['a b ', 5], 'love')
+        song.update_related([['r1 ', 10]], ['r1'], {'r1': [['s1 ', 20]]})
+        db.session.commit()
+
+        # rows added before the lists are built are in them once
+        song.state.add_line(SongLine(position=1, text='c d ', sentence_id=6))
+        self.assertEqual(song.lyric(), ['a b ', 'c d '])
+        song.state.add_related(RelatedCandidate(thread=False, position=1, text='r2 ', sentence_id=11))
+        self.assertEqual(song.num_related(), 2)
+        db.session.commit()
+        song.state.add_rhyme(RhymeCandidate(thread=False, related_position=0, position=1, text='s2 ',
+                                            sentence_id=21))
+        self.assertEqual(len(song.state.rhymes[False][0]), 2)
+
+    def test_about(self):
+        song = Songs(about="love;{'dove': 2};{'glove': 1}")
+        self.assertEqual(song.song_about(), 'love')
+        syns = song.about_syns()
+        syns[0]['dove'] = -1
+        self.assertEqual(song.about_syns(), [{'dove': 2}, {'glove': 1}])
+
+        # parsed again once about is assigned
+        song.about = "hate;{'late': 3};{}"
+        self.assertEqual(song.song_about(), 'hate')
+        self.assertEqual(song.about_syns(), [{'late': 3}, {}])
+
+
+class CandidatePoolCase(unittest.TestCase):
+    def setUp(self):
+        # a database file, the jobs of test_overlapping_refills use their own connections
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+
+        class PoolConfig(TestConfig):
+            SQLALCHEMY_DATABASE_URI = 'sqlite:///' + os.path.join(tmp.name, 'app.db')
+            JOB_WORKERS = 2
+
+        self.app = create_app(PoolConfig)
+        self.app_context = self.app.app_context()
+        self.app_context.push()
+        db.create_all()
+
+        self.refills = []
+        self.addCleanup(setattr, candidate_pool, 'populate_custom_song', candidate_pool.populate_custom_song)
+        candidate_pool.populate_custom_song = lambda syns, song_id, thread: self.refills.append(thread) or True
+
+    def tearDown(self):
+        if self.app.jobs:
+            self.app.jobs.shutdown(5)
+        db.session.remove()
+        db.drop_all()
+        self.app_context.pop()
+
+    def add_candidates(self, song, num, thread):
+        words = ['{}{}'.format(thread, i) for i in range(num)]
+        song.update_related([['{} '.format(word), i] for i, word in enumerate(words)], words,
+                            {word: [['r{} '.format(word), i]] for i, word in enumerate(words)}, thread=thread)
+
+    def refill_done(self, song):
+        """Clears the refill mark of song, as the refill job does when it ends"""
+        Songs.query.filter_by(id=song.id).update({'refill_requested_at': None})
+
+    def test_pop(self):
+        song = Songs(about="love;{'dove': 1};{}")
+        db.session.add(song)
+        self.add_candidates(song, 3, False)
+        self.add_candidates(song, 4, True)
+        db.session.commit()
+        pool = candidate_pool.CandidatePool(song, low_watermark=2)
+
+        for line in range(1, 4):
+            candidate = pool.pop(line)
+            self.assertEqual((candidate.thread, candidate.used_by_line), (False, line))
+        self.assertEqual(self.refills, [])
+
+        # the empty pool is refilled and lines are taken from the other one
+        candidate = pool.pop(4)
+        self.assertEqual((candidate.thread, candidate.used_by_line), (True, 4))
+        self.assertEqual(self.refills, [False])
+        self.assertTrue(song.active_pool)
+        self.assertEqual(song.get_related_id_by_line_id(4), [candidate.position, True])
+
+        # the standby pool is refilled once both are low, once the pending refill is done
+        pool.pop(5)
+        self.assertEqual(self.refills, [False])
+        self.refill_done(song)
+        pool.pop(6)
+        self.assertEqual(self.refills, [False, False])
+
+        pool.pop(7)
+        self.assertIsNone(pool.pop(8))
+        self.assertEqual(self.refills, [False, False])
+        db.session.commit()
+        self.assertEqual(len(song.non_used(thread=False)) + len(song.non_used(thread=True)), 0)
+
+    def test_refill(self):
+        song = Songs(about="love;{'dove': 1};{}")
+        db.session.add(song)
+        db.session.commit()
+        pool = candidate_pool.CandidatePool(song)
+
+        self.assertTrue(pool.refill(True))
+        self.assertFalse(pool.refill(True))
+        self.assertFalse(pool.refill(False))
+        self.assertEqual(self.refills, [True])
+
+        # the mark of a refill whose job died is ignored after REFILL_TIMEOUT seconds
+        song.refill_requested_at = datetime.utcnow() - timedelta(seconds=candidate_pool.REFILL_TIMEOUT + 1)
+        db.session.commit()
+        self.assertTrue(pool.refill(False))
+        self.assertEqual(self.refills, [True, False])
+
+        # and it is not kept when the job is not queued
+        self.refill_done(song)
+        candidate_pool.populate_custom_song = lambda syns, song_id, thread: False
+        self.assertFalse(pool.refill(False))
+        self.assertIsNone(db.session.query(Songs.refill_requested_at).filter_by(id=song.id).scalar())
+
+    def test_inline_refill(self):
+        # without job queue the refill runs in the request, in its session
+        self.app.jobs = None
+
+        def populate(syns, song_id, thread=True, first=False):
+            self.add_candidates(Songs.query.get(song_id), 4, thread)
+            db.session.commit()
+
+        self.addCleanup(setattr, sentence_generator, 'populate_custom_song_async',
+                        sentence_generator.populate_custom_song_async)
+        sentence_generator.populate_custom_song_async = populate
+        candidate_pool.populate_custom_song = sentence_generator.populate_custom_song
+
+        song = Songs(about="love;{'dove': 1};{}")
+        db.session.add(song)
+        self.add_candidates(song, 3, False)
+        db.session.commit()
+
+        candidate = candidate_pool.CandidatePool(song).pop(1)
+        song.active_pool = True
+        db.session.commit()
+
+        self.assertEqual(RelatedCandidate.query.filter_by(song_id=song.id, used_by_line=1).one().id, candidate.id)
+        self.assertEqual(RelatedCandidate.query.filter_by(song_id=song.id, thread=True).count(), 4)
+        self.assertIsNone(song.refill_requested_at)
+        self.assertTrue(song.active_pool)
+
+    def test_overlapping_refills(self):
+        song = Songs(about="love;{'dove': 1};{}")
+        db.session.add(song)
+        self.add_candidates(song, 3, True)
+        db.session.commit()
+        # the other threads load the song in their own sessions
+        song_id = song.id
+
+        # jobs add 4 candidates to the pool once released
+        released = threading.Event()
+
+        def populate(syns, song_id, thread=True, first=False):
+            released.wait(5)
+            self.add_candidates(Songs.query.get(song_id), 4, thread)
+            db.session.commit()
+
+        self.addCleanup(setattr, sentence_generator, 'populate_custom_song_async',
+                        sentence_generator.populate_custom_song_async)
+        sentence_generator.populate_custom_song_async = populate
+        candidate_pool.populate_custom_song = sentence_generator.populate_custom_song
+
+        def wait_done(jobs):
+            deadline = time.monotonic() + 5
+            while self.app.jobs.stats()['done'] < jobs and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+        self.assertTrue(candidate_pool.CandidatePool(Songs.query.get(song_id)).refill(True))
+        db.session.commit()
+
+        # other requests, with their own sessions, do not queue a refill of either pool while it runs
+        overlapping = []
+
+        def request(thread):
+            with self.app.app_context():
+                overlapping.append(candidate_pool.CandidatePool(Songs.query.get(song_id)).refill(thread))
+                db.session.commit()
+
+        for thread in (True, False):
+            worker = threading.Thread(target=request, args=(thread,))
+            worker.start()
+            worker.join()
+        self.assertEqual(overlapping, [False, False])
+
+        released.set()
+        wait_done(1)
+        self.assertIsNone(db.session.query(Songs.refill_requested_at).filter_by(id=song_id).scalar())
+
+        # the next refill adds its candidates after the ones of the last one
+        self.assertTrue(candidate_pool.CandidatePool(Songs.query.get(song_id)).refill(True))
+        db.session.commit()
+        wait_done(2)
+        self.assertEqual(self.app.jobs.stats()['failed'], 0)
+        positions = [position for position, in db.session.query(RelatedCandidate.position).filter_by(
+            song_id=song_id, thread=True).order_by(RelatedCandidate.position)]
+        self.assertEqual(positions, list(range(11)))
+
+
+class RhymeDistanceCase(unittest.TestCase):
+    def test_lookup(self):
+        self.assertEqual(lookup('zoo'), ('zoo', 'S', ('zoo',)))
+        self.assertEqual(lookup('youngins'), ('yuhngins', 'ANJNS', ('yuhng', 'ins')))
+        self.assertEqual(lookup('yogi').syllables, ('yoh', 'gee'))
+        self.assertEqual(lookup("you's").phonetic, 'yoo"s"')
+        self.assertIsNone(lookup('notaword'))
+        self.assertEqual(lookup_many(['zoo', 'notaword']), [lookup('zoo'), None])
+
+    def test_phonetic_store_is_shared_and_read_only(self):
+        self.assertIs(phonetic_store(), phonetic_store())
+        with self.assertRaises(TypeError):
+            phonetic_store()['zoo'] = ('', '')
+
+    def test_dist(self):
+        self.assertEqual(dist('notaword', 'notaword'), -3)
+        self.assertEqual(dist('notaword', 'zoo'), -1)
+        self.assertEqual(dist('zoo', 'notaword'), -2)
+        self.assertLess(dist('love', 'glove'), dist('love', 'zebra'))
+        self.assertAlmostEqual(dist('love', 'dove'), 4.5 / 13)
+        self.assertAlmostEqual(dist('love', 'glove', alliteration=True), 4.5 / 13)
+        self.assertAlmostEqual(dist('zone', 'zoo', alliteration=True), 5.5 / 13)
+
+    def test_syllable_dist(self):
+        self.assertEqual(rime('shelf'), 'elf')
+        self.assertEqual(rime('s'), 's')
+        self.assertEqual(syllable_dist(('yoor', 'self'), ('shelf',)), edit_dist('elf', 'elf'))
+        self.assertEqual(syllable_dist(('muhn', 'ee'), ('huhn', 'ee')), edit_dist('ee', 'ee') + edit_dist('uhn', 'uhn') / 2)
+        self.assertEqual(syllable_dist(('muhn', 'ee'), ('muhn', 'kee'), alliteration=True),
+                         edit_dist('muhn', 'muhn') + edit_dist('ee', 'kee') / 2)
+        self.assertEqual(dist('money', 'honey', mode='syllable'),
+                         (syllable_dist(('muhn', 'ee'), ('huhn', 'ee')) + edit_dist('MN', 'HN') * 3 * 0.5 + 3) / 13)
+        self.assertEqual(dist('notaword', 'zoo', mode='syllable'), -1)
+
+    def test_phonetic_clean(self):
+        self.assertEqual(phonetic_clean("['zoo', 'loo']"), "'zoo''loo'")
+        self.assertEqual(phonetic_clean('[uh-bout; ,]'), 'uhbout')
+        self.assertEqual(phonetic_syllables("['yoo', \"'s\"]"), ('yoo', 's'))
+        self.assertEqual(phonetic_syllables('[ey,]'), ('ey',))
+        self.assertEqual(phonetic_syllables('[]'), ())
+
+    def test_dist_many(self):
+        words = list(phonetic_store())[::50] + ['notaword']
+
+        for alliteration in (False, True):
+            expected = [dist('love', w, alliteration) for w in words]
+            self.assertEqual(list(dist_many('love', words, alliteration)), expected)
+
+        self.assertEqual(list(dist_many('notaword', ['zoo', 'notaword'])), [-1, -3])
+        self.assertEqual(len(dist_many('love')), len(phonetic_store()))
+
+    def test_closest_words(self):
+        store = phonetic_store()
+        position = store.index('love')
+
+        for alliteration in (False, True):
+            expected = sorted((dist('love', w, alliteration), i) for i, w in enumerate(store) if i != position)
+            self.assertEqual(closest_words(position, 5, alliteration), expected[:5])
+
+
+def use_corpus(case, words):
+    """Replaces the corpus of the process, until the end of the test, with one made of words"""
+    store = phonetic_store()
+    tmp = tempfile.TemporaryDirectory()
+    case.addCleanup(tmp.cleanup)
+    path = os.path.join(tmp.name, 'corpus.bin')
+    write_corpus(path, {'phonetics': {word: store[word] for word in words}, 'viable_words': {}})
+
+    case.addCleanup(setattr, corpus_module, '_corpus', corpus_module._corpus)
+    corpus_module._corpus = CorpusFile(path)
+
+
+class RhymeIndexCase(unittest.TestCase):
+    def setUp(self):
+        store = phonetic_store()
+        self.words = sorted(store.key_at(i) for i in range(0, len(store), 300))
+        use_corpus(self, self.words)
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.path = os.path.join(tmp.name, 'rhyme_index.bin')
+
+    def test_write_and_read(self):
+        build_rhyme_index(k=5, path=self.path)
+        index = RhymeIndex(self.path)
+
+        for alliteration in (False, True):
+            for position, word in enumerate(self.words):
+                expected = [(self.words[i], distance) for distance, i in closest_words(position, 5, alliteration)]
+                neighbours = index.nearest(word, 5, alliteration)
+                self.assertEqual([w for w, _ in neighbours], [w for w, _ in expected])
+                for (_, distance), (_, expected_distance) in zip(neighbours, expected):
+                    self.assertAlmostEqual(distance, expected_distance, places=6)
+
+        self.assertEqual(len(index.nearest(self.words[0], 2)), 2)
+        self.assertEqual(index.nearest('notaword', 5), -1)
+
+    def test_nearest_rhymes(self):
+        build_rhyme_index(k=5, path=self.path)
+        self.addCleanup(setattr, rhyme_index, 'INDEX_PATH', rhyme_index.INDEX_PATH)
+        self.addCleanup(setattr, rhyme_index, '_rhyme_index', None)
+        rhyme_index.INDEX_PATH = self.path
+        rhyme_index._rhyme_index = None
+
+        self.assertEqual(rhyme_index.nearest_rhymes(self.words[3], k=3),
+                         RhymeIndex(self.path).nearest(self.words[3], 3))
+        self.assertEqual(len(rhyme_index.nearest_rhymes(self.words[3], k=10)), 5)
+
+    def test_other_corpus(self):
+        build_rhyme_index(k=5, path=self.path)
+
+        # a corpus with as many words, one of them another one
+        store = phonetic_store()
+        words = self.words[1:] + [store.key_at(1)]
+        use_corpus(self, words)
+        with self.assertRaises(ValueError):
+            RhymeIndex(self.path)
+
+
+class RhymeMatrixCase(unittest.TestCase):
+    def setUp(self):
+        store = phonetic_store()
+        self.words = sorted(store.key_at(i) for i in range(0, len(store), 300))
+        use_corpus(self, self.words)
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.out = tmp.name
+
+    def expected(self, cutoff, alliteration=False):
+        pairs = set()
+        for i, word in enumerate(self.words):
+            distances = dist_many(word, alliteration=alliteration)
+            pairs.update((i, j, float(np.float32(d))) for j, d in enumerate(distances) if j != i and d < cutoff)
+        return pairs
+
+    def test_shards(self):
+        done = []
+        build_rhyme_matrix(self.out, cutoff=0.5, num_shards=4, workers=2,
+                           progress=lambda shards, total, speed: done.append((shards, total)))
+
+        self.assertEqual(done, [(1, 4), (2, 4), (3, 4), (4, 4)])
+        rows, cols, dists = load_rhyme_matrix(self.out)
+        self.assertEqual(set(zip(rows.tolist(), cols.tolist(), dists.tolist())), self.expected(0.5))
+
+    def test_resume(self):
+        build_rhyme_matrix(self.out, cutoff=0.5, num_shards=4, workers=1)
+        os.remove(shard_path(self.out, 2))
+        with self.assertRaises(ValueError):
+            load_rhyme_matrix(self.out)
+
+        # only the missing shard is computed again
+        done = []
+        build_rhyme_matrix(self.out, cutoff=0.5, num_shards=4, workers=1,
+                           progress=lambda shards, total, speed: done.append(shards))
+        self.assertEqual(done, [4])
+        rows, cols, dists = load_rhyme_matrix(self.out)
+        self.assertEqual(set(zip(rows.tolist(), cols.tolist(), dists.tolist())), self.expected(0.5))
+
+        # runs with other parameters do not resume from those shards
+        for options in ({'cutoff': 0.4}, {'alliteration': True}, {'num_shards': 3}):
+            with self.assertRaises(ValueError):
+                build_rhyme_matrix(self.out, **dict({'cutoff': 0.5, 'num_shards': 4, 'workers': 1}, **options))
+
+        clear_rhyme_matrix(self.out)
+        build_rhyme_matrix(self.out, cutoff=0.5, alliteration=True, num_shards=4, workers=1)
+        rows, cols, dists = load_rhyme_matrix(self.out)
+        self.assertEqual(set(zip(rows.tolist(), cols.tolist(), dists.tolist())), self.expected(0.5, True))
+
+        # nor do runs on another corpus, which cannot load them either
+        use_corpus(self, self.words[:-1])
+        with self.assertRaises(ValueError):
+            build_rhyme_matrix(self.out, cutoff=0.5, alliteration=True, num_shards=4, workers=1)
+        with self.assertRaises(ValueError):
+            load_rhyme_matrix(self.out)
+
+
+@lru_cache(maxsize=None)
+def recursive_edit_dist(a, b):
+    """edit_dist as it was first written, used as reference"""
+    if a == "":
+        return len(b)
+    if b == "":
+        return len(a)
+    if a[-1] == b[-1] and (a[-1] in ("a","e", "i", "o", "u") and b[-1] in ("a","e", "i", "o", "u")):
+        cost = -1
+    elif a[-1] == b[-1]:
+        cost = 0
+    else:
+        cost = 1
+
+    return min([recursive_edit_dist(a[:-1], b) + 1,
+                recursive_edit_dist(a, b[:-1]) + 1,
+                recursive_edit_dist(a[:-1], b[:-1]) + cost])
+
+
+class EditDistanceCase(unittest.TestCase):
+    def test_matches_recursive_on_corpus(self):
+        words = list(phonetic_store())
+        phonetics = [lookup(w).phonetic for w in words]
+        metaphones = [lookup(w).metaphone for w in words]
+
+        # every word against its neighbour and against a random word of the corpus
+        random.seed(0)
+        for strings in (phonetics, metaphones):
+            for i in range(len(strings)):
+                for other in (strings[i - 1], random.choice(strings)):
+                    self.assertEqual(edit_dist(strings[i], other), recursive_edit_dist(strings[i], other))
+                    self.assertEqual(edit_dist(other, strings[i]), recursive_edit_dist(other, strings[i]))
+        recursive_edit_dist.cache_clear()
+
+    def test_matches_recursive_on_random_strings(self):
+        random.seed(1)
+        pairs = []
+        for _ in range(2000):
+            a = ''.join(random.choice('aeioubdkst') for _ in range(random.randint(0, 8)))
+            b = ''.join(random.choice('aeioubdkst') for _ in range(random.randint(0, 8)))
+            self.assertEqual(edit_dist(a, b), recursive_edit_dist(a, b))
+            pairs.append((a, b))
+        recursive_edit_dist.cache_clear()
+
+        self.assertEqual(list(batch_edit_dist([a for a, _ in pairs], [b for _, b in pairs])),
+                         [edit_dist(a, b) for a, b in pairs])
+
+    def test_vowel_match_cost(self):
+        self.assertEqual(edit_dist('', 'abc'), 3)
+        self.assertEqual(edit_dist('bad', 'bad'), -1)
+        self.assertEqual(edit_dist('aa', 'aa'), -2)
+        self.assertEqual(edit_dist('bd', 'bd'), 0)
+
+    def test_cache_is_bounded(self):
+        info = edit_dist.cache_info()
+        self.assertEqual(info.maxsize, EDIT_DIST_CACHE_SIZE)
+        edit_dist('cache', 'test')
+        edit_dist('cache', 'test')
+        self.assertGreater(edit_dist.cache_info().hits, info.hits)
+        self.assertLessEqual(edit_dist.cache_info().currsize, EDIT_DIST_CACHE_SIZE)
+
+
+class CorpusFileCase(unittest.TestCase):
+    def test_write_and_read(self):
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        self.addCleanup(os.remove, path)
+
+        write_corpus(path, {'words': {'zoo': 'S', 'apple': '', 'yoga': 'AK'},
+                            'empty': {}})
+        corpus = CorpusFile(path)
+        words = corpus.table('words')
+
+        self.assertEqual(list(words), ['apple', 'yoga', 'zoo'])
+        self.assertEqual(words['yoga'], 'AK')
+        self.assertEqual(words.key_at(2), 'zoo')
+        self.assertEqual(words.index('apple'), 0)
+        self.assertEqual(words.index('banana'), -1)
+        self.assertNotIn('banana', words)
+        self.assertEqual(len(corpus.table('empty')), 0)
+
+        # the digest only depends on the content
+        digest = corpus.digest()
+        write_corpus(path, {'words': {'yoga': 'AK', 'zoo': 'S', 'apple': ''}, 'empty': {}})
+        self.assertEqual(CorpusFile(path).digest(), digest)
+        write_corpus(path, {'words': {'zoo': 'S'}, 'empty': {}})
+        self.assertNotEqual(CorpusFile(path).digest(), digest)
+
+
+class DistCacheCase(unittest.TestCase):
+    def test_hits_persist_across_instances(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = os.path.join(tmp.name, 'dist_cache.db')
+
+        cache = DistCache(path)
+        self.assertEqual(cache.dist('zoo', 'blue'), dist('zoo', 'blue'))
+        self.assertEqual(cache.dist('zoo', 'blue'), dist('zoo', 'blue'))
+        self.assertEqual(cache.dist('zoo', 'blue', alliteration=True), dist('zoo', 'blue', True))
+        self.assertEqual(cache.stats()['hits'], 1)
+        self.assertEqual(cache.most_requested(1), [cache_key('zoo', 'blue')])
+
+        # a second process sees the values and the totals of the first one
+        other = DistCache(path)
+        other.dist('zoo', 'blue')
+        stats = other.stats()
+        self.assertEqual((stats['hits'], stats['misses']), (1, 0))
+        self.assertEqual((stats['total_hits'], stats['total_misses']), (2, 2))
+        self.assertEqual(stats['size'], 2)
+
+        other.clear()
+        self.assertEqual(other.warm_up(other.most_requested(10)), 2)
+        self.assertEqual(other.get(cache_key('zoo', 'blue')), dist('zoo', 'blue'))
+
+    def test_words_are_not_normalized(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        cache = DistCache(os.path.join(tmp.name, 'dist_cache.db'))
+
+        self.assertEqual(cache.dist('zoo', 'blue'), dist('zoo', 'blue'))
+        self.assertEqual(cache.dist('Zoo', 'blue'), dist('Zoo', 'blue'))
+        self.assertEqual(cache.stats()['hits'], 0)
+
+    def test_values_are_kept_until_the_corpus_changes(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = os.path.join(tmp.name, 'dist_cache.db')
+
+        cache = DistCache(path)
+        cache.dist('zoo', 'blue')
+        self.assertFalse(cache.sync_corpus())
+
+        # e.g. a restart, which builds the same corpus again
+        other = DistCache(path)
+        other.dist('zoo', 'blue')
+        self.assertEqual(other.stats()['hits'], 1)
+
+        self.assertTrue(other.sync_corpus('another corpus'))
+        self.assertEqual(other.stats()['size'], 0)
+        self.assertEqual(other.most_requested(1), [cache_key('zoo', 'blue')])
+
+    def test_rhyme_distance_route(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+
+        class CacheConfig(TestConfig):
+            DIST_CACHE_PATH = os.path.join(tmp.name, 'dist_cache.db')
+            WTF_CSRF_ENABLED = False
+
+        app = create_app(CacheConfig)
+        client = app.test_client()
+        for _ in range(2):
+            response = client.post('/jinni_rhyme_distance', data={'word_1': 'Zoo ', 'word_2': 'blue'})
+            self.assertIn(str(dist('zoo', 'blue')).encode(), response.data)
+
+        self.assertEqual(app.dist_cache.stats()['hits'], 1)
+        self.assertEqual(app.dist_cache.most_requested(1), [cache_key('zoo', 'blue')])
+
+
+class FakeRhymeTable(object):
+    """In-memory stand-in for the Rhyme DynamoDB table"""
+
+    def __init__(self, items):
+        self.items = items
+        self.get_calls = 0
+
+    def get_item(self, key):
+        self.get_calls += 1
+        return self.items.get(key)
+
+    def update_item(self, key, attribute, value):
+        self.items[key][attribute] = value
+
+
+class RhymeRepositoryCase(unittest.TestCase):
+    def test_cache(self):
+        table = FakeRhymeTable({'zoo': {'id': 'zoo', 'rhymes': {'blue': [1, 2]}, 'sent_ids': [3, 4]}})
+        rhymes = RhymeRepository(table, maxsize=2)
+
+        self.assertEqual(rhymes.attribute('zoo', 'rhymes'), {'blue': [1, 2]})
+        self.assertEqual(rhymes.attribute('zoo', 'sent_ids'), [3, 4])
+        self.assertIsNone(rhymes.attribute('zoo', 'syns'))
+        self.assertNotIn('cat', rhymes)
+        self.assertNotIn('cat', rhymes)
+        self.assertEqual(table.get_calls, 2)
+        self.assertEqual((rhymes.calls, rhymes.calls_saved), (2, 3))
+
+        # items handed out are copies
+        rhymes.get('zoo')['rhymes']['new'] = []
+        rhymes.attribute('zoo', 'sent_ids').append(5)
+        self.assertEqual(list(rhymes.get('zoo')['rhymes']), ['blue'])
+        self.assertEqual(rhymes.attribute('zoo', 'sent_ids'), [3, 4])
+
+        rhymes.update('zoo', 'syns', ['blue'])
+        self.assertEqual(rhymes.attribute('zoo', 'syns'), ['blue'])
+
+        # least recently used entries are evicted
+        rhymes.get('dog')
+        rhymes.get('cat')
+        calls = table.get_calls
+        rhymes.get('zoo')
+        self.assertEqual(table.get_calls, calls + 1)
+
+    def test_rhyme_ranges(self):
+        rhymes = {'blue': [Decimal(10), Decimal(12)], 'true': [], 'you': [Decimal(40), Decimal(40)]}
+        ranges = RhymeRanges.from_rhymes(rhymes)
+        self.assertEqual(ranges.words, ['blue', 'you'])
+        self.assertEqual(ranges.ranges, [[10, 12], [40, 40]])
+        self.assertEqual(ranges.cumulative, [3, 4])
+
+        random.seed(0)
+        samples = [ranges.sample() for _ in range(400)]
+        self.assertEqual(set(samples), {('blue', 10), ('blue', 11), ('blue', 12), ('you', 40)})
+        self.assertLess(abs(samples.count(('you', 40)) - 100), 30)
+
+        # precomputed ranges are cached with the item and recomputed after an update
+        table = FakeRhymeTable({'zoo': {'id': 'zoo', 'rhymes': {'blue': [1, 2]},
+                                        'rhyme_ranges': ranges.to_attribute()}})
+        rhymes = RhymeRepository(table)
+        self.assertIs(rhymes.derived('zoo', 'ranges', RhymeRanges.from_item),
+                      rhymes.derived('zoo', 'ranges', RhymeRanges.from_item))
+        self.assertEqual(rhymes.derived('zoo', 'ranges', RhymeRanges.from_item).words, ['blue', 'you'])
+        rhymes.update('zoo', 'rhyme_ranges', RhymeRanges.from_rhymes({'true': [5, 6]}).to_attribute())
+        self.assertEqual(rhymes.derived('zoo', 'ranges', RhymeRanges.from_item).words, ['true'])
+        self.assertIsNone(rhymes.derived('cat', 'ranges', RhymeRanges.from_item))
+
+    def test_ttl(self):
+        table = FakeRhymeTable({'zoo': {'id': 'zoo'}})
+        rhymes = RhymeRepository(table, ttl=0)
+        rhymes.get('zoo')
+        rhymes.get('zoo')
+        self.assertEqual(table.get_calls, 2)
+
+
+class FakeBatchClient(object):
+    """Answers batch_get_item from a dictionary, leaving the last key of every request unprocessed once"""
+
+    def __init__(self, items):
+        self.items = items
+        self.requests = []
+        self.delayed = set()
+
+    def batch_get_item(self, RequestItems):
+        (table, request), = RequestItems.items()
+        keys = [key['id_'] for key in request['Keys']]
+        self.requests.append(list(keys))
+
+        unprocessed = []
+        if keys[-1] not in self.delayed:
+            self.delayed.add(keys[-1])
+            unprocessed = [keys.pop()]
+
+        response = {'Responses': {table: [self.items[k] for k in keys if k in self.items]}}
+        if unprocessed:
+            response['UnprocessedKeys'] = {table: {'Keys': [{'id_': k} for k in unprocessed]}}
+        return response
+
+
+class BatchGetCase(unittest.TestCase):
+    def test_chunks_and_retries(self):
+        table = DynamoStorage().table('Lyrics')
+        table.client = client = FakeBatchClient({i: {'id_': i, 'sent_': ['line', str(i)]} for i in range(250)})
+        items = table.batch_get_item(list(range(260)) + [3, 3], backoff=0)
+
+        self.assertEqual(sorted(items), list(range(250)))
+        self.assertEqual(items[42]['sent_'], ['line', '42'])
+        self.assertEqual([len(keys) for keys in client.requests], [100, 1, 100, 1, 60, 1])
+
+
+class FanOutCase(unittest.TestCase):
+    def test_results_in_order(self):
+        def slow_square(x):
+            time.sleep(0.05)
+            return x * x
+
+        app = create_app(TestConfig)
+        with app.app_context():
+            t = time.time()
+            self.assertEqual(fan_out((slow_square, 2), (slow_square, 3), (slow_square, 4)), [4, 9, 16])
+            self.assertLess(time.time() - t, 0.1)
+
+        # without an app context calls run one after another
+        self.assertEqual(fan_out((slow_square, 5), lambda: 'done'), [25, 'done'])
+
+
+class JobQueueCase(unittest.TestCase):
+    def test_jobs(self):
+        app = create_app(TestConfig)
+        jobs = JobQueue(app, workers=1, max_queued=2)
+        release = threading.Event()
+        done = []
+
+        def job(name):
+            release.wait(1)
+            if name == 'bad':
+                raise ValueError(name)
+            done.append((name, has_app_context()))
+
+        self.assertTrue(jobs.submit('a', job, 'a'))
+        # wait for the worker to take a, so b and c are the ones waiting
+        for _ in range(100):
+            if jobs.stats()['running']:
+                break
+            time.sleep(0.01)
+
+        # a is running, b is waiting
+        self.assertFalse(jobs.submit('a', job, 'a'))
+        self.assertTrue(jobs.submit('b', job, 'b'))
+        self.assertFalse(jobs.submit('b', job, 'b'))
+        self.assertTrue(jobs.submit('c', job, 'bad'))
+        self.assertFalse(jobs.submit('d', job, 'd'))
+        self.assertEqual(jobs.stats()['depth'], 2)
+
+        release.set()
+        jobs.shutdown(timeout=5)
+        self.assertFalse(jobs.submit('e', job, 'e'))
+        self.assertEqual(done, [('a', True), ('b', True)])
+
+        stats = jobs.stats()
+        self.assertEqual({name: stats[name] for name in ['queued', 'done', 'failed', 'deduplicated', 'rejected']},
+                         {'queued': 3, 'done': 2, 'failed': 1, 'deduplicated': 2, 'rejected': 1})
+        self.assertEqual(stats['depth'], 0)
+
+
+class SentPrefetchCase(unittest.TestCase):
+    def setUp(self):
+        self.calls = []
+
+        def fake_get_sent(word='', rhyme=''):
+            self.calls.append((word, rhyme))
+            if word == 'nothing':
+                return 1
+            return ['line {} '.format(len(self.calls)), len(self.calls), word]
+
+        self.addCleanup(setattr, sent_prefetch, 'get_sent', sent_prefetch.get_sent)
+        sent_prefetch.get_sent = fake_get_sent
+
+    def wait_for(self, prefetcher, word, rhyme, count):
+        for _ in range(100):
+            if prefetcher.queued(word, rhyme) == count:
+                return
+            time.sleep(0.01)
+        self.fail('{} sentences were not prefetched'.format(count))
+
+    def test_prefetch(self):
+        prefetcher = sent_prefetch.SentPrefetcher(depth=2)
+        app = create_app(TestConfig)
+
+        with app.app_context():
+            self.assertEqual(prefetcher.get_sent('zoo', 'blue'), ['line 1 ', 1, 'zoo'])
+            self.wait_for(prefetcher, 'zoo', 'blue', 2)
+
+            # served from the queue, which is then refilled
+            self.assertEqual(prefetcher.get_sent('zoo', 'blue'), ['line 2 ', 2, 'zoo'])
+            self.wait_for(prefetcher, 'zoo', 'blue', 2)
+            self.assertEqual(len(self.calls), 4)
+
+            self.assertEqual(prefetcher.get_sent('nothing'), 1)
+            self.assertEqual(prefetcher.queued('nothing'), 0)
+
+        stats = prefetcher.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['keys']), (1, 2, 2))
+
+    def test_bounds(self):
+        prefetcher = sent_prefetch.SentPrefetcher(max_keys=2, idle=60)
+
+        # without an app context nothing is prefetched
+        for word in ['zoo', 'blue', 'true']:
+            prefetcher.get_sent(word)
+        self.assertEqual(prefetcher.stats()['keys'], 2)
+        self.assertEqual(prefetcher.queued('zoo'), 0)
+
+        prefetcher.idle = 0
+        prefetcher.get_sent('you')
+        self.assertEqual(prefetcher.stats()['keys'], 1)
+
+
+class WordIndexCase(unittest.TestCase):
+    def test_posting_list(self):
+        random.seed(3)
+        ids = sorted(random.sample(range(10 ** 7), 1000))
+        postings = PostingList(encode_postings(ids))
+
+        self.assertEqual(len(postings), 1000)
+        self.assertEqual(list(postings), ids)
+        self.assertEqual([postings[i] for i in (0, 127, 128, 999)], [ids[0], ids[127], ids[128], ids[999]])
+        for id in [0, ids[0], ids[500], ids[500] + 1, ids[-1], 10 ** 7]:
+            self.assertEqual(postings.bisect_left(id), sum(1 for i in ids if i < id))
+
+    def test_sample_postings(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        path = os.path.join(tmp.name, 'word_index.bin')
+        write_corpus(path, {'postings': {'zoo': encode_postings(list(range(0, 1000, 2))),
+                                         'blue': encode_postings([3, 5, 7])}})
+        index = WordIndex(path)
+        self.assertIsNone(index.postings_of('cat'))
+
+        postings = [index.postings_of('zoo'), index.postings_of('blue')]
+        ids = sample_postings(postings, 10)
+        self.assertEqual(len(set(ids)), 10)
+        self.assertTrue(all(id % 2 == 0 or id in (3, 5, 7) for id in ids))
+        self.assertEqual(sorted(sample_postings(postings, 10, ranges=[[3, 6], [998, 2000]])), [3, 4, 5, 6, 998])
+
+
+class SQLiteStorageCase(unittest.TestCase):
+    def test_tables(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        storage = SQLiteStorage(os.path.join(tmp.name, 'lyrics.db'))
+
+        lyric = storage.table('Lyric')
+        lyric.put_items([{'id': Decimal(i), 'sent': ['a', 'line', str(i)], 'len': Decimal(3),
+                          'zoo' if i % 2 else 'blue': Decimal(1)} for i in range(10)])
+        self.assertEqual(lyric.item_count, 10)
+        self.assertEqual(lyric.get_item(3), {'id': 3, 'sent': ['a', 'line', '3'], 'len': 3, 'zoo': 1})
+        self.assertIsInstance(lyric.get_item(3)['id'], Decimal)
+        self.assertIsNone(lyric.get_item(10))
+        self.assertEqual(sorted(lyric.batch_get_item([1, 2, 2, 42])), [1, 2])
+        self.assertEqual([item['id'] for item in lyric.scan_by_word(['zoo'], start=4)], [5, 7, 9])
+
+        lyric.update_item(2, 'zoo', Decimal(1))
+        self.assertEqual([item['id'] for item in lyric.scan_by_word(['zoo', 'cat'])], [1, 2, 3, 5, 7, 9])
+
+        # the key of Lyrics is id_, and tables are copied between storages
+        other = SQLiteStorage(os.path.join(tmp.name, 'copy.db'))
+        storage.table('Lyrics').put_items([{'id_': Decimal(1), 'sent_': ['hello']}])
+        copy_tables(storage, other, tables=['Lyric', 'Lyrics'])
+        self.assertEqual(other.table('Lyrics').get_item(1), {'id_': 1, 'sent_': ['hello']})
+        self.assertEqual(list(other.table('Lyric').scan()), list(lyric.scan()))
+
+    def test_app_storage(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        app_storage = AppStorage()
+        lyric = app_storage.table('Lyric')
+        with self.assertRaises(RuntimeError):
+            lyric.item_count
+
+        # tables taken before the storage is opened are bound to the storage of the config
+        for name in ('one.db', 'two.db'):
+            class StoreConfig(TestConfig):
+                LYRIC_STORE_PATH = os.path.join(tmp.name, name)
+
+            app = create_app(StoreConfig)
+            app_storage.init_app(app)
+            self.assertEqual(app_storage.storage.path, StoreConfig.LYRIC_STORE_PATH)
+            app.storage.table('Lyric').put_items([{'id': Decimal(1)}])
+            self.assertEqual(lyric.get_item(1), {'id': 1})
+            self.assertEqual(lyric.item_count, 1)
+
+        # and the storage is opened again only when the path changes
+        opened = app_storage.storage
+        app_storage.init_app(create_app(StoreConfig))
+        self.assertIs(app_storage.storage, opened)
+
+    def test_table_metadata(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        storage = SQLiteStorage(os.path.join(tmp.name, 'lyrics.db'))
+        storage.table('Lyric').put_items([{'id': i} for i in range(5)])
+
+        metadata = TableMetadata(storage, interval=3600)
+        self.assertEqual(metadata.item_count('Lyric'), 5)
+        self.assertEqual(metadata.id_range('Lyric'), (0, 4))
+
+        # values only change when refreshed
+        storage.table('Lyric').put_items([{'id': 5}])
+        self.assertEqual(metadata.id_range('Lyric'), (0, 4))
+        metadata.refresh()
+        self.assertEqual(metadata.id_range('Lyric'), (0, 5))
+
+    def test_table_metadata_start(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        storage = SQLiteStorage(os.path.join(tmp.name, 'lyrics.db'))
+        storage.table('Lyric').put_items([{'id': i} for i in range(5)])
+        storage.table('Rhyme').put_items([{'id': 'zoo'}])
+
+        # tables are loaded up front, and readers do not touch the storage
+        metadata = TableMetadata(storage, interval=3600)
+        metadata.start()
+        self.assertEqual(sorted(metadata._data), ['Lyric', 'Lyrics', 'Rhyme'])
+        self.assertTrue(metadata._thread.is_alive())
+        metadata.storage = None
+        self.assertEqual(metadata.id_range('Lyric'), (0, 4))
+        self.assertEqual(metadata.item_count('Rhyme'), 1)
+
+
+class GetSentCase(unittest.TestCase):
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        storage = SQLiteStorage(os.path.join(tmp.name, 'lyrics.db'))
+
+        storage.table('Lyrics').put_items([{'id_': Decimal(i), 'sent_': ['line', str(i)]} for i in range(100)])
+        storage.table('Rhyme').put_items([
+            {'id': 'zoo', 'rhymes': {'blue': [Decimal(10), Decimal(19)], 'you': []},
+             'syns': [{'zoo': Decimal(0), 'animal': Decimal(3)}, {'cage': Decimal(1)}]},
+            {'id': 'true', 'rhymes': {'new': [Decimal(50), Decimal(50)]}}])
+        storage.table('LyricLink').put_items([
+            {'id': 'animal', 'counts': Decimal(2)}, {'id': 'animal-1', 'links': [Decimal(1), Decimal(30)]},
+            {'id': 'animal-2', 'links': [Decimal(5), Decimal(16)]}, {'id': 'cage', 'counts': Decimal(1)},
+            {'id': 'cage-1', 'links': [Decimal(70)]}])
+
+        for name, table in [('lyrics_table', 'Lyrics'), ('lyric_link_table', 'LyricLink')]:
+            self.addCleanup(setattr, sentence_generator, name, getattr(sentence_generator, name))
+            setattr(sentence_generator, name, storage.table(table))
+        self.addCleanup(setattr, rhyme_repository, 'table', rhyme_repository.table)
+        rhyme_repository.table = storage.table('Rhyme')
+        rhyme_repository.clear()
+        self.addCleanup(rhyme_repository.clear)
+        for cache in (sentence_generator._links_cache, sentence_generator._links_seen):
+            cache.clear()
+            self.addCleanup(cache.clear)
+
+    def test_get_links_by_pages(self):
+        # pages read for the first time are returned as they are read
+        links = sentence_generator.get_links_by_pages(['animal-1', 'cage-1', 'missing'])
+        self.assertEqual(links, {'animal-1': [Decimal(1), Decimal(30)], 'cage-1': [Decimal(70)]})
+
+        # and converted when read again, and then served from the cache
+        links = sentence_generator.get_links_by_pages(['animal-1', 'cage-1'])
+        self.assertEqual({page: ids.tolist() for page, ids in links.items()}, {'animal-1': [0, 29], 'cage-1': [69]})
+        sentence_generator.lyric_link_table.put_items([{'id': 'cage-1', 'links': [Decimal(80)]}])
+        self.assertEqual(sentence_generator.get_links_by_pages(['cage-1'])['cage-1'].tolist(), [69])
+
+    def test_links_in_ranges(self):
+        links = links_array([Decimal(16), Decimal(5), Decimal(12), Decimal(41)])
+        self.assertEqual(links.tolist(), [4, 11, 15, 40])
+
+        ranges = RhymeRanges(['blue', 'you', 'true'], [[30, 40], [10, 19], [0, 3]])
+        self.assertEqual(links_in_ranges(links, ranges).tolist(), [11, 15, 40])
+        self.assertEqual(links_in_ranges(links, RhymeRanges(['blue'], [[5, 10]])).tolist(), [])
+        self.assertEqual(links_in_ranges(links_array([]), ranges).tolist(), [])
+
+        random.seed(4)
+        links = links_array(random.sample(range(1, 10 ** 6), 5000))
+        ranges = RhymeRanges(['w{}'.format(i) for i in range(50)], [[i * 20000, i * 20000 + 999] for i in range(50)])
+        self.assertEqual(links_in_ranges(links, ranges).tolist(),
+                         [link for link in links.tolist() if any(lo <= link <= hi for lo, hi in ranges.ranges)])
+
+        # pages read for the first time are searched without converting them
+        page = [Decimal(link + 1) for link in links.tolist()]
+        self.assertEqual(links_in_ranges(page, ranges).tolist(), links_in_ranges(links, ranges).tolist())
+        self.assertEqual(links_in_ranges([], ranges).tolist(), [])
+
+    def test_get_sent(self):
+        # animal-2 has the only related sentence (16 - 1) that ends with a rhyme of zoo
+        self.assertEqual(get_sent('zoo', 'zoo'), ['line 15 ', 15, 'zoo'])
+        # no related sentence rhymes with true, so an unrelated one that does is used, tagged with its rhyme
+        self.assertEqual(get_sent('zoo', 'true'), ['line 50 ', 50, 'new'])
+        self.assertEqual(get_sent('zoo', 'cat'), 1)
+
+    def test_get_sent_missing_sentences(self):
+        class MissingLyrics(object):
+            def __init__(self, table, missing):
+                self.table = table
+                self.missing = missing
+
+            def batch_get_item(self, keys):
+                return {key: item for key, item in self.table.batch_get_item(keys).items() if key not in self.missing}
+
+        self.addCleanup(setattr, sentence_generator, 'lyrics_table', sentence_generator.lyrics_table)
+        sentence_generator.lyrics_table = MissingLyrics(sentence_generator.lyrics_table, {15, 50})
+        sentence_generator._sent_cache.clear()
+        self.addCleanup(sentence_generator._sent_cache.clear)
+
+        # the only related sentence is missing, so an unrelated one that rhymes is used
+        random.seed(3)
+        sent, id, rhyme_word = get_sent('zoo', 'zoo')
+        self.assertTrue(10 <= id <= 19 and id != 15)
+        self.assertEqual((sent, rhyme_word), ('line {} '.format(id), 'blue'))
+        # and none is left when every sentence of the rhymes is missing
+        self.assertEqual(get_sent('zoo', 'true'), 1)
+
+        with self.assertRaises(KeyError):
+            sentence_generator.get_sent_by_id(15)
+
+
 if __name__ == '__main__':
     unittest.main(verbosity=2)
\ No newline at end of file